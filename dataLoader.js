@@ -130,6 +130,57 @@ class DataLoader {
         // Extract unique genres
         return new Set(sailorWorks.map(w => w.genre).filter(Boolean));
     }
+
+    // Precomputed force layout of a view (pufi/force_layout.py): the preset laid out
+    // for exactly these edge types, else "all"; resolves to null when there is none
+    loadLayout(view, edgeTypes) {
+        if (!this.layoutIndex) {
+            this.layoutIndex = d3.json('payloads/layouts/index.json').catch(() => ({}));
+            this.layouts = new Map();
+        }
+        return this.layoutIndex.then(index => {
+            const presets = index[view] || {};
+            const preset = Object.keys(presets).find(name =>
+                presets[name].length === edgeTypes.size && presets[name].every(t => edgeTypes.has(t))
+            ) || 'all';
+            if (!presets[preset]) return null;
+
+            const key = `${view}/${preset}`;
+            if (!this.layouts.has(key)) {
+                this.layouts.set(key, d3.json(`payloads/layouts/${key}.json`)
+                    .then(layout => ({
+                        edgeLength: layout.edgeLength,
+                        positions: new Map(layout.ids.map((id, i) => [String(id), [layout.x[i], layout.y[i]]])),
+                    }))
+                    .catch(() => null));
+            }
+            return this.layouts.get(key);
+        });
+    }
+
+    // Move nodes to their layout positions, fitted into width x height with at most
+    // maxEdge pixels per edge length; true when every node had a position
+    placeNodes(nodes, layout, width, height, maxEdge) {
+        if (!layout) return false;
+        const placed = nodes.filter(n => layout.positions.has(n.id));
+        if (placed.length === 0) return false;
+
+        const xs = placed.map(n => layout.positions.get(n.id)[0]);
+        const ys = placed.map(n => layout.positions.get(n.id)[1]);
+        const [x0, x1] = d3.extent(xs);
+        const [y0, y1] = d3.extent(ys);
+        const margin = 30;
+        const scale = Math.min(
+            (width - 2 * margin) / ((x1 - x0) || 1),
+            (height - 2 * margin) / ((y1 - y0) || 1),
+            maxEdge / layout.edgeLength
+        );
+        placed.forEach((n, i) => {
+            n.x = width / 2 + (xs[i] - (x0 + x1) / 2) * scale;
+            n.y = height / 2 + (ys[i] - (y0 + y1) / 2) * scale;
+        });
+        return placed.length === nodes.length;
+    }
 }
 
 // Global data loader instance
@@ -158,8 +158,11 @@ class InfluencersNetwork {
         });
     }
 
-    render(nodes, links, yearRange) {
+    async render(nodes, links, yearRange) {
         if (!nodes || !links) return;
+        const request = this.lastRender = {};
+        const layout = await window.dataLoader.loadLayout("influencers", this.selectedInfluenceTypes);
+        if (this.lastRender !== request) return;  // a newer render started meanwhile
 
         const [minYear, maxYear] = yearRange;
         const nodeById = new Map(nodes.map(n => [n.id, n]));
@@ -183,7 +186,7 @@ class InfluencersNetwork {
         this.updateArtistSelector(graphNodes);
 
         // Create force simulation
-        this.createForceSimulation(graphNodes, graphLinks);
+        this.createForceSimulation(graphNodes, graphLinks, layout);
     }
 
     calculateDerivedData(nodes, links, nodeById, minYear, maxYear) {
@@ -351,12 +354,15 @@ class InfluencersNetwork {
             .text(d => d.name);
     }
 
-    createForceSimulation(graphNodes, graphLinks) {
+    createForceSimulation(graphNodes, graphLinks, layout) {
         // Clear existing visualization
         this.svg.selectAll("*").remove();
 
         if (graphNodes.length === 0) return;
 
+        // Start from the precomputed layout when there is one
+        const placed = window.dataLoader.placeNodes(graphNodes, layout, this.width, this.height, 80);
+
         // Create force simulation
         this.simulation = d3.forceSimulation(graphNodes)
             .force("link", d3.forceLink(graphLinks)
@@ -473,6 +479,12 @@ class InfluencersNetwork {
 
             node.attr("transform", d => `translate(${d.x},${d.y})`);
         });
+
+        // Every node placed: draw the layout as is (dragging restarts the simulation)
+        if (placed) {
+            this.simulation.stop();
+            this.simulation.on("tick")();
+        }
     }
 
     drawStar(selection, color) {
@@ -84,8 +84,10 @@ class NetworkGraph {
         return shapes[nodeType] || d3.symbolCircle;
     }
 
-    render(graph) {
+    async render(graph) {
         this.currentGraph = graph;
+        const layout = await window.dataLoader.loadLayout("network", this.visibleEdgeTypes);
+        if (this.currentGraph !== graph) return;  // a newer graph arrived meanwhile
         
         // Filter nodes and links based on visibility
         const filteredNodes = graph.nodes.filter(n => 
@@ -113,10 +115,10 @@ class NetworkGraph {
             [d.source.id, d.target.id].sort().join("__")
         );
 
-        this.updateVisualization(filteredNodes, linkData, edgeGroups);
+        this.updateVisualization(filteredNodes, linkData, edgeGroups, layout);
     }
 
-    updateVisualization(nodes, links, edgeGroups) {
+    updateVisualization(nodes, links, edgeGroups, layout) {
         // Stop existing simulation
         if (this.simulation) {
             this.simulation.stop();
@@ -144,7 +146,7 @@ class NetworkGraph {
 
         link.exit().remove();
 
-        link.enter()
+        const linkPaths = link.enter()
             .append("path")
             .merge(link)
             .attr("fill", "none")
@@ -167,7 +169,7 @@ class NetworkGraph {
             .type(d => this.getNodeShape(d["Node Type"]))
             .size(d => d.id === this.selectedNode?.id ? 600 : 200);
 
-        node.enter()
+        const nodePaths = node.enter()
             .append("path")
             .merge(node)
             .attr("d", symbolGenerator)
@@ -185,7 +187,7 @@ class NetworkGraph {
 
         label.exit().remove();
 
-        label.enter()
+        const labelTexts = label.enter()
             .append("text")
             .merge(label)
             .text(d => d.name || d.stage_name || d.id)
@@ -195,6 +197,9 @@ class NetworkGraph {
             .attr("dy", 2)
             .attr("fill", "#2c3e50"); // Dark text color
 
+        // Start from the precomputed layout when there is one
+        const placed = window.dataLoader.placeNodes(nodes, layout, this.width, this.height, 120);
+
         // Create and start simulation
         this.simulation = d3.forceSimulation(nodes)
             .force("link", d3.forceLink(links)
@@ -203,7 +208,13 @@ class NetworkGraph {
             .force("charge", d3.forceManyBody().strength(-200))
             .force("center", d3.forceCenter(this.width / 2, this.height / 2))
             .force("collision", d3.forceCollide().radius(30))
-            .on("tick", () => this.tick(link, node, label, edgeGroups));
+            .on("tick", () => this.tick(linkPaths, nodePaths, labelTexts, edgeGroups));
+
+        // Every node placed: draw the layout as is (dragging restarts the simulation)
+        if (placed) {
+            this.simulation.stop();
+            this.tick(linkPaths, nodePaths, labelTexts, edgeGroups);
+        }
     }
 
     tick(link, node, label, edgeGroups) {
@@ -23,57 +23,9 @@ async function drawOceanusFolkTimeline() {
         .attr('width', width)
         .attr('height', height + margin.top + margin.bottom);
 
-    // Load data
-    const [graphData, songsData] = await Promise.all([
-        d3.json('MC1_graph.json'),
-        d3.csv('songs_albums_analysis.csv')
-    ]);
-
-    // Build genre lookup
-    const genreLookup = {};
-    songsData.forEach(d => {
-        if (d.id && d.genre) genreLookup[String(d.id).trim()] = d.genre;
-    });
-    // Helper: get genre for a node
-    function getGenre(node) {
-        if (node['Node Type'] === 'Song' || node['Node Type'] === 'Album') {
-            const genre = genreLookup[String(node.id).trim()];
-            if (genre && genre !== 'Unknown') return genre;
-        }
-        if (node.genre && node.genre !== 'Unknown') return node.genre;
-        if (genreLookup[String(node.id).trim()] && genreLookup[String(node.id).trim()] !== 'Unknown') return genreLookup[String(node.id).trim()];
-        return 'Unknown';
-    }
-    // Helper: get release year
-    function getYear(node) {
-        let y = node.release_date || node.release_year;
-        if (!y && node.id && songsData) {
-            const d = songsData.find(row => String(row.id).trim() === String(node.id).trim());
-            if (d && d.release_date) y = d.release_date;
-        }
-        if (y) return parseInt(y);
-        return null;
-    }
-    // Build Song/Album node map
-    const nodes = new Map();
-    graphData.nodes.forEach(n => {
-        if (n['Node Type'] === 'Song' || n['Node Type'] === 'Album') {
-            nodes.set(n.id, { ...n, genre: getGenre(n) });
-        }
-    });
-    // Find all outward influences from Oceanus Folk
-    const yearCounts = {};
-    graphData.links.forEach(link => {
-        const source = nodes.get(link.source);
-        const target = nodes.get(link.target);
-        if (!source || !target) return;
-        if (getGenre(source) === 'Oceanus Folk' && getGenre(target) !== 'Oceanus Folk') {
-            const year = getYear(source);
-            if (year) yearCounts[year] = (yearCounts[year] || 0) + 1;
-        }
-    });
-    // Convert to sorted array
-    const data = Object.entries(yearCounts).map(([year, count]) => ({ year: +year, count })).sort((a,b) => a.year - b.year);
+    // Per-year counts are precomputed by pufi/dashboard_payloads.py
+    const timeline = await d3.json('payloads/oceanus_timeline.json');
+    const data = timeline.outward;
     if (data.length === 0) {
         svg.append('text')
             .attr('x', width/2)
@@ -147,19 +99,7 @@ async function drawOceanusFolkTimeline() {
         .text('Number of Outward Influences');
 
     // --- Inward Influence Timeline ---
-    // Find all inward influences to Oceanus Folk
-    const inwardYearCounts = {};
-    graphData.links.forEach(link => {
-        const source = nodes.get(link.source);
-        const target = nodes.get(link.target);
-        if (!source || !target) return;
-        if (getGenre(target) === 'Oceanus Folk' && getGenre(source) !== 'Oceanus Folk') {
-            const year = getYear(target);
-            if (year) inwardYearCounts[year] = (inwardYearCounts[year] || 0) + 1;
-        }
-    });
-    // Convert to sorted array
-    const inwardData = Object.entries(inwardYearCounts).map(([year, count]) => ({ year: +year, count })).sort((a,b) => a.year - b.year);
+    const inwardData = timeline.inward;
     // Add a new SVG for inward chart
     let inwardDiv = document.getElementById('oceanusfolk-timeline-inward');
     if (!inwardDiv) {
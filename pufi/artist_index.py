@@ -0,0 +1,230 @@
+"""Person → work index and rising-star scores for every artist at once.
+
+rising_stars.js found Oceanus Folk artists by filtering every link for every
+Person node, looked the other endpoint up with ``nodes.find`` and rescanned
+all links per artist for its metrics.  :class:`ArtistIndex` is built once
+from the edge arrays:
+
+- ``incident``: every edge touching a person, as ``(artist, other, edge)``
+  rows grouped by artist in link order (what ``processArtistMetrics`` walks);
+- ``timeline``: the dated works of each artist, sorted by release date, with
+  per-artist offsets (``timeline_of(artist)``);
+- ``contributors``: work → people linked to it by PerformerOf / ComposerOf,
+  the collaborator index behind the recent collaboration score.
+
+:meth:`ArtistIndex.scores` then computes notable works, genre spread,
+collaboration score, time to success and the potential score of the page,
+overall and since the start of the window, for every person with a handful
+of ``np.bincount`` / ``np.unique`` passes; :meth:`ArtistIndex.ranking` keeps
+the Oceanus Folk contributors the page would list, best first.  The
+``rising_stars`` stage writes them to ``rising_stars.csv``.
+
+    python eda.py --only rising_stars --window 2034 2039
+"""
+
+import numpy as np
+import pandas as pd
+
+from node_frame import WORK_TYPES
+
+OCEANUS_FOLK = 'Oceanus Folk'
+UNKNOWN_GENRE = 'Unknown'
+CONTRIBUTOR_EDGES = ('PerformerOf', 'ComposerOf')
+# Release years [start, end): a candidate needs a release in the window, and
+# its recent metrics count everything released from the start on
+RECENT_WINDOW = (2034, 2039)
+RANKING_FILE = 'rising_stars.csv'
+
+_SECONDS_PER_YEAR = 60 * 60 * 24 * 365
+
+
+def _codes(graph, column, names):
+    categories = graph.categories[column]
+    return np.isin(np.asarray(graph.columns[column]), [categories.index(n) for n in names if n in categories])
+
+
+def _group_count(keys, size, weights=None):
+    return np.bincount(keys, weights=weights, minlength=size)
+
+
+def _distinct_count(keys, values, size, width):
+    """Number of distinct ``values`` per key (both non-negative integers)."""
+    pairs = np.unique(keys.astype(np.int64) * width + values)
+    return _group_count(pairs // width, size)
+
+
+def _year_start(year):
+    return pd.Timestamp(year, 1, 1).value // 10**9
+
+
+class ArtistIndex:
+    """Incidence, timeline and contributor indexes over the people of a graph."""
+
+    def __init__(self, graph):
+        n = self.num_nodes = graph.num_nodes
+        self.ids = graph.node_ids
+        self.names = graph.text['name']
+        src = np.asarray(graph.edge_src, dtype=np.int64)
+        dst = np.asarray(graph.edge_dst, dtype=np.int64)
+        edge_type = np.asarray(graph.edge_type, dtype=np.int64)
+        contributor_types = [graph.edge_types.index(t) for t in CONTRIBUTOR_EDGES if t in graph.edge_types]
+
+        self.person = _codes(graph, 'Node Type', ['Person'])
+        self.work = _codes(graph, 'Node Type', WORK_TYPES)
+        self.notable = np.asarray(graph.columns['notable']) == 1
+
+        # Genre label per node: missing genres read 'Unknown' (as on the page)
+        categories = list(graph.categories['genre'])
+        unknown = categories.index(UNKNOWN_GENRE) if UNKNOWN_GENRE in categories else len(categories)
+        genre = np.asarray(graph.columns['genre'], dtype=np.int64)
+        self.has_genre = genre >= 0
+        self.genre = np.where(self.has_genre, genre, unknown)
+        self.num_genres = len(categories) + 1
+        self.oceanus_folk = self.has_genre & (genre == (categories.index(OCEANUS_FOLK) if OCEANUS_FOLK in categories else -1))
+
+        # Release dates as epoch seconds (parsed like the page's Date / pd.Timestamp)
+        dates = graph.categories['release_date']
+        release = np.asarray(graph.columns['release_date'], dtype=np.int64)
+        seconds = np.array([pd.Timestamp(v).value // 10**9 if v else 0 for v in dates] + [0], dtype=np.int64)
+        self.dated = np.array([bool(v) for v in dates] + [False])[release]
+        self.release = seconds[release]
+
+        # The page looks each artist up by name: metrics come from the first node of that name
+        name_codes, _ = pd.factorize(pd.Series(self.names, dtype=object))
+        named = name_codes >= 0
+        first = np.full(name_codes.max() + 1 if named.any() else 0, n, dtype=np.int64)
+        np.minimum.at(first, name_codes[named], np.flatnonzero(named))
+        self.metrics_node = np.where(named, first[np.maximum(name_codes, 0)] if len(first) else 0, np.arange(n))
+
+        # Incidence rows of people and their metrics nodes, in link order (self-loops once)
+        subject = self.person.copy()
+        subject[self.metrics_node[self.person]] = True
+        edges = np.arange(len(src), dtype=np.int64)
+        from_src, from_dst = subject[src], subject[dst] & (src != dst)
+        artist = np.concatenate([src[from_src], dst[from_dst]])
+        order = np.lexsort((np.concatenate([edges[from_src], edges[from_dst]]), artist))
+        self.incident_artist = artist[order]
+        self.incident_other = np.concatenate([dst[from_src], src[from_dst]])[order]
+        self.incident_contributor = np.isin(np.concatenate([edge_type[from_src], edge_type[from_dst]])[order],
+                                            contributor_types)
+
+        # Dated works per artist: link order (for time to success) and date order (the timeline)
+        dated = self.work[self.incident_other] & self.dated[self.incident_other]
+        self.linked_artist = self.incident_artist[dated]
+        self.linked_work = self.incident_other[dated]
+        by_date = np.lexsort((self.release[self.linked_work], self.linked_artist))
+        self.timeline_work = self.linked_work[by_date]
+        self.timeline_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(_group_count(self.linked_artist, n), out=self.timeline_indptr[1:])
+
+        # Collaborator index: work → people credited by PerformerOf / ComposerOf
+        contributor = np.isin(edge_type, contributor_types) & (self.person[src] | self.person[dst])
+        people = np.where(self.person[src], src, dst)[contributor]
+        works = np.where(self.person[src], dst, src)[contributor]
+        pairs = np.unique(works * n + people)
+        self.contributor_person = pairs % n
+        self.contributor_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(_group_count(pairs // n, n), out=self.contributor_indptr[1:])
+
+    def timeline_of(self, artist):
+        """Dated works of ``artist`` (node indices), oldest release first."""
+        return self.timeline_work[self.timeline_indptr[artist]:self.timeline_indptr[artist + 1]]
+
+    def contributors_of(self, work):
+        return self.contributor_person[self.contributor_indptr[work]:self.contributor_indptr[work + 1]]
+
+    def credits(self, works):
+        """Every (row, person) credit of the ``works`` array: ``works[row]`` lists ``person``."""
+        counts = self.contributor_indptr[works + 1] - self.contributor_indptr[works]
+        starts = np.repeat(self.contributor_indptr[works] - np.cumsum(counts) + counts, counts)
+        rows = np.repeat(np.arange(len(works)), counts)
+        return rows, self.contributor_person[starts + np.arange(counts.sum())]
+
+    def _recent_collaborators(self, artist, work):
+        """Distinct notable contributors of each artist's ``work`` rows, as ``artist * n + person`` keys."""
+        rows, people = self.credits(work)
+        keys = np.unique(artist[rows] * self.num_nodes + people)
+        return keys[self.notable[keys % self.num_nodes]]
+
+    def scores(self, window=RECENT_WINDOW):
+        """Per-node metrics as a DataFrame (rows indexed like the graph's nodes)."""
+        n = self.num_nodes
+        start, end = _year_start(window[0]), _year_start(window[1])
+        artist, other = self.incident_artist, self.incident_other
+
+        # Whole career: works, genres, notable dated works, notable people linked directly
+        works = self.work[other]
+        total_works = _distinct_count(artist[works], other[works], n, n)
+        genres = works & self.has_genre[other]
+        genre_spread = _distinct_count(artist[genres], self.genre[other[genres]], n, self.num_genres)
+        linked_artist, linked_work = self.linked_artist, self.linked_work
+        timeline_works = _group_count(linked_artist, n)
+        notable_works = _group_count(linked_artist[self.notable[linked_work]], n)
+        people = self.person[other]
+        collaborators = np.unique(artist[people] * n + other[people])
+        collaboration_score = _group_count(collaborators // n, n, self.notable[collaborators % n]).astype(np.int64)
+
+        # Time to success: first notable dated work minus first dated work, both in link order
+        _, first = np.unique(linked_artist, return_index=True)
+        notable = np.flatnonzero(self.notable[linked_work])
+        _, first_notable = np.unique(linked_artist[notable], return_index=True)
+        time_to_success = np.full(n, np.nan)
+        begin = np.full(n, 0, dtype=np.int64)
+        begin[linked_artist[first]] = self.release[linked_work[first]]
+        hit = linked_artist[notable[first_notable]]
+        time_to_success[hit] = (self.release[linked_work[notable[first_notable]]] - begin[hit]) / _SECONDS_PER_YEAR
+
+        # The window and everything released since its start
+        released = self.release[linked_work]
+        in_window = _group_count(linked_artist[(released >= start) & (released < end)], n) > 0
+        recent = released >= start
+        recent_artist, recent_work = linked_artist[recent], linked_work[recent]
+        recent_works = _group_count(recent_artist, n)
+        recent_notable = _group_count(recent_artist[self.notable[recent_work]], n)
+        recent_genres = _distinct_count(recent_artist, self.genre[recent_work], n, self.num_genres)
+        recent_keys = self._recent_collaborators(recent_artist, recent_work)
+
+        # Each person takes the metrics of the first node with its name, minus itself as a collaborator
+        m = self.metrics_node
+        own = np.isin(m * n + np.arange(n), recent_keys)
+        recent_collaboration = _group_count(recent_keys // n, n)[m] - own
+
+        frame = pd.DataFrame({
+            'id': self.ids,
+            'name': self.names,
+            'notable_works': notable_works[m],
+            'genre_spread': genre_spread[m],
+            'collaboration_score': collaboration_score[m],
+            'time_to_success': time_to_success[m],
+            'total_works': total_works[m],
+            'timeline_works': timeline_works[m],
+            'in_window': in_window[m],
+            'recent_works': recent_works[m],
+            'recent_notable_works': recent_notable[m],
+            'recent_genre_spread': recent_genres[m],
+            'recent_collaboration_score': recent_collaboration,
+        })
+        frame['score'] = potential_scores(frame['recent_notable_works'], frame['recent_genre_spread'],
+                                          frame['recent_collaboration_score'], frame['time_to_success'])
+        return frame
+
+    def ranking(self, window=RECENT_WINDOW):
+        """Oceanus Folk contributors with a notable work, three dated works and a release in
+        ``window``, best potential score first (ties in node order)."""
+        candidate = self.incident_contributor & self.oceanus_folk[self.incident_other]
+        oceanus = self.person & (_group_count(self.incident_artist[candidate], self.num_nodes) > 0)
+        frame = self.scores(window)
+        keep = (oceanus & (frame['notable_works'] > 0) & (frame['timeline_works'] >= 3) & frame['in_window']).to_numpy()
+        ranked = frame[keep].drop(columns='in_window')
+        ranked = ranked.iloc[np.argsort(-ranked['score'].to_numpy(), kind='stable')]
+        ranked.insert(0, 'rank', np.arange(1, len(ranked) + 1))
+        return ranked.reset_index(drop=True)
+
+
+def potential_scores(notable_works, genre_spread, collaboration_score, time_to_success):
+    """The page's potential score: an early first hit (under five years) plus notable works,
+    genres and notable collaborators; a time to success of 0 or unknown adds nothing."""
+    time_to_success = np.asarray(time_to_success, dtype=float)
+    early = np.where(np.isnan(time_to_success) | (time_to_success == 0), 0,
+                     np.maximum(0, 5 - np.nan_to_num(time_to_success)))
+    return early + np.asarray(notable_works) * 2 + np.asarray(genre_spread) + np.asarray(collaboration_score) * 1.5
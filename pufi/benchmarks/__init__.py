@@ -0,0 +1,4 @@
+"""Benchmarks for the MC1 analysis pipeline.
+
+Run from the ``pufi`` directory, e.g. ``python -m benchmarks.bench_loader``.
+"""
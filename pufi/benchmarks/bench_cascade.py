@@ -0,0 +1,59 @@
+"""Cascade sizes of every notable work: one reverse BFS per work vs the SCC condensation DP.
+
+``bfs`` walks the predecessors of each notable work separately (the work
+grows with works x ancestry); ``condensed`` is :func:`cascade.cascades`,
+which computes every node at once.  Both run on the collapsed
+creative-influence subgraph and must agree.
+
+    python -m benchmarks.bench_cascade [MC1_graph.json] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from cascade import cascade_sizes_bfs, cascades
+from csr_graph import CSRGraph
+from edge_table import EdgeTable
+from graph_loader import load_graph
+
+
+def _best(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(path, repeat=3):
+    graph = load_graph(path)
+    csr = CSRGraph.from_arrays(graph)
+    creative = csr.edge_subgraph(EdgeTable.from_arrays(graph).category_mask('creative_influences'))
+    notable = np.flatnonzero(np.asarray(graph.columns['notable']) == 1)
+
+    bfs_seconds, bfs_sizes = _best(lambda: cascade_sizes_bfs(creative, notable), 1)
+    dp_seconds, (sizes, _) = _best(lambda: cascades(creative), repeat)
+    assert np.array_equal(sizes[notable], bfs_sizes)
+    return {'works': len(notable), 'bfs': bfs_seconds, 'condensed': dp_seconds,
+            'mean_size': float(bfs_sizes.mean()) if len(notable) else 0.0}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    r = run(args.path, args.repeat)
+    print(f"{r['works']:,} notable works, mean cascade size {r['mean_size']:.1f}\n")
+    print(f"{'method':>10} {'wall (s)':>10} {'speedup':>8}")
+    print("-" * 30)
+    for name in ('bfs', 'condensed'):
+        print(f"{name:>10} {r[name]:>10.3f} {r['bfs'] / r[name]:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
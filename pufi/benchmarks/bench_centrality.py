@@ -0,0 +1,69 @@
+"""Wall time of sampled betweenness versus worker processes, plus PageRank.
+
+Each worker count runs the same ``k`` seeded sources on the full graph, so
+the scores are identical and only the wall time changes.  NetworkX's
+``betweenness_centrality(G, k=...)`` with the same seed is timed once as
+the single-core reference (skip it with ``--no-networkx``).
+
+    python -m benchmarks.bench_centrality [MC1_graph.json] [--samples 500] [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from centrality import betweenness, pagerank
+from csr_graph import CSRGraph
+from graph_loader import load_graph
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def run(path, samples=500, workers=(1, 2, 4), networkx=True, seed=0):
+    graph = load_graph(path)
+    csr = CSRGraph.from_arrays(graph)
+    simple = csr.edge_subgraph(np.ones(csr.num_edges, dtype=bool))
+
+    results = {'pagerank': _timed(lambda: pagerank(csr.num_nodes, csr.src, csr.dst))[0], 'betweenness': {}}
+    reference = None
+    for count in workers:
+        seconds, values = _timed(lambda: betweenness(simple, samples, seed, count))
+        results['betweenness'][count] = seconds
+        reference = values if reference is None else reference
+        assert np.allclose(values, reference, equal_nan=True)
+    if networkx:
+        import networkx as nx
+        G = graph.to_networkx()
+        results['networkx'] = _timed(lambda: nx.betweenness_centrality(G, k=samples, seed=seed))[0]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--samples', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    parser.add_argument('--no-networkx', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.samples, args.workers, not args.no_networkx)
+    print(f"{os.cpu_count()} CPUs, betweenness from {args.samples} sampled sources\n")
+    print(f"{'workers':>10} {'wall (s)':>10} {'speedup':>8}")
+    print("-" * 30)
+    base = results['betweenness'][args.workers[0]]
+    for count, seconds in results['betweenness'].items():
+        print(f"{count:>10} {seconds:>10.2f} {base / seconds:>7.2f}x")
+    if 'networkx' in results:
+        print(f"{'networkx':>10} {results['networkx']:>10.2f} {base / results['networkx']:>7.2f}x")
+    print(f"\nPageRank (full graph): {results['pagerank'] * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Export-stage wall time and peak heap: in-memory pipeline vs the chunked out-of-core mode.
+
+``in_memory`` is ``eda.py --only export`` on a cold graph cache; ``chunked`` is
+:func:`chunked.run` at each chunk size.  Peak is the tracemalloc high-water
+mark (memory-mapped spill files are not heap).  Output files are compared
+byte for byte.  The cascade ancestry bitsets are usually the largest
+buffer of both runs; ``--cascade-memory-mb`` shrinks them for the chunked
+runs.
+
+    python -m benchmarks.bench_chunked [MC1_graph.json] [--chunk-sizes 10000 100000] [--cascade-memory-mb 4]
+"""
+
+import argparse
+import contextlib
+import filecmp
+import io
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import chunked
+from cascade import DEFAULT_MEMORY_MB
+from eda import pipeline
+
+FILES = ('songs_albums_analysis.csv', 'network_metrics.json', 'edge_analysis.json', 'cascade_metrics.csv')
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'seconds': seconds, 'peak_mb': peak / 2**20}
+
+
+def run(path, chunk_sizes=(10_000, 100_000), cascade_memory_mb=DEFAULT_MEMORY_MB):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # A private copy, so the in-memory run parses cold and its cache stays in tmp
+        graph_path = shutil.copy(path, os.path.join(tmp, os.path.basename(path)))
+        reference = os.path.join(tmp, 'in_memory')
+        results['in_memory'] = _measure(lambda: pipeline.run(['export'], graph_path=graph_path,
+                                                             out_dir=reference))
+        for size in chunk_sizes:
+            out = os.path.join(tmp, f'chunked-{size}')
+            results[f'chunked {size:,}'] = _measure(
+                lambda: chunked.run(graph_path, out, size, cascade_memory_mb=cascade_memory_mb))
+            for name in FILES:
+                assert filecmp.cmp(os.path.join(reference, name), os.path.join(out, name), shallow=False), name
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--cascade-memory-mb', type=float, default=DEFAULT_MEMORY_MB,
+                        help="bitset budget of the chunked runs' cascade pass")
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.chunk_sizes, args.cascade_memory_mb)
+    print(f"{'mode':>18} {'wall (s)':>10} {'peak (MB)':>10}")
+    print("-" * 40)
+    for name, r in results.items():
+        print(f"{name:>18} {r['seconds']:>10.2f} {r['peak_mb']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
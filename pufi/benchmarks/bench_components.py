@@ -0,0 +1,74 @@
+"""Weak and strong components: NetworkX sets vs the CSR component engine.
+
+``networkx`` is what Section 4 used to do: materialize
+``list(nx.weakly_connected_components(G))`` / ``strongly_...`` and take the
+lengths.  ``csr`` is :meth:`CSRGraph.weakly_connected_components` (vectorized
+union-find) and :meth:`CSRGraph.strongly_connected_components` (trimming plus
+iterative Tarjan on the core), both returning dense labels; sizes come from
+``np.bincount``.  The two partitions are checked to agree.
+
+    python -m benchmarks.bench_components [MC1_graph.json] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from csr_graph import CSRGraph, dense_labels
+from graph_loader import load_graph
+
+
+def _best(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _labels(graph, components):
+    labels = np.empty(graph.num_nodes, dtype=np.int64)
+    for k, members in enumerate(components):
+        labels[[graph.node_index[n] for n in members]] = k
+    return dense_labels(labels)
+
+
+def run(path, repeat=3):
+    import networkx as nx
+
+    graph = load_graph(path)
+    G = graph.to_networkx()
+    csr = CSRGraph.from_arrays(graph)
+    cases = {
+        'weak': (nx.weakly_connected_components, csr.weakly_connected_components),
+        'strong': (nx.strongly_connected_components, csr.strongly_connected_components),
+    }
+    results = {}
+    for name, (reference, engine) in cases.items():
+        nx_seconds, components = _best(lambda: list(reference(G)), repeat)
+        csr_seconds, (labels, count) = _best(engine, repeat)
+        expected, expected_count = _labels(graph, components)
+        assert count == expected_count and np.array_equal(labels, expected), name
+        results[name] = {'count': count, 'largest': int(np.bincount(labels).max()),
+                         'networkx': nx_seconds, 'csr': csr_seconds}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.repeat)
+    print(f"{'components':>10} {'count':>9} {'largest':>9} {'networkx (ms)':>14} {'csr (ms)':>10} {'speedup':>8}")
+    print("-" * 65)
+    for name, r in results.items():
+        print(f"{name:>10} {r['count']:>9,} {r['largest']:>9,} {r['networkx'] * 1000:>14.1f} "
+              f"{r['csr'] * 1000:>10.1f} {r['networkx'] / r['csr']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Latency of 2-hop ego-network queries from every Person node.
+
+For each edge filter three timings are reported per query: ``index`` (the
+array walk only), ``cold`` (walk plus building the JSON-ready result, cache
+bypassed) and ``cached`` (a repeat hitting the LRU cache).
+
+    python -m benchmarks.bench_ego [MC1_graph.json] [--hops 2]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from ego_query import load_index
+
+FILTERS = ('all', 'creative_influences', 'professional_roles')
+
+
+def _latencies(func, args):
+    times = np.empty(len(args))
+    for k, arg in enumerate(args):
+        start = time.perf_counter()
+        func(arg)
+        times[k] = time.perf_counter() - start
+    return times
+
+
+def run(path, hops=2, filters=FILTERS):
+    with contextlib.redirect_stdout(io.StringIO()):
+        index = load_index(path, cache_size=None)
+    people = [i for i, t in enumerate(index.types) if t == 'Person']
+    people_ids = [index.graph.node_ids[i] for i in people]
+    results = {}
+    for edge_filter in filters:
+        key = index.edge_filter_key(edge_filter)
+        index.adjacency(key)
+        sizes = []
+
+        def cold(node_id):
+            sizes.append(len(index._query(node_id, hops, key)['nodes']))
+
+        results[edge_filter] = {
+            'index': _latencies(lambda i: index.neighborhood(i, hops, key), people),
+            'cold': _latencies(cold, people_ids),
+        }
+        for node_id in people_ids:
+            index.ego(node_id, hops, key)
+        results[edge_filter]['cached'] = _latencies(lambda n: index.ego(n, hops, key), people_ids)
+        results[edge_filter]['mean_nodes'] = float(np.mean(sizes)) if sizes else 0.0
+    return results, len(people)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--hops', type=int, default=2)
+    args = parser.parse_args(argv)
+
+    results, people = run(args.path, args.hops)
+    print(f"{people:,} Person nodes, {args.hops}-hop queries (latency in ms)\n")
+    print(f"{'edges':>20} {'timing':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'mean nodes':>11}")
+    print("-" * 76)
+    for edge_filter, r in results.items():
+        for timing in ('index', 'cold', 'cached'):
+            ms = r[timing] * 1000
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            print(f"{edge_filter:>20} {timing:>7} {p50:>8.3f} {p95:>8.3f} {p99:>8.3f} {ms.max():>8.3f} "
+                  f"{r['mean_nodes']:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
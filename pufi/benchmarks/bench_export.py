@@ -0,0 +1,79 @@
+"""File size and parse time: songs_albums_analysis.csv vs the Parquet / Arrow exports.
+
+CSV timings include coercing the strings back to the typed dtypes, which is
+what every consumer of the CSV has to do; the gzip column is the transfer
+size when the file is served with HTTP compression.
+
+    python -m benchmarks.bench_export [MC1_graph.json] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from columnar_export import coerce_csv, export_songs_albums, read_typed
+
+
+def _songs_albums(path):
+    from eda import pipeline
+    with contextlib.redirect_stdout(io.StringIO()):
+        return pipeline.run(['node_table'], graph_path=path)['node_table']['df_songs_albums']
+
+
+def _best(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(path, repeat=20):
+    df = _songs_albums(path)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'songs_albums_analysis.csv')
+        df.to_csv(csv_path, index=False)
+        files = {'csv': csv_path}
+        files.update(zip(('parquet', 'arrow'), export_songs_albums(df, tmp, ('parquet', 'arrow'))))
+        readers = {
+            'csv': lambda: coerce_csv(pd.read_csv(csv_path)),
+            'parquet': lambda: read_typed(files['parquet']),
+            'arrow': lambda: read_typed(files['arrow']),
+        }
+        for fmt, file_path in files.items():
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            results[fmt] = {
+                'bytes': len(raw),
+                'gzip_bytes': len(gzip.compress(raw, 6)),
+                'seconds': _best(readers[fmt], repeat),
+            }
+    return results, len(df)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results, rows = run(args.path, args.repeat)
+    csv = results['csv']
+    print(f"{'format':>8} {'size (KB)':>10} {'gzip (KB)':>10} {'read (ms)':>10} {'vs CSV':>8}")
+    print("-" * 50)
+    for fmt, r in results.items():
+        print(f"{fmt:>8} {r['bytes'] / 1024:>10.1f} {r['gzip_bytes'] / 1024:>10.1f} "
+              f"{r['seconds'] * 1000:>10.2f} {csv['seconds'] / r['seconds']:>7.1f}x")
+    print(f"\n{rows:,} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Wall time of drawing the eda.py figures: in-process vs a process pool vs an unchanged re-run.
+
+The figure stages are evaluated once to collect their specs; each mode then
+renders them into a fresh directory (``workers=0`` draws one after the other
+in this process, the pool draws them in parallel with Agg), and the cached
+mode re-renders into the pool's directory, where every chart is up to date
+and only the data hashes are computed.  Every mode must produce the same
+set of files.
+
+    python -m benchmarks.bench_figures [MC1_graph.json] [--formats png svg] [--workers 2 4] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+
+import figures
+from eda import DEFAULT_STAGES, pipeline
+
+
+def _specs(path):
+    targets = [name for name in DEFAULT_STAGES if pipeline.stages[name].figure]
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = pipeline.run(targets, graph_path=path)
+    return [spec for name in targets for spec in run[name]]
+
+
+def _best(func, repeat, setup=None):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(path, formats=('png',), workers=(2, 4), repeat=3):
+    specs = _specs(path)
+    expected = {f"{spec.name}.{fmt}" for spec in specs for fmt in formats}
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        modes = [('in-process', 0)] + [(f'pool ({n})', n) for n in workers]
+        for mode, n in modes:
+            out = os.path.join(tmp, mode)
+            results[mode], (drawn, _) = _best(lambda: figures.render(specs, out, formats, workers=n), repeat,
+                                              setup=lambda: shutil.rmtree(out, ignore_errors=True))
+            assert {os.path.basename(p) for p in drawn} == expected, mode
+        results['cached'], (drawn, cached) = _best(lambda: figures.render(specs, out, formats), repeat)
+        assert not drawn and {os.path.basename(p) for p in cached} == expected
+    return len(specs), results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--formats', nargs='+', default=['png'], choices=['png', 'svg', 'pdf'])
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    count, results = run(args.path, args.formats, args.workers, args.repeat)
+    baseline = results['in-process']
+    print(f"{count} figures x {len(args.formats)} formats, {os.cpu_count()} CPUs available\n")
+    print(f"{'mode':>12} {'wall (s)':>10} {'speedup':>8}")
+    print("-" * 32)
+    for name, seconds in results.items():
+        print(f"{name:>12} {seconds:>10.3f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Genre influence matrices for every window: one filtered groupby per window vs one bincount pass.
+
+``per_window`` filters the creative edge table to each window and runs a
+pandas ``groupby`` on (edge type, influencer genre, influenced genre), the
+way genreMatrix.js recomputes per year range.  ``one_pass`` is
+:func:`genre_matrix.influence_matrix`, which fills all windows at once.
+Both are run for decades and for single years and must agree.
+
+    python -m benchmarks.bench_genre_matrix [MC1_graph.json] [--repeat 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from edge_table import EDGE_CATEGORIES
+from genre_matrix import influence_matrix
+from graph_loader import load_graph
+from node_frame import node_years
+
+
+def _edge_frame(graph):
+    types = pd.Categorical.from_codes(np.asarray(graph.edge_type, dtype=np.int32), categories=graph.edge_types)
+    genre = np.asarray(graph.columns['genre'])
+    dst = np.asarray(graph.edge_dst)
+    df = pd.DataFrame({
+        'edge_type': types,
+        'influencer': genre[dst],
+        'influenced': genre[np.asarray(graph.edge_src)],
+        'year': node_years(graph, 'release_date')[dst],
+    })
+    return df[df['edge_type'].isin(EDGE_CATEGORIES['creative_influences'])
+              & (df['influencer'] >= 0) & (df['influenced'] >= 0)]
+
+
+def _per_window(df, starts, window):
+    return [df[(df['year'] >= start) & (df['year'] < start + window)]
+            .groupby(['edge_type', 'influencer', 'influenced'], observed=True).size()
+            for start in starts]
+
+
+def _best(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(path, repeat=5, windows=(10, 1)):
+    graph = load_graph(path)
+    df = _edge_frame(graph)
+    results = {}
+    for window in windows:
+        one_pass, matrix = _best(lambda: influence_matrix(graph, window=window), repeat)
+        starts = matrix['window_starts']
+        per_window, groups = _best(lambda: _per_window(df, starts, window), repeat)
+        type_index = {name: k for k, name in enumerate(matrix['edge_types'])}
+        for w, group in enumerate(groups):
+            for (edge_type, i, j), count in group.items():
+                assert matrix['counts'][w, type_index[edge_type], i, j] == count
+            assert matrix['counts'][w].sum() == group.sum()
+        results[window] = {'windows': len(starts), 'per_window': per_window, 'one_pass': one_pass}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.repeat)
+    print(f"{'window':>7} {'windows':>8} {'per_window (ms)':>16} {'one_pass (ms)':>14} {'speedup':>8}")
+    print("-" * 57)
+    for window, r in results.items():
+        print(f"{window:>7} {r['windows']:>8} {r['per_window'] * 1000:>16.1f} {r['one_pass'] * 1000:>14.1f} "
+              f"{r['per_window'] / r['one_pass']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Notable vs non-notable influence tallies: per-edge set membership vs bincount over a split.
+
+``sets`` is what Section 5 used to do: build ``notable_songs_albums`` /
+``non_notable_songs_albums`` id sets from DataFrame filters, loop over the
+creative-influence ``(source, target, type)`` tuples testing membership,
+and take in/out degrees node by node from the NetworkX creative subgraph.
+``split`` is :func:`influence_split.split_tallies` and
+:func:`~influence_split.split_values` over index arrays (plus the CSR
+subgraph degrees).  The two are checked to agree; ``genre`` times the same
+tallies for the split by genre (every genre a group) for comparison.
+
+    python -m benchmarks.bench_influence_split [MC1_graph.json] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from edge_table import EdgeTable
+from graph_loader import load_graph
+from influence_split import split_codes, split_tallies, split_values
+from node_frame import WORK_TYPES, node_frame, songs_albums, type_mask
+
+
+def _best(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _sets(graph, df, creative_edges):
+    import networkx as nx
+
+    notable = set(df[df['notable'] == True]['id'])
+    non_notable = set(df[df['notable'] == False]['id'])
+    counts = dict.fromkeys(('notable_received', 'notable_given', 'non_notable_received', 'non_notable_given'), 0)
+    for source, target, _ in creative_edges:
+        counts['notable_received'] += target in notable
+        counts['non_notable_received'] += target in non_notable
+        counts['notable_given'] += source in notable
+        counts['non_notable_given'] += source in non_notable
+    subgraph = nx.DiGraph()
+    subgraph.add_edges_from((source, target) for source, target, _ in creative_edges)
+    in_degrees = [subgraph.in_degree(n) for n in subgraph.nodes() if n in notable]
+    return counts, sorted(in_degrees)
+
+
+def _split(num_nodes, edges, creative, notable_mask, non_notable_mask):
+    groups = split_codes(notable_mask, non_notable_mask)
+    tallies = split_tallies(groups, 2, edges.src[creative], edges.dst[creative], edges.edge_type[creative],
+                            len(edges.type_names))
+    subgraph = CSRGraph(num_nodes, edges.src, edges.dst).edge_subgraph(creative)
+    in_degrees = split_values(subgraph.in_degree(), groups, 2, subgraph.has_edges())[0]
+    received, given = tallies['received'].sum(axis=1), tallies['given'].sum(axis=1)
+    counts = {'notable_received': int(received[0]), 'notable_given': int(given[0]),
+              'non_notable_received': int(received[1]), 'non_notable_given': int(given[1])}
+    return counts, sorted(in_degrees.tolist())
+
+
+def run(path, repeat=3):
+    graph = load_graph(path)
+    edges = EdgeTable.from_arrays(graph)
+    nodes = node_frame(graph)
+    work_mask = type_mask(nodes, WORK_TYPES)
+    notable_mask = work_mask & nodes['notable'].fillna(False).to_numpy(dtype=bool)
+    creative = edges.category_mask('creative_influences')
+    ids = np.flatnonzero(creative)
+    creative_edges = list(zip([graph.node_ids[i] for i in edges.src[ids]],
+                              [graph.node_ids[i] for i in edges.dst[ids]],
+                              [edges.type_names[t] for t in edges.edge_type[ids]]))
+    df = songs_albums(nodes)
+
+    sets_seconds, expected = _best(lambda: _sets(graph, df, creative_edges), repeat)
+    split_seconds, result = _best(
+        lambda: _split(graph.num_nodes, edges, creative, notable_mask, work_mask & ~notable_mask), repeat)
+    assert result == expected
+    genre = np.asarray(graph.columns['genre'], dtype=np.int64)
+    genre_seconds, _ = _best(lambda: split_tallies(genre, len(graph.categories['genre']), edges.src[ids],
+                                                   edges.dst[ids], edges.edge_type[ids], len(edges.type_names)),
+                             repeat)
+    return {'edges': len(ids), 'sets': sets_seconds, 'split': split_seconds, 'genre': genre_seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    r = run(args.path, args.repeat)
+    print(f"{r['edges']:,} creative-influence edges\n")
+    print(f"{'method':>16} {'time (ms)':>10} {'speedup':>8}")
+    print("-" * 36)
+    for name in ('sets', 'split', 'genre'):
+        label = {'sets': 'sets + networkx', 'split': 'split (notable)', 'genre': 'split (genre)'}[name]
+        print(f"{label:>16} {r[name] * 1e3:>10.2f} {r['sets'] / r[name]:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Force layout time and stress against node count: exact vs Barnes–Hut vs multilevel.
+
+Every scale lays out the whole graph of a synthetic MC1-shaped graph
+(:mod:`synthetic_graph`, generated in memory) with
+:func:`force_layout.force_layout`:
+
+- ``exact``: one level, all-pairs repulsion (``O(n**2)`` per iteration, only
+  up to ``--exact-max`` nodes);
+- ``barnes-hut``: one level, quadtree repulsion;
+- ``multilevel``: coarsened by matching, quadtree repulsion (the default).
+
+Quality is :func:`force_layout.stress` against hop distances from the same
+pivots, next to the stress of uniformly random positions.  ``--grid`` adds
+square lattices, whose ideal layout is known (stress near 0) and which a
+single level tends to leave folded.
+
+    python -m benchmarks.bench_layout [--scales 1k 4k 16k 64k] [--grid 40 80] [--iterations 50] [--exact-max 4k]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import synthetic_graph
+from force_layout import DEFAULT_ITERATIONS, force_layout, stress
+
+METHODS = {
+    'exact': dict(exact=True, multilevel=False),
+    'barnes-hut': dict(multilevel=False),
+    'multilevel': dict(),
+}
+
+
+def _best(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def grid(side):
+    """Edges of a ``side`` x ``side`` lattice."""
+    index = np.arange(side * side).reshape(side, side)
+    return (np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()]),
+            np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()]))
+
+
+def run(num_nodes, iterations=DEFAULT_ITERATIONS, exact_max=4000, repeat=1, seed=0, lattice=False):
+    if lattice:
+        (src, dst), n = grid(num_nodes), num_nodes * num_nodes
+    else:
+        g = synthetic_graph.generate(num_nodes, seed)
+        src, dst, n = g['edge_src'], g['edge_dst'], len(g['node_type'])
+    results = {'nodes': n, 'edges': len(src),
+               'random': stress(np.random.default_rng(seed).random((n, 2)), src, dst, seed=seed)}
+    for name, options in METHODS.items():
+        if name == 'exact' and n > exact_max:
+            continue
+        seconds, pos = _best(lambda: force_layout(n, src, dst, iterations, seed, **options), repeat)
+        results[name] = (seconds, stress(pos, src, dst, seed=seed))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', nargs='+', default=['1k', '4k', '16k', '64k'])
+    parser.add_argument('--grid', nargs='*', type=int, default=[], metavar='SIDE')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument('--exact-max', default='4k', help="largest graph laid out with exact repulsion")
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"{'graph':>9} {'nodes':>8} {'edges':>8} {'method':>11} {'time (s)':>9} {'stress':>7} {'random':>7}")
+    print("-" * 66)
+    cases = [(synthetic_graph.parse_count(scale), False) for scale in args.scales]
+    for size, lattice in cases + [(side, True) for side in args.grid]:
+        r = run(size, args.iterations, synthetic_graph.parse_count(args.exact_max), args.repeat, lattice=lattice)
+        for name in METHODS:
+            if name in r:
+                seconds, quality = r[name]
+                print(f"{'grid' if lattice else 'synthetic':>9} {r['nodes']:>8,} {r['edges']:>8,} {name:>11} "
+                      f"{seconds:>9.2f} {quality:>7.3f} {r['random']:>7.3f}")
+
+
+if __name__ == '__main__':
+    main()
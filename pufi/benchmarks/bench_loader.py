@@ -0,0 +1,87 @@
+"""Peak RSS and wall time: ``json.load`` + ``nx.node_link_graph`` vs the streaming loader.
+
+Each path runs in a fresh interpreter so peak RSS is not polluted by the other.
+
+    python -m benchmarks.bench_loader [MC1_graph.json] [--repeat 3]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+
+def _worker(method, path):
+    # Baseline RSS after imports, so the report shows what loading itself costs
+    if method == 'networkx':
+        import networkx as nx
+    else:
+        from graph_loader import load_graph
+    base_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if method == 'networkx':
+        with open(path, 'r', encoding='utf-8') as f:
+            graph_data = json.load(f)
+        try:
+            G = nx.node_link_graph(graph_data, edges='links')
+        except TypeError:  # networkx < 3.4
+            G = nx.node_link_graph(graph_data)
+        nodes, edges = G.number_of_nodes(), G.number_of_edges()
+    elif method == 'stream':
+        graph = load_graph(path)
+        nodes, edges = graph.num_nodes, graph.num_edges
+    else:
+        # Streaming loader followed by a NetworkX graph, as eda.py now does
+        G = load_graph(path).to_networkx()
+        nodes, edges = G.number_of_nodes(), G.number_of_edges()
+    elapsed = time.perf_counter() - start
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'seconds': elapsed, 'peak_kb': peak_kb, 'base_kb': base_kb,
+                      'nodes': nodes, 'edges': edges}))
+
+
+def run(path, repeat=3, methods=('networkx', 'stream', 'stream+networkx')):
+    results = {}
+    for method in methods:
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_loader', '--worker', method, path],
+                check=True, capture_output=True, text=True,
+            )
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        results[method] = {
+            'seconds': min(r['seconds'] for r in runs),
+            'peak_mb': max(r['peak_kb'] for r in runs) / 1024,
+            'load_mb': max(r['peak_kb'] - r['base_kb'] for r in runs) / 1024,
+            'nodes': runs[0]['nodes'],
+            'edges': runs[0]['edges'],
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _worker(args.worker, args.path)
+        return
+
+    results = run(args.path, args.repeat)
+    print(f"{'method':>16} {'wall (s)':>10} {'peak RSS (MB)':>14} {'load delta (MB)':>16}")
+    print("-" * 60)
+    for method, r in results.items():
+        print(f"{method:>16} {r['seconds']:>10.3f} {r['peak_mb']:>14.1f} {r['load_mb']:>16.1f}")
+    print(f"\n{results['networkx']['nodes']:,} nodes, {results['networkx']['edges']:,} edges")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Build time and memory: per-node dict extraction from NetworkX vs the typed node table.
+
+``dicts`` is the original Section 1 path: ``G.nodes[node].get(...)`` per
+attribute, a list of dicts and ``pd.DataFrame`` on top.  ``typed`` is
+``node_frame`` + ``songs_albums`` over the loader's code arrays.  Peak is the
+tracemalloc high-water mark of one build; table is the resulting frames'
+deep memory usage.
+
+    python -m benchmarks.bench_node_table [MC1_graph.json] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import pandas as pd
+
+from graph_loader import load_graph
+from node_frame import node_frame, songs_albums
+
+
+def _dicts(G):
+    node_types = [G.nodes[node].get('Node Type', 'Unknown') for node in G.nodes()]
+    songs_and_albums = [node for node in G.nodes() if G.nodes[node].get('Node Type') in ['Song', 'Album']]
+    songs_albums_data = []
+    for node in songs_and_albums:
+        node_data = G.nodes[node]
+        songs_albums_data.append({
+            'id': node,
+            'type': node_data.get('Node Type'),
+            'genre': node_data.get('genre'),
+            'notable': node_data.get('notable', False),
+            'release_date': node_data.get('release_date'),
+            'notoriety_date': node_data.get('notoriety_date'),
+            'written_date': node_data.get('written_date'),
+            'single': node_data.get('single') if node_data.get('Node Type') == 'Song' else None
+        })
+    df = pd.DataFrame(songs_albums_data)
+    df['release_year'] = pd.to_numeric(df['release_date'], errors='coerce')
+    df['notoriety_year'] = pd.to_numeric(df['notoriety_date'], errors='coerce')
+    return [pd.Series(node_types), df]
+
+
+def _typed(graph):
+    nodes = node_frame(graph)
+    return [nodes, songs_albums(nodes)]
+
+
+def _measure(build, arg, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(arg)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    frames = build(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    table = sum(int(pd.DataFrame(f).memory_usage(deep=True).sum()) for f in frames)
+    return {'seconds': best, 'peak_mb': peak / 2**20, 'table_mb': table / 2**20, 'rows': len(frames[1])}
+
+
+def run(path, repeat=5):
+    graph = load_graph(path)
+    G = graph.to_networkx()
+    return {'dicts': _measure(_dicts, G, repeat), 'typed': _measure(_typed, graph, repeat)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.repeat)
+    print(f"{'path':>8} {'build (ms)':>11} {'peak (MB)':>10} {'table (MB)':>11}")
+    print("-" * 44)
+    for name, r in results.items():
+        print(f"{name:>8} {r['seconds'] * 1000:>11.1f} {r['peak_mb']:>10.1f} {r['table_mb']:>11.1f}")
+    print(f"\n{results['typed']['rows']:,} songs/albums")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Wall time of the non-figure report: serial pipeline vs the parallel runner at 1..N workers.
+
+Each run evaluates the default stages without figures on a warm graph cache
+and writes into its own directory; every output file of the parallel runs
+is compared byte for byte with the serial one.  The speedup ceiling is set
+by the longest dependency chain (load -> node/edge tables -> influence ->
+cascade -> export) and by the number of cores.
+
+    python -m benchmarks.bench_parallel [MC1_graph.json] [--workers 1 2 4 8] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import filecmp
+import io
+import os
+import tempfile
+import time
+
+import parallel_runner
+from eda import DEFAULT_STAGES, pipeline
+
+
+def _files(root):
+    for folder, _, names in os.walk(root):
+        for name in names:
+            yield os.path.relpath(os.path.join(folder, name), root)
+
+
+def _best(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(path, workers=(1, 2, 4, 8), repeat=3):
+    targets = [name for name in DEFAULT_STAGES if not pipeline.stages[name].figure]
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline.run(['load'], graph_path=path)  # warm the column cache
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = os.path.join(tmp, 'serial')
+        results['serial'] = _best(lambda: pipeline.run(targets, graph_path=path, out_dir=reference), repeat)
+        for n in workers:
+            out = os.path.join(tmp, f'parallel-{n}')
+            results[f'{n} workers'] = _best(
+                lambda: parallel_runner.run(pipeline, targets, workers=n, graph_path=path, out_dir=out), repeat)
+            for name in _files(reference):
+                assert filecmp.cmp(os.path.join(reference, name), os.path.join(out, name), shallow=False), name
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.workers, args.repeat)
+    serial = results['serial']
+    print(f"{os.cpu_count()} CPUs available\n")
+    print(f"{'mode':>12} {'wall (s)':>10} {'speedup':>8}")
+    print("-" * 32)
+    for name, seconds in results.items():
+        print(f"{name:>12} {seconds:>10.2f} {serial / seconds:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Rising-star ranking: per-artist link scans vs the vectorized ArtistIndex.
+
+``per-artist`` is the page logic as dashboard_payloads ran it before: for
+every person, scan its links for an Oceanus Folk credit, rebuild its
+metrics with :func:`dashboard_payloads.artist_metrics` and collect the
+recent collaborators from a work → contributors dict.  ``index`` builds
+:class:`artist_index.ArtistIndex` and ranks every artist in one pass.  Both
+rankings (ids and scores, in order) are checked to agree.
+
+    python -m benchmarks.bench_rising_stars [MC1_graph.json ...] [--window 2034 2039] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from artist_index import CONTRIBUTOR_EDGES, OCEANUS_FOLK, RECENT_WINDOW, ArtistIndex, potential_scores
+from dashboard_payloads import _View, artist_metrics
+from graph_cache import load_graph_cached
+
+
+def _best(func, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _per_artist(graph, window):
+    view = _View(graph)
+    start, end = pd.Timestamp(window[0], 1, 1), pd.Timestamp(window[1], 1, 1)
+    contributors = {}
+    for e, edge_type in enumerate(view.edge_types):
+        if edge_type in CONTRIBUTOR_EDGES:
+            source, target = int(view.src[e]), int(view.dst[e])
+            if view.types[source] == 'Person':
+                contributors.setdefault(view.ids[target], set()).add(source)
+            elif view.types[target] == 'Person':
+                contributors.setdefault(view.ids[source], set()).add(target)
+
+    stars = []
+    for artist, node_type in enumerate(view.types):
+        if node_type != 'Person' or not any(
+                view.edge_types[e] in CONTRIBUTOR_EDGES and view.genres[view.other(e, artist)] == OCEANUS_FOLK
+                for e in view.edges_of(artist)):
+            continue
+        metrics = artist_metrics(view, view.by_name[view.names[artist]])
+        dates = [pd.Timestamp(work['date']) for work in metrics['timeline']]
+        if metrics['notableWorks'] == 0 or len(dates) < 3 or not any(start <= d < end for d in dates):
+            continue
+        recent = [work for work, date in zip(metrics['timeline'], dates) if date >= start]
+        collaborators = {p for work in recent for p in contributors.get(work['id'], ())
+                         if p != artist and view.notable[p]}
+        score = potential_scores([sum(work['notable'] for work in recent)], [len({work['genre'] for work in recent})],
+                                 [len(collaborators)], [np.nan if metrics['timeToSuccess'] is None
+                                                        else metrics['timeToSuccess']])[0]
+        stars.append((view.ids[artist], score))
+    stars.sort(key=lambda star: -star[1])
+    return stars
+
+
+def _index(graph, window):
+    ranking = ArtistIndex(graph).ranking(window)
+    return list(zip(ranking['id'], ranking['score']))
+
+
+def run(path, window=RECENT_WINDOW, repeat=3):
+    graph = load_graph_cached(path)
+    loop_seconds, expected = _best(lambda: _per_artist(graph, window), repeat)
+    index_seconds, ranking = _best(lambda: _index(graph, window), repeat)
+    assert ranking == expected
+    return {'nodes': graph.num_nodes, 'candidates': len(ranking), 'per-artist': loop_seconds, 'index': index_seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=['MC1_graph.json'])
+    parser.add_argument('--window', nargs=2, type=int, default=list(RECENT_WINDOW), metavar=('START', 'END'))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'nodes':>10} {'ranked':>7} {'per-artist (s)':>15} {'index (s)':>10} {'speedup':>8}")
+    print("-" * 54)
+    for path in args.paths:
+        r = run(path, tuple(args.window), args.repeat)
+        print(f"{r['nodes']:>10,} {r['candidates']:>7,} {r['per-artist']:>15.3f} {r['index']:>10.3f} "
+              f"{r['per-artist'] / r['index']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
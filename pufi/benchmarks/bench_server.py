@@ -0,0 +1,135 @@
+"""Load test of data_server.py: requests/s and latency percentiles under concurrent clients.
+
+Starts ``python data_server.py`` in a subprocess (port 0) once per mode and
+drives it with ``--clients`` threads, each holding one keep-alive connection
+and sending ``--requests`` requests drawn round-robin from a query mix
+(filtered works, influence links, the songs/albums table, an ego network
+and, with ``--static``, a file under ``--root``) with
+``Accept-Encoding: gzip, br`` like a browser:
+
+- ``uncached``: ``--cache-mb 0``, every query is filtered, serialised and
+  compressed again;
+- ``cached``: the default LRU cache of encoded responses;
+- ``revalidate``: cached, and clients send back the ETag they were given
+  (``If-None-Match``), as a browser does for a ``no-cache`` response,
+  and get ``304 Not Modified``.
+
+Clients and server share the machine, so absolute numbers are a lower bound.
+
+    python -m benchmarks.bench_server [MC1_graph.json] [--clients 8] [--requests 200] [--static MC1_graph.json --root .]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import quote
+
+import numpy as np
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data_server.py')
+MODES = ('uncached', 'cached', 'revalidate')
+GENRE = 'Oceanus Folk'
+EGO_NAME = 'Sailor Shift'
+
+
+def _start(graph_path, cache_mb=None, root=None):
+    args = [sys.executable, SERVER, '--graph', graph_path, '--port', '0']
+    if cache_mb is not None:
+        args += ['--cache-mb', str(cache_mb)]
+    if root is not None:
+        args += ['--root', root]
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        if line.startswith('Serving'):
+            return proc, int(line.split('http://')[1].split(':')[1].split('/')[0])
+    raise RuntimeError(f"data_server.py exited with {proc.wait()}")
+
+
+def _get(conn, path, headers=None):
+    conn.request('GET', path, headers={'Accept-Encoding': 'gzip, br', **(headers or {})})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def query_mix(port, static=None):
+    """Paths of the load test; the ego centre falls back to the first person without Sailor Shift."""
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    genre = quote(GENRE)
+    ego = f'/ego?name={quote(EGO_NAME)}&hops=2'
+    if _get(conn, ego)[0].status != 200:
+        conn.request('GET', '/nodes?type=Person&limit=1')
+        ego = f"/ego?id={json.loads(conn.getresponse().read())['nodes'][0]['id']}&hops=2"
+    conn.close()
+    paths = [
+        f'/nodes?type=Song,Album&genre={genre}&notable=true',
+        f'/links?edges=creative_influences&genre={genre}&side=target',
+        '/songs_albums?years=2030-&notable=true',
+        ego,
+        f'/graph?genre={genre}&edges=creative_influences',
+    ]
+    return paths + ([f'/{static}'] if static else [])
+
+
+def _client(port, paths, requests, offset, revalidate, latencies, sizes):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    etags = {}
+    for i in range(requests):
+        path = paths[(offset + i) % len(paths)]
+        headers = {'If-None-Match': etags[path]} if revalidate and path in etags else None
+        start = time.perf_counter()
+        response, body = _get(conn, path, headers)
+        latencies.append(time.perf_counter() - start)
+        sizes.append(len(body))
+        if response.status not in (200, 304):
+            raise RuntimeError(f"{path}: HTTP {response.status} {body[:200]!r}")
+        etags[path] = response.getheader('ETag')
+    conn.close()
+
+
+def run(graph_path='MC1_graph.json', mode='cached', clients=8, requests=200, static=None, root=None):
+    proc, port = _start(graph_path, 0 if mode == 'uncached' else None, root)
+    try:
+        paths = query_mix(port, static)
+        latencies, sizes = [], []
+        threads = [threading.Thread(target=_client, args=(port, paths, requests, c, mode == 'revalidate',
+                                                          latencies, sizes))
+                   for c in range(clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        proc.terminate()
+        proc.wait()
+    ms = np.asarray(latencies) * 1000
+    return {'requests': len(ms), 'rps': len(ms) / elapsed, 'p50': np.percentile(ms, 50),
+            'p99': np.percentile(ms, 99), 'bytes': float(np.mean(sizes))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help="requests per client")
+    parser.add_argument('--static', help="also request this file under --root, e.g. MC1_graph.json")
+    parser.add_argument('--root', default='.', help="directory served for --static (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':>10} {'clients':>8} {'requests':>9} {'req/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'bytes/resp':>11}")
+    print("-" * 70)
+    for mode in args.modes:
+        r = run(args.path, mode, args.clients, args.requests, args.static, args.root if args.static else None)
+        print(f"{mode:>10} {args.clients:>8} {r['requests']:>9,} {r['rps']:>8,.0f} {r['p50']:>9.2f} "
+              f"{r['p99']:>9.2f} {r['bytes']:>11,.0f}")
+
+
+if __name__ == '__main__':
+    main()
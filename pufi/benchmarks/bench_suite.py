@@ -0,0 +1,149 @@
+"""Pipeline stages at 10k-10M nodes on synthetic MC1-shaped graphs, with stored results.
+
+For every scale a graph is generated once with :mod:`synthetic_graph` (kept
+in ``--data-dir`` and reused) and the export path of ``eda.py`` is timed
+stage by stage with :mod:`profiling`:
+
+- ``load (cold)``: JSON parse, CSR build and weak components, no cache;
+- ``load``, ``node_table``, ``edge_table`` (edge classification),
+  ``structure`` (degrees, components), ``influence`` (notable tallies),
+  ``cascade`` and ``export``: best of ``--repeat`` warm runs;
+- heap peak per stage from one extra tracemalloc run.
+
+Each run appends one JSON line per (scale, stage) to ``--results`` with the
+git commit, the machine and the library versions, and prints the change in
+wall time and heap peak against the last stored run of the same scale and
+stage, so regressions show up as the code changes.
+
+    python -m benchmarks.bench_suite [--scales 10k 100k 1M] [--repeat 3] [--results bench_results.jsonl]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+import profiling
+import synthetic_graph
+from eda import pipeline
+from graph_cache import clear_cache
+
+TARGETS = ['export']
+DEFAULT_SCALES = ['10k', '100k', '1M']
+
+
+def _graph(data_dir, scale, seed):
+    path = os.path.join(data_dir, f"synthetic_{scale}_seed{seed}.json")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        g = synthetic_graph.generate(synthetic_graph.parse_count(scale), seed)
+        synthetic_graph.write_node_link(g, path + '.tmp')
+        os.replace(path + '.tmp', path)
+    return path
+
+
+def _profile(path, out_dir, memory):
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = profiling.run(pipeline, TARGETS, memory=memory, graph_path=path, out_dir=out_dir)
+    return run.records, run['load']['csr']
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales=DEFAULT_SCALES, repeat=3, seed=0, data_dir='.bench_data'):
+    """One record per (scale, stage): wall/CPU seconds, throughput and heap peak."""
+    records = []
+    for scale in scales:
+        path = _graph(data_dir, scale, seed)
+        with tempfile.TemporaryDirectory() as out_dir:
+            clear_cache(path)
+            cold, csr = _profile(path, out_dir, memory=False)
+            timings = [_profile(path, out_dir, memory=False)[0] for _ in range(repeat)]
+            memory, _ = _profile(path, out_dir, memory=True)
+        size = csr.num_nodes + csr.num_edges
+        heap = {r['stage']: r['heap_peak_mb'] for r in memory}
+        rows = [('load (cold)', cold[0], None)]
+        for stage in [r['stage'] for r in timings[0]]:
+            best = min((r for records_ in timings for r in records_ if r['stage'] == stage),
+                       key=lambda r: r['wall_s'])
+            rows.append((stage, best, heap[stage]))
+        for stage, r, heap_peak in rows:
+            records.append({
+                'scale': scale, 'nodes': csr.num_nodes, 'edges': csr.num_edges, 'seed': seed,
+                'stage': stage, 'wall_s': r['wall_s'], 'cpu_s': r['cpu_s'],
+                'items_per_s': size / r['wall_s'] if r['wall_s'] else None,
+                'heap_peak_mb': heap_peak,
+            })
+    return records
+
+
+def _previous(path):
+    """Latest stored record per (scale, seed, stage)."""
+    latest = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                r = json.loads(line)
+                latest[r['scale'], r['seed'], r['stage']] = r
+    return latest
+
+
+def store(records, path):
+    meta = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _commit(),
+        'machine': f"{platform.machine()} {platform.processor() or ''}".strip(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+    }
+    with open(path, 'a') as f:
+        for r in records:
+            f.write(json.dumps({**meta, **r}) + '\n')
+
+
+def _change(now, before):
+    if now is None or not before:
+        return ''
+    return f"{(now / before - 1) * 100:+.0f}%"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', nargs='+', default=DEFAULT_SCALES, help="node counts, e.g. 10k 100k 1M 10M")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', default='.bench_data', help="where generated graphs are kept")
+    parser.add_argument('--results', default='bench_results.jsonl', help="JSON-lines history to append to")
+    parser.add_argument('--no-store', action='store_true', help="print only, do not append to --results")
+    args = parser.parse_args(argv)
+
+    previous = _previous(args.results)
+    records = run(args.scales, args.repeat, args.seed, args.data_dir)
+    print(f"{'scale':>6} {'stage':>12} {'wall (s)':>9} {'Δ wall':>7} {'items/s':>11} {'heap pk MB':>11} {'Δ heap':>7}")
+    print("-" * 70)
+    for r in records:
+        before = previous.get((r['scale'], r['seed'], r['stage']), {})
+        heap = '-' if r['heap_peak_mb'] is None else f"{r['heap_peak_mb']:.1f}"
+        print(f"{r['scale']:>6} {r['stage']:>12} {r['wall_s']:>9.3f} {_change(r['wall_s'], before.get('wall_s')):>7} "
+              f"{r['items_per_s']:>11,.0f} {heap:>11} {_change(r['heap_peak_mb'], before.get('heap_peak_mb')):>7}")
+    if not args.no_store:
+        store(records, args.results)
+        print(f"\nAppended {len(records)} records to {args.results}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Year-range queries: boolean scans over the node/edge tables vs the temporal index.
+
+Three query kinds over random year ranges: ``count`` (works released in the
+range), ``count_genre_notable`` (same, one genre and notable only) and
+``snapshot`` (edge ids of the graph as of a year).  ``scan`` evaluates each
+with masks over the full songs/albums table or edge arrays, the way Section
+3 and the timeline pages filter; ``index`` uses :class:`TemporalIndex`.
+Answers are checked to agree.
+
+    python -m benchmarks.bench_temporal [MC1_graph.json] [--queries 1000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from graph_loader import load_graph
+from node_frame import node_frame, songs_albums
+from temporal_index import TemporalIndex
+
+
+def _timed(func, args):
+    start = time.perf_counter()
+    results = [func(*a) for a in args]
+    return (time.perf_counter() - start) / max(len(args), 1), results
+
+
+def run(path, queries=1000, seed=0):
+    graph = load_graph(path)
+    build_start = time.perf_counter()
+    index = TemporalIndex(graph)
+    build = time.perf_counter() - build_start
+
+    df = songs_albums(node_frame(graph))
+    year = df['release_year'].to_numpy(dtype=np.float64, na_value=np.nan)
+    genre = df['genre'].to_numpy(dtype=object)
+    notable = df['notable'].to_numpy()
+    # Per-edge year as the index defines it, so the scan pays only for the filter
+    order_years = np.empty(graph.num_edges, dtype=np.int64)
+    order_years[index.edge_order] = index.edge_years
+
+    rng = np.random.default_rng(seed)
+    lo, hi = int(index.years[0]), int(index.years[-1])
+    ranges = np.sort(rng.integers(lo, hi + 1, size=(queries, 2)), axis=1)
+    genres = rng.choice(index.genres, size=queries)
+
+    def scan_count(a, b):
+        return int(((year >= a) & (year <= b)).sum())
+
+    def scan_genre_notable(a, b, g):
+        return int(((year >= a) & (year <= b) & (genre == g) & notable).sum())
+
+    def scan_snapshot(y):
+        return np.flatnonzero(order_years <= y)
+
+    cases = {
+        'count': (scan_count, index.count, [tuple(r) for r in ranges.tolist()]),
+        'count_genre_notable': (scan_genre_notable, lambda a, b, g: index.count(a, b, g, True),
+                                [(a, b, g) for (a, b), g in zip(ranges.tolist(), genres)]),
+        'snapshot': (scan_snapshot, index.snapshot_edges, [(b,) for _, b in ranges.tolist()]),
+    }
+    results = {'build': build}
+    for name, (scan, indexed, args) in cases.items():
+        scan_seconds, expected = _timed(scan, args)
+        index_seconds, actual = _timed(indexed, args)
+        for e, a in zip(expected, actual):
+            assert np.array_equal(np.sort(a), e) if name == 'snapshot' else e == a
+        results[name] = {'scan': scan_seconds, 'index': index_seconds}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--queries', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    results = run(args.path, args.queries)
+    print(f"Index build: {results.pop('build') * 1000:.1f} ms, {args.queries:,} queries each (µs per query)\n")
+    print(f"{'query':>20} {'scan':>10} {'index':>10} {'speedup':>8}")
+    print("-" * 51)
+    for name, r in results.items():
+        print(f"{name:>20} {r['scan'] * 1e6:>10.1f} {r['index'] * 1e6:>10.1f} {r['scan'] / r['index']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""Transitive influence ancestry ("success cascades") of every work.
+
+A work's cascade is the set of nodes with a path to it in the collapsed
+creative-influence subgraph, i.e. its direct influences, their influences,
+and so on.  Two numbers are reported per node:
+
+- ``cascade_size``: how many distinct nodes are in that ancestry (the node
+  itself excluded, the rest of its strong component included);
+- ``cascade_depth``: the longest influence chain leading into it, counted in
+  strong components, so a cycle of mutual influences is one step.
+
+Rather than one BFS per work, the subgraph is condensed into its strong
+components (a DAG) and both numbers are filled in by dynamic programming
+over the DAG in topological order.  Depth is the Kahn level of each
+component.  Ancestry is a packed bitset per component: a component's row is
+the OR of its predecessors' rows plus their own bits, done one level at a
+time with ``np.bitwise_or.reduceat``.  Components are numbered by level, so
+an ancestor always has a smaller number; the bit columns are processed in
+blocks sized to ``memory_mb``, and each block only touches the components
+numbered after it.
+
+    python cascade.py --graph MC1_graph.json
+"""
+
+import argparse
+
+import numpy as np
+
+from csr_graph import _gather, _index
+from node_frame import node_frame
+
+CASCADE_FILE = 'cascade_metrics.csv'
+DEFAULT_MEMORY_MB = 64
+
+
+def condensation(csr):
+    """SCC labels, component count and the distinct DAG edges between components."""
+    labels, count = csr.strongly_connected_components()
+    src, dst = labels[csr.src].astype(np.int64), labels[csr.dst].astype(np.int64)
+    keep = src != dst
+    pairs = np.unique(src[keep] * count + dst[keep])
+    return labels, count, pairs // count, pairs % count
+
+
+def dag_levels(count, src, dst):
+    """Longest-path level of every node of the DAG ``src -> dst`` (sources are 0)."""
+    indptr, successors, _ = _index(count, src, dst)
+    remaining = np.bincount(dst, minlength=count)
+    level = np.full(count, -1, dtype=np.int32)
+    frontier = np.flatnonzero(remaining == 0)
+    depth = 0
+    while len(frontier):
+        level[frontier] = depth
+        reached = _gather(indptr, successors, frontier)
+        remaining -= np.bincount(reached, minlength=count)
+        candidates = np.unique(reached)
+        frontier = candidates[remaining[candidates] == 0]
+        depth += 1
+    if (level < 0).any():
+        raise ValueError("graph has a cycle")
+    return level
+
+
+def ancestor_weights(count, src, dst, level, weights, memory_mb=DEFAULT_MEMORY_MB):
+    """Sum of ``weights`` over the strict ancestors of every node of the DAG ``src -> dst``."""
+    # Nodes without edges have no ancestors and are nobody's ancestor: keep them out of the bitsets
+    touched = np.flatnonzero(np.bincount(np.r_[src, dst], minlength=count))
+    if len(touched) < count:
+        local = np.full(count, -1, dtype=np.int64)
+        local[touched] = np.arange(len(touched))
+        result = np.zeros(count, dtype=np.int64)
+        result[touched] = ancestor_weights(len(touched), local[src], local[dst], np.asarray(level)[touched],
+                                           np.asarray(weights)[touched], memory_mb)
+        return result
+    # Renumber by level: every DAG edge goes from a lower to a higher rank
+    order = np.argsort(level, kind='stable')
+    rank = np.empty(count, dtype=np.int64)
+    rank[order] = np.arange(count)
+    a, b = rank[src], rank[dst]
+    by_target = np.argsort(b, kind='stable')
+    a, b = a[by_target], b[by_target]
+    weights = np.asarray(weights, dtype=np.int64)[order]
+
+    width = max(8, int(memory_mb * 2**20 * 8 // max(count, 1)) // 8 * 8)
+    total = np.zeros(count, dtype=np.int64)
+    for lo in range(0, count, width):
+        hi = min(lo + width, count)
+        # Ancestors inside [lo, hi) only ever reach ranks >= lo
+        keep = a >= lo
+        ea, eb = a[keep] - lo, b[keep] - lo
+        bits = np.zeros((count - lo, (hi - lo + 7) // 8), dtype=np.uint8)
+        if len(eb) == 0:
+            continue
+        starts = np.flatnonzero(np.r_[True, eb[1:] != eb[:-1]])
+        targets = eb[starts]
+        bounds = np.r_[starts, len(eb)]
+        # Targets are in rank order, so one level's targets form a contiguous run
+        target_level = level[order[targets + lo]]
+        runs = np.flatnonzero(np.r_[True, target_level[1:] != target_level[:-1], True])
+        for first, last in zip(runs[:-1], runs[1:]):
+            e0, e1 = bounds[first], bounds[last]
+            rows = bits[ea[e0:e1]]
+            inside = np.flatnonzero(ea[e0:e1] < hi - lo)
+            bit = ea[e0:e1][inside]
+            rows[inside, bit >> 3] |= (1 << (bit & 7)).astype(np.uint8)
+            bits[targets[first:last]] = np.bitwise_or.reduceat(rows, bounds[first:last] - e0, axis=0)
+        block_weights = weights[lo:hi]
+        # Unpacked rows cost 9 bytes per bit (uint8 bits, upcast to int64 for the product)
+        step = max(1, memory_mb * 2**20 // (9 * (hi - lo)))
+        for r in range(0, count - lo, int(step)):
+            chunk = np.unpackbits(bits[r:r + int(step)], axis=1, count=hi - lo, bitorder='little')
+            total[lo + r:lo + r + len(chunk)] += chunk @ block_weights
+    result = np.empty(count, dtype=np.int64)
+    result[order] = total
+    return result
+
+
+def cascades(csr, memory_mb=DEFAULT_MEMORY_MB):
+    """``(cascade_size, cascade_depth)`` of every node of ``csr``, via the SCC condensation."""
+    labels, count, src, dst = condensation(csr)
+    component_size = np.bincount(labels, minlength=count)
+    level = dag_levels(count, src, dst)
+    ancestors = ancestor_weights(count, src, dst, level, component_size, memory_mb)
+    size = component_size[labels] - 1 + ancestors[labels]
+    return size, level[labels]
+
+
+def cascade_sizes_bfs(csr, nodes):
+    """Reference: ancestry size of each of ``nodes`` by one reverse BFS per node."""
+    sizes = np.zeros(len(nodes), dtype=np.int64)
+    for k, node in enumerate(nodes):
+        seen = np.zeros(csr.num_nodes, dtype=bool)
+        frontier = np.array([node], dtype=np.int64)
+        while len(frontier):
+            reached = _gather(csr.in_indptr, csr.in_indices, frontier)
+            frontier = np.unique(reached[~seen[reached]])
+            seen[frontier] = True
+        seen[node] = False
+        sizes[k] = int(seen.sum())
+    return sizes
+
+
+def cascade_frame(graph, creative_subgraph, rows, memory_mb=DEFAULT_MEMORY_MB, nodes=None):
+    """One row per node index in ``rows``: direct influences and cascade metrics.
+
+    ``creative_subgraph`` may be induced on a node subset closed under
+    predecessors; ``nodes`` then maps its indices (and ``rows``) to ``graph``.
+    """
+    size, depth = cascades(creative_subgraph, memory_mb)
+    rows = np.asarray(rows, dtype=np.int64)
+    nodes = node_frame(graph, rows if nodes is None else np.asarray(nodes)[rows])
+    df = nodes[['id', 'name', 'type', 'genre']].reset_index(drop=True)
+    for column in ('type', 'genre'):
+        df[column] = df[column].cat.remove_unused_categories()
+    df['notable'] = nodes['notable'].fillna(False).astype(bool).to_numpy()
+    df['direct_influences'] = creative_subgraph.in_degree()[rows]
+    df['cascade_size'] = size[rows]
+    df['cascade_depth'] = depth[rows]
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transitive influence ancestry of every work.")
+    parser.add_argument('--graph', default='MC1_graph.json', help="node-link JSON graph (default: %(default)s)")
+    parser.add_argument('--out-dir', default='.', help="directory for cascade_metrics.csv")
+    args = parser.parse_args(argv)
+
+    from eda import pipeline
+    return pipeline.run(['cascade'], graph_path=args.graph, out_dir=args.out_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""Centrality scores for keystone-node detection, on the full and creative graphs.
+
+- PageRank: power iteration where each step is one sparse matrix-vector
+  product over the edge arrays (``np.bincount`` scatter), with NetworkX's
+  dangling-node handling and stopping rule.  Parallel edges add weight, as
+  ``nx.pagerank`` does on a multigraph.
+- Betweenness: Brandes' algorithm from ``k`` sampled sources, one
+  level-synchronous BFS per source with array gathers.  Sources are split
+  into chunks and fanned out over a process pool; each worker receives the
+  CSR arrays once.  Sampling and scaling follow
+  ``nx.betweenness_centrality(G, k=..., seed=...)``, so the same seed gives
+  the same sources and scores.
+- In/out degree centrality: degree / (n - 1).
+
+The creative graph is the collapsed creative-influence subgraph from eda.py,
+restricted to the nodes it touches; nodes outside it get NaN there.
+
+    python centrality.py --samples 500 --workers 4
+"""
+
+import argparse
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from csr_graph import _gather
+
+DEFAULT_SAMPLES = 500
+METRICS_FILE = 'centrality_metrics.csv'
+
+
+# ---------------------------------------------------------------------------
+# PageRank
+# ---------------------------------------------------------------------------
+
+def pagerank(num_nodes, src, dst, alpha=0.85, max_iter=100, tol=1.0e-6):
+    """PageRank of every node of the directed (multi)graph ``src -> dst``."""
+    n = int(num_nodes)
+    if n == 0:
+        return np.zeros(0)
+    src = np.asarray(src, dtype=np.intp)
+    dst = np.asarray(dst, dtype=np.intp)
+    out_weight = np.bincount(src, minlength=n).astype(np.float64)
+    dangling = out_weight == 0
+    edge_weight = 1.0 / out_weight[src]
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        x = alpha * np.bincount(dst, weights=last[src] * edge_weight, minlength=n)
+        x += (alpha * last[dangling].sum() + 1 - alpha) / n
+        if np.abs(x - last).sum() < n * tol:
+            return x
+    raise RuntimeError(f"PageRank did not converge in {max_iter} iterations")
+
+
+# ---------------------------------------------------------------------------
+# Betweenness
+# ---------------------------------------------------------------------------
+
+def _dependencies(indptr, indices, num_nodes, sources):
+    """Summed Brandes dependencies of every node over ``sources``."""
+    total = np.zeros(num_nodes)
+    for s in sources:
+        dist = np.full(num_nodes, -1, dtype=np.int32)
+        sigma = np.zeros(num_nodes)
+        dist[s], sigma[s] = 0, 1.0
+        frontier = np.array([s], dtype=np.int64)
+        levels = []
+        depth = 0
+        while len(frontier):
+            u = np.repeat(frontier, indptr[frontier + 1] - indptr[frontier])
+            v = _gather(indptr, indices, frontier)
+            new = np.unique(v[dist[v] == -1])
+            dist[new] = depth + 1
+            on_path = dist[v] == depth + 1
+            u, v = u[on_path], v[on_path]
+            np.add.at(sigma, v, sigma[u])
+            levels.append((u, v))
+            frontier = new
+            depth += 1
+
+        delta = np.zeros(num_nodes)
+        for u, v in reversed(levels):
+            np.add.at(delta, u, sigma[u] / sigma[v] * (1 + delta[v]))
+        delta[s] = 0
+        total += delta
+    return total
+
+
+_worker_graph = None
+
+
+def _init_worker(indptr, indices, num_nodes):
+    global _worker_graph
+    _worker_graph = (indptr, indices, num_nodes)
+
+
+def _worker_dependencies(sources):
+    return _dependencies(*_worker_graph, sources)
+
+
+def betweenness(csr, k=DEFAULT_SAMPLES, seed=None, workers=1, nodes=None, normalized=True):
+    """Approximate betweenness of a simple :class:`CSRGraph` from ``k`` sampled sources.
+
+    ``nodes`` optionally restricts the graph's node set (boolean mask), as for
+    an edge-induced subgraph; ``k=None`` uses every node.
+    """
+    node_list = np.arange(csr.num_nodes) if nodes is None else np.flatnonzero(nodes)
+    n = len(node_list)
+    sampled = None
+    if k is not None and k < n:
+        sampled = np.array(sorted(random.Random(seed).sample(range(n), k)), dtype=np.int64)
+        sources = node_list[sampled]
+    else:
+        sources = node_list
+    indptr, indices = csr.out_indptr, csr.out_indices.astype(np.int64)
+
+    if workers and workers > 1 and len(sources) > 1:
+        chunks = np.array_split(sources, min(len(sources), workers * 4))
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(indptr, indices, csr.num_nodes)) as pool:
+            scores = sum(pool.map(_worker_dependencies, chunks))
+    else:
+        scores = _dependencies(indptr, indices, csr.num_nodes, sources)
+    scores = scores[node_list]
+
+    # Rescaling as in networkx (directed, endpoints excluded)
+    N = n - 1
+    if N < 2:
+        return scores
+    if sampled is None:
+        return scores / (N * (N - 1)) if normalized else scores
+    k = len(sampled)
+    if normalized:
+        scale_source = 1 / ((k - 1) * (N - 1)) if k > 1 else np.nan
+        scale_other = 1 / (k * (N - 1))
+    else:
+        scale_source = N / (k - 1) if k > 1 else np.nan
+        scale_other = N / k
+    scale = np.full(n, scale_other)
+    scale[sampled] = scale_source
+    return scores * scale
+
+
+# ---------------------------------------------------------------------------
+# Scores table
+# ---------------------------------------------------------------------------
+
+def scores(csr, k=DEFAULT_SAMPLES, seed=0, workers=1, nodes=None):
+    """PageRank, sampled betweenness and degree centralities; NaN outside ``nodes``."""
+    num_nodes = csr.num_nodes
+    node_list = np.arange(num_nodes) if nodes is None else np.flatnonzero(nodes)
+    n = len(node_list)
+    local = np.full(num_nodes, -1, dtype=np.int64)
+    local[node_list] = np.arange(n)
+
+    result = {name: np.full(num_nodes, np.nan) for name in
+              ('pagerank', 'betweenness', 'in_degree_centrality', 'out_degree_centrality')}
+    result['pagerank'][node_list] = pagerank(n, local[csr.src], local[csr.dst])
+    simple = csr.edge_subgraph(np.ones(csr.num_edges, dtype=bool))
+    result['betweenness'][node_list] = betweenness(simple, k, seed, workers, nodes)
+    norm = 1.0 / (n - 1) if n > 1 else 1.0
+    result['in_degree_centrality'][node_list] = csr.in_degree()[node_list] * norm
+    result['out_degree_centrality'][node_list] = csr.out_degree()[node_list] * norm
+    return result
+
+
+def metrics_frame(graph, graphs):
+    """One row per node; ``graphs`` maps a suffix ('full', 'creative') to :func:`scores` output."""
+    df = pd.DataFrame({
+        'id': graph.node_ids,
+        'name': graph.text['name'],
+        'type': graph.decode('Node Type'),
+    })
+    for suffix, values in graphs.items():
+        for name, column in values.items():
+            df[f"{name}_{suffix}"] = column
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Centrality scores for keystone-node detection.")
+    parser.add_argument('--graph', default='MC1_graph.json', help="node-link JSON graph (default: %(default)s)")
+    parser.add_argument('--out-dir', default='.', help="directory for centrality_metrics.csv")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES,
+                        help="betweenness source samples (default: %(default)s; 0 = exact)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="betweenness processes")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from eda import pipeline
+    return pipeline.run(['centrality'], graph_path=args.graph, out_dir=args.out_dir,
+                        betweenness_samples=args.samples or None, workers=args.workers, seed=args.seed)
+
+
+if __name__ == '__main__':
+    main()
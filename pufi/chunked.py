@@ -0,0 +1,492 @@
+"""Out-of-core run of the export stage for graphs larger than memory.
+
+The in-memory pipeline keeps every column of the graph, its CSR index and the
+node table alive at once.  This mode keeps only per-node state (the id
+interner, code columns, union-find forest, degree counts) and streams
+everything proportional to the number of edges through fixed-size chunks:
+
+1. **spill**: the node-link JSON is streamed (:func:`graph_loader.iter_node_link`)
+   into a spill directory of columnar ``.npz`` chunks, ``chunk_size`` node
+   records or links each.  Node ids are interned to the same dense indices
+   and category values to the same codes as :mod:`graph_loader`;
+2. **node columns**: node chunks are replayed in order into memory-mapped
+   ``.npy`` columns (later records for an id override earlier ones, as
+   ``nx.node_link_graph`` does);
+3. **map-reduce** over the edge chunks: edge type counts (``np.bincount``
+   per chunk, summed), degrees, notable influence tallies, and the edge
+   type order of ``G.edges()`` (a second pass over the few sources that
+   hold each type's first edge);
+4. **components**: weak components with a union-find forest kept in a
+   memory-mapped array and fed one edge chunk at a time; strong components
+   with Tarjan over a CSR index written to disk by an external counting
+   sort (an edge's slot is its source's running cursor);
+5. **outputs**: songs_albums_analysis.csv is written one node range at a
+   time; network_metrics.json, edge_analysis.json, node_components.csv and
+   cascade_metrics.csv come from the reduced aggregates and labels.  Only the creative-influence edges are
+   gathered in memory, for the cascade ancestry.
+
+The files are byte-identical to ``python eda.py --only export``.
+
+    python chunked.py --graph merged.json --out-dir out --chunk-size 1000000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+from array import array
+
+import numpy as np
+
+from cascade import CASCADE_FILE, DEFAULT_MEMORY_MB, cascade_frame
+from components import COMPONENTS_FILE, component_frame
+from csr_graph import CSRGraph, _tarjan, dense_labels
+from edge_table import EDGE_CATEGORIES, UNKNOWN
+from graph_loader import (EDGE_TYPE, MISSING, NODE_CATEGORICAL, NODE_FLAGS, NODE_TEXT, GraphArrays, code_dtype,
+                          _Interner, iter_node_link)
+from influence_split import split_codes, split_tallies
+from node_frame import WORK_TYPES, node_frame, songs_albums
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Node record columns: a field absent from the record leaves the node's value alone
+_ABSENT = -2
+_META = 'meta.json'
+
+
+# ---------------------------------------------------------------------------
+# 1. Spill
+# ---------------------------------------------------------------------------
+
+class _Spiller:
+    """Streams node-link records into columnar chunk files."""
+
+    def __init__(self, spill_dir, chunk_size):
+        self.spill_dir = spill_dir
+        self.chunk_size = chunk_size
+        self.node_ids = []
+        self.node_index = {}
+        self.interners = {c: _Interner() for c in NODE_CATEGORICAL}
+        self.edge_types = _Interner()
+        self.graph_attrs = {}
+        self.nodes_done = False
+        self.node_chunks, self.edge_chunks, self.pending_chunks = [], [], []
+        self.num_edges = 0
+        self._reset_nodes()
+        self._reset_edges()
+
+    def _reset_nodes(self):
+        self._nodes = {'index': array('i'), 'has_name': array('b')}
+        self._nodes.update({c: array('i') for c in NODE_CATEGORICAL + NODE_FLAGS})
+        self._names = []
+
+    def _reset_edges(self):
+        self._src, self._dst, self._type = array('i'), array('i'), array('i')
+        self._raw = []
+
+    def _intern(self, node_id):
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self.node_index[node_id] = index
+            self.node_ids.append(node_id)
+        return index
+
+    def _path(self, kind, number, ext='npz'):
+        return os.path.join(self.spill_dir, f"{kind}-{number:05d}.{ext}")
+
+    def add_node(self, node):
+        nodes = self._nodes
+        nodes['index'].append(self._intern(node['id']))
+        for column in NODE_CATEGORICAL:
+            nodes[column].append(self.interners[column].code(node[column]) if column in node else _ABSENT)
+        for column in NODE_FLAGS:
+            nodes[column].append(int(node[column]) if isinstance(node.get(column), bool) else _ABSENT)
+        nodes['has_name'].append('name' in node)
+        self._names.append(node.get('name'))
+        if len(nodes['index']) >= self.chunk_size:
+            self.flush_nodes()
+
+    def add_link(self, link):
+        edge_type = link.get(EDGE_TYPE)
+        self._type.append(MISSING if edge_type is None else self.edge_types.code(edge_type))
+        if self.nodes_done:
+            self._src.append(self._intern(link['source']))
+            self._dst.append(self._intern(link['target']))
+        else:
+            self._raw.append((link['source'], link['target']))
+        if len(self._type) >= self.chunk_size:
+            self.flush_edges()
+
+    def flush_nodes(self):
+        if not len(self._nodes['index']):
+            return
+        path = self._path('nodes', len(self.node_chunks))
+        np.savez(path, **{name: np.frombuffer(values, dtype=np.int32 if values.typecode == 'i' else np.int8)
+                          for name, values in self._nodes.items()})
+        with open(self._path('names', len(self.node_chunks), 'json'), 'w', encoding='utf-8') as f:
+            json.dump(self._names, f, ensure_ascii=False)
+        self.node_chunks.append(path)
+        self._reset_nodes()
+
+    def flush_edges(self):
+        if not len(self._type):
+            return
+        edge_type = np.frombuffer(self._type, dtype=np.int32).astype(code_dtype(len(self.edge_types)))
+        if self._raw:
+            # Links seen before the nodes array: endpoints are resolved in finish()
+            path = self._path('pending', len(self.pending_chunks))
+            np.save(path[:-4] + '.npy', edge_type)
+            with open(path[:-4] + '.json', 'w', encoding='utf-8') as f:
+                json.dump(self._raw, f, ensure_ascii=False)
+            self.pending_chunks.append(path[:-4])
+        else:
+            self._write_edges(np.frombuffer(self._src, dtype=np.int32),
+                              np.frombuffer(self._dst, dtype=np.int32), edge_type)
+        self._reset_edges()
+
+    def _write_edges(self, src, dst, edge_type):
+        path = self._path('edges', len(self.edge_chunks))
+        np.savez(path, src=src, dst=dst, edge_type=edge_type)
+        self.edge_chunks.append(path)
+        self.num_edges += len(src)
+
+    def finish(self):
+        self.flush_nodes()
+        self.flush_edges()
+        for stem in self.pending_chunks:
+            with open(stem + '.json', 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            # Interned pairwise, source first, as graph_loader resolves them
+            ends = np.array([self._intern(end) for pair in raw for end in pair], dtype=np.int32).reshape(-1, 2)
+            src, dst = ends[:, 0].copy(), ends[:, 1].copy()
+            self._write_edges(src, dst, np.load(stem + '.npy'))
+            os.remove(stem + '.json')
+            os.remove(stem + '.npy')
+        meta = {
+            'num_nodes': len(self.node_ids),
+            'num_edges': self.num_edges,
+            'node_chunks': [os.path.basename(p) for p in self.node_chunks],
+            'edge_chunks': [os.path.basename(p) for p in self.edge_chunks],
+            'categories': {c: self.interners[c].values for c in NODE_CATEGORICAL},
+            'edge_types': self.edge_types.values,
+            'graph_attrs': self.graph_attrs,
+        }
+        with open(os.path.join(self.spill_dir, _META), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        return meta
+
+
+def spill(path, spill_dir, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream ``path`` into chunk files under ``spill_dir``; returns the metadata and node ids."""
+    os.makedirs(spill_dir, exist_ok=True)
+    spiller = _Spiller(spill_dir, chunk_size)
+    for section, item in iter_node_link(path):
+        if section == 'nodes':
+            if item is None:
+                spiller.flush_edges()
+                spiller.nodes_done = True
+            else:
+                spiller.add_node(item)
+        elif section == 'links':
+            if item is not None:
+                spiller.add_link(item)
+        else:
+            spiller.graph_attrs[section] = item
+    return spiller.finish(), spiller.node_ids
+
+
+def edge_chunks(spill_dir, meta):
+    """Yield ``(first edge id, src, dst, edge_type)`` per spilled chunk."""
+    offset = 0
+    for name in meta['edge_chunks']:
+        with np.load(os.path.join(spill_dir, name)) as chunk:
+            src, dst, edge_type = chunk['src'], chunk['dst'], chunk['edge_type']
+        yield offset, src, dst, edge_type
+        offset += len(src)
+
+
+# ---------------------------------------------------------------------------
+# 2. Node columns
+# ---------------------------------------------------------------------------
+
+def node_columns(spill_dir, meta):
+    """Replay the node chunks into memory-mapped code/flag columns (last record wins)."""
+    n = meta['num_nodes']
+    columns = {}
+    for column in NODE_CATEGORICAL + NODE_FLAGS:
+        dtype = np.int8 if column in NODE_FLAGS else np.int32
+        columns[column] = np.lib.format.open_memmap(os.path.join(spill_dir, f"column-{column}.npy"),
+                                                    mode='w+', dtype=dtype, shape=(n,))
+        columns[column][:] = MISSING
+    for name in meta['node_chunks']:
+        with np.load(os.path.join(spill_dir, name)) as chunk:
+            records = {key: chunk[key] for key in chunk.files}
+        for column, values in columns.items():
+            present = np.flatnonzero(records[column] != _ABSENT)[::-1]
+            # A repeated id within the chunk: keep its last record
+            nodes, last = np.unique(records['index'][present], return_index=True)
+            values[nodes] = records[column][present[last]]
+    return columns
+
+
+def node_names(spill_dir, meta, rows):
+    """``{node index: name}`` for ``rows`` only, from the spilled records."""
+    wanted = np.zeros(meta['num_nodes'], dtype=bool)
+    wanted[rows] = True
+    names = {}
+    for k, name in enumerate(meta['node_chunks']):
+        with np.load(os.path.join(spill_dir, name)) as chunk:
+            index, has_name = chunk['index'], chunk['has_name'].astype(bool)
+        with open(os.path.join(spill_dir, f"names-{k:05d}.json"), 'r', encoding='utf-8') as f:
+            values = json.load(f)
+        for record in np.flatnonzero(has_name & wanted[index]).tolist():
+            names[int(index[record])] = values[record]
+    return names
+
+
+def _node_graph(meta, node_ids, columns, lo=0, hi=None, names=None):
+    """A :class:`GraphArrays` over nodes ``[lo, hi)`` without edges, for node_frame()."""
+    hi = meta['num_nodes'] if hi is None else hi
+    names = names or {}
+    text = {c: [None] * (hi - lo) for c in NODE_TEXT}
+    text['name'] = [names.get(i) for i in range(lo, hi)]
+    empty = np.zeros(0, dtype=np.int32)
+    return GraphArrays(
+        node_ids=node_ids[lo:hi], node_index={}, text=text,
+        columns={c: np.asarray(values[lo:hi]) for c, values in columns.items()},
+        categories=meta['categories'], edge_src=empty, edge_dst=empty,
+        edge_type=empty.astype(code_dtype(len(meta['edge_types']))), edge_types=meta['edge_types'],
+    )
+
+
+def _type_codes(meta, types):
+    return [meta['categories']['Node Type'].index(t) for t in types if t in meta['categories']['Node Type']]
+
+
+# ---------------------------------------------------------------------------
+# 3. Streaming aggregates
+# ---------------------------------------------------------------------------
+
+def _type_slots(edge_type, num_types):
+    return np.where(edge_type < 0, num_types, edge_type).astype(np.intp)
+
+
+def edge_aggregates(spill_dir, meta, notable_mask, non_notable_mask):
+    """One pass: type counts, degrees, creative edges and notable influence tallies."""
+    n, num_types = meta['num_nodes'], len(meta['edge_types'])
+    creative_codes = [meta['edge_types'].index(t) for t in EDGE_CATEGORIES['creative_influences']
+                      if t in meta['edge_types']]
+    type_counts = np.zeros(num_types + 1, dtype=np.int64)
+    out_degree = np.zeros(n, dtype=np.int64)
+    in_degree = np.zeros(n, dtype=np.int64)
+    # First source of each type, for the G.edges() type order
+    first_source = np.full(num_types + 1, n, dtype=np.int64)
+    groups = split_codes(notable_mask, non_notable_mask)
+    received = np.zeros((2, num_types), dtype=np.int64)
+    given = np.zeros((2, num_types), dtype=np.int64)
+    creative_src, creative_dst = [], []
+    for _, src, dst, edge_type in edge_chunks(spill_dir, meta):
+        slots = _type_slots(edge_type, num_types)
+        type_counts += np.bincount(slots, minlength=num_types + 1)
+        out_degree += np.bincount(src, minlength=n)
+        in_degree += np.bincount(dst, minlength=n)
+        np.minimum.at(first_source, slots, src)
+        creative = np.isin(edge_type, creative_codes)
+        cs, cd = src[creative], dst[creative]
+        chunk = split_tallies(groups, 2, cs, cd, edge_type[creative], num_types)
+        received += chunk['received']
+        given += chunk['given']
+        creative_src.append(cs)
+        creative_dst.append(cd)
+    return {
+        'type_counts': type_counts,
+        'first_source': first_source,
+        'out_degree': out_degree,
+        'in_degree': in_degree,
+        'tallies': {
+            'notable_influences_received': int(received[0].sum()),
+            'notable_influences_given': int(given[0].sum()),
+            'non_notable_influences_received': int(received[1].sum()),
+            'non_notable_influences_given': int(given[1].sum()),
+        },
+        'creative_src': np.concatenate(creative_src) if creative_src else np.zeros(0, dtype=np.int32),
+        'creative_dst': np.concatenate(creative_dst) if creative_dst else np.zeros(0, dtype=np.int32),
+    }
+
+
+def edge_type_counts(spill_dir, meta, aggregates):
+    """``{edge type: count}`` in first-seen ``G.edges()`` order, as EdgeTable.type_counts().
+
+    ``G.edges()`` walks sources in node order, so a type first shows up at its
+    smallest source; only the edges of those few sources are gathered to
+    order the types within and across them.
+    """
+    num_types = len(meta['edge_types'])
+    counts, first_source = aggregates['type_counts'], aggregates['first_source']
+    sources = np.unique(first_source[counts > 0])
+    gathered = []
+    for offset, src, dst, edge_type in edge_chunks(spill_dir, meta):
+        keep = np.flatnonzero(np.isin(src, sources))
+        gathered.append((offset + keep, src[keep], dst[keep], _type_slots(edge_type[keep], num_types)))
+    if not gathered:
+        return {}
+    edge_ids, src, dst, slots = (np.concatenate(parts) for parts in zip(*gathered))
+    pairs = src.astype(np.int64) * meta['num_nodes'] + dst
+    _, first, inverse = np.unique(pairs, return_index=True, return_inverse=True)
+    order = np.lexsort((edge_ids, edge_ids[first][inverse], src))
+    slots = slots[order]
+    _, seen = np.unique(slots, return_index=True)
+    names = meta['edge_types'] + [UNKNOWN]
+    return {names[slots[i]]: int(counts[slots[i]]) for i in np.sort(seen)}
+
+
+# ---------------------------------------------------------------------------
+# 4. Components
+# ---------------------------------------------------------------------------
+
+def _find(parent, nodes):
+    roots = parent[nodes]
+    while True:
+        up = parent[roots]
+        if np.array_equal(up, roots):
+            return roots
+        roots = up
+
+
+def weak_components(spill_dir, meta):
+    """Union-find over the edge chunks; returns per-node root labels (memory-mapped forest)."""
+    n = meta['num_nodes']
+    parent = np.lib.format.open_memmap(os.path.join(spill_dir, 'union_find.npy'), mode='w+',
+                                       dtype=np.int64, shape=(n,))
+    parent[:] = np.arange(n)
+    for _, src, dst, _ in edge_chunks(spill_dir, meta):
+        u, v = src.astype(np.int64), dst.astype(np.int64)
+        while len(u):
+            ru, rv = _find(parent, u), _find(parent, v)
+            apart = ru != rv
+            # Hook the larger root under the smaller one; pointers only decrease, so no cycles
+            np.minimum.at(parent, np.maximum(ru, rv)[apart], np.minimum(ru, rv)[apart])
+            u, v = u[apart], v[apart]
+        touched = np.unique(np.concatenate((src, dst)))
+        parent[touched] = _find(parent, touched)
+    return _find(parent, np.arange(n))
+
+
+def disk_csr(spill_dir, meta, out_degree):
+    """Out-adjacency CSR with the index array on disk, in edge-id order per source."""
+    n = meta['num_nodes']
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(out_degree, out=indptr[1:])
+    indices = np.lib.format.open_memmap(os.path.join(spill_dir, 'csr_indices.npy'), mode='w+',
+                                        dtype=np.int32, shape=(meta['num_edges'],))
+    cursor = indptr[:-1].copy()
+    for _, src, dst, _ in edge_chunks(spill_dir, meta):
+        order = np.argsort(src, kind='stable')
+        s = src[order]
+        # Position of each edge among the chunk's edges from the same source
+        starts = np.flatnonzero(np.r_[True, s[1:] != s[:-1]])
+        rank = np.arange(len(s)) - np.repeat(starts, np.diff(np.r_[starts, len(s)]))
+        indices[cursor[s] + rank] = dst[order]
+        cursor += np.bincount(src, minlength=n)
+    indices.flush()
+    return indptr, np.load(os.path.join(spill_dir, 'csr_indices.npy'), mmap_mode='r')
+
+
+# ---------------------------------------------------------------------------
+# 5. Outputs
+# ---------------------------------------------------------------------------
+
+def write_songs_albums(path, meta, node_ids, columns, chunk_size):
+    """songs_albums_analysis.csv, one node range at a time."""
+    with open(path, 'w', newline='') as f:
+        for lo in range(0, max(meta['num_nodes'], 1), chunk_size):
+            hi = min(lo + chunk_size, meta['num_nodes'])
+            df = songs_albums(node_frame(_node_graph(meta, node_ids, columns, lo, hi)))
+            df.to_csv(f, index=False, header=lo == 0)
+
+
+def run(path, out_dir='.', chunk_size=DEFAULT_CHUNK_SIZE, spill_dir=None, cascade_memory_mb=DEFAULT_MEMORY_MB):
+    """Write the export-stage files for ``path`` without loading the whole graph."""
+    os.makedirs(out_dir, exist_ok=True)
+    own_spill = spill_dir is None
+    spill_dir = spill_dir or tempfile.mkdtemp(prefix='.mc1_spill-', dir=out_dir)
+    try:
+        print(f"Spilling {os.path.basename(path)} to {chunk_size:,}-record chunks...")
+        meta, node_ids = spill(path, spill_dir, chunk_size)
+        n, m = meta['num_nodes'], meta['num_edges']
+        print(f"Nodes: {n:,} ({len(meta['node_chunks'])} chunks), edges: {m:,} ({len(meta['edge_chunks'])} chunks)")
+
+        columns = node_columns(spill_dir, meta)
+        work_mask = np.isin(columns['Node Type'], _type_codes(meta, WORK_TYPES))
+        notable_mask = work_mask & (columns['notable'] == 1)
+        aggregates = edge_aggregates(spill_dir, meta, notable_mask, work_mask & ~notable_mask)
+
+        csv_path = os.path.join(out_dir, 'songs_albums_analysis.csv')
+        write_songs_albums(csv_path, meta, node_ids, columns, chunk_size)
+        print("✅ Songs and albums data saved to 'songs_albums_analysis.csv'")
+
+        wcc_labels, wcc_count = dense_labels(weak_components(spill_dir, meta))
+        indptr, indices = disk_csr(spill_dir, meta, aggregates['out_degree'])
+        scc_labels, scc_count = dense_labels(_tarjan(n, indptr.tolist(), indices)[0])
+        network_metrics = {
+            'node_count': n,
+            'edge_count': m,
+            'density': 0 if m == 0 or n <= 1 else m / (n * (n - 1)),
+            'weakly_connected_components': wcc_count,
+            'strongly_connected_components': scc_count,
+            'largest_wcc_size': int(np.bincount(wcc_labels).max()) if n else 0,
+            'largest_scc_size': int(np.bincount(scc_labels).max()) if n else 0,
+        }
+        with open(os.path.join(out_dir, 'network_metrics.json'), 'w') as f:
+            json.dump(network_metrics, f, indent=2)
+        print("✅ Network metrics saved to 'network_metrics.json'")
+
+        component_frame(node_ids, wcc_labels, scc_labels).to_csv(os.path.join(out_dir, COMPONENTS_FILE), index=False)
+        print(f"✅ Component labels saved to '{COMPONENTS_FILE}'")
+
+        edge_analysis = {
+            'edge_type_counts': edge_type_counts(spill_dir, meta, aggregates),
+            'creative_influences': EDGE_CATEGORIES['creative_influences'],
+            'professional_roles': EDGE_CATEGORIES['professional_roles'],
+            'business_relationships': EDGE_CATEGORIES['business_relationships'],
+            'total_creative_influences': len(aggregates['creative_src']),
+        }
+        with open(os.path.join(out_dir, 'edge_analysis.json'), 'w') as f:
+            json.dump(edge_analysis, f, indent=2)
+        print("✅ Edge analysis saved to 'edge_analysis.json'")
+
+        # Only the creative-influence edges are held in memory, for the ancestry DP
+        works = np.flatnonzero(work_mask)
+        creative = CSRGraph(n, aggregates['creative_src'], aggregates['creative_dst'])
+        creative = creative.edge_subgraph(np.ones(creative.num_edges, dtype=bool))
+        graph = _node_graph(meta, node_ids, columns, names=node_names(spill_dir, meta, works))
+        cascade_frame(graph, creative, works, cascade_memory_mb).to_csv(os.path.join(out_dir, CASCADE_FILE), index=False)
+        print(f"✅ Cascade metrics saved to '{CASCADE_FILE}'")
+
+        print("\nCreative Influence Analysis:")
+        for name, value in aggregates['tallies'].items():
+            print(f"   • {name.replace('_', ' ')}: {value:,}")
+        return {'network_metrics': network_metrics, 'edge_analysis': edge_analysis,
+                'tallies': aggregates['tallies']}
+    finally:
+        if own_spill:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Out-of-core run of the EDA export stage.")
+    parser.add_argument('--graph', default='MC1_graph.json', help="node-link JSON graph (default: %(default)s)")
+    parser.add_argument('--out-dir', default='.', help="directory for the exported files")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="node records / links per spilled chunk (default: %(default)s)")
+    parser.add_argument('--spill-dir', help="keep the chunk files here instead of a temporary directory")
+    parser.add_argument('--cascade-memory-mb', type=float, default=DEFAULT_MEMORY_MB,
+                        help="bitset budget of the cascade ancestry pass (default: %(default)s)")
+    args = parser.parse_args(argv)
+    return run(args.graph, args.out_dir, args.chunk_size, args.spill_dir, args.cascade_memory_mb)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""Per-node weak and strong component labels, for filtering network views.
+
+The labels come from :meth:`csr_graph.CSRGraph.weakly_connected_components`
+and :meth:`~csr_graph.CSRGraph.strongly_connected_components`: dense ids
+numbered in order of each component's smallest node, so every producer
+(``eda.py``, ``chunked.py``, ``incremental.py``) writes the same file for the
+same graph.  Sizes are repeated on every row so a view can keep, say, the
+largest weak component with one comparison.  The file is written by the
+``export`` stage.
+"""
+
+import numpy as np
+import pandas as pd
+
+COMPONENTS_FILE = 'node_components.csv'
+
+
+def component_frame(node_ids, wcc_labels, scc_labels, wcc_sizes=None, scc_sizes=None):
+    """One row per node: id, weak/strong component label and component size.
+
+    Sizes are counted from the labels unless given, which they must be when
+    ``node_ids`` is only part of the graph.
+    """
+    wcc_labels = np.asarray(wcc_labels)
+    scc_labels = np.asarray(scc_labels)
+    return pd.DataFrame({
+        'id': node_ids,
+        'wcc': wcc_labels,
+        'wcc_size': np.bincount(wcc_labels)[wcc_labels] if wcc_sizes is None else wcc_sizes,
+        'scc': scc_labels,
+        'scc_size': np.bincount(scc_labels)[scc_labels] if scc_sizes is None else scc_sizes,
+    })
@@ -0,0 +1,258 @@
+"""Array-backed directed multigraph for the EDA metrics.
+
+Replaces NetworkX's dict-of-dicts with two index structures over the same
+edge list:
+
+- CSR (by source): ``out_indptr`` / ``out_indices`` give the successors of
+  each node, ``out_edges`` the original edge id of each entry;
+- CSC (by target): ``in_indptr`` / ``in_indices`` / ``in_edges`` give the
+  predecessors.
+
+Nodes are the dense ``int32`` indices produced by :mod:`graph_loader`, so the
+degree arrays line up with ``GraphArrays.node_ids``.  Every query here matches
+the corresponding NetworkX call on the ``MultiDiGraph`` (see
+``parity_check.py``).
+"""
+
+import numpy as np
+
+# Narrowest frontier worth a vectorized trimming pass in strongly_connected_components
+_MIN_PEEL = 64
+
+# Every array a CSRGraph holds
+INDEX_ARRAYS = ('src', 'dst', 'edge_type', 'out_indptr', 'out_indices', 'out_edges',
+                'in_indptr', 'in_indices', 'in_edges')
+
+
+def _index(num_nodes, keys, values):
+    """Stable counting sort of ``values`` by ``keys`` -> (indptr, sorted values, order)."""
+    order = np.argsort(keys, kind='stable').astype(np.int32)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=num_nodes), out=indptr[1:])
+    return indptr, values[order], order
+
+
+def _gather(indptr, indices, nodes):
+    """Concatenate ``indices[indptr[n]:indptr[n + 1]]`` for every n in ``nodes``."""
+    starts = indptr[nodes]
+    lengths = indptr[nodes + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return indices[:0]
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return indices[offsets + np.arange(total)]
+
+
+def _tarjan(num_nodes, indptr, indices):
+    """Iterative Tarjan: SCC label per node (``int32``) and the component count.
+
+    ``indptr`` / ``indices`` only need integer indexing, so lists or
+    memory-mapped arrays both work.
+    """
+    n = num_nodes
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = [False] * n
+    labels = [-1] * n
+    stack = []
+    counter = 0
+    count = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, indptr[root])]
+        while work:
+            node, pos = work[-1]
+            end = indptr[node + 1]
+            while pos < end:
+                child = indices[pos]
+                pos += 1
+                if index[child] == -1:
+                    work[-1] = (node, pos)
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, indptr[child]))
+                    break
+                if on_stack[child] and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        labels[member] = count
+                        if member == node:
+                            break
+                    count += 1
+    return np.array(labels, dtype=np.int32), count
+
+
+def dense_labels(components):
+    """Relabel per-node component ids to ``0..count-1`` by each component's smallest node.
+
+    Returns ``(int32 labels, count)``; any algorithm's labelling of the same
+    partition maps to the same array.
+    """
+    _, first, inverse = np.unique(components, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int32)
+    rank[np.argsort(first, kind='stable')] = np.arange(len(first), dtype=np.int32)
+    return rank[inverse.reshape(-1)], len(first)
+
+
+class CSRGraph:
+    """Directed multigraph stored as CSR + CSC index arrays."""
+
+    def __init__(self, num_nodes, src, dst, edge_type=None):
+        src = np.asarray(src, dtype=np.int32)
+        dst = np.asarray(dst, dtype=np.int32)
+        self.num_nodes = int(num_nodes)
+        self.src = src
+        self.dst = dst
+        # Codes keep the loader's dtype (int8 unless there are over 127 edge types)
+        self.edge_type = (np.asarray(edge_type) if edge_type is not None
+                          else np.zeros(len(src), dtype=np.int8))
+        self.out_indptr, self.out_indices, self.out_edges = _index(self.num_nodes, src, dst)
+        self.in_indptr, self.in_indices, self.in_edges = _index(self.num_nodes, dst, src)
+
+    @classmethod
+    def from_arrays(cls, graph):
+        """Build from a :class:`graph_loader.GraphArrays`."""
+        return cls(graph.num_nodes, graph.edge_src, graph.edge_dst, graph.edge_type)
+
+    @classmethod
+    def from_index_arrays(cls, num_nodes, arrays):
+        """Wrap already built index arrays (see :meth:`index_arrays`) without re-sorting."""
+        graph = cls.__new__(cls)
+        graph.num_nodes = int(num_nodes)
+        for name in INDEX_ARRAYS:
+            setattr(graph, name, arrays[name])
+        return graph
+
+    def index_arrays(self):
+        return {name: getattr(self, name) for name in INDEX_ARRAYS}
+
+    @property
+    def num_edges(self):
+        return len(self.src)
+
+    # ------------------------------------------------------------------
+    # Degrees and density
+    # ------------------------------------------------------------------
+    def out_degree(self):
+        return np.diff(self.out_indptr)
+
+    def in_degree(self):
+        return np.diff(self.in_indptr)
+
+    def degree(self):
+        # Self-loops count twice, as in NetworkX
+        return self.out_degree() + self.in_degree()
+
+    def density(self):
+        n, m = self.num_nodes, self.num_edges
+        if m == 0 or n <= 1:
+            return 0
+        return m / (n * (n - 1))
+
+    # ------------------------------------------------------------------
+    # Neighbor queries
+    # ------------------------------------------------------------------
+    def successors(self, node):
+        return self.out_indices[self.out_indptr[node]:self.out_indptr[node + 1]]
+
+    def predecessors(self, node):
+        return self.in_indices[self.in_indptr[node]:self.in_indptr[node + 1]]
+
+    def edge_subgraph(self, mask, simple=True):
+        """Graph on the same node indices keeping only edges where ``mask`` is set.
+
+        With ``simple=True`` parallel edges collapse to one, like building an
+        ``nx.DiGraph`` from the selected edges (the first edge's type is kept).
+        """
+        src, dst, edge_type = self.src[mask], self.dst[mask], self.edge_type[mask]
+        if simple and len(src):
+            pairs = src.astype(np.int64) * self.num_nodes + dst
+            _, first = np.unique(pairs, return_index=True)
+            first.sort()
+            src, dst, edge_type = src[first], dst[first], edge_type[first]
+        return CSRGraph(self.num_nodes, src, dst, edge_type)
+
+    def has_edges(self):
+        """Boolean mask of nodes incident to at least one edge.
+
+        For an edge subgraph this is the node set NetworkX would report.
+        """
+        return (self.out_degree() + self.in_degree()) > 0
+
+    # ------------------------------------------------------------------
+    # Components
+    # ------------------------------------------------------------------
+    def weakly_connected_components(self):
+        """Dense component label per node (``int32``) and the number of components.
+
+        Vectorized union-find over the edge list; labels are numbered in
+        order of each component's smallest node (see :func:`dense_labels`).
+        """
+        parent = np.arange(self.num_nodes, dtype=np.int64)
+        u, v = self.src.astype(np.int64), self.dst.astype(np.int64)
+        while len(u):
+            # parent is fully compressed here, so it maps every node to its root
+            ru, rv = parent[u], parent[v]
+            apart = ru != rv
+            u, v, ru, rv = u[apart], v[apart], ru[apart], rv[apart]
+            # Hook the larger root under the smaller one; pointers only decrease, so no cycles
+            np.minimum.at(parent, np.maximum(ru, rv), np.minimum(ru, rv))
+            # Pointer jumping: depth halves every pass
+            while True:
+                up = parent[parent]
+                if np.array_equal(up, parent):
+                    break
+                parent = up
+        return dense_labels(parent)
+
+    def strongly_connected_components(self):
+        """Dense SCC label per node (``int32``) and the number of components.
+
+        Nodes that cannot lie on a cycle (no predecessor or no successor once
+        such nodes are peeled away) are singletons and are trimmed in
+        vectorized passes; iterative Tarjan then runs on the remaining core
+        only, so deep chains cannot overflow the Python stack.  Labels are
+        numbered like :meth:`weakly_connected_components`.
+        """
+        n = self.num_nodes
+        alive = np.ones(n, dtype=bool)
+        # Peel sources forward (by in-degree), then sinks backward (by out-degree)
+        for indptr, indices, ends in ((self.out_indptr, self.out_indices, self.dst),
+                                      (self.in_indptr, self.in_indices, self.src)):
+            kept = alive[self.src] & alive[self.dst]
+            degree = np.bincount(ends[kept], minlength=n)
+            frontier = np.flatnonzero(alive & (degree == 0))
+            # A pass costs a few numpy calls, so narrow frontiers are left to Tarjan
+            while len(frontier) >= _MIN_PEEL:
+                alive[frontier] = False
+                reached = _gather(indptr, indices, frontier)
+                candidates, hits = np.unique(reached[alive[reached]], return_counts=True)
+                degree[candidates] -= hits
+                frontier = candidates[degree[candidates] == 0]
+        labels = np.arange(n, dtype=np.int64)
+        core = np.flatnonzero(alive)
+        if len(core):
+            position = np.full(n, -1, dtype=np.int64)
+            position[core] = np.arange(len(core))
+            kept = alive[self.src] & alive[self.dst]
+            indptr, indices, _ = _index(len(core), position[self.src[kept]], position[self.dst[kept]])
+            core_labels, _ = _tarjan(len(core), indptr.tolist(), indices.tolist())
+            # Name each core component by its smallest member, as trimmed nodes name themselves
+            labels[core] = core[np.unique(core_labels, return_index=True)[1]][core_labels]
+        return dense_labels(labels)
@@ -0,0 +1,358 @@
+"""Small pre-aggregated JSON payloads for the dashboard pages.
+
+The rising stars, Sankey, Oceanus Folk timeline and Sailor Shift ego-network
+pages used to fetch the whole MC1_graph.json and rebuild lookups in the
+browser (``nodes.find`` inside a loop over every link).  Each function here
+computes exactly what one page renders, from the columnar graph, and
+:func:`write_payloads` saves them as ``<out_dir>/payloads/<view>.json``:
+
+- ``rising_stars.json``: predictions, trajectories and the metrics panel;
+- ``sankey_flows.json``: inward/outward genre and genre → artist flow tables
+  per Sailor Shift era, heaviest first;
+- ``oceanus_timeline.json``: outward/inward influence counts per year;
+- ``sailor_ego.json``: the depth-2 ego network around Sailor Shift.
+
+Links are visited in file order and dictionaries keep first-seen order, so
+ties and orderings come out as the page logic produced them.
+
+    python eda.py --only dashboard_payloads
+"""
+
+import json
+import os
+import re
+from functools import cached_property, partial
+
+import numpy as np
+import pandas as pd
+
+from artist_index import OCEANUS_FOLK, RECENT_WINDOW, UNKNOWN_GENRE, ArtistIndex
+
+WORK_TYPES = ('Song', 'Album')
+
+# rising_stars.js: Oceanus Folk contributors with recent releases (ranked by artist_index)
+TOP_PREDICTIONS = 5
+TOP_TRAJECTORIES = 3
+
+# success_sankey.js eras, by release year of the Oceanus Folk work
+ERAS = {
+    'all': (None, None),
+    'pre': (None, 2023),
+    'mid': (2023, 2030),
+    'peak': (2031, 2039),
+}
+# Genre → artist rows lighter than this are left out of the payload (the page's
+# default flow strength); most artists are credited on a single influenced work
+MIN_ARTIST_FLOW = 2
+
+# sailor_ego_network.js
+EGO_CENTER = 'Sailor Shift'
+INFLUENCE_EDGES = ('InStyleOf', 'CoverOf', 'DirectlySamples', 'InterpolatesFrom', 'LyricalReferenceTo')
+
+PAYLOAD_DIR = 'payloads'
+
+
+class _View:
+    """Decoded node columns and a file-order incidence index shared by the payloads."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.ids = graph.node_ids
+        self.names = graph.text['name']
+        self.types = graph.decode('Node Type')
+        self.genres = graph.decode('genre')
+        self.release = graph.decode('release_date')
+        self.notable = np.asarray(graph.columns['notable']) == 1
+        self.src = np.asarray(graph.edge_src, dtype=np.int64)
+        self.dst = np.asarray(graph.edge_dst, dtype=np.int64)
+        self.edge_types = [graph.edge_types[c] if c >= 0 else None
+                           for c in np.asarray(graph.edge_type).tolist()]
+
+        # Edges touching each node, ascending edge id (self-loops listed once)
+        edges = np.arange(graph.num_edges, dtype=np.int64)
+        loop = self.src == self.dst
+        nodes = np.concatenate([self.src, self.dst[~loop]])
+        edges = np.concatenate([edges, edges[~loop]])
+        order = np.lexsort((edges, nodes))
+        self.incident = edges[order]
+        self.indptr = np.zeros(graph.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(nodes, minlength=graph.num_nodes), out=self.indptr[1:])
+
+        self.by_name = {}
+        for i, name in enumerate(self.names):
+            self.by_name.setdefault(name, i)
+
+        codes = np.asarray(graph.columns['Node Type'])
+        type_names = graph.categories['Node Type']
+        self.work = np.isin(codes, [type_names.index(t) for t in WORK_TYPES if t in type_names])
+
+    @cached_property
+    def artists(self):
+        return ArtistIndex(self.graph)
+
+    def edges_of(self, i):
+        return self.incident[self.indptr[i]:self.indptr[i + 1]].tolist()
+
+    def other(self, e, i):
+        return int(self.dst[e]) if self.src[e] == i else int(self.src[e])
+
+    def work_genre_labels(self):
+        """Genre label per node (missing → 'Unknown') as integer ids plus their names."""
+        categories = self.graph.categories['genre']
+        labels = list(categories)
+        missing = labels.index(UNKNOWN_GENRE) if UNKNOWN_GENRE in labels else len(labels)
+        if missing == len(labels):
+            labels.append(UNKNOWN_GENRE)
+        codes = np.asarray(self.graph.columns['genre'], dtype=np.int64)
+        return np.where(codes < 0, missing, codes), labels
+
+    def release_years(self):
+        """Leading integer of release_date per node (0 where missing), like ``parseInt``."""
+        values = self.graph.categories['release_date']
+        years = np.array([_parse_int(v) for v in values] + [0], dtype=np.int64)
+        return years[np.asarray(self.graph.columns['release_date'], dtype=np.int64)]
+
+
+def _parse_int(value):
+    match = re.match(r'\s*([+-]?\d+)', str(value))
+    return int(match.group(1)) if match else 0
+
+
+# ---------------------------------------------------------------------------
+# Rising stars
+# ---------------------------------------------------------------------------
+
+def artist_metrics(view, artist):
+    """Works, timeline and success metrics of one artist (``processArtistMetrics``)."""
+    works, collaborators, genres, timeline = set(), set(), {}, []
+    for e in view.edges_of(artist):
+        other = view.other(e, artist)
+        node_type = view.types[other]
+        if node_type in WORK_TYPES:
+            works.add(other)
+            genre = view.genres[other]
+            if genre:
+                genres[genre] = None
+            if view.release[other]:
+                timeline.append({
+                    'id': view.ids[other],
+                    'date': view.release[other],
+                    'type': node_type,
+                    'name': view.names[other] or f"{node_type} {view.ids[other]}",
+                    'genre': genre or UNKNOWN_GENRE,
+                    'notable': bool(view.notable[other]),
+                })
+        elif node_type == 'Person':
+            collaborators.add(other)
+
+    # Time to success is measured in link order, before the timeline is sorted
+    time_to_success = None
+    first_notable = next((work for work in timeline if work['notable']), None)
+    if first_notable is not None:
+        delta = pd.Timestamp(first_notable['date']) - pd.Timestamp(timeline[0]['date'])
+        time_to_success = delta.total_seconds() / (60 * 60 * 24 * 365)
+    timeline.sort(key=lambda work: pd.Timestamp(work['date']))
+
+    return {
+        'timeline': timeline,
+        'notableWorks': sum(work['notable'] for work in timeline),
+        'timeToSuccess': time_to_success,
+        'genreSpread': len(genres),
+        'collaborationScore': int(view.notable[list(collaborators)].sum()) if collaborators else 0,
+        'totalWorks': len(works),
+        'genres': list(genres),
+    }
+
+
+def rising_stars(view, window=RECENT_WINDOW):
+    """Everything rising_stars.html renders: predictions, trajectories, metrics."""
+    # Candidates and scores for every artist come from one vectorized pass;
+    # only the few predictions are expanded into full metrics here
+    predictions = []
+    for star in view.artists.ranking(window).head(TOP_PREDICTIONS).to_dict('records'):
+        metrics = artist_metrics(view, view.by_name[star['name']])
+        summary = {key: value for key, value in metrics.items() if key != 'timeline'}
+        predictions.append({'name': star['name'], 'metrics': summary, 'score': float(star['score'])})
+
+    trajectories = {}
+    for star in predictions[:TOP_TRAJECTORIES]:
+        trajectories[star['name']] = artist_metrics(view, view.by_name[star['name']])
+
+    times = [m['timeToSuccess'] for m in trajectories.values() if m['timeToSuccess']]
+    collaborations = {}
+    for name in trajectories:
+        artist = view.by_name[name]
+        for e in view.edges_of(artist):
+            other = view.other(e, artist)
+            if view.types[other] == 'Person' and view.notable[other]:
+                key = (name, view.names[other])
+                collaborations[key] = collaborations.get(key, 0) + 1
+    key_collaborations = sorted(collaborations.items(), key=lambda item: -item[1])[:10]
+
+    return {
+        'window': list(window),
+        'trajectories': [{'artist': name, **metrics} for name, metrics in trajectories.items()],
+        'metrics': {
+            'averageTimeToSuccess': float(np.mean(times)) if times else None,
+            'keyCollaborations': [{'artists': list(key), 'count': count} for key, count in key_collaborations],
+            'genreVersatility': [{'artist': name, 'genres': m['genres'], 'versatility': m['genreSpread']}
+                                 for name, m in trajectories.items()],
+        },
+        'predictions': predictions,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Oceanus Folk flows
+# ---------------------------------------------------------------------------
+
+def _oceanus_flows(view):
+    """Work→work edges crossing the Oceanus Folk boundary, with genres and years."""
+    genre, labels = view.work_genre_labels()
+    oceanus = labels.index(OCEANUS_FOLK) if OCEANUS_FOLK in labels else -1
+    is_of = view.work & (genre == oceanus)
+    both = view.work[view.src] & view.work[view.dst]
+    inward = both & is_of[view.dst] & ~is_of[view.src]
+    outward = both & is_of[view.src] & ~is_of[view.dst]
+    years = view.release_years()
+    return {
+        'labels': labels,
+        'inward': (genre[view.src[inward]], years[view.dst[inward]]),
+        'outward': (genre[view.dst[outward]], years[view.src[outward]]),
+        'influenced': view.dst[outward],
+    }
+
+
+def _heaviest_first(keys):
+    """Distinct ``keys`` and their counts, largest count first (ties in order of first occurrence)."""
+    unique, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.lexsort((first, -counts))
+    return unique[order], counts[order]
+
+
+def _genre_table(genres, labels):
+    unique, counts = _heaviest_first(genres)
+    return [[labels[g], int(c)] for g, c in zip(unique, counts)]
+
+
+def _artist_table(view, genres, works, labels):
+    """[[genre, artist, count], ...] down to MIN_ARTIST_FLOW: each influence on a work of
+    ``genre`` counts once for every person credited on it (PerformerOf / ComposerOf)."""
+    rows, people = view.artists.credits(works)
+    n = view.graph.num_nodes
+    unique, counts = _heaviest_first(genres[rows].astype(np.int64) * n + people)
+    keep = counts >= MIN_ARTIST_FLOW
+    return [[labels[key // n], view.names[key % n], int(c)] for key, c in zip(unique[keep], counts[keep])]
+
+
+def _era_mask(years, era):
+    low, high = ERAS[era]
+    mask = years != 0
+    if low is not None:
+        mask &= years >= low
+    if high is not None:
+        mask &= years <= high
+    return mask
+
+
+def sankey_flows(view):
+    """Oceanus Folk → genre → artist flow tables per era (success_sankey.js).
+
+    Every table is sorted by weight, heaviest first, so the rows above any
+    flow-strength threshold are a prefix of it (for artists, any threshold
+    from ``MIN_ARTIST_FLOW`` up).
+    """
+    flows = _oceanus_flows(view)
+    labels = flows['labels']
+    eras = {}
+    for era in ERAS:
+        inward, outward = (_era_mask(flows[direction][1], era) for direction in ('inward', 'outward'))
+        genres = flows['outward'][0][outward]
+        eras[era] = {
+            'inward': _genre_table(flows['inward'][0][inward], labels),
+            'outward': _genre_table(genres, labels),
+            'artists': _artist_table(view, genres, flows['influenced'][outward], labels),
+        }
+    return {'eras': {era: list(bounds) for era, bounds in ERAS.items()}, 'minArtistFlow': MIN_ARTIST_FLOW,
+            'flows': eras}
+
+
+def oceanus_timeline(view):
+    """Outward and inward Oceanus Folk influence counts per release year."""
+    flows = _oceanus_flows(view)
+    timeline = {}
+    for direction in ('outward', 'inward'):
+        years = flows[direction][1]
+        years = years[years != 0]
+        unique, counts = np.unique(years, return_counts=True)
+        timeline[direction] = [{'year': int(y), 'count': int(c)} for y, c in zip(unique, counts)]
+    return timeline
+
+
+# ---------------------------------------------------------------------------
+# Ego network
+# ---------------------------------------------------------------------------
+
+def ego_network(view, center=EGO_CENTER):
+    """Nodes and links within two hops of ``center`` (sailor_ego_network.js)."""
+    if center not in view.by_name:
+        return None
+    c = view.by_name[center]
+    nodes, links = {}, {}
+
+    def add_node(i, depth):
+        nodes[i] = {'id': view.ids[i], 'name': view.names[i], 'type': view.types[i],
+                    'notable': bool(view.notable[i]), 'depth': depth}
+
+    def add_link(e):
+        key = (int(view.src[e]), int(view.dst[e]))
+        if key not in links:
+            links[key] = {'source': view.ids[key[0]], 'target': view.ids[key[1]],
+                          'type': view.edge_types[e], 'isInfluence': view.edge_types[e] in INFLUENCE_EDGES}
+
+    add_node(c, 0)
+    nodes[c]['center'] = True
+    for e in view.edges_of(c):
+        other = view.other(e, c)
+        if other not in nodes:
+            add_node(other, 1)
+        add_link(e)
+    for i in [i for i, node in nodes.items() if node['depth'] == 1]:
+        for e in view.edges_of(i):
+            other = view.other(e, i)
+            if other == c:
+                continue
+            if other not in nodes:
+                add_node(other, 2)
+            add_link(e)
+    return {'nodes': list(nodes.values()), 'links': list(links.values())}
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+PAYLOADS = {
+    'rising_stars': rising_stars,
+    'sankey_flows': sankey_flows,
+    'oceanus_timeline': oceanus_timeline,
+    'sailor_ego': ego_network,
+}
+
+
+def build_payloads(graph, names=None, window=RECENT_WINDOW):
+    view = _View(graph)
+    payloads = dict(PAYLOADS, rising_stars=partial(rising_stars, window=window))
+    return {name: payloads[name](view) for name in (names or PAYLOADS)}
+
+
+def write_payloads(graph, out_dir='.', names=None, window=RECENT_WINDOW):
+    """Write compact ``<out_dir>/payloads/<name>.json`` files; returns name → path."""
+    directory = os.path.join(out_dir, PAYLOAD_DIR)
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, payload in build_payloads(graph, names, window).items():
+        paths[name] = os.path.join(directory, f"{name}.json")
+        with open(paths[name], 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    return paths
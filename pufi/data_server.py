@@ -0,0 +1,433 @@
+"""Local HTTP data server: filtered graph queries and static files, precompressed and ETag'd.
+
+The pages fetch the whole MC1_graph.json (or songs_albums_analysis.csv) and
+filter it in the browser.  :class:`DataIndex` keeps the graph loaded by
+eda.py's ``load`` stage in memory, with per-node code columns (type, genre,
+release year, notable) and the edge table, and answers the same filters
+with array masks:
+
+- ``/nodes``: node records (as in the node-link JSON) matching the node
+  filters ``type``, ``genre``, ``years`` (``2020-2030``, ``2030-``, ``-2010``,
+  inclusive) and ``notable``;
+- ``/links``: links of the ``edges`` filter (``all``, an
+  ``EDGE_CATEGORIES`` name or edge types) whose endpoints match the node
+  filters, on the ``side`` given (``both``, ``source``, ``target``,
+  ``either``);
+- ``/graph``: a node-link document of the matching nodes and the links
+  between them, loadable wherever MC1_graph.json is;
+- ``/songs_albums``: rows of songs_albums_analysis.csv (``format=csv`` or
+  ``json``);
+- ``/ego``: the k-hop neighbourhoods of :mod:`ego_query`;
+- any other path: a file under ``--root`` (the pages, MC1_graph.json,
+  ``payloads/``), so the dashboards can be served from the same origin.
+
+``offset`` / ``limit`` page through ``/nodes`` and ``/links``.  Every body is
+compressed once when it is built (gzip, and brotli when the ``brotli``
+package is installed) and kept with a content hash ETag in an LRU cache of
+hot queries bounded by total body bytes (static files are keyed by their
+size and mtime; bodies over an eighth of the budget are rebuilt on every
+request).  Requests get the best encoding their ``Accept-Encoding`` allows,
+and an ``If-None-Match`` carrying the ETag gets ``304 Not Modified``.
+Dotfiles and dot directories under ``--root`` (``.git``, ``.mc1_cache``) are
+never served.
+
+    python data_server.py --root .. --port 8000
+
+    GET /nodes?type=Song,Album&genre=Oceanus%20Folk&years=2030-&notable=true
+    GET /links?edges=creative_influences&genre=Oceanus%20Folk&side=target
+    GET /songs_albums?years=2020-2030&format=json
+    GET /ego?name=Sailor%20Shift&hops=2
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import numpy as np
+
+from ego_query import ALL_EDGES, DEFAULT_HOPS, NeighborhoodIndex
+from node_frame import node_frame, node_years, songs_albums
+
+try:
+    import brotli
+except ImportError:  # optional: responses are then offered gzip only
+    brotli = None
+
+DEFAULT_CACHE_MB = 64
+STATIC_CACHE_MB = 64
+# Bodies larger than this share of a cache's budget are not cached
+MAX_ENTRY_SHARE = 1 / 8
+# Bodies smaller than this are sent as they are
+MIN_COMPRESS_SIZE = 512
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 6
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript', 'image/svg+xml')
+
+NODE_FILTERS = ('type', 'genre', 'years', 'notable')
+PAGE_PARAMS = ('offset', 'limit')
+LINK_SIDES = ('both', 'source', 'target', 'either')
+NO_YEAR = np.iinfo(np.int32).min
+
+
+class Encoded:
+    """A response body with its compressed variants and ETag."""
+
+    def __init__(self, body, content_type):
+        self.content_type = content_type
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self.bodies = {'identity': body}
+        if len(body) >= MIN_COMPRESS_SIZE and content_type.startswith(COMPRESSIBLE_TYPES):
+            if brotli is not None:
+                self.bodies['br'] = brotli.compress(body, quality=BROTLI_QUALITY)
+            self.bodies['gzip'] = gzip.compress(body, GZIP_LEVEL, mtime=0)
+
+    def negotiate(self, accept_encoding):
+        """Smallest variant the ``Accept-Encoding`` header allows."""
+        accepted = {}
+        for item in (accept_encoding or '').split(','):
+            coding, _, quality = item.strip().partition(';')
+            try:
+                weight = float(quality.strip()[2:]) if quality.strip().startswith('q=') else 1.0
+            except ValueError:
+                weight = 0.0
+            accepted[coding.strip().lower()] = weight
+        usable = [coding for coding in self.bodies
+                  if coding == 'identity' or accepted.get(coding, accepted.get('*', 0)) > 0]
+        return min(usable, key=lambda coding: len(self.bodies[coding]))
+
+    @property
+    def size(self):
+        return sum(len(body) for body in self.bodies.values())
+
+    def tag(self, coding):
+        # Each encoding is a different representation, so it gets its own strong ETag
+        return f'"{self.etag}"' if coding == 'identity' else f'"{self.etag}-{coding}"'
+
+    def matches(self, if_none_match):
+        tags = {t.strip().removeprefix('W/').strip('"').split('-')[0] for t in (if_none_match or '').split(',')}
+        return '*' in tags or self.etag in tags
+
+
+class ResponseCache:
+    """LRU of :class:`Encoded` responses bounded by the total size of their bodies."""
+
+    def __init__(self, max_mb):
+        self.max_bytes = int(max_mb * 2 ** 20)
+        self.max_entry_bytes = int(self.max_bytes * MAX_ENTRY_SHARE)
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build, *args):
+        """Cached response for ``key``, else ``build(*args)`` (kept when small enough)."""
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                return encoded
+        encoded = build(*args)
+        if encoded.size <= self.max_entry_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = encoded
+                    self.bytes += encoded.size
+                    while self.bytes > self.max_bytes:
+                        self.bytes -= self._entries.popitem(last=False)[1].size
+        return encoded
+
+
+def encode_json(payload):
+    return Encoded(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+                   'application/json; charset=utf-8')
+
+
+def _flag(text):
+    value = text.strip().lower()
+    if value in ('1', 'true', 'yes'):
+        return True
+    if value in ('0', 'false', 'no'):
+        return False
+    raise ValueError(f"Expected true or false, got {text!r}")
+
+
+def _year_range(text):
+    """``'2020-2030'`` / ``'2030-'`` / ``'-2010'`` / ``'2024'`` -> inclusive (start, end), None = open."""
+    start, dash, end = text.strip().partition('-')
+    try:
+        start = int(start) if start.strip() else None
+        end = (int(end) if end.strip() else None) if dash else start
+    except ValueError:
+        raise ValueError(f"years must look like 2020-2030, 2030- or -2010, got {text!r}") from None
+    return start, end
+
+
+def _items(text):
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+
+class DataIndex:
+    """In-memory code columns and edge table answering the server's filtered queries."""
+
+    def __init__(self, graph, cache_mb=DEFAULT_CACHE_MB):
+        self.graph = graph
+        # Encoded ego responses are cached below, so the index keeps no results of its own
+        self.neighborhoods = NeighborhoodIndex(graph, cache_size=0)
+        self.edges = self.neighborhoods.edges
+        self.node_type = np.asarray(graph.columns['Node Type'])
+        self.genre = np.asarray(graph.columns['genre'])
+        self.notable = np.asarray(graph.columns['notable'])
+        self.year = node_years(graph, 'release_date').to_numpy(dtype=np.int32, na_value=NO_YEAR)
+        self.cache = ResponseCache(cache_mb)
+        self.endpoints = {
+            '/nodes': (self.nodes, NODE_FILTERS + PAGE_PARAMS),
+            '/links': (self.links, NODE_FILTERS + PAGE_PARAMS + ('edges', 'side')),
+            '/graph': (self.subgraph, NODE_FILTERS + ('edges',)),
+            '/songs_albums': (self.songs_albums, NODE_FILTERS + ('format',)),
+            '/ego': (self.ego, ('id', 'name', 'hops', 'edges')),
+        }
+
+    @cached_property
+    def table(self):
+        """songs_albums_analysis.csv rows and the dense node index of each row."""
+        df = songs_albums(node_frame(self.graph))
+        return df, np.fromiter((self.graph.node_index[i] for i in df['id']), dtype=np.int64, count=len(df))
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+    def _codes(self, column, text):
+        categories = self.graph.categories[column]
+        values = _items(text)
+        unknown = [v for v in values if v not in categories]
+        if unknown:
+            raise ValueError(f"Unknown {column} {', '.join(map(repr, unknown))}")
+        return [categories.index(v) for v in values]
+
+    def node_mask(self, params):
+        """Nodes matching every node filter in ``params``."""
+        mask = np.ones(self.graph.num_nodes, dtype=bool)
+        if 'type' in params:
+            mask &= np.isin(self.node_type, self._codes('Node Type', params['type']))
+        if 'genre' in params:
+            mask &= np.isin(self.genre, self._codes('genre', params['genre']))
+        if 'years' in params:
+            start, end = _year_range(params['years'])
+            mask &= self.year != NO_YEAR
+            if start is not None:
+                mask &= self.year >= start
+            if end is not None:
+                mask &= self.year <= end
+        if 'notable' in params:
+            mask &= self.notable == int(_flag(params['notable']))
+        return mask
+
+    def link_mask(self, params, side='both'):
+        """Links of the ``edges`` filter whose ``side`` endpoints match the node filters."""
+        key = self.neighborhoods.edge_filter_key(params.get('edges'))
+        if key == ALL_EDGES:
+            mask = np.ones(self.edges.num_edges, dtype=bool)
+        else:
+            mask = self.edges.category_mask(key) if isinstance(key, str) else self.edges.mask(key)
+        if side not in LINK_SIDES:
+            raise ValueError(f"side must be one of {', '.join(LINK_SIDES)}")
+        if any(name in params for name in NODE_FILTERS):
+            nodes = self.node_mask(params)
+            src, dst = nodes[self.edges.src], nodes[self.edges.dst]
+            mask &= {'both': src & dst, 'source': src, 'target': dst, 'either': src | dst}[side]
+        return mask
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+    def _node_records(self, rows):
+        ids = self.graph.node_ids
+        return [{**self.graph.node_attrs(i), 'id': ids[i]} for i in rows.tolist()]
+
+    def _link_records(self, rows):
+        ids, graph = self.graph.node_ids, self.graph
+        return [{'source': ids[s], 'target': ids[t], **graph.edge_attrs(e)}
+                for e, s, t in zip(rows.tolist(), self.edges.src[rows].tolist(), self.edges.dst[rows].tolist())]
+
+    @staticmethod
+    def _page(rows, params):
+        offset = int(params.get('offset', 0))
+        limit = int(params['limit']) if 'limit' in params else None
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset and limit must not be negative")
+        return rows[offset:None if limit is None else offset + limit], offset
+
+    def nodes(self, params):
+        rows = np.flatnonzero(self.node_mask(params))
+        page, offset = self._page(rows, params)
+        return {'total': len(rows), 'offset': offset, 'nodes': self._node_records(page)}
+
+    def links(self, params):
+        rows = np.flatnonzero(self.link_mask(params, params.get('side', 'both')))
+        page, offset = self._page(rows, params)
+        return {'total': len(rows), 'offset': offset, 'links': self._link_records(page)}
+
+    def subgraph(self, params):
+        attrs = self.graph.graph_attrs
+        return {'directed': attrs.get('directed', False), 'multigraph': attrs.get('multigraph', True),
+                'graph': attrs.get('graph', {}),
+                'nodes': self._node_records(np.flatnonzero(self.node_mask(params))),
+                'links': self._link_records(np.flatnonzero(self.link_mask(params)))}
+
+    def songs_albums(self, params):
+        fmt = params.get('format', 'csv')
+        if fmt not in ('csv', 'json'):
+            raise ValueError("format must be csv or json")
+        df, rows = self.table
+        df = df[self.node_mask(params)[rows]]
+        return json.loads(df.to_json(orient='records')) if fmt == 'json' else df.to_csv(index=False)
+
+    def ego(self, params):
+        index = self.neighborhoods
+        if 'id' not in params and 'name' not in params:
+            raise ValueError("id or name is required")
+        node_id = params['id'] if 'id' in params else index.node_by_name(params['name'])
+        node_id = self.graph.node_ids[index.node_index(node_id)]
+        return index.ego(node_id, int(params.get('hops', DEFAULT_HOPS)), params.get('edges'))
+
+    def _response(self, path, params):
+        func, allowed = self.endpoints[path]
+        unknown = sorted(set(params) - set(allowed))
+        if unknown:
+            raise ValueError(f"Unknown parameter {', '.join(unknown)} for {path}; expected {', '.join(allowed)}")
+        result = func(params)
+        if isinstance(result, str):
+            return Encoded(result.encode('utf-8'), 'text/csv; charset=utf-8')
+        return encode_json(result)
+
+    def query(self, path, params):
+        """Cached :class:`Encoded` response of an endpoint for the ``params`` dict."""
+        return self.cache.get((path, tuple(sorted(params.items()))), self._response, path, params)
+
+
+class StaticFiles:
+    """Files under ``root`` except dotfiles, encoded once per (path, size, mtime)."""
+
+    def __init__(self, root, cache_mb=STATIC_CACHE_MB):
+        self.root = os.path.realpath(root)
+        self.cache = ResponseCache(cache_mb)
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith(('text/', 'application/javascript', 'application/json')):
+            content_type += '; charset=utf-8'
+        return Encoded(body, content_type)
+
+    def get(self, url_path):
+        path = os.path.realpath(os.path.join(self.root, unquote(url_path).lstrip('/')))
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        # '..' (outside the root) and hidden files such as .git/ both start with a dot
+        hidden = any(part.startswith('.') for part in os.path.relpath(path, self.root).split(os.sep))
+        if hidden or not os.path.isfile(path):
+            raise KeyError(f"Not found: {url_path}")
+        stat = os.stat(path)
+        return self.cache.get((path, stat.st_size, stat.st_mtime_ns), self._read, path)
+
+
+# ---------------------------------------------------------------------------
+# HTTP endpoint
+# ---------------------------------------------------------------------------
+
+def _handler(index, static=None):
+    class DataHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are separate writes; without TCP_NODELAY keep-alive
+        # clients wait out the delayed ACK on every response
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            try:
+                if url.path in index.endpoints:
+                    params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                    encoded = index.query(url.path, params)
+                elif static is not None:
+                    encoded = static.get(url.path)
+                else:
+                    raise KeyError(f"Unknown path {url.path}; use {', '.join(index.endpoints)}")
+            except KeyError as exc:
+                return self._send(404, encode_json({'error': exc.args[0]}))
+            except ValueError as exc:
+                return self._send(400, encode_json({'error': str(exc)}))
+            self._send(200, encoded)
+
+        def _send(self, status, encoded):
+            coding = encoded.negotiate(self.headers.get('Accept-Encoding'))
+            if status == 200 and encoded.matches(self.headers.get('If-None-Match')):
+                status = 304
+            self.send_response(status)
+            self.send_header('ETag', encoded.tag(coding))
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            if status == 304:
+                # No body, and a Content-Length here would have to be the 200 body's
+                self.end_headers()
+                return
+            body = encoded.bodies[coding]
+            self.send_header('Content-Type', encoded.content_type)
+            self.send_header('Content-Length', str(len(body)))
+            if coding != 'identity':
+                self.send_header('Content-Encoding', coding)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return DataHandler
+
+
+def make_server(index, root=None, host='127.0.0.1', port=8000, static_cache_mb=STATIC_CACHE_MB):
+    static = StaticFiles(root, static_cache_mb) if root is not None else None
+    return ThreadingHTTPServer((host, port), _handler(index, static))
+
+
+def serve(index, root=None, host='127.0.0.1', port=8000):
+    server = make_server(index, root, host, port)
+    print(f"Serving {', '.join(index.endpoints)}{' and ' + root if root else ''} "
+          f"on http://{host}:{server.server_port}/ (brotli {'on' if brotli else 'off'})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def load_index(graph_path='MC1_graph.json', cache_mb=DEFAULT_CACHE_MB):
+    """Index over the graph loaded by eda.py's ``load`` stage."""
+    from eda import pipeline
+    return DataIndex(pipeline.run(['load'], graph_path=graph_path)['load']['graph'], cache_mb)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP data server for the MC1 dashboards.")
+    parser.add_argument('--graph', default='MC1_graph.json', help="node-link JSON graph (default: %(default)s)")
+    parser.add_argument('--root', help="also serve the files under this directory (e.g. .. for the pages)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-mb', type=float, default=DEFAULT_CACHE_MB,
+                        help="memory for cached query responses, in MB (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    serve(load_index(args.graph, args.cache_mb), args.root, args.host, args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,804 +1,923 @@
-# %% [markdown]
-# # MC1 Musical Influence Graph - Exploratory Data Analysis
-# 
+# MC1 Musical Influence Graph - Exploratory Data Analysis
+#
 # ## Overview
-# This notebook performs an exploratory data analysis of the VAST 2025 MC1 musical influence graph dataset.
-# 
+# Exploratory data analysis of the VAST 2025 MC1 musical influence graph dataset,
+# organised as a lazily evaluated pipeline of named stages (see pipeline.py).
+#
 # **Dataset characteristics:**
 # - **File**: MC1_graph.json
-# - **Type**: Directed Multigraph  
+# - **Type**: Directed Multigraph
 # - **Nodes**: 17,412
 # - **Edges**: 37,857
 # - **Connected Components**: 18
 # - **Node Types**: Person, Song, RecordLabel, Album, MusicalGroup
 # - **Edge Types**: 12 different relationship types
-# 
+#
 # **Data Sources:**
 # - Crowdsourced musical influence repository
 # - Song popularity data from journalist Silas Reed
-# 
-
-# %%
-# Import required libraries
+#
+# **Usage:**
+#     python eda.py                      # every stage, figures saved under <out-dir>/figures
+#     python eda.py --only export        # just the saved datasets, no plotting imports
+#     python eda.py --only export --format parquet arrow   # plus typed columnar copies
+#     python eda.py --no-figures         # full report without rendering
+#     python eda.py --show-figures       # figure windows, as in the notebook
+#     python eda.py --list               # stages and their dependencies
+#
+# Figure stages return figures.FigureSpec records (data plus a drawing function
+# from eda_figures.py); they are rendered after the run, in a process pool,
+# and only when their data changed (see figures.py).
+#
+# Other modules can import the pipeline and evaluate stages on demand:
+#     from eda import pipeline
+#     run = pipeline.run(['structure'], graph_path='MC1_graph.json')
+#     run['structure']['largest_wcc_size']
+
+import argparse
 import json
-import networkx as nx
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter, defaultdict
+import os
 import warnings
-warnings.filterwarnings('ignore')
+from collections import Counter, defaultdict
 
-# Set plotting style
-plt.style.use('default')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 8)
+import numpy as np
 
-print("Libraries imported successfully!")
+from csr_graph import CSRGraph
+from edge_table import EDGE_CATEGORIES, EdgeTable
+import eda_figures
+from figures import figure
+from graph_cache import load_graph_cached
+from influence_split import split_codes, split_tallies, split_values
+from node_frame import WORK_TYPES, node_frame, songs_albums, type_mask
+import parallel_runner
+from pipeline import Pipeline
 
+warnings.filterwarnings('ignore')
 
-# %%
+pipeline = Pipeline()
+
+# Stages run by a plain `python eda.py`, in report order
+DEFAULT_STAGES = [
+    'load',
+    'node_table', 'node_figures',
+    'edge_table', 'edge_figures',
+    'temporal', 'temporal_figures',
+    'structure', 'structure_figures',
+    'influence', 'influence_figures',
+    'cascade', 'genre_matrix',
+    'summary',
+    'export',
+    'dashboard_payloads',
+    'rising_stars',
+]
+
+# ---------------------------------------------------------------------------
 # Load the graph data
-print("Loading MC1_graph.json...")
-with open('MC1_graph.json', 'r', encoding='utf-8') as f:
-    graph_data = json.load(f)
-
-# Convert to NetworkX graph
-G = nx.node_link_graph(graph_data)
-
-print(f"Graph loaded successfully!")
-print(f"Number of nodes: {G.number_of_nodes():,}")
-print(f"Number of edges: {G.number_of_edges():,}")
-print(f"Is directed: {G.is_directed()}")
-print(f"Is multigraph: {G.is_multigraph()}")
-print(f"Number of connected components: {nx.number_weakly_connected_components(G)}")
-
-
-# %% [markdown]
-# ## 1. Node Analysis
-# 
-
-# %%
-# Analyze node types
-node_types = [G.nodes[node].get('Node Type', 'Unknown') for node in G.nodes()]
-node_type_counts = Counter(node_types)
-
-print("Node Type Distribution:")
-print("-" * 30)
-for node_type, count in node_type_counts.most_common():
-    percentage = (count / len(node_types)) * 100
-    print(f"{node_type:>15}: {count:>6,} ({percentage:.1f}%)")
-
-# Visualize node type distribution
-plt.figure(figsize=(12, 6))
-types, counts = zip(*node_type_counts.most_common())
-colors = sns.color_palette("husl", len(types))
-
-plt.subplot(1, 2, 1)
-# Increase figure size and adjust pie chart
-plt.pie(counts, labels=types, autopct='%1.1f%%', colors=colors, startangle=90,
-        labeldistance=1.2, pctdistance=0.8)  # Adjust label and percentage distances
-plt.title('Node Type Distribution')
-
-plt.subplot(1, 2, 2)
-bars = plt.bar(types, counts, color=colors)
-plt.title('Node Type Counts')
-plt.xlabel('Node Type')
-plt.ylabel('Count')
-plt.xticks(rotation=45)
-for bar, count in zip(bars, counts):
-    percentage = (count / sum(counts)) * 100
-    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 100, f'{percentage:.1f}%', 
-             ha='center', va='bottom')
-
-plt.tight_layout()
-plt.show()
-
-
-# %%
-# Analyze Songs and Albums in detail
-songs_and_albums = [node for node in G.nodes() if G.nodes[node].get('Node Type') in ['Song', 'Album']]
-
-print(f"Total Songs and Albums: {len(songs_and_albums):,}")
-
-# Extract detailed information
-songs_albums_data = []
-for node in songs_and_albums:
-    node_data = G.nodes[node]
-    songs_albums_data.append({
-        'id': node,
-        'type': node_data.get('Node Type'),
-        'genre': node_data.get('genre'),
-        'notable': node_data.get('notable', False),
-        'release_date': node_data.get('release_date'),
-        'notoriety_date': node_data.get('notoriety_date'),
-        'written_date': node_data.get('written_date'),
-        'single': node_data.get('single') if node_data.get('Node Type') == 'Song' else None
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('load')
+def load(run):
+    """Load MC1_graph.json into columnar arrays and a CSR view."""
+    path = run.params.get('graph_path', 'MC1_graph.json')
+    print(f"Loading {os.path.basename(path)}...")
+    # Stream nodes/links into compact columns instead of holding the full JSON dict;
+    # warm runs memory-map the cached columns (rebuilt whenever the JSON changes)
+    graph = load_graph_cached(path)
+
+    # Array-backed CSR/CSC view used for degree, density and component queries
+    csr = CSRGraph.from_arrays(graph)
+    wcc_labels, wcc_count = csr.weakly_connected_components()
+
+    print(f"Graph loaded successfully!")
+    print(f"Number of nodes: {csr.num_nodes:,}")
+    print(f"Number of edges: {csr.num_edges:,}")
+    print(f"Is directed: {graph.graph_attrs.get('directed', False)}")
+    print(f"Is multigraph: {graph.graph_attrs.get('multigraph', True)}")
+    print(f"Number of connected components: {wcc_count}")
+    return {'graph': graph, 'csr': csr, 'wcc_labels': wcc_labels, 'wcc_count': wcc_count}
+
+
+# ---------------------------------------------------------------------------
+# 1. Node Analysis
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('node_table', deps=('load',))
+def node_table(run):
+    """Node type counts and the songs/albums table."""
+    graph = run['load']['graph']
+
+    # Typed attribute table over all nodes; later sections select rows with masks
+    nodes = node_frame(graph)
+
+    # Analyze node types (bincount over type codes, in first-seen order like Counter)
+    type_codes = np.asarray(graph.columns['Node Type'], dtype=np.int64) + 1  # 0 = missing type
+    type_sizes = np.bincount(type_codes)
+    _, first_seen = np.unique(type_codes, return_index=True)
+    type_names = ['Unknown'] + graph.categories['Node Type']
+    node_type_counts = Counter({type_names[type_codes[i]]: int(type_sizes[type_codes[i]])
+                                for i in np.sort(first_seen)})
+
+    print("Node Type Distribution:")
+    print("-" * 30)
+    for node_type, count in node_type_counts.most_common():
+        percentage = (count / len(nodes)) * 100
+        print(f"{node_type:>15}: {count:>6,} ({percentage:.1f}%)")
+
+    # Analyze Songs and Albums in detail
+    work_mask = type_mask(nodes, WORK_TYPES)
+
+    print(f"Total Songs and Albums: {int(work_mask.sum()):,}")
+
+    df_songs_albums = songs_albums(nodes)
+
+    print("\nSongs vs Albums:")
+    print(df_songs_albums['type'].value_counts())
+
+    print("\nNotable vs Non-Notable:")
+    print(df_songs_albums['notable'].value_counts())
+
+    print(f"\nNotable percentage: {(df_songs_albums['notable'].sum() / len(df_songs_albums)) * 100:.1f}%")
+
+    # Genre analysis
+    print("Genre Distribution:")
+    print("-" * 20)
+    genre_counts = df_songs_albums['genre'].value_counts()
+    print(genre_counts.head(10))
+
+    # Print notable/non-notable distribution for songs and albums
+    print("\nNotable/Non-Notable Distribution:")
+    print("-" * 20)
+    notable_dist = df_songs_albums.groupby(['type', 'notable']).size().unstack(fill_value=0)
+    notable_pct = notable_dist.div(notable_dist.sum(axis=1), axis=0) * 100
+    print("Songs:")
+    print(f"Notable: {notable_pct.loc['Song', True]:.1f}%")
+    print(f"Non-Notable: {notable_pct.loc['Song', False]:.1f}%")
+    print("\nAlbums:")
+    print(f"Notable: {notable_pct.loc['Album', True]:.1f}%")
+    print(f"Non-Notable: {notable_pct.loc['Album', False]:.1f}%")
+
+    # Print singles distribution for songs
+    print("\nSingles Distribution (Songs only):")
+    print("-" * 20)
+    songs_only = df_songs_albums[df_songs_albums['type'] == 'Song']
+    singles_dist = songs_only['single'].value_counts(normalize=True) * 100
+    print(f"Singles: {singles_dist[True]:.1f}%")
+    print(f"Non-Singles: {singles_dist[False]:.1f}%")
+
+    return {
+        'nodes': nodes,
+        'work_mask': work_mask,
+        'notable_mask': work_mask & nodes['notable'].fillna(False).to_numpy(dtype=bool),
+        'node_type_counts': node_type_counts,
+        'df_songs_albums': df_songs_albums,
+        'genre_counts': genre_counts,
+        'notable_by_type': notable_dist,
+        'songs_only': songs_only,
+    }
+
+
+@pipeline.stage('node_figures', deps=('node_table',), figure=True)
+def node_figures(run):
+    """Node type, genre, notability and singles charts."""
+    nodes = run['node_table']
+    df_songs_albums = nodes['df_songs_albums']
+
+    # Visualize node type distribution
+    types, counts = zip(*nodes['node_type_counts'].most_common())
+
+    # Visualize top genres
+    top_genres = nodes['genre_counts'].head(10)
+    notable_by_type = nodes['notable_by_type']
+
+    # Singles vs non-singles (for songs only) and genre diversity
+    songs_only = nodes['songs_only']
+    single_counts = songs_only['single'].value_counts().to_numpy() if len(songs_only) > 0 else np.zeros(0, dtype=np.int64)
+
+    return [
+        figure('node_types', eda_figures.node_types, {'types': list(types), 'counts': list(counts)}, (12, 6)),
+        figure('genres_notability', eda_figures.genres_and_notability, {
+            'top_genres': top_genres.index.tolist(),
+            'top_genre_counts': top_genres.to_numpy(),
+            'types': notable_by_type.index.tolist(),
+            'non_notable': notable_by_type[False].to_numpy(),
+            'notable': notable_by_type[True].to_numpy(),
+        }, (15, 8)),
+        figure('singles_genre_diversity', eda_figures.singles_and_genre_diversity, {
+            'single_counts': single_counts,
+            'notable_genres': df_songs_albums[df_songs_albums['notable'] == True]['genre'].nunique(),
+            'non_notable_genres': df_songs_albums[df_songs_albums['notable'] == False]['genre'].nunique(),
+        }, (12, 8)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 2. Edge Analysis
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('edge_table', deps=('load',))
+def edge_table(run):
+    """Edge type counts and category rollups."""
+    graph = run['load']['graph']
+
+    # Analyze edge types: one columnar table (source, target, type code) built once
+    edges = EdgeTable.from_arrays(graph)
+    edge_type_counts = Counter(edges.type_counts())
+
+    print("Edge Type Distribution:")
+    print("-" * 30)
+    for edge_type, count in edge_type_counts.most_common():
+        percentage = (count / edges.num_edges) * 100
+        print(f"{edge_type:>20}: {count:>6,} ({percentage:.1f}%)")
+
+    # Count edges by category (single bincount over the type codes)
+    edge_category_counts = edges.category_counts()
+
+    # Create lists and sort by count
+    categories = ['Creative\nInfluences', 'Professional\nRoles', 'Business\nRelationships', 'Membership']
+    category_counts = [edge_category_counts['creative_influences'], edge_category_counts['professional_roles'],
+                       edge_category_counts['business_relationships'], edge_category_counts['membership']]
+    colors = ['#FF6B9D', '#4ECDC4', '#45B7D1', '#96CEB4']
+
+    # Sort all lists based on counts in reverse order
+    sorted_indices = sorted(range(len(category_counts)), key=lambda k: category_counts[k], reverse=True)
+    categories = [categories[i] for i in sorted_indices]
+    category_counts = [category_counts[i] for i in sorted_indices]
+    colors = [colors[i] for i in sorted_indices]
+
+    print("Edge Categories:")
+    print("-" * 20)
+    for cat, count in zip(categories, category_counts):
+        percentage = (count / sum(category_counts)) * 100
+        cat_formatted = cat.replace('\n', ' ')
+        print(f"{cat_formatted:>20}: {count:>6,} ({percentage:.1f}%)")
+
+    return {
+        'edges': edges,
+        'edge_type_counts': edge_type_counts,
+        'categories': categories,
+        'category_counts': category_counts,
+        'category_colors': colors,
+    }
+
+
+@pipeline.stage('edge_figures', deps=('edge_table',), figure=True)
+def edge_figures(run):
+    """Edge type and edge category charts."""
+    edge_info = run['edge_table']
+    types, counts = zip(*edge_info['edge_type_counts'].most_common())
+    return [
+        figure('edge_types', eda_figures.edge_types, {'types': list(types), 'counts': list(counts)}, (15, 5)),
+        figure('edge_categories', eda_figures.edge_categories, {
+            'categories': edge_info['categories'],
+            'counts': edge_info['category_counts'],
+            'colors': edge_info['category_colors'],
+        }, (12, 6)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 3. Temporal Analysis
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('temporal', deps=('load', 'node_table'))
+def temporal(run):
+    """Release years and time to notoriety."""
+    from temporal_index import TemporalIndex
+
+    df_songs_albums = run['node_table']['df_songs_albums']
+    # Works and edges sorted by release year; year-range counts are prefix-sum lookups
+    index = TemporalIndex(run['load']['graph'])
+
+    # Filter out invalid years
+    print(f"Songs/Albums with valid release years: {index.count():,}")
+    if len(index.years):
+        print(f"Release year range: {index.years[0]} - {index.years[-1]}")
+
+    # Time to notoriety analysis
+    notable_with_both_dates = df_songs_albums.dropna(subset=['release_year', 'notoriety_year'])
+    if len(notable_with_both_dates) > 0:
+        notable_with_both_dates['time_to_notoriety'] = notable_with_both_dates['notoriety_year'] - notable_with_both_dates['release_year']
+        print(f"\nSongs/Albums with both release and notoriety dates: {len(notable_with_both_dates):,}")
+        print(f"Average time to notoriety: {notable_with_both_dates['time_to_notoriety'].mean():.1f} years")
+        print(f"Median time to notoriety: {notable_with_both_dates['time_to_notoriety'].median():.1f} years")
+
+    return {'index': index, 'notable_with_both_dates': notable_with_both_dates}
+
+
+@pipeline.stage('temporal_figures', deps=('node_table', 'temporal'), figure=True)
+def temporal_figures(run):
+    """Release timelines, top genres over time and releases by decade."""
+    index = run['temporal']['index']
+    genre_counts = run['node_table']['genre_counts']
+
+    # Release timeline and genre evolution over time (top 5 genres)
+    years, release_counts = index.counts_by_year()
+    top_5_genres = [genre for genre in genre_counts.head(5).index if genre in index.genres]
+    genre_timeline = {genre: index.counts_by_year(genre=genre)[1] for genre in top_5_genres}
+
+    # Release decade analysis
+    decades, decade_slot = np.unique(years // 10 * 10, return_inverse=True)
+    decade_counts = np.bincount(decade_slot, weights=release_counts, minlength=len(decades))
+
+    return [
+        figure('release_timeline', eda_figures.release_timelines, {
+            'years': years, 'release_counts': release_counts, 'genre_timeline': genre_timeline,
+        }, (15, 6)),
+        figure('notable_timeline', eda_figures.notable_timeline, {
+            'years': years,
+            'non_notable': index.counts_by_year(notable=False)[1],
+            'notable': index.counts_by_year(notable=True)[1],
+        }, (12, 6)),
+        figure('releases_by_decade', eda_figures.releases_by_decade,
+               {'decades': decades, 'counts': decade_counts}, (12, 6)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 4. Network Structure Analysis
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('structure', deps=('load',))
+def structure(run):
+    """Density, connected components and degree statistics."""
+    loaded = run['load']
+    graph, csr = loaded['graph'], loaded['csr']
+    wcc_labels, wcc_count = loaded['wcc_labels'], loaded['wcc_count']
+
+    # Network structure analysis
+    print("Network Structure Analysis:")
+    print("-" * 30)
+
+    # Basic metrics
+    print(f"Number of nodes: {csr.num_nodes:,}")
+    print(f"Number of edges: {csr.num_edges:,}")
+    print(f"Density: {csr.density():.6f}")
+
+    # Connected components (dense label per node instead of a set per component)
+    scc_labels, scc_count = csr.strongly_connected_components()
+
+    print(f"\nConnected Components:")
+    print(f"Weakly connected components: {wcc_count}")
+    print(f"Strongly connected components: {scc_count}")
+
+    # Component size distribution
+    wcc_sizes = np.bincount(wcc_labels)
+    scc_sizes = np.bincount(scc_labels)
+
+    # Largest components
+    largest_wcc_size = int(wcc_sizes.max())
+    largest_scc_size = int(scc_sizes.max())
+
+    print(f"Largest weakly connected component: {largest_wcc_size:,} nodes ({(largest_wcc_size/csr.num_nodes)*100:.1f}%)")
+    print(f"Largest strongly connected component: {largest_scc_size:,} nodes ({(largest_scc_size/csr.num_nodes)*100:.1f}%)")
+
+    # Degree analysis: arrays are indexed like graph.node_ids
+    in_degree_values = csr.in_degree()
+    out_degree_values = csr.out_degree()
+    total_degree_values = csr.degree()
+
+    print("Degree Statistics:")
+    print("-" * 20)
+    print(f"In-degree  - Mean: {np.mean(in_degree_values):.2f}, Median: {np.median(in_degree_values):.1f}, Max: {max(in_degree_values)}")
+    print(f"Out-degree - Mean: {np.mean(out_degree_values):.2f}, Median: {np.median(out_degree_values):.1f}, Max: {max(out_degree_values)}")
+    print(f"Total degree - Mean: {np.mean(total_degree_values):.2f}, Median: {np.median(total_degree_values):.1f}, Max: {max(total_degree_values)}")
+
+    # Find high-degree nodes (stable sort keeps node order among ties)
+    top_in_degree = np.argsort(-in_degree_values, kind='stable')[:10]
+    top_out_degree = np.argsort(-out_degree_values, kind='stable')[:10]
+    node_type_names = [t if t is not None else 'Unknown' for t in graph.decode('Node Type')]
+    node_names = [n if n is not None else 'Unknown' for n in graph.text['name']]
+
+    print("\nTop 10 Nodes by In-Degree:")
+    for node in top_in_degree:
+        print(f"  {node_names[node]} ({node_type_names[node]}): {in_degree_values[node]}")
+
+    print("\nTop 10 Nodes by Out-Degree:")
+    for node in top_out_degree:
+        print(f"  {node_names[node]} ({node_type_names[node]}): {out_degree_values[node]}")
+
+    # Average degree by node type, in first-seen type order
+    type_codes = graph.columns['Node Type'].astype(np.int64) + 1  # 0 = missing type
+    type_sums = np.bincount(type_codes, weights=total_degree_values)
+    type_sizes = np.bincount(type_codes)
+    _, first_seen = np.unique(type_codes, return_index=True)
+    type_avg_degrees = {
+        node_type_names[i]: type_sums[type_codes[i]] / type_sizes[type_codes[i]]
+        for i in np.sort(first_seen)
+    }
+
+    return {
+        'density': csr.density(),
+        'wcc_count': wcc_count,
+        'scc_count': scc_count,
+        'wcc_labels': wcc_labels,
+        'scc_labels': scc_labels,
+        'wcc_sizes': wcc_sizes,
+        'scc_sizes': scc_sizes,
+        'largest_wcc_size': largest_wcc_size,
+        'largest_scc_size': largest_scc_size,
+        'in_degree_values': in_degree_values,
+        'out_degree_values': out_degree_values,
+        'total_degree_values': total_degree_values,
+        'type_avg_degrees': type_avg_degrees,
+    }
+
+
+@pipeline.stage('structure_figures', deps=('structure',), figure=True)
+def structure_figures(run):
+    """Component size and degree distribution charts."""
+    s = run['structure']
+    return [
+        figure('component_sizes', eda_figures.component_sizes,
+               {'wcc_sizes': s['wcc_sizes'], 'scc_sizes': s['scc_sizes']}, (15, 6)),
+        figure('degree_distributions', eda_figures.degree_distributions, {
+            'in_degree': s['in_degree_values'],
+            'out_degree': s['out_degree_values'],
+            'total_degree': s['total_degree_values'],
+            'type_avg_degrees': s['type_avg_degrees'],
+        }, (15, 8)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 5. Influence and Success Analysis
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('influence', deps=('load', 'node_table', 'edge_table'))
+def influence(run):
+    """Creative influence subgraph and notable vs non-notable tallies."""
+    csr = run['load']['csr']
+    edges = run['edge_table']['edges']
+
+    # Analyze relationship between influence and success
+    # Focus on creative influence edges
+    creative_mask = edges.category_mask('creative_influences')
+    creative_edge_ids = edges.networkx_order()[creative_mask[edges.networkx_order()]]
+    print(f"Total creative influence relationships: {len(creative_edge_ids):,}")
+
+    # Create subgraph with only creative influences (parallel edges collapse, like nx.DiGraph)
+    creative_subgraph = csr.edge_subgraph(creative_mask)
+    in_creative_subgraph = creative_subgraph.has_edges()
+
+    print(f"Creative influence subgraph - Nodes: {int(in_creative_subgraph.sum()):,}, Edges: {creative_subgraph.num_edges:,}")
+
+    # Analyze influence patterns for notable vs non-notable works: group 0 notable, 1 non-notable
+    notable_mask = run['node_table']['notable_mask']
+    non_notable_mask = run['node_table']['work_mask'] & ~notable_mask
+    groups = split_codes(notable_mask, non_notable_mask)
+    creative_src, creative_dst = edges.src[creative_edge_ids], edges.dst[creative_edge_ids]
+    creative_types = edges.edge_type[creative_edge_ids]
+
+    # Count influences received and given, per group and edge type
+    tallies = split_tallies(groups, 2, creative_src, creative_dst, creative_types, len(edges.type_names))
+    received, given = tallies['received'].sum(axis=1), tallies['given'].sum(axis=1)
+    notable_influences_received, non_notable_influences_received = int(received[0]), int(received[1])
+    notable_influences_given, non_notable_influences_given = int(given[0]), int(given[1])
+
+    print("\nCreative Influence Analysis:")
+    print("-" * 30)
+    print(f"Notable works - Influences received: {notable_influences_received:,}")
+    print(f"Notable works - Influences given: {notable_influences_given:,}")
+    print(f"Non-notable works - Influences received: {non_notable_influences_received:,}")
+    print(f"Non-notable works - Influences given: {non_notable_influences_given:,}")
+
+    # Calculate rates
+    notable_count, non_notable_count = (int(size) for size in np.bincount(groups[groups >= 0], minlength=2))
+
+    print(f"\nInfluence Rates (per work):")
+    print(f"Notable works - Avg influences received: {notable_influences_received/notable_count:.2f}")
+    print(f"Notable works - Avg influences given: {notable_influences_given/notable_count:.2f}")
+    print(f"Non-notable works - Avg influences received: {non_notable_influences_received/non_notable_count:.2f}")
+    print(f"Non-notable works - Avg influences given: {non_notable_influences_given/non_notable_count:.2f}")
+
+    # Influence type breakdown for notable works (influences received, first-seen order)
+    received_types = creative_types[groups[creative_dst] == 0]
+    first_seen = np.full(len(edges.type_names), len(received_types))
+    np.minimum.at(first_seen, received_types, np.arange(len(received_types)))
+    notable_influence_types = defaultdict(int, {
+        edges.type_names[t]: int(tallies['received'][0, t])
+        for t in np.argsort(first_seen, kind='stable') if tallies['received'][0, t]
     })
 
-df_songs_albums = pd.DataFrame(songs_albums_data)
-
-print("\nSongs vs Albums:")
-print(df_songs_albums['type'].value_counts())
-
-print("\nNotable vs Non-Notable:")
-print(df_songs_albums['notable'].value_counts())
-
-print(f"\nNotable percentage: {(df_songs_albums['notable'].sum() / len(df_songs_albums)) * 100:.1f}%")
-
-
-# %%
-# Genre analysis
-print("Genre Distribution:")
-print("-" * 20)
-genre_counts = df_songs_albums['genre'].value_counts()
-print(genre_counts.head(10))
-
-# Print notable/non-notable distribution for songs and albums
-print("\nNotable/Non-Notable Distribution:")
-print("-" * 20)
-notable_dist = df_songs_albums.groupby(['type', 'notable']).size().unstack(fill_value=0)
-notable_pct = notable_dist.div(notable_dist.sum(axis=1), axis=0) * 100
-print("Songs:")
-print(f"Notable: {notable_pct.loc['Song', True]:.1f}%")
-print(f"Non-Notable: {notable_pct.loc['Song', False]:.1f}%")
-print("\nAlbums:")
-print(f"Notable: {notable_pct.loc['Album', True]:.1f}%") 
-print(f"Non-Notable: {notable_pct.loc['Album', False]:.1f}%")
-
-# Print singles distribution for songs
-print("\nSingles Distribution (Songs only):")
-print("-" * 20)
-songs_only = df_songs_albums[df_songs_albums['type'] == 'Song']
-singles_dist = songs_only['single'].value_counts(normalize=True) * 100
-print(f"Singles: {singles_dist[True]:.1f}%")
-print(f"Non-Singles: {singles_dist[False]:.1f}%")
-
-# Visualize top genres
-plt.figure(figsize=(15, 8))
-
-plt.subplot(1, 2, 1)
-top_genres = genre_counts.head(10)
-colors = sns.color_palette("pastel", len(top_genres))
-plt.barh(range(len(top_genres)), top_genres.values, color=colors)
-plt.yticks(range(len(top_genres)), top_genres.index)
-plt.xlabel('Count')
-plt.title('Top 10 Genres')
-plt.gca().invert_yaxis()
-
-plt.subplot(1, 2, 2)
-# Notable vs non-notable by type
-notable_by_type = df_songs_albums.groupby(['type', 'notable']).size().unstack(fill_value=0)
-colors = sns.color_palette("pastel", 2)
-bars = plt.bar(notable_by_type.index, notable_by_type[False], label='Non-Notable', color=colors[0])
-plt.bar(notable_by_type.index, notable_by_type[True], bottom=notable_by_type[False], label='Notable', color=colors[1])
-plt.title('Notable vs Non-Notable by Type')
-plt.xlabel('Type')
-plt.ylabel('Count')
-plt.xticks(rotation=0)
-plt.legend()
-
-plt.tight_layout()
-plt.show()
-
-# Additional plots in separate figures
-plt.figure(figsize=(12, 8))
-
-plt.subplot(1, 2, 1)
-# Singles vs non-singles (for songs only) - using bar chart instead of pie
-songs_only = df_songs_albums[df_songs_albums['type'] == 'Song']
-if len(songs_only) > 0:
-    single_counts = songs_only['single'].value_counts()
-    colors = sns.color_palette("pastel", 2)
-    plt.bar(['Non-Single', 'Single'], single_counts.values, color=colors)
-    plt.title('Songs: Singles vs Non-Singles')
-    # Add percentage labels on top of bars
-    for i, v in enumerate(single_counts.values):
-        percentage = (v / single_counts.sum()) * 100
-        plt.text(i, v, f'{percentage:.1f}%', ha='center', va='bottom')
-
-plt.subplot(1, 2, 2)
-# Genre diversity for notable vs non-notable
-notable_genres = df_songs_albums[df_songs_albums['notable'] == True]['genre'].nunique()
-non_notable_genres = df_songs_albums[df_songs_albums['notable'] == False]['genre'].nunique()
-colors = sns.color_palette("pastel", 2)
-plt.bar(['Notable', 'Non-Notable'], [notable_genres, non_notable_genres], color=colors)
-plt.ylabel('Number of Unique Genres')
-plt.title('Genre Diversity: Notable vs Non-Notable')
-
-plt.tight_layout()
-plt.show()
-
-
-# %% [markdown]
-# ## 2. Edge Analysis
-# 
-
-# %%
-# Analyze edge types
-edge_types = []
-for u, v, d in G.edges(data=True):
-    edge_types.append(d.get('Edge Type', 'Unknown'))
-
-edge_type_counts = Counter(edge_types)
-
-print("Edge Type Distribution:")
-print("-" * 30)
-for edge_type, count in edge_type_counts.most_common():
-    percentage = (count / len(edge_types)) * 100
-    print(f"{edge_type:>20}: {count:>6,} ({percentage:.1f}%)")
-
-# Visualize edge type distribution
-plt.figure(figsize=(15, 5))
-
-types, counts = zip(*edge_type_counts.most_common())
-colors = sns.color_palette("Set3", len(types))
-bars = plt.bar(types, counts, color=colors)
-plt.title('Edge Type Distribution')
-plt.xlabel('Edge Type')
-plt.ylabel('Count')
-plt.xticks(rotation=45, ha='right')
-
-# Add count and percentage labels on top of bars
-total = sum(counts)
-for bar, count in zip(bars, counts):
-    percentage = (count/total) * 100
-    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-             f'{count:,}\n({percentage:.1f}%)', 
-             ha='center', va='bottom')
-
-plt.tight_layout()
-plt.show()
-
-
-# %%
-# Categorize edge types by function
-creative_influences = ['InStyleOf', 'InterpolatesFrom', 'CoverOf', 'LyricalReferenceTo', 'DirectlySamples']
-professional_roles = ['PerformerOf', 'ComposerOf', 'ProducerOf', 'LyricistOf']
-business_relationships = ['RecordedBy', 'DistributedBy']
-membership = ['MemberOf']
-
-# Count edges by category
-creative_count = sum(edge_type_counts[edge_type] for edge_type in creative_influences)
-professional_count = sum(edge_type_counts[edge_type] for edge_type in professional_roles)
-business_count = sum(edge_type_counts[edge_type] for edge_type in business_relationships)
-membership_count = sum(edge_type_counts[edge_type] for edge_type in membership)
-
-# Create lists and sort by count
-categories = ['Creative\nInfluences', 'Professional\nRoles', 'Business\nRelationships', 'Membership']
-category_counts = [creative_count, professional_count, business_count, membership_count]
-colors = ['#FF6B9D', '#4ECDC4', '#45B7D1', '#96CEB4']
-
-# Sort all lists based on counts in reverse order
-sorted_indices = sorted(range(len(category_counts)), key=lambda k: category_counts[k], reverse=True)
-categories = [categories[i] for i in sorted_indices]
-category_counts = [category_counts[i] for i in sorted_indices]
-colors = [colors[i] for i in sorted_indices]
-
-print("Edge Categories:")
-print("-" * 20)
-for cat, count in zip(categories, category_counts):
-    percentage = (count / sum(category_counts)) * 100
-    cat_formatted = cat.replace('\n', ' ')
-    print(f"{cat_formatted:>20}: {count:>6,} ({percentage:.1f}%)")
-
-# Visualize categories
-plt.figure(figsize=(12, 6))
-
-total = sum(category_counts)
-percentages = [count/total * 100 for count in category_counts]
-bars = plt.barh(categories, percentages, color=colors)
-plt.title('Conexiones agrupadas por categoría')
-plt.xlabel('Percentage (%)')
-
-# Add percentage labels
-for bar, pct in zip(bars, percentages):
-    plt.text(bar.get_width(), bar.get_y() + bar.get_height()/2,
-             f'{pct:.1f}%',
-             ha='left', va='center')
-
-plt.tight_layout()
-plt.show()
-
-
-# %% [markdown]
-# ## 3. Temporal Analysis
-# 
-
-# %%
-# Temporal analysis of releases
-df_songs_albums['release_year'] = pd.to_numeric(df_songs_albums['release_date'], errors='coerce')
-df_songs_albums['notoriety_year'] = pd.to_numeric(df_songs_albums['notoriety_date'], errors='coerce')
-
-# Filter out invalid years
-valid_releases = df_songs_albums.dropna(subset=['release_year'])
-print(f"Songs/Albums with valid release years: {len(valid_releases):,}")
-print(f"Release year range: {valid_releases['release_year'].min():.0f} - {valid_releases['release_year'].max():.0f}")
-
-# Time to notoriety analysis
-notable_with_both_dates = df_songs_albums.dropna(subset=['release_year', 'notoriety_year'])
-if len(notable_with_both_dates) > 0:
-    notable_with_both_dates['time_to_notoriety'] = notable_with_both_dates['notoriety_year'] - notable_with_both_dates['release_year']
-    print(f"\nSongs/Albums with both release and notoriety dates: {len(notable_with_both_dates):,}")
-    print(f"Average time to notoriety: {notable_with_both_dates['time_to_notoriety'].mean():.1f} years")
-    print(f"Median time to notoriety: {notable_with_both_dates['time_to_notoriety'].median():.1f} years")
-
-# Releases over time and top 5 genres plot
-plt.figure(figsize=(15, 6))
-
-# Release timeline
-plt.subplot(1, 2, 1)
-release_counts = valid_releases['release_year'].value_counts().sort_index()
-plt.plot(release_counts.index, release_counts.values, color='#2E86C1', marker='o', markersize=3, markerfacecolor='#E74C3C', markeredgecolor='#E74C3C')
-plt.title('Releases Over Time')
-plt.xlabel('Year')
-plt.ylabel('Number of Releases')
-plt.grid(True, alpha=0.3)
-
-# Genre evolution over time (top 5 genres)
-plt.subplot(1, 2, 2)
-top_5_genres = genre_counts.head(5).index
-genre_year_data = valid_releases[valid_releases['genre'].isin(top_5_genres)]
-genre_timeline = genre_year_data.groupby(['release_year', 'genre']).size().unstack(fill_value=0)
-for genre in top_5_genres:
-    if genre in genre_timeline.columns:
-        plt.plot(genre_timeline.index, genre_timeline[genre], marker='o', label=genre, markersize=2)
-plt.title('Top 5 Genres Over Time')
-plt.xlabel('Year')
-plt.ylabel('Number of Releases')
-plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
-
-# Notable vs non-notable plot
-plt.figure(figsize=(12, 6))
-notable_by_year = valid_releases.groupby(['release_year', 'notable']).size().unstack(fill_value=0)
-if False in notable_by_year.columns and True in notable_by_year.columns:
-    plt.stackplot(notable_by_year.index, notable_by_year[False], notable_by_year[True], 
-                  labels=['Non-Notable', 'Notable'], alpha=0.7)
-    plt.title('Notable vs Non-Notable Releases Over Time')
-    plt.xlabel('Year')
-    plt.ylabel('Number of Releases')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.show()
-
-# Release decade analysis plot
-plt.figure(figsize=(12, 6))
-valid_releases['decade'] = (valid_releases['release_year'] // 10) * 10
-decade_counts = valid_releases['decade'].value_counts().sort_index()
-plt.bar(decade_counts.index, decade_counts.values, width=8, alpha=0.7)
-plt.title('Releases by Decade')
-plt.xlabel('Decade')
-plt.ylabel('Number of Releases')
-plt.xticks(decade_counts.index)
-plt.tight_layout()
-plt.show()
-
-
-# %% [markdown]
-# ## 4. Network Structure Analysis
-# 
-
-# %%
-# Network structure analysis
-print("Network Structure Analysis:")
-print("-" * 30)
-
-# Basic metrics
-print(f"Number of nodes: {G.number_of_nodes():,}")
-print(f"Number of edges: {G.number_of_edges():,}")
-print(f"Density: {nx.density(G):.6f}")
-
-# Connected components
-weakly_connected = list(nx.weakly_connected_components(G))
-strongly_connected = list(nx.strongly_connected_components(G))
-
-print(f"\nConnected Components:")
-print(f"Weakly connected components: {len(weakly_connected)}")
-print(f"Strongly connected components: {len(strongly_connected)}")
-
-# Largest components
-largest_wcc_size = len(max(weakly_connected, key=len))
-largest_scc_size = len(max(strongly_connected, key=len))
-
-print(f"Largest weakly connected component: {largest_wcc_size:,} nodes ({(largest_wcc_size/G.number_of_nodes())*100:.1f}%)")
-print(f"Largest strongly connected component: {largest_scc_size:,} nodes ({(largest_scc_size/G.number_of_nodes())*100:.1f}%)")
-
-# Component size distribution
-wcc_sizes = [len(comp) for comp in weakly_connected]
-scc_sizes = [len(comp) for comp in strongly_connected]
-
-plt.figure(figsize=(15, 6))
-
-plt.subplot(1, 3, 1)
-plt.hist(wcc_sizes, bins=20, alpha=0.7, edgecolor='black')
-plt.xlabel('Component Size')
-plt.ylabel('Frequency')
-plt.title('Weakly Connected Components\nSize Distribution')
-plt.yscale('log')
-
-plt.subplot(1, 3, 2)
-plt.hist(scc_sizes, bins=20, alpha=0.7, edgecolor='black', color='orange')
-plt.xlabel('Component Size')
-plt.ylabel('Frequency')
-plt.title('Strongly Connected Components\nSize Distribution')
-plt.yscale('log')
-
-plt.subplot(1, 3, 3)
-sizes_comparison = pd.DataFrame({
-    'Weakly Connected': pd.Series(wcc_sizes).value_counts().sort_index(),
-    'Strongly Connected': pd.Series(scc_sizes).value_counts().sort_index()
-}).fillna(0)
-sizes_comparison.plot(kind='bar', alpha=0.7)
-plt.xlabel('Component Size')
-plt.ylabel('Number of Components')
-plt.title('Component Size Comparison')
-plt.xticks(rotation=45)
-plt.legend()
-
-plt.tight_layout()
-plt.show()
-
-
-# %%
-# Degree analysis
-in_degrees = dict(G.in_degree())
-out_degrees = dict(G.out_degree())
-total_degrees = dict(G.degree())
-
-in_degree_values = list(in_degrees.values())
-out_degree_values = list(out_degrees.values())
-total_degree_values = list(total_degrees.values())
-
-print("Degree Statistics:")
-print("-" * 20)
-print(f"In-degree  - Mean: {np.mean(in_degree_values):.2f}, Median: {np.median(in_degree_values):.1f}, Max: {max(in_degree_values)}")
-print(f"Out-degree - Mean: {np.mean(out_degree_values):.2f}, Median: {np.median(out_degree_values):.1f}, Max: {max(out_degree_values)}")
-print(f"Total degree - Mean: {np.mean(total_degree_values):.2f}, Median: {np.median(total_degree_values):.1f}, Max: {max(total_degree_values)}")
-
-# Find high-degree nodes
-top_in_degree = sorted(in_degrees.items(), key=lambda x: x[1], reverse=True)[:10]
-top_out_degree = sorted(out_degrees.items(), key=lambda x: x[1], reverse=True)[:10]
-
-print("\nTop 10 Nodes by In-Degree:")
-for node, degree in top_in_degree:
-    node_type = G.nodes[node].get('Node Type', 'Unknown')
-    name = G.nodes[node].get('name', 'Unknown')
-    print(f"  {name} ({node_type}): {degree}")
-
-print("\nTop 10 Nodes by Out-Degree:")
-for node, degree in top_out_degree:
-    node_type = G.nodes[node].get('Node Type', 'Unknown')
-    name = G.nodes[node].get('name', 'Unknown')
-    print(f"  {name} ({node_type}): {degree}")
-
-# Visualize degree distributions
-plt.figure(figsize=(15, 8))
-
-plt.subplot(2, 3, 1)
-plt.hist(in_degree_values, bins=50, alpha=0.7, edgecolor='black')
-plt.xlabel('In-Degree')
-plt.ylabel('Frequency')
-plt.title('In-Degree Distribution')
-plt.yscale('log')
-
-plt.subplot(2, 3, 2)
-plt.hist(out_degree_values, bins=50, alpha=0.7, edgecolor='black', color='orange')
-plt.xlabel('Out-Degree')
-plt.ylabel('Frequency')
-plt.title('Out-Degree Distribution')
-plt.yscale('log')
-
-plt.subplot(2, 3, 3)
-plt.hist(total_degree_values, bins=50, alpha=0.7, edgecolor='black', color='green')
-plt.xlabel('Total Degree')
-plt.ylabel('Frequency')
-plt.title('Total Degree Distribution')
-plt.yscale('log')
-
-# Degree by node type
-plt.subplot(2, 3, 4)
-node_type_degrees = {}
-for node in G.nodes():
-    node_type = G.nodes[node].get('Node Type', 'Unknown')
-    if node_type not in node_type_degrees:
-        node_type_degrees[node_type] = []
-    node_type_degrees[node_type].append(total_degrees[node])
-
-type_avg_degrees = {k: np.mean(v) for k, v in node_type_degrees.items()}
-plt.bar(type_avg_degrees.keys(), type_avg_degrees.values())
-plt.xlabel('Node Type')
-plt.ylabel('Average Total Degree')
-plt.title('Average Degree by Node Type')
-plt.xticks(rotation=45)
-
-# In vs Out degree scatter
-plt.subplot(2, 3, 5)
-plt.scatter(in_degree_values, out_degree_values, alpha=0.5, s=10)
-plt.xlabel('In-Degree')
-plt.ylabel('Out-Degree')
-plt.title('In-Degree vs Out-Degree')
-plt.xscale('log')
-plt.yscale('log')
-
-# Degree distribution comparison
-plt.subplot(2, 3, 6)
-plt.hist(in_degree_values, bins=50, alpha=0.5, label='In-Degree', density=True)
-plt.hist(out_degree_values, bins=50, alpha=0.5, label='Out-Degree', density=True)
-plt.xlabel('Degree')
-plt.ylabel('Density')
-plt.title('Degree Distribution Comparison')
-plt.legend()
-plt.yscale('log')
-
-plt.tight_layout()
-plt.show()
-
-
-# %% [markdown]
-# ## 5. Influence and Success Analysis
-# 
-
-# %%
-creative_influences
-
-# %%
-# Analyze relationship between influence and success
-# Focus on creative influence edges
-creative_influence_edges = []
-for u, v, d in G.edges(data=True):
-    if d.get('Edge Type') in creative_influences:
-        creative_influence_edges.append((u, v, d.get('Edge Type')))
-
-print(f"Total creative influence relationships: {len(creative_influence_edges):,}")
-
-# Create subgraph with only creative influences
-creative_subgraph = nx.DiGraph()
-for u, v, edge_type in creative_influence_edges:
-    creative_subgraph.add_edge(u, v, EdgeType=edge_type)
-
-print(f"Creative influence subgraph - Nodes: {creative_subgraph.number_of_nodes():,}, Edges: {creative_subgraph.number_of_edges():,}")
-
-# Analyze influence patterns for notable vs non-notable works
-notable_songs_albums = set(df_songs_albums[df_songs_albums['notable'] == True]['id'])
-non_notable_songs_albums = set(df_songs_albums[df_songs_albums['notable'] == False]['id'])
-
-# Count influences received and given
-notable_influences_received = 0
-notable_influences_given = 0
-non_notable_influences_received = 0
-non_notable_influences_given = 0
-
-for u, v, edge_type in creative_influence_edges:
-    # Influences received
-    if v in notable_songs_albums:
-        notable_influences_received += 1
-    elif v in non_notable_songs_albums:
-        non_notable_influences_received += 1
-    
-    # Influences given
-    if u in notable_songs_albums:
-        notable_influences_given += 1
-    elif u in non_notable_songs_albums:
-        non_notable_influences_given += 1
-
-print("\nCreative Influence Analysis:")
-print("-" * 30)
-print(f"Notable works - Influences received: {notable_influences_received:,}")
-print(f"Notable works - Influences given: {notable_influences_given:,}")
-print(f"Non-notable works - Influences received: {non_notable_influences_received:,}")
-print(f"Non-notable works - Influences given: {non_notable_influences_given:,}")
-
-# Calculate rates
-notable_count = len(notable_songs_albums)
-non_notable_count = len(non_notable_songs_albums)
-
-print(f"\nInfluence Rates (per work):")
-print(f"Notable works - Avg influences received: {notable_influences_received/notable_count:.2f}")
-print(f"Notable works - Avg influences given: {notable_influences_given/notable_count:.2f}")
-print(f"Non-notable works - Avg influences received: {non_notable_influences_received/non_notable_count:.2f}")
-print(f"Non-notable works - Avg influences given: {non_notable_influences_given/non_notable_count:.2f}")
-
-# Visualize influence patterns
-plt.figure(figsize=(15, 10))
-
-# Influence counts comparison
-plt.subplot(2, 3, 1)
-categories = ['Received', 'Given']
-notable_values = [notable_influences_received, notable_influences_given]
-non_notable_values = [non_notable_influences_received, non_notable_influences_given]
-
-x = np.arange(len(categories))
-width = 0.35
-
-plt.bar(x - width/2, notable_values, width, label='Notable', alpha=0.7)
-plt.bar(x + width/2, non_notable_values, width, label='Non-Notable', alpha=0.7)
-plt.xlabel('Influence Direction')
-plt.ylabel('Total Count')
-plt.title('Creative Influences: Notable vs Non-Notable')
-plt.xticks(x, categories)
-plt.legend()
-
-# Influence rates comparison
-plt.subplot(2, 3, 2)
-notable_rates = [notable_influences_received/notable_count, notable_influences_given/notable_count]
-non_notable_rates = [non_notable_influences_received/non_notable_count, non_notable_influences_given/non_notable_count]
-
-plt.bar(x - width/2, notable_rates, width, label='Notable', alpha=0.7)
-plt.bar(x + width/2, non_notable_rates, width, label='Non-Notable', alpha=0.7)
-plt.xlabel('Influence Direction')
-plt.ylabel('Average per Work')
-plt.title('Creative Influence Rates')
-plt.xticks(x, categories)
-plt.legend()
-
-# Influence type breakdown for notable works
-plt.subplot(2, 3, 3)
-notable_influence_types = defaultdict(int)
-for u, v, edge_type in creative_influence_edges:
-    if v in notable_songs_albums:  # influences received by notable works
-        notable_influence_types[edge_type] += 1
-
-if notable_influence_types:
-    types, counts = zip(*notable_influence_types.items())
-    plt.pie(counts, labels=types, autopct='%1.1f%%', startangle=90)
-    plt.title('Types of Influences\nReceived by Notable Works')
-
-# Distribution of influences per work
-plt.subplot(2, 3, 4)
-notable_in_degrees = [creative_subgraph.in_degree(node) for node in notable_songs_albums if node in creative_subgraph]
-non_notable_in_degrees = [creative_subgraph.in_degree(node) for node in non_notable_songs_albums if node in creative_subgraph]
-
-plt.hist(notable_in_degrees, bins=20, alpha=0.7, label='Notable', density=True)
-plt.hist(non_notable_in_degrees, bins=20, alpha=0.7, label='Non-Notable', density=True)
-plt.xlabel('Number of Influences Received')
-plt.ylabel('Density')
-plt.title('Distribution of Influences Received')
-plt.legend()
-
-plt.subplot(2, 3, 5)
-notable_out_degrees = [creative_subgraph.out_degree(node) for node in notable_songs_albums if node in creative_subgraph]
-non_notable_out_degrees = [creative_subgraph.out_degree(node) for node in non_notable_songs_albums if node in creative_subgraph]
-
-plt.hist(notable_out_degrees, bins=20, alpha=0.7, label='Notable', density=True)
-plt.hist(non_notable_out_degrees, bins=20, alpha=0.7, label='Non-Notable', density=True)
-plt.xlabel('Number of Influences Given')
-plt.ylabel('Density')
-plt.title('Distribution of Influences Given')
-plt.legend()
-
-# Success cascade analysis
-plt.subplot(2, 3, 6)
-# Find chains of influence leading to notable works
-influence_chains = []
-for notable_work in notable_songs_albums:
-    if notable_work in creative_subgraph:
-        predecessors = list(creative_subgraph.predecessors(notable_work))
-        influence_chains.append(len(predecessors))
-
-if influence_chains:
-    plt.hist(influence_chains, bins=15, alpha=0.7, edgecolor='black')
-    plt.xlabel('Number of Direct Influences')
-    plt.ylabel('Number of Notable Works')
-    plt.title('Direct Influences to Notable Works')
-
-plt.tight_layout()
-plt.show()
-
-
-# %% [markdown]
-# ## 6. Key Findings and Summary
-# 
-
-# %%
-# Summary statistics and key insights
-print("🎵 MC1 MUSICAL INFLUENCE GRAPH - KEY FINDINGS 🎵")
-print("=" * 60)
-
-print(f"\n📊 DATASET OVERVIEW:")
-print(f"   • Total nodes: {G.number_of_nodes():,}")
-print(f"   • Total edges: {G.number_of_edges():,}")
-print(f"   • Network density: {nx.density(G):.6f}")
-print(f"   • Connected components: {nx.number_weakly_connected_components(G)}")
-
-print(f"\n🎭 NODE COMPOSITION:")
-for node_type, count in node_type_counts.most_common():
-    percentage = (count / len(node_types)) * 100
-    print(f"   • {node_type}: {count:,} ({percentage:.1f}%)")
-
-print(f"\n🔗 RELATIONSHIP TYPES:")
-for edge_type, count in edge_type_counts.most_common()[:5]:
-    percentage = (count / len(edge_types)) * 100
-    print(f"   • {edge_type}: {count:,} ({percentage:.1f}%)")
-
-print(f"\n⭐ SUCCESS METRICS:")
-total_works = len(df_songs_albums)
-notable_works = df_songs_albums['notable'].sum()
-print(f"   • Total songs/albums: {total_works:,}")
-print(f"   • Notable works: {notable_works:,} ({(notable_works/total_works)*100:.1f}%)")
-
-if len(notable_with_both_dates) > 0:
-    avg_time_to_notoriety = notable_with_both_dates['time_to_notoriety'].mean()
-    print(f"   • Average time to notoriety: {avg_time_to_notoriety:.1f} years")
-
-print(f"\n🎨 CREATIVE INFLUENCES:")
-print(f"   • Total creative influence relationships: {len(creative_influence_edges):,}")
-print(f"   • Notable works avg influences received: {notable_influences_received/notable_count:.2f}")
-print(f"   • Non-notable works avg influences received: {non_notable_influences_received/non_notable_count:.2f}")
-
-print(f"\n🏆 TOP GENRES:")
-for i, (genre, count) in enumerate(genre_counts.head(5).items(), 1):
-    percentage = (count / len(df_songs_albums)) * 100
-    print(f"   {i}. {genre}: {count:,} ({percentage:.1f}%)")
-
-print(f"\n🌟 NETWORK INSIGHTS:")
-largest_wcc = len(max(weakly_connected, key=len))
-print(f"   • Largest connected component: {largest_wcc:,} nodes ({(largest_wcc/G.number_of_nodes())*100:.1f}%)")
-print(f"   • Average in-degree: {np.mean(in_degree_values):.2f}")
-print(f"   • Average out-degree: {np.mean(out_degree_values):.2f}")
-
-print(f"\n💡 KEY RESEARCH DIRECTIONS:")
-print(f"   • Influence propagation patterns across {len(creative_influences)} creative relationship types")
-print(f"   • Success prediction based on network position and influence patterns")
-print(f"   • Temporal evolution of genre popularity and cross-genre influences")
-print(f"   • Identification of keystone nodes in the influence network")
-
-print("\n" + "=" * 60)
-
-
-# %%
+    # Distribution of influences per work (nodes of the creative subgraph)
+    notable_in_degrees, non_notable_in_degrees = split_values(creative_subgraph.in_degree(), groups, 2, in_creative_subgraph)
+    notable_out_degrees, non_notable_out_degrees = split_values(creative_subgraph.out_degree(), groups, 2, in_creative_subgraph)
+
+    return {
+        'creative_edge_ids': creative_edge_ids,
+        'creative_subgraph': creative_subgraph,
+        'influence_tallies': tallies,
+        'notable_count': notable_count,
+        'non_notable_count': non_notable_count,
+        'notable_influences_received': notable_influences_received,
+        'notable_influences_given': notable_influences_given,
+        'non_notable_influences_received': non_notable_influences_received,
+        'non_notable_influences_given': non_notable_influences_given,
+        'notable_influence_types': notable_influence_types,
+        'notable_in_degrees': notable_in_degrees,
+        'non_notable_in_degrees': non_notable_in_degrees,
+        'notable_out_degrees': notable_out_degrees,
+        'non_notable_out_degrees': non_notable_out_degrees,
+        # In the collapsed subgraph the in-degree is the number of distinct predecessors
+        'influence_chains': notable_in_degrees,
+    }
+
+
+@pipeline.stage('influence_figures', deps=('influence',), figure=True)
+def influence_figures(run):
+    """Creative influence comparisons between notable and non-notable works."""
+    inf = run['influence']
+    return [figure('influence_patterns', eda_figures.influence_patterns, {
+        'notable_count': inf['notable_count'],
+        'non_notable_count': inf['non_notable_count'],
+        'notable_values': [inf['notable_influences_received'], inf['notable_influences_given']],
+        'non_notable_values': [inf['non_notable_influences_received'], inf['non_notable_influences_given']],
+        'notable_influence_types': dict(inf['notable_influence_types']),
+        'notable_in_degrees': inf['notable_in_degrees'],
+        'non_notable_in_degrees': inf['non_notable_in_degrees'],
+        'notable_out_degrees': inf['notable_out_degrees'],
+        'non_notable_out_degrees': inf['non_notable_out_degrees'],
+        'influence_chains': inf['influence_chains'],
+    }, (15, 10))]
+
+
+@pipeline.stage('cascade', deps=('load', 'node_table', 'influence'))
+def cascade(run):
+    """Transitive influence ancestry of every work (cascade_metrics.csv)."""
+    from cascade import CASCADE_FILE, cascade_frame
+
+    graph = run['load']['graph']
+    works = np.flatnonzero(run['node_table']['work_mask'])
+    df_cascade = cascade_frame(graph, run['influence']['creative_subgraph'], works)
+
+    notable = df_cascade[df_cascade['notable']]
+    print("\nSuccess Cascades (transitive creative influences):")
+    print("-" * 30)
+    for label, group in (('Notable', notable), ('Non-notable', df_cascade[~df_cascade['notable']])):
+        if len(group):
+            print(f"{label} works - Avg cascade size: {group['cascade_size'].mean():.2f}, "
+                  f"max: {group['cascade_size'].max():,}, avg depth: {group['cascade_depth'].mean():.2f}")
+    if len(notable):
+        print("\nLargest cascades behind notable works:")
+        for row in notable.nlargest(5, 'cascade_size').itertuples():
+            print(f"  {row.name} ({row.type}): {row.cascade_size:,} ancestors, depth {row.cascade_depth}")
+
+    out_dir = run.params.get('out_dir', '.')
+    os.makedirs(out_dir, exist_ok=True)
+    df_cascade.to_csv(os.path.join(out_dir, CASCADE_FILE), index=False)
+    print(f"\n✅ Cascade metrics saved to '{CASCADE_FILE}'")
+    return {'df_cascade': df_cascade}
+
+
+@pipeline.stage('genre_matrix', deps=('load',))
+def genre_matrix(run):
+    """Genre x genre creative influence counts per edge type and decade."""
+    from genre_matrix import MATRIX_FILE, influence_matrix, write_matrix
+
+    matrix = influence_matrix(run['load']['graph'])
+    counts = matrix['counts']
+    genres = matrix['genres']
+    total = counts.sum(axis=(0, 1), dtype=np.int64)
+
+    print("\nGenre Influence Matrix (influencer genre ← influenced genre):")
+    print("-" * 30)
+    print(f"{len(genres)} genres x {len(matrix['edge_types'])} edge types x "
+          f"{len(matrix['window_starts'])} windows of {matrix['window']} years, {int(total.sum()):,} edges")
+    print("Top genre influence pairs:")
+    for flat in np.argsort(-total, axis=None, kind='stable')[:10]:
+        i, j = divmod(int(flat), len(genres))
+        if total[i, j] == 0:
+            break
+        print(f"  {genres[i]} ← {genres[j]}: {int(total[i, j]):,}")
+
+    out_dir = run.params.get('out_dir', '.')
+    os.makedirs(out_dir, exist_ok=True)
+    write_matrix(matrix, os.path.join(out_dir, MATRIX_FILE))
+    print(f"\n✅ Genre influence matrix saved to '{MATRIX_FILE}'")
+    return matrix
+
+
+# ---------------------------------------------------------------------------
+# 6. Key Findings and Summary
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('summary', deps=('node_table', 'edge_table', 'temporal', 'structure', 'influence'))
+def summary(run):
+    """Print the key findings."""
+    nodes, edge_info, s, inf = run['node_table'], run['edge_table'], run['structure'], run['influence']
+    csr = run['load']['csr']
+    df_songs_albums = nodes['df_songs_albums']
+    notable_with_both_dates = run['temporal']['notable_with_both_dates']
+
+    # Summary statistics and key insights
+    print("🎵 MC1 MUSICAL INFLUENCE GRAPH - KEY FINDINGS 🎵")
+    print("=" * 60)
+
+    print(f"\n📊 DATASET OVERVIEW:")
+    print(f"   • Total nodes: {csr.num_nodes:,}")
+    print(f"   • Total edges: {csr.num_edges:,}")
+    print(f"   • Network density: {s['density']:.6f}")
+    print(f"   • Connected components: {s['wcc_count']}")
+
+    print(f"\n🎭 NODE COMPOSITION:")
+    for node_type, count in nodes['node_type_counts'].most_common():
+        percentage = (count / len(nodes['nodes'])) * 100
+        print(f"   • {node_type}: {count:,} ({percentage:.1f}%)")
+
+    print(f"\n🔗 RELATIONSHIP TYPES:")
+    for edge_type, count in edge_info['edge_type_counts'].most_common()[:5]:
+        percentage = (count / edge_info['edges'].num_edges) * 100
+        print(f"   • {edge_type}: {count:,} ({percentage:.1f}%)")
+
+    print(f"\n⭐ SUCCESS METRICS:")
+    total_works = len(df_songs_albums)
+    notable_works = df_songs_albums['notable'].sum()
+    print(f"   • Total songs/albums: {total_works:,}")
+    print(f"   • Notable works: {notable_works:,} ({(notable_works/total_works)*100:.1f}%)")
+
+    if len(notable_with_both_dates) > 0:
+        avg_time_to_notoriety = notable_with_both_dates['time_to_notoriety'].mean()
+        print(f"   • Average time to notoriety: {avg_time_to_notoriety:.1f} years")
+
+    print(f"\n🎨 CREATIVE INFLUENCES:")
+    print(f"   • Total creative influence relationships: {len(inf['creative_edge_ids']):,}")
+    print(f"   • Notable works avg influences received: {inf['notable_influences_received']/inf['notable_count']:.2f}")
+    print(f"   • Non-notable works avg influences received: {inf['non_notable_influences_received']/inf['non_notable_count']:.2f}")
+
+    print(f"\n🏆 TOP GENRES:")
+    for i, (genre, count) in enumerate(nodes['genre_counts'].head(5).items(), 1):
+        percentage = (count / len(df_songs_albums)) * 100
+        print(f"   {i}. {genre}: {count:,} ({percentage:.1f}%)")
+
+    print(f"\n🌟 NETWORK INSIGHTS:")
+    largest_wcc = s['largest_wcc_size']
+    print(f"   • Largest connected component: {largest_wcc:,} nodes ({(largest_wcc/csr.num_nodes)*100:.1f}%)")
+    print(f"   • Average in-degree: {np.mean(s['in_degree_values']):.2f}")
+    print(f"   • Average out-degree: {np.mean(s['out_degree_values']):.2f}")
+
+    print(f"\n💡 KEY RESEARCH DIRECTIONS:")
+    print(f"   • Influence propagation patterns across {len(EDGE_CATEGORIES['creative_influences'])} creative relationship types")
+    print(f"   • Success prediction based on network position and influence patterns")
+    print(f"   • Temporal evolution of genre popularity and cross-genre influences")
+    print(f"   • Identification of keystone nodes in the influence network")
+
+    print("\n" + "=" * 60)
+
+
+# ---------------------------------------------------------------------------
 # Save processed data for future analysis
-print("Saving processed datasets for future analysis...")
-
-# Save key datasets
-df_songs_albums.to_csv('songs_albums_analysis.csv', index=False)
-print("✅ Songs and albums data saved to 'songs_albums_analysis.csv'")
-
-# Save network metrics
-network_metrics = {
-    'node_count': G.number_of_nodes(),
-    'edge_count': G.number_of_edges(),
-    'density': nx.density(G),
-    'weakly_connected_components': len(weakly_connected),
-    'strongly_connected_components': len(strongly_connected),
-    'largest_wcc_size': largest_wcc_size,
-    'largest_scc_size': largest_scc_size
-}
-
-import json
-with open('network_metrics.json', 'w') as f:
-    json.dump(network_metrics, f, indent=2)
-print("✅ Network metrics saved to 'network_metrics.json'")
-
-# Save edge type analysis
-edge_analysis = {
-    'edge_type_counts': dict(edge_type_counts),
-    'creative_influences': creative_influences,
-    'professional_roles': professional_roles,
-    'business_relationships': business_relationships,
-    'total_creative_influences': len(creative_influence_edges)
-}
-
-with open('edge_analysis.json', 'w') as f:
-    json.dump(edge_analysis, f, indent=2)
-print("✅ Edge analysis saved to 'edge_analysis.json'")
-
-print("\n🎯 NEXT STEPS FOR VISUALIZATION PROJECT:")
-print("   1. Focus on creative influence subgraph for interactive visualization")
-print("   2. Implement temporal filtering for year-based analysis")
-print("   3. Create genre-based network views")
-print("   4. Develop success pathway tracking (notable work connections)")
-print("   5. Build interactive node/edge filtering based on relationship types")
-
-print("\n📁 Generated Files:")
-print("   • songs_albums_analysis.csv - Processed song/album data")
-print("   • network_metrics.json - Basic network statistics")
-print("   • edge_analysis.json - Edge type analysis results")
-
-
-
+# ---------------------------------------------------------------------------
+
+@pipeline.stage('export', deps=('node_table', 'edge_table', 'structure', 'influence', 'cascade'))
+def export(run):
+    """Write songs_albums_analysis.csv, network metrics, edge analysis and component labels.
+
+    cascade_metrics.csv is written by the 'cascade' stage this depends on.
+    """
+    from components import COMPONENTS_FILE, component_frame
+
+    out_dir = run.params.get('out_dir', '.')
+    os.makedirs(out_dir, exist_ok=True)
+    df_songs_albums = run['node_table']['df_songs_albums']
+    s = run['structure']
+    csr = run['load']['csr']
+
+    print("Saving processed datasets for future analysis...")
+
+    # Save key datasets
+    df_songs_albums.to_csv(os.path.join(out_dir, 'songs_albums_analysis.csv'), index=False)
+    print("✅ Songs and albums data saved to 'songs_albums_analysis.csv'")
+
+    # Typed columnar copies (optional, need pyarrow)
+    columnar_files = []
+    formats = run.params.get('formats') or ()
+    if formats:
+        from columnar_export import export_songs_albums
+        columnar_files = [os.path.basename(p) for p in export_songs_albums(df_songs_albums, out_dir, formats)]
+        for name in columnar_files:
+            print(f"✅ Typed songs and albums data saved to '{name}'")
+
+    # Save network metrics
+    network_metrics = {
+        'node_count': csr.num_nodes,
+        'edge_count': csr.num_edges,
+        'density': s['density'],
+        'weakly_connected_components': s['wcc_count'],
+        'strongly_connected_components': s['scc_count'],
+        'largest_wcc_size': s['largest_wcc_size'],
+        'largest_scc_size': s['largest_scc_size']
+    }
+
+    with open(os.path.join(out_dir, 'network_metrics.json'), 'w') as f:
+        json.dump(network_metrics, f, indent=2)
+    print("✅ Network metrics saved to 'network_metrics.json'")
+
+    # Per-node component labels, so network views can filter without recomputing
+    df_components = component_frame(run['load']['graph'].node_ids, s['wcc_labels'], s['scc_labels'])
+    df_components.to_csv(os.path.join(out_dir, COMPONENTS_FILE), index=False)
+    print(f"✅ Component labels saved to '{COMPONENTS_FILE}'")
+
+    # Save edge type analysis
+    edge_analysis = {
+        'edge_type_counts': dict(run['edge_table']['edge_type_counts']),
+        'creative_influences': EDGE_CATEGORIES['creative_influences'],
+        'professional_roles': EDGE_CATEGORIES['professional_roles'],
+        'business_relationships': EDGE_CATEGORIES['business_relationships'],
+        'total_creative_influences': len(run['influence']['creative_edge_ids'])
+    }
+
+    with open(os.path.join(out_dir, 'edge_analysis.json'), 'w') as f:
+        json.dump(edge_analysis, f, indent=2)
+    print("✅ Edge analysis saved to 'edge_analysis.json'")
+
+    print("\n🎯 NEXT STEPS FOR VISUALIZATION PROJECT:")
+    print("   1. Focus on creative influence subgraph for interactive visualization")
+    print("   2. Implement temporal filtering for year-based analysis")
+    print("   3. Create genre-based network views")
+    print("   4. Develop success pathway tracking (notable work connections)")
+    print("   5. Build interactive node/edge filtering based on relationship types")
+
+    print("\n📁 Generated Files:")
+    print("   • songs_albums_analysis.csv - Processed song/album data")
+    print("   • network_metrics.json - Basic network statistics")
+    print("   • edge_analysis.json - Edge type analysis results")
+    print(f"   • {COMPONENTS_FILE} - Weak/strong component label and size per node")
+    print("   • cascade_metrics.csv - Per-work transitive influence ancestry")
+    for name in columnar_files:
+        print(f"   • {name} - Typed columnar song/album data")
+
+    return {'network_metrics': network_metrics, 'edge_analysis': edge_analysis}
+
+
+@pipeline.stage('dashboard_payloads', deps=('load',))
+def dashboard_payloads(run):
+    """Write the per-page JSON payloads the dashboards load instead of MC1_graph.json."""
+    from dashboard_payloads import write_payloads
+
+    paths = write_payloads(run['load']['graph'], run.params.get('out_dir', '.'), window=rising_window(run))
+    print("\n📦 Dashboard payloads:")
+    for path in paths.values():
+        print(f"   • {os.path.relpath(path, run.params.get('out_dir', '.'))} ({os.path.getsize(path) / 1024:.1f} KB)")
+    return paths
+
+
+def rising_window(run):
+    from artist_index import RECENT_WINDOW
+
+    return tuple(run.params.get('window') or RECENT_WINDOW)
+
+
+@pipeline.stage('rising_stars', deps=('load',))
+def rising_stars(run):
+    """Rising-star scores of every Oceanus Folk contributor, ranked (rising_stars.csv)."""
+    from artist_index import RANKING_FILE, ArtistIndex
+
+    window = rising_window(run)
+    index = ArtistIndex(run['load']['graph'])
+    ranking = index.ranking(window)
+
+    print(f"\nRising Stars ({window[0]}-{window[1] - 1} releases, {len(ranking):,} candidates):")
+    for star in ranking.head(10).itertuples():
+        print(f"  {star.rank:>2}. {star.name}: {star.score:.2f} "
+              f"({star.recent_notable_works} notable / {star.recent_works} works since {window[0]})")
+
+    out_dir = run.params.get('out_dir', '.')
+    os.makedirs(out_dir, exist_ok=True)
+    ranking.to_csv(os.path.join(out_dir, RANKING_FILE), index=False)
+    print(f"✅ Rising-star ranking saved to '{RANKING_FILE}'")
+    return {'index': index, 'ranking': ranking}
+
+
+@pipeline.stage('layouts', deps=('load',))
+def layouts(run):
+    """Precomputed force layouts of the network pages per filter preset (payloads/layouts)."""
+    from force_layout import view_layouts, write_layouts
+
+    out_dir = run.params.get('out_dir', '.')
+    layouts = view_layouts(run['load']['graph'], seed=run.params.get('seed', 0))
+    paths = write_layouts(layouts, out_dir)
+    print("\n🗺️ Network layouts:")
+    for (view, preset), path in paths.items():
+        layout = layouts[view][preset]
+        print(f"   • {os.path.relpath(path, out_dir)}: {len(layout['ids']):,} nodes, "
+              f"stress {layout['stress']:.3f} ({os.path.getsize(path) / 1024:.1f} KB)")
+    return {'layouts': layouts, 'paths': paths}
+
+
+@pipeline.stage('centrality', deps=('load', 'influence'))
+def centrality(run):
+    """PageRank, sampled betweenness and degree centrality for keystone nodes."""
+    from centrality import DEFAULT_SAMPLES, METRICS_FILE, metrics_frame, scores
+
+    graph, csr = run['load']['graph'], run['load']['csr']
+    creative_subgraph = run['influence']['creative_subgraph']
+    k = run.params.get('betweenness_samples', DEFAULT_SAMPLES)
+    workers = run.params.get('workers') or 1
+    seed = run.params.get('seed', 0)
+
+    graphs = {
+        'full': scores(csr, k, seed, workers),
+        'creative': scores(creative_subgraph, k, seed, workers, nodes=creative_subgraph.has_edges()),
+    }
+    node_names = [n if n is not None else 'Unknown' for n in graph.text['name']]
+    node_type_names = [t if t is not None else 'Unknown' for t in graph.decode('Node Type')]
+    for suffix, label in (('full', 'Full Graph'), ('creative', 'Creative Influence Subgraph')):
+        for metric in ('pagerank', 'betweenness'):
+            values = np.nan_to_num(graphs[suffix][metric], nan=-np.inf)
+            print(f"\nTop 10 Keystone Nodes by {metric.title()} ({label}):")
+            for node in np.argsort(-values, kind='stable')[:10]:
+                print(f"  {node_names[node]} ({node_type_names[node]}): {values[node]:.6f}")
+
+    out_dir = run.params.get('out_dir', '.')
+    os.makedirs(out_dir, exist_ok=True)
+    df_centrality = metrics_frame(graph, graphs)
+    df_centrality.to_csv(os.path.join(out_dir, METRICS_FILE), index=False)
+    print(f"\n✅ Centrality metrics saved to '{METRICS_FILE}'")
+    return {'scores': graphs, 'df_centrality': df_centrality}
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def list_stages():
+    for name in DEFAULT_STAGES + [n for n in pipeline.stages if n not in DEFAULT_STAGES]:
+        stage = pipeline.stages[name]
+        deps = f" (needs {', '.join(stage.deps)})" if stage.deps else ''
+        print(f"{name:>18}  {stage.doc}{deps}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MC1 exploratory data analysis pipeline.")
+    parser.add_argument('--graph', default='MC1_graph.json', help="node-link JSON graph (default: %(default)s)")
+    parser.add_argument('--out-dir', default='.', help="directory for exported datasets (default: %(default)s)")
+    parser.add_argument('--format', nargs='+', dest='formats', default=[], choices=['parquet', 'arrow'],
+                        help="also export songs/albums as Parquet and/or Arrow IPC (needs pyarrow)")
+    parser.add_argument('--only', nargs='+', metavar='STAGE', choices=list(pipeline.stages),
+                        help="run only these stages and what they depend on")
+    parser.add_argument('--no-figures', action='store_true', help="skip every figure stage")
+    parser.add_argument('--list', action='store_true', help="list stages and exit")
+    parser.add_argument('--parallel', type=int, metavar='N',
+                        help="run independent stages in N worker processes sharing the loaded arrays")
+    parser.add_argument('--profile', action='store_true',
+                        help="time every stage (wall, CPU, peak RSS, tracemalloc) and write stage_profile.json")
+    parser.add_argument('--trace-events', metavar='PATH',
+                        help="with --profile, also write a Chrome trace-event file")
+    parser.add_argument('--cprofile', metavar='DIR', help="with --profile, dump a cProfile file per stage into DIR")
+    parser.add_argument('--window', nargs=2, type=int, metavar=('START', 'END'),
+                        help="rising-star release window [START, END) in years (default: 2034 2039)")
+    parser.add_argument('--figures-dir', metavar='DIR',
+                        help="where figures are saved (default: <out-dir>/figures); unchanged ones are not redrawn")
+    parser.add_argument('--figure-format', nargs='+', dest='figure_formats', default=['png'], metavar='FMT',
+                        choices=['png', 'svg', 'pdf'], help="file formats of saved figures (default: png)")
+    parser.add_argument('--figure-workers', type=int, metavar='N',
+                        help="processes drawing figures (default: one per CPU; 0 draws in this process)")
+    parser.add_argument('--show-figures', action='store_true',
+                        help="open figure windows instead of saving files")
+    args = parser.parse_args(argv)
+    if (args.trace_events or args.cprofile) and not args.profile:
+        parser.error("--trace-events and --cprofile need --profile")
+    if args.profile and args.parallel:
+        parser.error("--profile times stages in this process; it cannot be combined with --parallel")
+
+    if args.list:
+        list_stages()
+        return None
+
+    targets = args.only or DEFAULT_STAGES
+    if args.no_figures:
+        targets = [name for name in targets if not pipeline.stages[name].figure]
+    params = dict(graph_path=args.graph, out_dir=args.out_dir, formats=args.formats, window=args.window)
+    if args.parallel:
+        run = parallel_runner.run(pipeline, targets, workers=args.parallel, **params)
+    elif args.profile:
+        import profiling
+        run = profiling.run(pipeline, targets, cprofile_dir=args.cprofile, **params)
+        profiling.print_records(run.records)
+        os.makedirs(args.out_dir, exist_ok=True)
+        profiling.write_trace(run.records, os.path.join(args.out_dir, profiling.TRACE_FILE), graph_path=args.graph)
+        if args.trace_events:
+            profiling.write_chrome_trace(run.records, args.trace_events)
+    else:
+        run = pipeline.run(targets, **params)
+    render_figures(run, targets, args)
+    return run
+
+
+def render_figures(run, targets, args):
+    """Draw the figure specs returned by the figure stages among ``targets``."""
+    import figures
+
+    specs = [spec for name in pipeline.resolve(targets) if pipeline.stages[name].figure
+             for spec in run[name]]
+    if not specs:
+        return
+    if args.show_figures:
+        figures.show(specs)
+        return
+    figures_dir = args.figures_dir or os.path.join(args.out_dir, 'figures')
+    drawn, cached = figures.render(specs, figures_dir, args.figure_formats, args.figure_workers)
+    print(f"\nFigures: {len(drawn)} drawn, {len(cached)} unchanged in {figures_dir}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+"""Drawing functions of the eda.py figures.
+
+Each function draws one figure onto the current pyplot figure from the data
+its figure stage recorded (see :mod:`figures`); the stage keeps the analysis,
+these keep the look.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# ---------------------------------------------------------------------------
+# 1. Node Analysis
+# ---------------------------------------------------------------------------
+
+def node_types(plt, sns, data):
+    types, counts = data['types'], data['counts']
+    colors = sns.color_palette("husl", len(types))
+
+    plt.subplot(1, 2, 1)
+    # Increase figure size and adjust pie chart
+    plt.pie(counts, labels=types, autopct='%1.1f%%', colors=colors, startangle=90,
+            labeldistance=1.2, pctdistance=0.8)  # Adjust label and percentage distances
+    plt.title('Node Type Distribution')
+
+    plt.subplot(1, 2, 2)
+    bars = plt.bar(types, counts, color=colors)
+    plt.title('Node Type Counts')
+    plt.xlabel('Node Type')
+    plt.ylabel('Count')
+    plt.xticks(rotation=45)
+    for bar, count in zip(bars, counts):
+        percentage = (count / sum(counts)) * 100
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 100, f'{percentage:.1f}%',
+                 ha='center', va='bottom')
+
+
+def genres_and_notability(plt, sns, data):
+    plt.subplot(1, 2, 1)
+    genres, genre_counts = data['top_genres'], data['top_genre_counts']
+    colors = sns.color_palette("pastel", len(genres))
+    plt.barh(range(len(genres)), genre_counts, color=colors)
+    plt.yticks(range(len(genres)), genres)
+    plt.xlabel('Count')
+    plt.title('Top 10 Genres')
+    plt.gca().invert_yaxis()
+
+    plt.subplot(1, 2, 2)
+    # Notable vs non-notable by type
+    types = data['types']
+    colors = sns.color_palette("pastel", 2)
+    plt.bar(types, data['non_notable'], label='Non-Notable', color=colors[0])
+    plt.bar(types, data['notable'], bottom=data['non_notable'], label='Notable', color=colors[1])
+    plt.title('Notable vs Non-Notable by Type')
+    plt.xlabel('Type')
+    plt.ylabel('Count')
+    plt.xticks(rotation=0)
+    plt.legend()
+
+
+def singles_and_genre_diversity(plt, sns, data):
+    plt.subplot(1, 2, 1)
+    # Singles vs non-singles (for songs only) - using bar chart instead of pie
+    single_counts = data['single_counts']
+    if len(single_counts) > 0:
+        colors = sns.color_palette("pastel", 2)
+        plt.bar(['Non-Single', 'Single'], single_counts, color=colors)
+        plt.title('Songs: Singles vs Non-Singles')
+        # Add percentage labels on top of bars
+        for i, v in enumerate(single_counts):
+            percentage = (v / sum(single_counts)) * 100
+            plt.text(i, v, f'{percentage:.1f}%', ha='center', va='bottom')
+
+    plt.subplot(1, 2, 2)
+    # Genre diversity for notable vs non-notable
+    colors = sns.color_palette("pastel", 2)
+    plt.bar(['Notable', 'Non-Notable'], [data['notable_genres'], data['non_notable_genres']], color=colors)
+    plt.ylabel('Number of Unique Genres')
+    plt.title('Genre Diversity: Notable vs Non-Notable')
+
+
+# ---------------------------------------------------------------------------
+# 2. Edge Analysis
+# ---------------------------------------------------------------------------
+
+def edge_types(plt, sns, data):
+    types, counts = data['types'], data['counts']
+    colors = sns.color_palette("Set3", len(types))
+    bars = plt.bar(types, counts, color=colors)
+    plt.title('Edge Type Distribution')
+    plt.xlabel('Edge Type')
+    plt.ylabel('Count')
+    plt.xticks(rotation=45, ha='right')
+
+    # Add count and percentage labels on top of bars
+    total = sum(counts)
+    for bar, count in zip(bars, counts):
+        percentage = (count/total) * 100
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
+                 f'{count:,}\n({percentage:.1f}%)',
+                 ha='center', va='bottom')
+
+
+def edge_categories(plt, sns, data):
+    category_counts = data['counts']
+    total = sum(category_counts)
+    percentages = [count/total * 100 for count in category_counts]
+    bars = plt.barh(data['categories'], percentages, color=data['colors'])
+    plt.title('Conexiones agrupadas por categoría')
+    plt.xlabel('Percentage (%)')
+
+    # Add percentage labels
+    for bar, pct in zip(bars, percentages):
+        plt.text(bar.get_width(), bar.get_y() + bar.get_height()/2,
+                 f'{pct:.1f}%',
+                 ha='left', va='center')
+
+
+# ---------------------------------------------------------------------------
+# 3. Temporal Analysis
+# ---------------------------------------------------------------------------
+
+def release_timelines(plt, sns, data):
+    years = data['years']
+
+    # Release timeline
+    plt.subplot(1, 2, 1)
+    plt.plot(years, data['release_counts'], color='#2E86C1', marker='o', markersize=3, markerfacecolor='#E74C3C', markeredgecolor='#E74C3C')
+    plt.title('Releases Over Time')
+    plt.xlabel('Year')
+    plt.ylabel('Number of Releases')
+    plt.grid(True, alpha=0.3)
+
+    # Genre evolution over time (top 5 genres)
+    plt.subplot(1, 2, 2)
+    genre_timeline = data['genre_timeline']
+    # Only the years in which one of the top genres released something
+    active = np.sum(list(genre_timeline.values()), axis=0) > 0 if genre_timeline else None
+    for genre, counts in genre_timeline.items():
+        if counts.any():
+            plt.plot(years[active], counts[active], marker='o', label=genre, markersize=2)
+    plt.title('Top 5 Genres Over Time')
+    plt.xlabel('Year')
+    plt.ylabel('Number of Releases')
+    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.grid(True, alpha=0.3)
+
+
+def notable_timeline(plt, sns, data):
+    non_notable_by_year, notable_by_year = data['non_notable'], data['notable']
+    if non_notable_by_year.any() and notable_by_year.any():
+        plt.stackplot(data['years'], non_notable_by_year, notable_by_year,
+                      labels=['Non-Notable', 'Notable'], alpha=0.7)
+        plt.title('Notable vs Non-Notable Releases Over Time')
+        plt.xlabel('Year')
+        plt.ylabel('Number of Releases')
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+
+
+def releases_by_decade(plt, sns, data):
+    decades = data['decades']
+    plt.bar(decades, data['counts'], width=8, alpha=0.7)
+    plt.title('Releases by Decade')
+    plt.xlabel('Decade')
+    plt.ylabel('Number of Releases')
+    plt.xticks(decades)
+
+
+# ---------------------------------------------------------------------------
+# 4. Network Structure Analysis
+# ---------------------------------------------------------------------------
+
+def component_sizes(plt, sns, data):
+    wcc_sizes, scc_sizes = data['wcc_sizes'], data['scc_sizes']
+
+    plt.subplot(1, 3, 1)
+    plt.hist(wcc_sizes, bins=20, alpha=0.7, edgecolor='black')
+    plt.xlabel('Component Size')
+    plt.ylabel('Frequency')
+    plt.title('Weakly Connected Components\nSize Distribution')
+    plt.yscale('log')
+
+    plt.subplot(1, 3, 2)
+    plt.hist(scc_sizes, bins=20, alpha=0.7, edgecolor='black', color='orange')
+    plt.xlabel('Component Size')
+    plt.ylabel('Frequency')
+    plt.title('Strongly Connected Components\nSize Distribution')
+    plt.yscale('log')
+
+    plt.subplot(1, 3, 3)
+    sizes_comparison = pd.DataFrame({
+        'Weakly Connected': pd.Series(wcc_sizes).value_counts().sort_index(),
+        'Strongly Connected': pd.Series(scc_sizes).value_counts().sort_index()
+    }).fillna(0)
+    sizes_comparison.plot(kind='bar', alpha=0.7, ax=plt.gca())
+    plt.xlabel('Component Size')
+    plt.ylabel('Number of Components')
+    plt.title('Component Size Comparison')
+    plt.xticks(rotation=45)
+    plt.legend()
+
+
+def degree_distributions(plt, sns, data):
+    in_degree_values, out_degree_values = data['in_degree'], data['out_degree']
+
+    plt.subplot(2, 3, 1)
+    plt.hist(in_degree_values, bins=50, alpha=0.7, edgecolor='black')
+    plt.xlabel('In-Degree')
+    plt.ylabel('Frequency')
+    plt.title('In-Degree Distribution')
+    plt.yscale('log')
+
+    plt.subplot(2, 3, 2)
+    plt.hist(out_degree_values, bins=50, alpha=0.7, edgecolor='black', color='orange')
+    plt.xlabel('Out-Degree')
+    plt.ylabel('Frequency')
+    plt.title('Out-Degree Distribution')
+    plt.yscale('log')
+
+    plt.subplot(2, 3, 3)
+    plt.hist(data['total_degree'], bins=50, alpha=0.7, edgecolor='black', color='green')
+    plt.xlabel('Total Degree')
+    plt.ylabel('Frequency')
+    plt.title('Total Degree Distribution')
+    plt.yscale('log')
+
+    # Degree by node type
+    plt.subplot(2, 3, 4)
+    type_avg_degrees = data['type_avg_degrees']
+    plt.bar(type_avg_degrees.keys(), type_avg_degrees.values())
+    plt.xlabel('Node Type')
+    plt.ylabel('Average Total Degree')
+    plt.title('Average Degree by Node Type')
+    plt.xticks(rotation=45)
+
+    # In vs Out degree scatter
+    plt.subplot(2, 3, 5)
+    plt.scatter(in_degree_values, out_degree_values, alpha=0.5, s=10)
+    plt.xlabel('In-Degree')
+    plt.ylabel('Out-Degree')
+    plt.title('In-Degree vs Out-Degree')
+    plt.xscale('log')
+    plt.yscale('log')
+
+    # Degree distribution comparison
+    plt.subplot(2, 3, 6)
+    plt.hist(in_degree_values, bins=50, alpha=0.5, label='In-Degree', density=True)
+    plt.hist(out_degree_values, bins=50, alpha=0.5, label='Out-Degree', density=True)
+    plt.xlabel('Degree')
+    plt.ylabel('Density')
+    plt.title('Degree Distribution Comparison')
+    plt.legend()
+    plt.yscale('log')
+
+
+# ---------------------------------------------------------------------------
+# 5. Influence and Success Analysis
+# ---------------------------------------------------------------------------
+
+def influence_patterns(plt, sns, data):
+    notable_count, non_notable_count = data['notable_count'], data['non_notable_count']
+
+    # Influence counts comparison
+    plt.subplot(2, 3, 1)
+    categories = ['Received', 'Given']
+    notable_values, non_notable_values = data['notable_values'], data['non_notable_values']
+
+    x = np.arange(len(categories))
+    width = 0.35
+
+    plt.bar(x - width/2, notable_values, width, label='Notable', alpha=0.7)
+    plt.bar(x + width/2, non_notable_values, width, label='Non-Notable', alpha=0.7)
+    plt.xlabel('Influence Direction')
+    plt.ylabel('Total Count')
+    plt.title('Creative Influences: Notable vs Non-Notable')
+    plt.xticks(x, categories)
+    plt.legend()
+
+    # Influence rates comparison
+    plt.subplot(2, 3, 2)
+    notable_rates = [v / notable_count for v in notable_values]
+    non_notable_rates = [v / non_notable_count for v in non_notable_values]
+
+    plt.bar(x - width/2, notable_rates, width, label='Notable', alpha=0.7)
+    plt.bar(x + width/2, non_notable_rates, width, label='Non-Notable', alpha=0.7)
+    plt.xlabel('Influence Direction')
+    plt.ylabel('Average per Work')
+    plt.title('Creative Influence Rates')
+    plt.xticks(x, categories)
+    plt.legend()
+
+    # Influence type breakdown for notable works
+    plt.subplot(2, 3, 3)
+    notable_influence_types = data['notable_influence_types']
+    if notable_influence_types:
+        types, counts = zip(*notable_influence_types.items())
+        plt.pie(counts, labels=types, autopct='%1.1f%%', startangle=90)
+        plt.title('Types of Influences\nReceived by Notable Works')
+
+    # Distribution of influences per work
+    plt.subplot(2, 3, 4)
+    plt.hist(data['notable_in_degrees'], bins=20, alpha=0.7, label='Notable', density=True)
+    plt.hist(data['non_notable_in_degrees'], bins=20, alpha=0.7, label='Non-Notable', density=True)
+    plt.xlabel('Number of Influences Received')
+    plt.ylabel('Density')
+    plt.title('Distribution of Influences Received')
+    plt.legend()
+
+    plt.subplot(2, 3, 5)
+    plt.hist(data['notable_out_degrees'], bins=20, alpha=0.7, label='Notable', density=True)
+    plt.hist(data['non_notable_out_degrees'], bins=20, alpha=0.7, label='Non-Notable', density=True)
+    plt.xlabel('Number of Influences Given')
+    plt.ylabel('Density')
+    plt.title('Distribution of Influences Given')
+    plt.legend()
+
+    # Success cascade analysis
+    plt.subplot(2, 3, 6)
+    influence_chains = data['influence_chains']
+    if len(influence_chains):
+        plt.hist(influence_chains, bins=15, alpha=0.7, edgecolor='black')
+        plt.xlabel('Number of Direct Influences')
+        plt.ylabel('Number of Notable Works')
+        plt.title('Direct Influences to Notable Works')
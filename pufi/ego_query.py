@@ -0,0 +1,232 @@
+"""k-hop ego-network queries over the columnar graph, with a small HTTP endpoint.
+
+:class:`NeighborhoodIndex` keeps one undirected adjacency index (CSR over
+both edge directions, with the edge id of every entry) per edge category of
+:data:`edge_table.EDGE_CATEGORIES`, plus one over all edges.  A query walks
+``hops`` breadth-first levels from a node with array gathers and returns the
+induced subgraph: every node within ``hops`` and every edge of the selected
+types between two of them.  Arbitrary edge-type lists get their own index on
+first use; results of hot queries are kept in an LRU cache.
+
+    python ego_query.py query 17 --hops 2 --edges creative_influences
+    python ego_query.py serve --port 8765
+
+    GET /ego?id=17&hops=2&edges=creative_influences
+    GET /ego?name=Sailor%20Shift&edges=PerformerOf,ComposerOf
+"""
+
+import argparse
+import json
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from csr_graph import _gather, _index
+from edge_table import EDGE_CATEGORIES, EdgeTable
+
+ALL_EDGES = 'all'
+DEFAULT_HOPS = 2
+MAX_HOPS = 6
+DEFAULT_CACHE_SIZE = 4096
+
+
+class NeighborhoodIndex:
+    """Per-category adjacency indexes answering k-hop neighborhood queries."""
+
+    def __init__(self, graph, cache_size=DEFAULT_CACHE_SIZE):
+        self.graph = graph
+        self.edges = EdgeTable.from_arrays(graph)
+        self.num_nodes = graph.num_nodes
+        self.names = graph.text['name']
+        self.types = graph.decode('Node Type')
+        self.notable = np.asarray(graph.columns['notable']) == 1
+        self._adjacency = {}
+        for key in (ALL_EDGES, *EDGE_CATEGORIES):
+            self._adjacency[key] = self._build(key)
+        self.query = lru_cache(maxsize=cache_size)(self._query)
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+    def edge_filter_key(self, edge_filter=None):
+        """Normalise a category name, edge type name or list of types to a cache key."""
+        if edge_filter is None or edge_filter == ALL_EDGES:
+            return ALL_EDGES
+        if isinstance(edge_filter, str):
+            if edge_filter in EDGE_CATEGORIES:
+                return edge_filter
+            edge_filter = edge_filter.split(',')
+        types = tuple(sorted({t.strip() for t in edge_filter if t.strip()}))
+        unknown = [t for t in types if t not in self.edges.type_names]
+        if unknown or not types:
+            raise ValueError(f"Unknown edge filter {', '.join(unknown) or edge_filter!r}; expected "
+                             f"{ALL_EDGES}, one of {', '.join(EDGE_CATEGORIES)} or edge type names")
+        return types
+
+    def _build(self, key):
+        if key == ALL_EDGES:
+            edge_ids = np.arange(self.edges.num_edges, dtype=np.int32)
+        else:
+            types = EDGE_CATEGORIES[key] if isinstance(key, str) else key
+            edge_ids = np.flatnonzero(self.edges.mask(types)).astype(np.int32)
+        src, dst = self.edges.src[edge_ids], self.edges.dst[edge_ids]
+        loop = src == dst
+        keys = np.concatenate((src, dst[~loop]))
+        neighbors = np.concatenate((dst, src[~loop]))
+        indptr, neighbors, order = _index(self.num_nodes, keys, neighbors)
+        return indptr, neighbors, np.concatenate((edge_ids, edge_ids[~loop]))[order]
+
+    def adjacency(self, edge_filter=None):
+        """``(indptr, neighbor indices, edge ids)`` for the given edge filter."""
+        key = self.edge_filter_key(edge_filter)
+        if key not in self._adjacency:
+            self._adjacency[key] = self._build(key)
+        return self._adjacency[key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def node_index(self, node_id):
+        """Dense index of ``node_id``; string ids from URLs are retried as integers."""
+        index = self.graph.node_index
+        if node_id in index:
+            return index[node_id]
+        if isinstance(node_id, str):
+            try:
+                return index[int(node_id)]
+            except (ValueError, KeyError):
+                pass
+        raise KeyError(f"Unknown node id {node_id!r}")
+
+    def node_by_name(self, name):
+        try:
+            return self.graph.node_ids[self.names.index(name)]
+        except ValueError:
+            raise KeyError(f"No node named {name!r}") from None
+
+    def neighborhood(self, node, hops=DEFAULT_HOPS, edge_filter=None):
+        """Node indices within ``hops`` of dense index ``node``, their depths and the induced edge ids."""
+        indptr, neighbors, edge_ids = self.adjacency(edge_filter)
+        levels = [np.array([node], dtype=np.int32)]
+        seen = levels[0]
+        for _ in range(hops):
+            reached = np.unique(_gather(indptr, neighbors, levels[-1]))
+            new = reached[~np.isin(reached, seen, assume_unique=True)]
+            if len(new) == 0:
+                break
+            levels.append(new)
+            seen = np.concatenate((seen, new))
+        depth = np.repeat(np.arange(len(levels), dtype=np.int8), [len(level) for level in levels])
+
+        candidates = np.unique(_gather(indptr, edge_ids, seen))
+        inside = (np.isin(self.edges.src[candidates], seen)
+                  & np.isin(self.edges.dst[candidates], seen))
+        return seen, depth, candidates[inside]
+
+    def _query(self, node_id, hops=DEFAULT_HOPS, edge_filter=ALL_EDGES):
+        if not 0 <= hops <= MAX_HOPS:
+            raise ValueError(f"hops must be between 0 and {MAX_HOPS}")
+        nodes, depth, edges = self.neighborhood(self.node_index(node_id), hops, edge_filter)
+        ids = self.graph.node_ids
+        type_names = self.edges.type_names
+        return {
+            'center': node_id,
+            'hops': hops,
+            'edge_filter': edge_filter if isinstance(edge_filter, str) else list(edge_filter),
+            'nodes': [
+                {'id': ids[i], 'name': self.names[i], 'type': self.types[i],
+                 'notable': bool(self.notable[i]), 'depth': int(d)}
+                for i, d in zip(nodes.tolist(), depth.tolist())
+            ],
+            'links': [
+                {'source': ids[s], 'target': ids[t], 'type': type_names[c] if c >= 0 else None}
+                for s, t, c in zip(self.edges.src[edges].tolist(), self.edges.dst[edges].tolist(),
+                                   self.edges.edge_type[edges].tolist())
+            ],
+        }
+
+    def ego(self, node_id, hops=DEFAULT_HOPS, edge_filter=None):
+        """Cached induced subgraph around ``node_id``; treat the result as read-only."""
+        return self.query(node_id, hops, self.edge_filter_key(edge_filter))
+
+
+# ---------------------------------------------------------------------------
+# HTTP endpoint
+# ---------------------------------------------------------------------------
+
+def _handler(index):
+    class EgoHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != '/ego':
+                return self._send(404, {'error': f"Unknown path {url.path}; use /ego"})
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if 'id' not in params and 'name' not in params:
+                return self._send(400, {'error': "id or name is required"})
+            try:
+                node_id = params['id'] if 'id' in params else index.node_by_name(params['name'])
+                node_id = index.graph.node_ids[index.node_index(node_id)]
+                result = index.ego(node_id, int(params.get('hops', DEFAULT_HOPS)), params.get('edges'))
+            except KeyError as exc:
+                return self._send(404, {'error': exc.args[0]})
+            except ValueError as exc:
+                return self._send(400, {'error': str(exc)})
+            self._send(200, result)
+
+        def _send(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return EgoHandler
+
+
+def serve(index, host='127.0.0.1', port=8765):
+    server = ThreadingHTTPServer((host, port), _handler(index))
+    print(f"Serving ego queries on http://{host}:{server.server_port}/ego")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def load_index(graph_path='MC1_graph.json', cache_size=DEFAULT_CACHE_SIZE):
+    """Index over the graph loaded by eda.py's ``load`` stage."""
+    from eda import pipeline
+    return NeighborhoodIndex(pipeline.run(['load'], graph_path=graph_path)['load']['graph'], cache_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="k-hop ego-network queries over the MC1 graph.")
+    parser.add_argument('--graph', default='MC1_graph.json', help="node-link JSON graph (default: %(default)s)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    query = sub.add_parser('query', help="print one neighborhood as JSON")
+    query.add_argument('node_id')
+    query.add_argument('--hops', type=int, default=DEFAULT_HOPS)
+    query.add_argument('--edges', default=None, help="category name or comma-separated edge types")
+    server = sub.add_parser('serve', help="run the local HTTP endpoint")
+    server.add_argument('--host', default='127.0.0.1')
+    server.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    index = load_index(args.graph)
+    if args.command == 'query':
+        node_id = index.graph.node_ids[index.node_index(args.node_id)]
+        print(json.dumps(index.ego(node_id, args.hops, args.edges), ensure_ascii=False, indent=2))
+    else:
+        serve(index, args.host, args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""Deferred figure rendering: charts recorded as data, drawn only on request.
+
+A figure stage returns :class:`FigureSpec` records instead of drawing: a
+file name, the drawing function (``"module:function"``, called as
+``draw(plt, sns, data)`` on a fresh figure) and the plain data it plots
+(numbers, lists, dicts and numpy arrays).  Nothing imports matplotlib until
+something is rendered.
+
+:func:`render` draws specs headlessly with the Agg backend in a process pool
+and saves one file per requested format (PNG, SVG, PDF, ...).  Every
+spec is keyed by a hash of its data, figure size and the source of its
+drawing function; ``.figure_cache.json`` in the output directory remembers
+the key each file was drawn from, so charts whose inputs did not change are
+not redrawn.  :func:`show` draws them in-process with the default backend,
+as the notebook did.
+
+    python eda.py --figures-dir figures --figure-format png svg
+"""
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+CACHE_INDEX = '.figure_cache.json'
+
+
+@dataclass(frozen=True)
+class FigureSpec:
+    name: str
+    draw: str
+    data: dict = field(default_factory=dict)
+    figsize: tuple = (12, 8)
+
+
+def figure(name, draw, data, figsize=(12, 8)):
+    """A :class:`FigureSpec` for the module-level function ``draw``."""
+    return FigureSpec(name, f"{draw.__module__}:{draw.__qualname__}", data, tuple(figsize))
+
+
+def _resolve(draw):
+    module, name = draw.split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+def _update(digest, value):
+    """Feed a canonical encoding of ``value`` (data of a spec) into ``digest``."""
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        digest.update(f"nd{value.dtype.str}{value.shape}".encode())
+        digest.update(value.tobytes() if value.dtype != object else repr(value.tolist()).encode())
+    elif isinstance(value, dict):
+        digest.update(b'{')
+        for key, item in value.items():
+            _update(digest, key)
+            _update(digest, item)
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update(digest, item)
+        digest.update(b']')
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def spec_hash(spec):
+    """Key of what a spec would draw: its data, size and drawing code."""
+    digest = hashlib.sha256()
+    _update(digest, [spec.name, spec.draw, list(spec.figsize), inspect.getsource(_resolve(spec.draw))])
+    _update(digest, spec.data)
+    return digest.hexdigest()
+
+
+def _pyplot(backend=None):
+    import matplotlib
+    if backend:
+        matplotlib.use(backend)
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set plotting style
+    plt.style.use('default')
+    sns.set_palette("husl")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['svg.hashsalt'] = 'mc1'  # stable SVG element ids
+    return plt, sns
+
+
+def _draw(spec, plt, sns):
+    plt.figure(figsize=spec.figsize)
+    _resolve(spec.draw)(plt, sns, spec.data)
+    plt.tight_layout()
+
+
+def _render_one(spec, paths):
+    plt, sns = _pyplot('Agg')
+    _draw(spec, plt, sns)
+    for path in paths:
+        # No timestamps, so unchanged charts give identical files
+        metadata = {'.svg': {'Date': None}, '.pdf': {'CreationDate': None}}.get(os.path.splitext(path)[1])
+        plt.savefig(path, metadata=metadata)
+    plt.close('all')
+    return paths
+
+
+def render(specs, out_dir, formats=('png',), workers=None):
+    """Draw ``specs`` to ``<out_dir>/<name>.<format>``; returns ``(drawn, cached)`` file paths.
+
+    ``workers`` processes draw in parallel (default: one per CPU, at most one
+    per figure); ``workers=0`` draws in this process.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    index_path = os.path.join(out_dir, CACHE_INDEX)
+    index = {}
+    if os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+    jobs, cached, keys = [], [], {}
+    for spec in specs:
+        key = spec_hash(spec)
+        paths = []
+        for fmt in formats:
+            path = os.path.join(out_dir, f"{spec.name}.{fmt}")
+            if index.get(os.path.basename(path)) == key and os.path.exists(path):
+                cached.append(path)
+            else:
+                paths.append(path)
+                keys[path] = key
+        if paths:
+            jobs.append((spec, paths))
+
+    drawn = []
+    try:
+        if workers == 0:
+            for spec, paths in jobs:
+                drawn.extend(_render_one(spec, paths))
+        elif jobs:
+            with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(jobs))) as pool:
+                for paths in pool.map(_render_one, *zip(*jobs)):
+                    drawn.extend(paths)
+    finally:
+        # Only files actually drawn take their new key
+        index.update({os.path.basename(path): keys[path] for path in drawn})
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+    return drawn, cached
+
+
+def show(specs):
+    """Draw ``specs`` one window at a time with the default (interactive) backend."""
+    plt, sns = _pyplot()
+    for spec in specs:
+        _draw(spec, plt, sns)
+        plt.show()
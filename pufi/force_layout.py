@@ -0,0 +1,385 @@
+"""Force-directed node positions computed ahead of time for the network pages.
+
+networkGraph.js and influencersNetwork.js ran ``d3.forceSimulation`` on every
+render, so thousands of nodes settled in the browser for seconds before the
+graph was readable.  :func:`force_layout` runs the same kind of
+Fruchterman–Reingold layout (edge springs, all-pairs repulsion, cooling
+temperature, a pull to the centre that keeps components together) over the
+edge arrays, multilevel and with Barnes–Hut repulsion:
+
+- the graph is coarsened by random edge matching (plus leaves folded into
+  their neighbour) until it stops shrinking; the coarsest graph is laid out
+  from random positions and each finer level is refined from its coarse
+  nodes' positions, which untangles what a single level leaves folded;
+- the nodes are binned into a quadtree of ``4**level`` square cells, built
+  level by level with ``np.bincount`` (node count and centre of mass);
+- at every level a node feels each cell that is well separated from its own
+  (not one of the 3 x 3 neighbours) but whose parent is a neighbour of its
+  parent, as one mass at the cell's centre: 27 cells per node and level, so
+  every other cell of the plane is counted exactly once;
+- at the deepest level, nodes in the 3 x 3 neighbouring cells repel pair by
+  pair, the pairs built with the same indptr gather as the CSR queries.
+
+An iteration costs ``O(n log n + m)`` instead of the ``O(n**2)`` of
+``exact=True`` (kept as the reference).  :func:`stress` scores a layout
+against BFS hop distances from a sample of pivot nodes.
+
+:func:`view_layouts` lays out the graph each page draws, under every filter
+preset in :data:`VIEWS`, and :func:`write_layouts` saves them as
+``<out_dir>/payloads/layouts/<view>/<preset>.json``: node ids with ``x`` /
+``y`` in a ``LAYOUT_SIZE`` square.  The pages place every node a layout
+lists and only simulate the rest.
+
+    python eda.py --only layouts --out-dir ..
+"""
+
+import json
+import os
+
+import numpy as np
+
+from csr_graph import _gather
+from dashboard_payloads import INFLUENCE_EDGES, OCEANUS_FOLK, PAYLOAD_DIR, WORK_TYPES
+from edge_table import EDGE_CATEGORIES
+
+DEFAULT_ITERATIONS = 50
+# Pull towards the centre of mass, relative to the edge springs
+GRAVITY = 1.0
+# Nodes sharing a deepest quadtree cell with an average node (sets the depth)
+LEAF_SIZE = 4
+MAX_DEPTH = 10
+# Below this many nodes the exact all-pairs repulsion is as cheap as the tree
+EXACT_MAX_NODES = 1000
+# Multilevel: stop coarsening at this size or once a level keeps more than the ratio of nodes
+COARSEST_NODES = 50
+COARSEN_RATIO = 0.8
+MATCH_ROUNDS = 4
+# Finer levels start close to their layout: shorter steps (in edge lengths), half the iterations
+REFINE_TEMPERATURE = 2.0
+REFINE_SHARE = 0.5
+# Source nodes of the hop distances behind the sampled stress
+DEFAULT_PIVOTS = 64
+
+LAYOUT_DIR = 'layouts'
+LAYOUT_SIZE = 1000
+
+# Node filter presets of each page: view -> preset -> edge types laid out
+VIEWS = {
+    # networkGraph.js: the visible edge-type checkboxes
+    'network': {'all': [t for types in EDGE_CATEGORIES.values() for t in types], **EDGE_CATEGORIES},
+    # influencersNetwork.js: Oceanus Folk works, their influences and the contributors of both
+    'influencers': {'all': list(INFLUENCE_EDGES)},
+}
+CONTRIBUTOR_EDGES = tuple(EDGE_CATEGORIES['professional_roles'])
+
+
+def _undirected(num_nodes, src, dst):
+    """Distinct node pairs of the edges (either direction), self-loops dropped."""
+    src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+    pairs = np.unique(lo[lo != hi] * num_nodes + hi[lo != hi])
+    return pairs // num_nodes, pairs % num_nodes
+
+
+def _exact_repulsion(pos, block=1 << 22):
+    """``sum_j (x_i - x_j) / |x_i - x_j|**2`` over every other node, in row blocks."""
+    n = len(pos)
+    force = np.zeros_like(pos)
+    rows = max(1, block // max(n, 1))
+    for start in range(0, n, rows):
+        delta = pos[start:start + rows, None, :] - pos[None, :, :]
+        dist2 = np.einsum('ijk,ijk->ij', delta, delta)
+        dist2[dist2 == 0] = np.inf
+        force[start:start + rows] = np.einsum('ijk,ij->ik', delta, 1 / dist2)
+    return force
+
+
+def _cells(unit, depth):
+    side = 1 << depth
+    cx, cy = np.minimum(unit * side, side - 1).astype(np.int64).T
+    return cx, cy, side
+
+
+def _depth(unit):
+    """Shallowest quadtree depth whose deepest cells hold about ``LEAF_SIZE`` nodes around a node.
+
+    Layouts are far from uniform (a dense core, a few far-off components), so
+    the depth follows the occupancy rather than the node count.
+    """
+    for depth in range(2, MAX_DEPTH):
+        cx, cy, side = _cells(unit, depth)
+        occupancy = np.bincount(cx * side + cy)
+        if (occupancy * occupancy).sum() <= LEAF_SIZE * len(unit):
+            return depth
+    return MAX_DEPTH
+
+
+def _barnes_hut_repulsion(pos):
+    """:func:`_exact_repulsion` with cells beyond the neighbouring ones taken as one mass."""
+    n = len(pos)
+    lo = pos.min(axis=0)
+    span = max((pos.max(axis=0) - lo).max(), 1e-9) * (1 + 1e-9)
+    unit = (pos - lo) / span
+    depth = _depth(unit)
+    x, y = pos[:, 0], pos[:, 1]
+    force = np.zeros_like(pos)
+
+    # Far field: the 36 children of the parent's 3 x 3 neighbourhood minus the own 3 x 3
+    for level in range(2, depth + 1):
+        cx, cy, side = _cells(unit, level)
+        cells = side * side
+        key = cx * side + cy
+        mass = np.bincount(key, minlength=cells + 1).astype(float)
+        mx = np.bincount(key, x, minlength=cells + 1) / np.maximum(mass, 1)
+        my = np.bincount(key, y, minlength=cells + 1) / np.maximum(mass, 1)
+        px, py = cx >> 1, cy >> 1
+        for a in range(-2, 4):
+            ox = 2 * px + a
+            inside_x = (ox >= 0) & (ox < side)
+            far_x = np.abs(ox - cx) > 1
+            for b in range(-2, 4):
+                oy = 2 * py + b
+                use = inside_x & (oy >= 0) & (oy < side) & (far_x | (np.abs(oy - cy) > 1))
+                other = np.where(use, ox * side + oy, cells)      # slot ``cells`` is empty
+                dx, dy = x - mx[other], y - my[other]
+                weight = mass[other] / np.maximum(dx * dx + dy * dy, 1e-12)
+                force[:, 0] += weight * dx
+                force[:, 1] += weight * dy
+
+    # Near field: node pairs in the same or adjacent deepest cells
+    cx, cy, side = _cells(unit, depth)
+    order = np.argsort(cx * side + cy, kind='stable')
+    indptr = np.zeros(side * side + 2, dtype=np.int64)
+    np.cumsum(np.bincount(cx * side + cy, minlength=side * side + 1), out=indptr[1:])
+    nodes, neighbours = [], []
+    for a in (-1, 0, 1):
+        for b in (-1, 0, 1):
+            ox, oy = cx + a, cy + b
+            use = (ox >= 0) & (ox < side) & (oy >= 0) & (oy < side)
+            cell = np.where(use, ox * side + oy, side * side)
+            counts = indptr[cell + 1] - indptr[cell]
+            nodes.append(np.repeat(np.arange(n), counts))
+            neighbours.append(_gather(indptr, order, cell))
+    i, j = np.concatenate(nodes), np.concatenate(neighbours)
+    i, j = i[i != j], j[i != j]
+    dx, dy = x[i] - x[j], y[i] - y[j]
+    weight = 1 / np.maximum(dx * dx + dy * dy, 1e-12)
+    force[:, 0] += np.bincount(i, weight * dx, minlength=n)
+    force[:, 1] += np.bincount(i, weight * dy, minlength=n)
+    return force
+
+
+def _refine(pos, u, v, iterations, temperature, exact=False):
+    """Fruchterman–Reingold steps from ``pos``, the step length cooling linearly from ``temperature``."""
+    n = len(pos)
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        force = _exact_repulsion(pos) if exact or n <= EXACT_MAX_NODES else _barnes_hut_repulsion(pos)
+        delta = pos[v] - pos[u]
+        spring = delta * np.sqrt(np.einsum('ij,ij->i', delta, delta))[:, None]
+        for axis in (0, 1):
+            force[:, axis] += np.bincount(u, spring[:, axis], minlength=n)
+            force[:, axis] -= np.bincount(v, spring[:, axis], minlength=n)
+        force -= GRAVITY * (pos - pos.mean(axis=0))
+        length = np.sqrt(np.einsum('ij,ij->i', force, force))
+        pos += force * (np.minimum(length, temperature) / np.maximum(length, 1e-12))[:, None]
+        temperature -= cooling
+    return pos
+
+
+def _coarsen(num_nodes, u, v, rng):
+    """Coarse node of every node, and the coarse node count.
+
+    Edges are matched at random (each round every unmatched node proposes
+    to a random unmatched neighbour and mutual proposals are matched), then
+    unmatched leaves join their neighbour, which collapses the stars around
+    hubs that a matching can only shrink one leaf at a time.
+    """
+    mate = np.full(num_nodes, -1, dtype=np.int64)
+    for _ in range(MATCH_ROUNDS):
+        free = (mate[u] < 0) & (mate[v] < 0)
+        if not free.any():
+            break
+        proposer = np.concatenate([u[free], v[free]])
+        partner = np.concatenate([v[free], u[free]])
+        order = np.lexsort((rng.random(len(proposer)), proposer))
+        first = order[np.r_[True, proposer[order][1:] != proposer[order][:-1]]]
+        choice = np.full(num_nodes + 1, num_nodes, dtype=np.int64)
+        choice[proposer[first]] = partner[first]
+        mutual = np.flatnonzero(choice[choice[:num_nodes]] == np.arange(num_nodes))
+        mate[mutual] = choice[mutual]
+
+    nodes = np.arange(num_nodes)
+    group = np.where(mate >= 0, np.minimum(nodes, mate), nodes)
+    degree = np.bincount(u, minlength=num_nodes) + np.bincount(v, minlength=num_nodes)
+    leaf_u = (degree[u] == 1) & (mate[u] < 0)
+    leaf_v = (degree[v] == 1) & (mate[v] < 0) & ~leaf_u
+    group[u[leaf_u]] = group[v[leaf_u]]
+    group[v[leaf_v]] = group[u[leaf_v]]
+    parent = np.unique(group, return_inverse=True)[1]
+    return parent, int(parent.max()) + 1 if num_nodes else 0
+
+
+def force_layout(num_nodes, src, dst, iterations=DEFAULT_ITERATIONS, seed=0, exact=False, multilevel=True,
+                 pos=None):
+    """``(num_nodes, 2)`` positions (ideal edge length 1) of the undirected simple graph of the edges.
+
+    With ``multilevel`` the graph is coarsened by matching until it stops
+    shrinking (or is down to ``COARSEST_NODES``), the coarsest graph is laid
+    out from a seeded random square and every finer level starts from its
+    coarse node's position; otherwise, or when ``pos`` is given, one level
+    is laid out from there.  ``exact=True`` sums the repulsion over every
+    pair instead of the quadtree (always the case up to ``EXACT_MAX_NODES``
+    nodes).
+    """
+    n = int(num_nodes)
+    rng = np.random.default_rng(seed)
+    if n < 2:
+        return rng.random((n, 2)) if pos is None else np.array(pos, dtype=float)
+    u, v = _undirected(n, src, dst)
+    if pos is not None:
+        return _refine(np.array(pos, dtype=float), u, v, iterations, REFINE_TEMPERATURE, exact)
+
+    levels = [(n, u, v, None)]
+    while multilevel and levels[-1][0] > COARSEST_NODES:
+        size, fine_u, fine_v, _ = levels[-1]
+        parent, coarse = _coarsen(size, fine_u, fine_v, rng)
+        if coarse > COARSEN_RATIO * size:
+            break
+        levels.append((coarse, *_undirected(coarse, parent[fine_u], parent[fine_v]), None))
+        levels[-2] = (size, fine_u, fine_v, parent)
+
+    size, u, v, _ = levels[-1]
+    side = np.sqrt(max(size, 1))
+    pos = _refine(rng.random((size, 2)) * side, u, v, iterations, 0.1 * side, exact)
+    for (size, u, v, parent), (coarse, *_) in zip(levels[-2::-1], levels[:0:-1]):
+        # Same density at the finer level: spread by sqrt(size ratio), split matched pairs slightly
+        pos = pos[parent] * np.sqrt(size / coarse) + rng.normal(scale=0.1, size=(size, 2))
+        pos = _refine(pos, u, v, max(int(iterations * REFINE_SHARE), 1), REFINE_TEMPERATURE, exact)
+    return pos
+
+
+# ---------------------------------------------------------------------------
+# Quality
+# ---------------------------------------------------------------------------
+
+def hop_distances(num_nodes, src, dst, sources):
+    """``(len(sources), num_nodes)`` undirected BFS hop counts (``-1`` if unreachable)."""
+    u, v = _undirected(num_nodes, src, dst)
+    ends, starts = np.concatenate([u, v]), np.concatenate([v, u])
+    order = np.argsort(starts, kind='stable')
+    indices = ends[order]
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(starts, minlength=num_nodes), out=indptr[1:])
+
+    dist = np.full((len(sources), num_nodes), -1, dtype=np.int32)
+    for row, source in enumerate(sources):
+        dist[row, source] = 0
+        frontier, depth = np.array([source], dtype=np.int64), 0
+        while len(frontier):
+            reached = _gather(indptr, indices, frontier)
+            frontier = np.unique(reached[dist[row, reached] < 0])
+            depth += 1
+            dist[row, frontier] = depth
+    return dist
+
+
+def stress(pos, src, dst, pivots=DEFAULT_PIVOTS, seed=0):
+    """Normalized stress of ``pos`` against hop distances from ``pivots`` random nodes.
+
+    ``sum w (s * |x_i - x_j| - d_ij)**2 / sum w d_ij**2`` with ``w = d_ij**-2``
+    over connected pivot/node pairs, at the scale ``s`` that minimizes it:
+    0 for a layout whose distances are proportional to the hop counts, around
+    0.3 and above for random positions.
+    """
+    pos = np.asarray(pos, dtype=float)
+    n = len(pos)
+    sources = np.random.default_rng(seed).choice(n, size=min(pivots, n), replace=False)
+    hops = hop_distances(n, src, dst, sources)
+    rows, cols = np.nonzero(hops > 0)
+    d = hops[rows, cols].astype(float)
+    e = np.sqrt(((pos[sources[rows]] - pos[cols]) ** 2).sum(axis=1))
+    w = d ** -2
+    scale = (w * d * e).sum() / max((w * e * e).sum(), 1e-12)
+    return float((w * (scale * e - d) ** 2).sum() / max((w * d * d).sum(), 1e-12))
+
+
+# ---------------------------------------------------------------------------
+# Page views
+# ---------------------------------------------------------------------------
+
+def _edge_mask(graph, types):
+    codes = [graph.edge_types.index(t) for t in types if t in graph.edge_types]
+    return np.isin(np.asarray(graph.edge_type), codes)
+
+
+def _influencers_edges(graph, types):
+    """Influence edges into Oceanus Folk works plus contributor edges onto the works involved."""
+    src = np.asarray(graph.edge_src, dtype=np.int64)
+    dst = np.asarray(graph.edge_dst, dtype=np.int64)
+    node_type = np.asarray(graph.decode('Node Type'), dtype=object)
+    genre = np.asarray(graph.decode('genre'), dtype=object)
+    oceanus = np.isin(node_type, WORK_TYPES) & (genre == OCEANUS_FOLK)
+    influence = _edge_mask(graph, types) & oceanus[dst]
+    works = oceanus.copy()
+    works[src[influence]] = True
+    credits = _edge_mask(graph, CONTRIBUTOR_EDGES) & works[dst] & (node_type[src] != 'RecordLabel')
+    return influence | credits
+
+
+def view_edges(graph, view, preset):
+    """Edge mask of the graph ``view`` draws under ``preset``."""
+    types = VIEWS[view][preset]
+    if view == 'influencers':
+        return _influencers_edges(graph, types)
+    return _edge_mask(graph, types)
+
+
+def view_layouts(graph, views=None, iterations=DEFAULT_ITERATIONS, seed=0):
+    """``{view: {preset: payload}}`` with node ids and positions scaled into ``LAYOUT_SIZE``."""
+    src, dst = np.asarray(graph.edge_src, dtype=np.int64), np.asarray(graph.edge_dst, dtype=np.int64)
+    layouts = {}
+    for view in views or VIEWS:
+        layouts[view] = {}
+        for preset, types in VIEWS[view].items():
+            mask = view_edges(graph, view, preset)
+            nodes, local = np.unique(np.concatenate([src[mask], dst[mask]]), return_inverse=True)
+            local_src, local_dst = local[:mask.sum()], local[mask.sum():]
+            pos = force_layout(len(nodes), local_src, local_dst, iterations, seed)
+            # ``unit``: one edge length of the layout in the units of the saved square
+            unit = 1.0
+            if len(nodes):
+                pos -= pos.min(axis=0)
+                unit = LAYOUT_SIZE / max(pos.max(), 1e-9)
+                pos *= unit
+            layouts[view][preset] = {
+                'view': view,
+                'preset': preset,
+                'edgeTypes': types,
+                'size': LAYOUT_SIZE,
+                'edgeLength': round(float(unit), 2),
+                'stress': round(stress(pos, local_src, local_dst, seed=seed), 4) if len(nodes) > 1 else 0.0,
+                'ids': [graph.node_ids[i] for i in nodes.tolist()],
+                'x': np.rint(pos[:, 0]).astype(int).tolist(),
+                'y': np.rint(pos[:, 1]).astype(int).tolist(),
+            }
+    return layouts
+
+
+def write_layouts(layouts, out_dir='.'):
+    """Write :func:`view_layouts` output as ``<out_dir>/payloads/layouts/<view>/<preset>.json``,
+    plus ``index.json`` (view → preset → edge types) for the pages to pick a preset;
+    returns (view, preset) → path."""
+    root = os.path.join(out_dir, PAYLOAD_DIR, LAYOUT_DIR)
+    paths = {}
+    for view, presets in layouts.items():
+        os.makedirs(os.path.join(root, view), exist_ok=True)
+        for preset, payload in presets.items():
+            paths[view, preset] = os.path.join(root, view, f"{preset}.json")
+            with open(paths[view, preset], 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    index = {view: {preset: payload['edgeTypes'] for preset, payload in presets.items()}
+             for view, presets in layouts.items()}
+    with open(os.path.join(root, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    return paths
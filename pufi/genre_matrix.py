@@ -0,0 +1,108 @@
+"""Genre x genre influence matrix, per edge type and release-year window.
+
+genreMatrix.js rebuilds this in the browser from MC1_graph.json on every
+year-range change.  Here it is one ``np.bincount`` over the creative edges:
+each edge gets a flat key ``(window, edge type, influencer genre, influenced
+genre)`` and the counts reshape into a dense array
+
+    counts[w, t, i, j]  = edges of type t from a genre-j work to a genre-i
+                          work released in window w
+
+The influencer is the edge target and the window comes from its release
+year, as in the page's 'outgoing' mode ('incoming' is the transpose of the
+last two axes).  Windows are ``window`` years wide and aligned to multiples
+of it (decades by default); every edge lands in exactly one window, so any
+number of windows costs the same single pass.  The last window slot holds
+edges whose influencer has no parseable release year, so summing axis 0
+gives the all-years matrix.
+
+:func:`write_matrix` saves the arrays to an ``.npz`` (no pickled objects).
+
+    python eda.py --only genre_matrix
+"""
+
+import numpy as np
+
+from edge_table import EDGE_CATEGORIES
+from node_frame import node_years
+
+DEFAULT_WINDOW = 10
+MATRIX_FILE = 'genre_influence_matrix.npz'
+
+
+def influence_matrix(graph, edge_types=EDGE_CATEGORIES['creative_influences'], window=DEFAULT_WINDOW):
+    """Counts array plus its axis labels (see the module docstring)."""
+    genres = list(graph.categories['genre'])
+    type_names = [t for t in edge_types if t in graph.edge_types]
+    type_slot = np.full(len(graph.edge_types) + 1, -1, dtype=np.int64)
+    type_slot[[graph.edge_types.index(t) for t in type_names]] = np.arange(len(type_names))
+
+    src = np.asarray(graph.edge_src, dtype=np.intp)
+    dst = np.asarray(graph.edge_dst, dtype=np.intp)
+    t = type_slot[np.asarray(graph.edge_type, dtype=np.intp)]
+    genre = np.asarray(graph.columns['genre'], dtype=np.int64)
+    keep = (t >= 0) & (genre[src] >= 0) & (genre[dst] >= 0)
+    src, dst, t = src[keep], dst[keep], t[keep]
+
+    years = node_years(graph, 'release_date')[dst]
+    known = ~np.asarray(years.isna())
+    year = years.to_numpy(dtype=np.int64, na_value=0)
+    if known.any():
+        first = int(year[known].min()) // window
+        num_windows = int(year[known].max()) // window - first + 1
+    else:
+        first, num_windows = 0, 0
+    w = np.where(known, year // window - first, num_windows)
+
+    G, T, W = len(genres), len(type_names), num_windows + 1
+    key = ((w * T + t) * G + genre[dst]) * G + genre[src]
+    counts = np.bincount(key, minlength=W * T * G * G).astype(np.uint32).reshape(W, T, G, G)
+    return {
+        'counts': counts,
+        'genres': genres,
+        'edge_types': type_names,
+        'window_starts': (np.arange(num_windows) + first) * window,
+        'window': window,
+    }
+
+
+def select(matrix, first_year=None, last_year=None, edge_types=None):
+    """Genre x genre counts summed over whole windows inside ``[first_year, last_year]``.
+
+    With both years ``None`` the unknown-year slot is included too.
+    """
+    counts = matrix['counts']
+    if edge_types is not None:
+        counts = counts[:, [matrix['edge_types'].index(t) for t in edge_types]]
+    if first_year is None and last_year is None:
+        return counts.sum(axis=(0, 1), dtype=np.int64)
+    starts = matrix['window_starts']
+    inside = np.ones(len(starts), dtype=bool)
+    if first_year is not None:
+        inside &= starts >= first_year
+    if last_year is not None:
+        inside &= starts + matrix['window'] - 1 <= last_year
+    return counts[:len(starts)][inside].sum(axis=(0, 1), dtype=np.int64)
+
+
+def write_matrix(matrix, path):
+    np.savez_compressed(
+        path,
+        counts=matrix['counts'],
+        genres=np.array(matrix['genres'], dtype=str),
+        edge_types=np.array(matrix['edge_types'], dtype=str),
+        window_starts=matrix['window_starts'],
+        window=np.int64(matrix['window']),
+    )
+    return path
+
+
+def read_matrix(path):
+    with np.load(path) as data:
+        return {
+            'counts': data['counts'],
+            'genres': data['genres'].tolist(),
+            'edge_types': data['edge_types'].tolist(),
+            'window_starts': data['window_starts'],
+            'window': int(data['window']),
+        }
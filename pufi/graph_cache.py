@@ -0,0 +1,189 @@
+"""Persistent on-disk cache of the parsed graph.
+
+The first run streams ``MC1_graph.json`` through :mod:`graph_loader` and
+writes the resulting columns as ``.npy`` files plus one JSON string table
+(node ids, names, category values).  Later runs memory-map the arrays, so a
+warm start costs a few milliseconds instead of a full JSON parse.
+
+Entries live in ``<cache_dir>/<stem>-<sha256[:16]>-v<SCHEMA_VERSION>/``: any
+change to the JSON content or to the cached layout gives a new key and the
+entry is rebuilt automatically.  A small manifest remembers the file's size
+and mtime so the content hash is only recomputed when those change.
+
+    python graph_cache.py MC1_graph.json        # build or validate the cache
+    python graph_cache.py MC1_graph.json --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from graph_loader import NODE_CATEGORICAL, NODE_FLAGS, GraphArrays, load_graph
+
+# Bump whenever the on-disk layout or GraphArrays fields change
+SCHEMA_VERSION = 1
+
+DEFAULT_CACHE_DIR = '.mc1_cache'
+_MANIFEST = 'manifest.json'
+_STRINGS = 'strings.json'
+_EDGE_ARRAYS = ('edge_src', 'edge_dst', 'edge_type')
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_root(path, cache_dir):
+    return cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), DEFAULT_CACHE_DIR)
+
+
+def _content_hash(path, root):
+    """sha256 of ``path``, reusing the manifest entry while size and mtime match."""
+    stat = os.stat(path)
+    manifest_path = os.path.join(root, _MANIFEST)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    key = os.path.abspath(path)
+    entry = manifest.get(key)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry['sha256']
+
+    digest = file_hash(path)
+    manifest[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+    os.makedirs(root, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return digest
+
+
+def cache_entry(path, cache_dir=None):
+    """Directory that holds (or will hold) the cache entry for ``path``."""
+    root = _cache_root(path, cache_dir)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(root, f"{stem}-{_content_hash(path, root)[:16]}-v{SCHEMA_VERSION}")
+
+
+def _node_file(column):
+    return f"node.{column.replace(' ', '_')}.npy"
+
+
+def _int_keys(d):
+    return {int(k): v for k, v in d.items()}
+
+
+def save_arrays(graph, entry):
+    """Write ``graph`` to the directory ``entry`` atomically."""
+    parent = os.path.dirname(entry)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+    try:
+        for column, values in graph.columns.items():
+            np.save(os.path.join(tmp, _node_file(column)), values)
+        for name in _EDGE_ARRAYS:
+            np.save(os.path.join(tmp, f"{name}.npy"), getattr(graph, name))
+        strings = {
+            'schema_version': SCHEMA_VERSION,
+            'node_ids': graph.node_ids,
+            'categories': graph.categories,
+            'text': graph.text,
+            'edge_types': graph.edge_types,
+            'node_extra': graph.node_extra,
+            'edge_extra': graph.edge_extra,
+            'graph_attrs': graph.graph_attrs,
+        }
+        with open(os.path.join(tmp, _STRINGS), 'w', encoding='utf-8') as f:
+            json.dump(strings, f, ensure_ascii=False)
+        if os.path.exists(entry):
+            shutil.rmtree(entry)
+        os.replace(tmp, entry)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def load_arrays(entry, mmap_mode='r'):
+    """Read a cache entry back; numeric columns are memory-mapped."""
+    with open(os.path.join(entry, _STRINGS), 'r', encoding='utf-8') as f:
+        strings = json.load(f)
+    if strings.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(f"Cache entry {entry} has schema {strings.get('schema_version')}, "
+                         f"expected {SCHEMA_VERSION}")
+    columns = {
+        column: np.load(os.path.join(entry, _node_file(column)), mmap_mode=mmap_mode)
+        for column in NODE_CATEGORICAL + NODE_FLAGS
+    }
+    edges = {name: np.load(os.path.join(entry, f"{name}.npy"), mmap_mode=mmap_mode)
+             for name in _EDGE_ARRAYS}
+    node_ids = strings['node_ids']
+    return GraphArrays(
+        node_ids=node_ids,
+        node_index={node_id: i for i, node_id in enumerate(node_ids)},
+        columns=columns,
+        categories=strings['categories'],
+        text=strings['text'],
+        node_extra=_int_keys(strings['node_extra']),
+        edge_extra=_int_keys(strings['edge_extra']),
+        graph_attrs=strings['graph_attrs'],
+        edge_types=strings['edge_types'],
+        **edges,
+    )
+
+
+def _prune(entry):
+    """Remove stale entries for the same source file (other hashes/schemas)."""
+    root, name = os.path.split(entry)
+    stem = name.rsplit('-', 2)[0]
+    for other in os.listdir(root):
+        path = os.path.join(root, other)
+        if other != name and other.rsplit('-', 2)[0] == stem and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_graph_cached(path='MC1_graph.json', cache_dir=None, refresh=False):
+    """Like :func:`graph_loader.load_graph`, but served from the on-disk cache when valid."""
+    entry = cache_entry(path, cache_dir)
+    if not refresh and os.path.isdir(entry):
+        try:
+            return load_arrays(entry)
+        except (OSError, ValueError):
+            pass  # corrupt or incompatible entry: rebuild below
+    graph = load_graph(path)
+    save_arrays(graph, entry)
+    _prune(entry)
+    return load_arrays(entry)
+
+
+def clear_cache(path='MC1_graph.json', cache_dir=None):
+    shutil.rmtree(_cache_root(path, cache_dir), ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or clear the parsed-graph cache.")
+    parser.add_argument('path', nargs='?', default='MC1_graph.json')
+    parser.add_argument('--cache-dir', default=None)
+    parser.add_argument('--refresh', action='store_true', help="rebuild even if the entry is valid")
+    parser.add_argument('--clear', action='store_true', help="delete the whole cache directory")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        clear_cache(args.path, args.cache_dir)
+        print(f"Cleared {_cache_root(args.path, args.cache_dir)}")
+        return
+    graph = load_graph_cached(args.path, args.cache_dir, refresh=args.refresh)
+    print(f"{cache_entry(args.path, args.cache_dir)}: {graph.num_nodes:,} nodes, {graph.num_edges:,} edges")
+
+
+if __name__ == '__main__':
+    main()
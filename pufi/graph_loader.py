@@ -0,0 +1,422 @@
+"""Streaming, low-memory loader for MC1_graph.json.
+
+``json.load`` + ``nx.node_link_graph`` keeps the whole decoded document and a
+full NetworkX graph alive at the same time.  This module walks the ``nodes``
+and ``links`` arrays one element at a time and writes straight into compact
+columns:
+
+- node ids are interned to dense ``int32`` indices (file order, exactly the
+  order ``nx.node_link_graph`` would add them in);
+- categorical attributes (``Node Type``, ``genre``, dates) and ``Edge Type``
+  become integer codes into small value tables;
+- ``notable`` / ``single`` become ``int8`` flags (-1 = missing);
+- anything the schema does not know about is kept in sparse ``*_extra`` dicts
+  so no information is lost.
+
+Usage::
+
+    from graph_loader import load_graph
+    graph = load_graph('MC1_graph.json')
+    G = graph.to_networkx()   # only if NetworkX is really needed
+"""
+
+import json
+from array import array
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Node attributes stored as integer codes into a value table
+NODE_CATEGORICAL = ('Node Type', 'genre', 'release_date', 'notoriety_date', 'written_date')
+# Node attributes stored as int8 flags: -1 missing, 0 False, 1 True
+NODE_FLAGS = ('notable', 'single')
+# Free-text node attributes kept as plain lists (None when missing)
+NODE_TEXT = ('name', 'stage_name')
+
+EDGE_TYPE = 'Edge Type'
+MISSING = -1
+
+_CHUNK_SIZE = 1 << 20
+_CODE_DTYPES = (np.int8, np.int16, np.int32)
+_STREAMED_ARRAYS = ('nodes', 'links')
+
+
+def code_dtype(num_values, dtypes=_CODE_DTYPES):
+    """Smallest signed dtype of ``dtypes`` holding codes ``0..num_values-1`` and MISSING."""
+    for dtype in dtypes:
+        if num_values <= np.iinfo(dtype).max:
+            return dtype
+    raise OverflowError(f"{num_values:,} distinct values do not fit in {np.dtype(dtypes[-1]).name} codes")
+
+
+class _Interner:
+    """Maps hashable values to dense integer codes in first-seen order."""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self._codes = {value: code for code, value in enumerate(self.values)}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.values)
+
+
+@dataclass
+class GraphArrays:
+    """Columnar representation of a node-link multigraph."""
+
+    node_ids: list
+    node_index: dict
+    columns: dict
+    categories: dict
+    text: dict
+    edge_src: np.ndarray
+    edge_dst: np.ndarray
+    edge_type: np.ndarray
+    edge_types: list
+    node_extra: dict = field(default_factory=dict)
+    edge_extra: dict = field(default_factory=dict)
+    graph_attrs: dict = field(default_factory=dict)
+
+    @property
+    def num_nodes(self):
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self):
+        return len(self.edge_src)
+
+    def decode(self, column):
+        """Return a categorical column as a list of values (None when missing)."""
+        values = self.categories[column]
+        return [values[c] if c != MISSING else None for c in self.columns[column].tolist()]
+
+    def node_attrs(self, i):
+        """Attribute dict of node ``i``, as ``G.nodes[node_ids[i]]`` would hold it."""
+        attrs = {}
+        for column in NODE_CATEGORICAL:
+            code = self.columns[column][i]
+            if code != MISSING:
+                attrs[column] = self.categories[column][code]
+        for column in NODE_FLAGS:
+            flag = self.columns[column][i]
+            if flag != MISSING:
+                attrs[column] = bool(flag)
+        for column in NODE_TEXT:
+            value = self.text[column][i]
+            if value is not None:
+                attrs[column] = value
+        attrs.update(self.node_extra.get(i, {}))
+        return attrs
+
+    def edge_attrs(self, e):
+        attrs = {}
+        code = self.edge_type[e]
+        if code != MISSING:
+            attrs[EDGE_TYPE] = self.edge_types[code]
+        attrs.update(self.edge_extra.get(e, {}))
+        return attrs
+
+    def to_networkx(self):
+        """Build the equivalent ``nx.MultiDiGraph`` (one copy, no raw JSON dict)."""
+        import networkx as nx
+
+        # Same defaults as nx.node_link_graph when the flags are absent
+        directed = self.graph_attrs.get('directed', False)
+        if self.graph_attrs.get('multigraph', True):
+            G = nx.MultiDiGraph() if directed else nx.MultiGraph()
+        else:
+            G = nx.DiGraph() if directed else nx.Graph()
+        G.graph.update(self.graph_attrs.get('graph', {}))
+        G.add_nodes_from((self.node_ids[i], self.node_attrs(i)) for i in range(self.num_nodes))
+        ids = self.node_ids
+        G.add_edges_from(
+            (ids[u], ids[v], self.edge_attrs(e))
+            for e, (u, v) in enumerate(zip(self.edge_src.tolist(), self.edge_dst.tolist()))
+        )
+        return G
+
+
+class _GraphBuilder:
+    """Accumulates streamed nodes/links into growable typed columns."""
+
+    def __init__(self):
+        self.node_ids = []
+        self.node_index = {}
+        self.columns = {c: array('i') for c in NODE_CATEGORICAL}
+        self.columns.update({c: array('b') for c in NODE_FLAGS})
+        self.interners = {c: _Interner() for c in NODE_CATEGORICAL}
+        self.text = {c: [] for c in NODE_TEXT}
+        self.node_extra = {}
+        self.edge_src = array('i')
+        self.edge_dst = array('i')
+        self.edge_type = array('i')
+        self.edge_types = _Interner()
+        self.edge_extra = {}
+        self.graph_attrs = {}
+        self.nodes_done = False
+        # Raw endpoint ids of links seen before the nodes array (resolved at the end)
+        self._pending = []
+
+    def _intern_node(self, node_id):
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self.node_index[node_id] = index
+            self.node_ids.append(node_id)
+            for column in NODE_CATEGORICAL:
+                self.columns[column].append(MISSING)
+            for column in NODE_FLAGS:
+                self.columns[column].append(MISSING)
+            for column in NODE_TEXT:
+                self.text[column].append(None)
+        return index
+
+    def add_node(self, node):
+        node = dict(node)
+        index = self._intern_node(node.pop('id'))
+        for column in NODE_CATEGORICAL:
+            if column in node:
+                self.columns[column][index] = self.interners[column].code(node.pop(column))
+        for column in NODE_FLAGS:
+            if isinstance(node.get(column), bool):
+                self.columns[column][index] = int(node.pop(column))
+        for column in NODE_TEXT:
+            if column in node:
+                self.text[column][index] = node.pop(column)
+        if node:
+            self.node_extra.setdefault(index, {}).update(node)
+
+    def add_link(self, link):
+        link = dict(link)
+        source, target = link.pop('source'), link.pop('target')
+        link.pop('key', None)
+        edge = len(self.edge_type)
+        if self.nodes_done:
+            self.edge_src.append(self._intern_node(source))
+            self.edge_dst.append(self._intern_node(target))
+        else:
+            self._pending.append((source, target))
+        edge_type = link.pop(EDGE_TYPE, None)
+        self.edge_type.append(MISSING if edge_type is None else self.edge_types.code(edge_type))
+        if link:
+            self.edge_extra[edge] = link
+
+    def finish(self):
+        for source, target in self._pending:
+            self.edge_src.append(self._intern_node(source))
+            self.edge_dst.append(self._intern_node(target))
+        self._pending = []
+
+        columns = {}
+        for column in NODE_CATEGORICAL:
+            dtype = code_dtype(len(self.interners[column]), (np.int16, np.int32))
+            columns[column] = np.frombuffer(self.columns[column], dtype=np.int32).astype(dtype)
+        for column in NODE_FLAGS:
+            columns[column] = np.frombuffer(self.columns[column], dtype=np.int8).copy()
+        return GraphArrays(
+            node_ids=self.node_ids,
+            node_index=self.node_index,
+            columns=columns,
+            categories={c: self.interners[c].values for c in NODE_CATEGORICAL},
+            text=self.text,
+            edge_src=np.frombuffer(self.edge_src, dtype=np.int32).copy(),
+            edge_dst=np.frombuffer(self.edge_dst, dtype=np.int32).copy(),
+            edge_type=np.frombuffer(self.edge_type, dtype=np.int32).astype(code_dtype(len(self.edge_types))),
+            edge_types=self.edge_types.values,
+            node_extra=self.node_extra,
+            edge_extra=self.edge_extra,
+            graph_attrs=self.graph_attrs,
+        )
+
+
+class _StreamReader:
+    """Incremental top-level scanner for a node-link JSON document."""
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, fp, chunk_size=_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the buffer stays around one chunk in size
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON document')
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f'Expected {char!r} at offset {self.pos}, found {self.buf[self.pos]!r}')
+        self.pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Yield ``(key, value)``; streamed arrays yield one item per element."""
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key in _STREAMED_ARRAYS and self._peek() == '[':
+                self.pos += 1
+                if self._peek() != ']':
+                    while True:
+                        yield key, self._value()
+                        if self._peek() == ']':
+                            break
+                        self._expect(',')
+                self.pos += 1
+                yield key, None
+            else:
+                yield key, self._value()
+            if self._peek() == '}':
+                return
+            self._expect(',')
+
+
+def iter_node_link(path, chunk_size=_CHUNK_SIZE):
+    """Stream ``(section, item)`` pairs from a node-link JSON file.
+
+    ``section`` is ``'nodes'`` or ``'links'`` for array elements (``item`` is
+    ``None`` once the array is exhausted); any other top-level key is yielded
+    with its fully decoded value.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from _StreamReader(f, chunk_size).items()
+
+
+def append_to_graph(graph, nodes=(), links=()):
+    """Append node-link ``nodes`` and ``links`` to ``graph`` in place.
+
+    Follows NetworkX semantics: a node whose id already exists has its
+    attributes updated, and links may introduce new (bare) nodes.  Existing
+    node and edge indices are unchanged.  The Python work is proportional to
+    the appended items; each numpy column is extended by one concatenation.
+    """
+    interners = {c: _Interner(graph.categories[c]) for c in NODE_CATEGORICAL}
+    edge_types = _Interner(graph.edge_types)
+    first_new = graph.num_nodes
+    # Codes of the new rows, and of existing rows whose value changes
+    appended = {c: [] for c in NODE_CATEGORICAL + NODE_FLAGS}
+    updated = {c: {} for c in NODE_CATEGORICAL + NODE_FLAGS}
+
+    def intern(node_id):
+        index = graph.node_index.get(node_id)
+        if index is None:
+            index = len(graph.node_ids)
+            graph.node_index[node_id] = index
+            graph.node_ids.append(node_id)
+            for values in appended.values():
+                values.append(MISSING)
+            for column in NODE_TEXT:
+                graph.text[column].append(None)
+        return index
+
+    def assign(column, index, code):
+        if index >= first_new:
+            appended[column][index - first_new] = code
+        else:
+            updated[column][index] = code
+
+    for node in nodes:
+        node = dict(node)
+        index = intern(node.pop('id'))
+        for column in NODE_CATEGORICAL:
+            if column in node:
+                assign(column, index, interners[column].code(node.pop(column)))
+        for column in NODE_FLAGS:
+            if isinstance(node.get(column), bool):
+                assign(column, index, int(node.pop(column)))
+        for column in NODE_TEXT:
+            if column in node:
+                graph.text[column][index] = node.pop(column)
+        if node:
+            graph.node_extra.setdefault(index, {}).update(node)
+
+    src, dst, types = [], [], []
+    for link in links:
+        link = dict(link)
+        src.append(intern(link.pop('source')))
+        dst.append(intern(link.pop('target')))
+        link.pop('key', None)
+        edge_type = link.pop(EDGE_TYPE, None)
+        types.append(MISSING if edge_type is None else edge_types.code(edge_type))
+        if link:
+            graph.edge_extra[graph.num_edges + len(types) - 1] = link
+
+    for column in NODE_CATEGORICAL + NODE_FLAGS:
+        if column in NODE_FLAGS:
+            dtype = np.int8
+        else:
+            graph.categories[column] = interners[column].values
+            dtype = code_dtype(len(interners[column]), (np.int16, np.int32))
+        values = np.concatenate((graph.columns[column].astype(dtype, copy=False),
+                                 np.array(appended[column], dtype=dtype)))
+        if updated[column]:
+            values[list(updated[column])] = list(updated[column].values())
+        graph.columns[column] = values
+    graph.edge_types = edge_types.values
+    graph.edge_src = np.concatenate((graph.edge_src, np.array(src, dtype=np.int32)))
+    graph.edge_dst = np.concatenate((graph.edge_dst, np.array(dst, dtype=np.int32)))
+    dtype = code_dtype(len(edge_types))
+    graph.edge_type = np.concatenate((graph.edge_type.astype(dtype, copy=False), np.array(types, dtype=dtype)))
+    return graph
+
+
+def load_graph(path='MC1_graph.json', chunk_size=_CHUNK_SIZE):
+    """Stream ``path`` into a :class:`GraphArrays`."""
+    builder = _GraphBuilder()
+    for section, item in iter_node_link(path, chunk_size):
+        if section == 'nodes':
+            if item is None:
+                builder.nodes_done = True
+            else:
+                builder.add_node(item)
+        elif section == 'links':
+            if item is not None:
+                builder.add_link(item)
+        else:
+            builder.graph_attrs[section] = item
+    return builder.finish()
@@ -0,0 +1,827 @@
+"""Incremental updates of the saved EDA artifacts from small graph deltas.
+
+``init`` runs the full pipeline once and stores a state directory next to the
+artifacts: the graph columns (graph_cache layout), live-node / live-edge
+masks, degree arrays, an edge index, weak and strong component labels, the
+values last written to the per-node tables and the running counters.
+``apply`` then folds delta files into that state.  The graph and analysis
+updates take work proportional to the delta and to the components it
+touches:
+
+- the graph columns grow in place (:func:`graph_loader.append_to_graph`);
+- the edge index keeps the live edge ids sorted by (source, target) and by
+  (target, source), so the edges of a node set and the parallel edges of one
+  pair are binary searches; added edges are inserted and removed ones
+  deleted, nothing is re-sorted;
+- node type / edge type counts, degrees and the notable influence tallies
+  are adjusted per added or removed element;
+- weak components carry explicit labels with their sizes: joining two
+  relabels the smaller one, and a removal searches from the endpoints of the
+  removed edges in parallel until at most one search is still growing, so
+  only the pieces that split off are visited;
+- strong components are recomputed only on the affected node set: for added
+  edges, the nodes both reachable from a new edge's target and reaching a new
+  edge's source; for removed edges, the SCC that held both endpoints;
+- cascade metrics are recomputed for the works downstream of a changed
+  creative influence (or whose own row changed), over their ancestors only;
+- the three CSV tables keep every unchanged line as it is and only format
+  the rows of nodes whose values changed; network_metrics.json and
+  edge_analysis.json are rewritten from the counters.
+
+``apply`` as a whole is still O(n) in the graph size, in I/O and in plain
+array passes: every run loads and saves the whole state directory and
+rewrites each CSV file (unchanged lines are copied, not re-formatted), the
+columns and the edge index grow by array copies, and the component row of
+every live node is compared with the one last written.  That comparison is
+needed because node_components.csv holds dense ranks: one component
+appearing or vanishing renumbers every component after it.
+
+Removed nodes and edges are tombstoned, so node indices never move; an id
+that is added again after removal gets a fresh index at the end, matching
+NetworkX node order.  Delta
+files are node-link JSON::
+
+    {
+      "add":    {"nodes": [{"id": ..., "Node Type": ...}], "links": [{"source": ..., "target": ..., "Edge Type": ...}]},
+      "remove": {"nodes": [<id>, ...], "links": [{"source": ..., "target": ..., "Edge Type": ...}]}
+    }
+
+Usage::
+
+    python incremental.py init --graph MC1_graph.json
+    python incremental.py apply delta.json
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import numpy as np
+
+from cascade import CASCADE_FILE, cascade_frame
+from components import COMPONENTS_FILE, component_frame
+from csr_graph import CSRGraph
+from edge_table import EDGE_CATEGORIES, EdgeTable
+from graph_cache import load_arrays, save_arrays
+from graph_loader import EDGE_TYPE, MISSING, append_to_graph
+from node_frame import WORK_TYPES, node_frame, songs_albums
+
+DEFAULT_STATE_DIR = '.mc1_incremental'
+SONGS_ALBUMS_FILE = 'songs_albums_analysis.csv'
+_GRAPH = 'graph'
+# row_*: what the per-node tables held when last written (row_components: wcc, wcc_size, scc, scc_size)
+_ARRAYS = ('node_alive', 'edge_alive', 'in_degree', 'out_degree', 'edge_anchor',
+           'row_node', 'row_work', 'row_components')
+_INDEXES = ('out_index', 'in_index')
+_COMPONENTS = ('wcc', 'scc')
+_COUNTERS = 'counters.json'
+
+
+class _EdgeIndex:
+    """Live edge ids sorted by (node, neighbor), the pair packed into one int64 key.
+
+    The edges of a set of nodes, or between one ordered pair, are found by
+    binary search.  Inserting or deleting edges shifts the arrays once and
+    never re-sorts them.
+    """
+
+    def __init__(self, keys, edges):
+        self.keys = np.asarray(keys, dtype=np.int64)
+        self.edges = np.asarray(edges, dtype=np.int64)
+
+    @classmethod
+    def build(cls, nodes, neighbors, edge_ids):
+        keys = _pack(nodes, neighbors)
+        order = np.lexsort((edge_ids, keys))
+        return cls(keys[order], np.asarray(edge_ids)[order])
+
+    def of_nodes(self, nodes):
+        """Edge ids of every node in ``nodes``."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        lo = np.searchsorted(self.keys, nodes << 32)
+        hi = np.searchsorted(self.keys, (nodes + 1) << 32)
+        return self.edges[_spans(lo, hi)]
+
+    def of_pair(self, node, neighbor):
+        """Edge ids from ``node`` to ``neighbor``, oldest first."""
+        key = _pack(node, neighbor)
+        return self.edges[np.searchsorted(self.keys, key):np.searchsorted(self.keys, key, side='right')]
+
+    def insert(self, nodes, neighbors, edge_ids):
+        """Index new edges; their ids must be larger than every indexed one."""
+        keys = _pack(nodes, neighbors)
+        order = np.argsort(keys, kind='stable')
+        at = np.searchsorted(self.keys, keys[order], side='right')
+        self.keys = np.insert(self.keys, at, keys[order])
+        self.edges = np.insert(self.edges, at, np.asarray(edge_ids)[order])
+
+    def delete(self, nodes, neighbors, edge_ids):
+        keys = _pack(nodes, neighbors)
+        candidates = np.unique(_spans(np.searchsorted(self.keys, keys), np.searchsorted(self.keys, keys, side='right')))
+        positions = candidates[np.isin(self.edges[candidates], edge_ids)]
+        self.keys = np.delete(self.keys, positions)
+        self.edges = np.delete(self.edges, positions)
+
+
+class _Components:
+    """Component label of every node, with the size and smallest node of each label.
+
+    Labels are never reused: new and split-off components take fresh ones,
+    and the label of a component that merged away or was removed keeps size
+    0.  Removed nodes have label -1.
+    """
+
+    _ARRAYS = ('label', 'size', 'first')
+
+    def __init__(self, label, size, first):
+        self.label = np.asarray(label, dtype=np.int64)
+        self.size = np.asarray(size, dtype=np.int64)
+        self.first = np.asarray(first, dtype=np.int64)
+
+    @classmethod
+    def from_labels(cls, labels):
+        """From the dense labels of a full component computation."""
+        _, first, size = np.unique(labels, return_index=True, return_counts=True)
+        return cls(labels, size, first)
+
+    @classmethod
+    def load(cls, state_dir, name):
+        return cls(*(np.load(os.path.join(state_dir, f"{name}_{a}.npy")) for a in cls._ARRAYS))
+
+    def save(self, state_dir, name):
+        for a in self._ARRAYS:
+            np.save(os.path.join(state_dir, f"{name}_{a}.npy"), getattr(self, a))
+
+    @property
+    def count(self):
+        return int(np.count_nonzero(self.size))
+
+    @property
+    def largest(self):
+        return int(self.size.max(initial=0))
+
+    def extend(self, count):
+        """Append ``count`` nodes, each a component of its own."""
+        n, labels = len(self.label), len(self.size)
+        self.label = np.concatenate((self.label, np.arange(labels, labels + count)))
+        self.size = np.concatenate((self.size, np.ones(count, dtype=np.int64)))
+        self.first = np.concatenate((self.first, np.arange(n, n + count)))
+
+    def assign(self, nodes, labels):
+        """Move sorted ``nodes`` to fresh components given by dense local ``labels``."""
+        _, first, size = np.unique(labels, return_index=True, return_counts=True)
+        self.label[nodes] = len(self.size) + labels
+        self.size = np.concatenate((self.size, size))
+        self.first = np.concatenate((self.first, nodes[first]))
+
+    def merge(self, keep, label, members):
+        """Join component ``label``, whose nodes are ``members``, into ``keep``."""
+        self.label[members] = keep
+        self.size[keep] += self.size[label]
+        self.first[keep] = min(self.first[keep], self.first[label])
+        self.size[label] = 0
+
+    def split(self, label, pieces):
+        """Move ``pieces`` (node arrays) of component ``label`` to fresh labels; the rest keeps it."""
+        if not pieces:
+            return
+        nodes = np.concatenate(pieces)
+        labels = np.repeat(np.arange(len(pieces)), [len(p) for p in pieces])
+        order = np.argsort(nodes)
+        self.assign(nodes[order], labels[order])
+        self.size[label] -= len(nodes)
+        if self.label[self.first[label]] != label:
+            self.first[label] = _first_member(self.label, label, self.first[label] + 1)
+
+    def retire(self, nodes):
+        """Drop ``nodes``; each must be alone in its component."""
+        self.size[self.label[nodes]] = 0
+        self.label[nodes] = -1
+
+    def dense(self, nodes):
+        """Labels of ``nodes`` numbered in order of each component's smallest node, and their sizes."""
+        live = np.flatnonzero(self.size)
+        rank = np.empty(len(self.size), dtype=np.int64)
+        rank[live[np.argsort(self.first[live])]] = np.arange(len(live))
+        labels = self.label[nodes]
+        return rank[labels], self.size[labels]
+
+
+class IncrementalState:
+    """Graph plus the maintained aggregates behind the EDA artifacts."""
+
+    def __init__(self, graph, arrays, indexes, components, counters):
+        self.graph = graph
+        for name in _ARRAYS:
+            setattr(self, name, np.array(arrays[name]))
+        self.out_index, self.in_index = indexes
+        self.wcc, self.scc = components
+        self.counters = counters
+        # Nodes whose table rows may have changed, and targets of changed creative edges, since the last write
+        self.changed = set()
+        self.influenced = set()
+        self._seen = np.zeros(0, dtype=bool)
+        self._owner = np.zeros(0, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Construction and persistence
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_graph(cls, graph):
+        """Full computation, done once by ``init``."""
+        n, m = graph.num_nodes, graph.num_edges
+        csr = CSRGraph.from_arrays(graph)
+        wcc_labels, _ = csr.weakly_connected_components()
+        scc_labels, _ = csr.strongly_connected_components()
+        edge_ids = np.arange(m)
+        # The edge that opened each (u, v) adjacency entry: NetworkX iterates G[u] in that order
+        _, first, inverse = np.unique(_pack(graph.edge_src, graph.edge_dst), return_index=True, return_inverse=True)
+
+        edges = EdgeTable.from_arrays(graph)
+        counters = {
+            'node_count': n,
+            'edge_count': m,
+            'node_type_counts': dict(Counter(_node_type(graph, i) for i in range(n))),
+            'edge_type_counts': edges.type_counts(),
+            'tallies': dict.fromkeys(_TALLIES, 0),
+            'total_creative_influences': 0,
+        }
+        state = cls(graph, {
+            'node_alive': np.ones(n, dtype=bool),
+            'edge_alive': np.ones(m, dtype=bool),
+            'in_degree': csr.in_degree(),
+            'out_degree': csr.out_degree(),
+            'edge_anchor': first[inverse],
+            'row_node': np.zeros(n, dtype=bool),
+            'row_work': np.zeros(n, dtype=bool),
+            'row_components': np.full((n, 4), -1, dtype=np.int64),
+        }, (_EdgeIndex.build(graph.edge_src, graph.edge_dst, edge_ids),
+            _EdgeIndex.build(graph.edge_dst, graph.edge_src, edge_ids)),
+            (_Components.from_labels(wcc_labels), _Components.from_labels(scc_labels)), counters)
+        for e in np.flatnonzero(state._creative_mask()):
+            state._tally(e, +1)
+        return state
+
+    @classmethod
+    def load(cls, state_dir):
+        # Read into memory: save() rewrites these files
+        graph = load_arrays(os.path.join(state_dir, _GRAPH), mmap_mode=None)
+        arrays = {name: np.load(os.path.join(state_dir, f"{name}.npy")) for name in _ARRAYS}
+        # Removed ids stay in node_ids as tombstones but must not resolve any more
+        graph.node_index = {graph.node_ids[i]: i for i in np.flatnonzero(arrays['node_alive'])}
+        indexes = [_EdgeIndex(np.load(os.path.join(state_dir, f"{name}_keys.npy")),
+                              np.load(os.path.join(state_dir, f"{name}_edges.npy"))) for name in _INDEXES]
+        components = [_Components.load(state_dir, name) for name in _COMPONENTS]
+        with open(os.path.join(state_dir, _COUNTERS), 'r', encoding='utf-8') as f:
+            counters = json.load(f)
+        return cls(graph, arrays, indexes, components, counters)
+
+    def save(self, state_dir):
+        os.makedirs(state_dir, exist_ok=True)
+        save_arrays(self.graph, os.path.join(state_dir, _GRAPH))
+        for name in _ARRAYS:
+            np.save(os.path.join(state_dir, f"{name}.npy"), getattr(self, name))
+        for name in _INDEXES:
+            index = getattr(self, name)
+            np.save(os.path.join(state_dir, f"{name}_keys.npy"), index.keys)
+            np.save(os.path.join(state_dir, f"{name}_edges.npy"), index.edges)
+        for name in _COMPONENTS:
+            getattr(self, name).save(state_dir, name)
+        with open(os.path.join(state_dir, _COUNTERS), 'w', encoding='utf-8') as f:
+            json.dump(self.counters, f, indent=2)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _creative_codes(self):
+        return [self.graph.edge_types.index(t) for t in EDGE_CATEGORIES['creative_influences']
+                if t in self.graph.edge_types]
+
+    def _creative_mask(self, edge_ids=None):
+        types = self.graph.edge_type if edge_ids is None else self.graph.edge_type[edge_ids]
+        alive = self.edge_alive if edge_ids is None else self.edge_alive[edge_ids]
+        return np.isin(types, self._creative_codes()) & alive
+
+    def _is_work(self, nodes):
+        codes = [c for c, t in enumerate(self.graph.categories['Node Type']) if t in WORK_TYPES]
+        return np.isin(self.graph.columns['Node Type'][nodes], codes)
+
+    def _work_flag(self, node):
+        """'notable' / 'non_notable' for songs and albums, None for everything else."""
+        if _node_type(self.graph, node) not in WORK_TYPES:
+            return None
+        return 'notable' if self.graph.columns['notable'][node] == 1 else 'non_notable'
+
+    def _tally(self, e, sign):
+        tallies = self.counters['tallies']
+        received = self._work_flag(int(self.graph.edge_dst[e]))
+        given = self._work_flag(int(self.graph.edge_src[e]))
+        if received:
+            tallies[f'{received}_influences_received'] += sign
+        if given:
+            tallies[f'{given}_influences_given'] += sign
+        self.counters['total_creative_influences'] += sign
+
+    def _count(self, key, name, sign):
+        counts = self.counters[key]
+        counts[name] = counts.get(name, 0) + sign
+        if counts[name] == 0:
+            del counts[name]
+
+    def _successors(self, nodes, codes=None):
+        edges = self.out_index.of_nodes(nodes)
+        if codes is not None:
+            edges = edges[np.isin(self.graph.edge_type[edges], codes)]
+        return self.graph.edge_dst[edges]
+
+    def _predecessors(self, nodes, codes=None):
+        edges = self.in_index.of_nodes(nodes)
+        if codes is not None:
+            edges = edges[np.isin(self.graph.edge_type[edges], codes)]
+        return self.graph.edge_src[edges]
+
+    def _neighbors(self, nodes):
+        return np.concatenate((self._successors(nodes), self._predecessors(nodes)))
+
+    def _reach(self, seeds, step, within=None):
+        """Sorted nodes reachable from ``seeds`` (included) through ``step(frontier)``.
+
+        With ``within``, only neighbors for which ``within(nodes)`` holds are entered.
+        """
+        if len(self._seen) < self.graph.num_nodes:
+            self._seen = np.zeros(self.graph.num_nodes, dtype=bool)
+        seen = self._seen
+        frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+        visited = []
+        while len(frontier):
+            seen[frontier] = True
+            visited.append(frontier)
+            neighbors = step(frontier)
+            neighbors = np.unique(neighbors[~seen[neighbors]])
+            frontier = neighbors[within(neighbors)] if within is not None else neighbors
+        nodes = np.concatenate(visited) if visited else np.zeros(0, dtype=np.int64)
+        seen[nodes] = False
+        return np.sort(nodes)
+
+    def _induced(self, nodes):
+        """CSR graph of the live edges between sorted ``nodes``, renumbered 0..len(nodes)-1."""
+        edges = self.out_index.of_nodes(nodes)
+        dst = self.graph.edge_dst[edges]
+        local = np.searchsorted(nodes, dst)
+        inside = nodes[np.minimum(local, len(nodes) - 1)] == dst
+        src = np.searchsorted(nodes, self.graph.edge_src[edges[inside]])
+        return CSRGraph(len(nodes), src, local[inside])
+
+    def _relabel_scc(self, nodes):
+        """Recompute strong components on sorted ``nodes``, a union of whole SCCs."""
+        if len(nodes) == 0:
+            return
+        self.scc.size[np.unique(self.scc.label[nodes])] = 0
+        labels, _ = self._induced(nodes).strongly_connected_components()
+        self.scc.assign(nodes, labels)
+
+    def _split_wcc(self, label, seeds):
+        """Give fresh labels to the pieces weak component ``label`` fell into around ``seeds``.
+
+        One search per seed advances level by level; searches that meet are
+        merged, and the rounds stop once at most one search is still growing.
+        A finished search has visited a whole piece; the piece still growing,
+        usually the big one, is never fully visited and keeps ``label``.
+        """
+        if len(seeds) < 2:
+            return
+        if len(self._owner) < self.graph.num_nodes:
+            self._owner = np.full(self.graph.num_nodes, -1, dtype=np.int64)
+        owner = self._owner
+        parent = list(range(len(seeds)))
+
+        def find(s):
+            while parent[s] != s:
+                parent[s] = parent[parent[s]]
+                s = parent[s]
+            return s
+
+        owner[seeds] = np.arange(len(seeds))
+        members = {s: [seeds[s:s + 1]] for s in range(len(seeds))}
+        frontiers = {s: seeds[s:s + 1] for s in range(len(seeds))}
+        finished = []
+        while len(frontiers) > 1:
+            for s in list(frontiers):
+                if s not in frontiers:
+                    continue
+                neighbors = np.unique(self._neighbors(frontiers.pop(s)))
+                owners = owner[neighbors]
+                frontier = neighbors[owners < 0]
+                owner[frontier] = s
+                members[s].append(frontier)
+                for other in {find(o) for o in np.unique(owners[owners >= 0]).tolist()} - {s}:
+                    parent[other] = s
+                    members[s].extend(members.pop(other))
+                    frontier = np.concatenate((frontier, frontiers.pop(other, frontier[:0])))
+                if len(frontier):
+                    frontiers[s] = frontier
+                else:
+                    finished.append(s)
+        pieces = [np.concatenate(members[s]) for s in finished]
+        for piece in members.values():
+            owner[np.concatenate(piece)] = -1
+        if not frontiers:
+            # Every piece was visited: the largest one keeps the label
+            pieces.pop(max(range(len(pieces)), key=lambda k: len(pieces[k])))
+        self.wcc.split(label, pieces)
+
+    # ------------------------------------------------------------------
+    # Delta application
+    # ------------------------------------------------------------------
+    def apply(self, delta):
+        """Fold a delta dict into the state; the tables are updated by :meth:`write_artifacts`."""
+        add = delta.get('add', {})
+        remove = delta.get('remove', {})
+        self._remove_links(remove.get('links', []))
+        self._remove_nodes(remove.get('nodes', []))
+        self._add(add.get('nodes', []), add.get('links', []))
+
+    def _add(self, nodes, links):
+        if not nodes and not links:
+            return
+        graph = self.graph
+        old_n, old_e = graph.num_nodes, graph.num_edges
+        touched = list(dict.fromkeys(graph.node_index[node['id']] for node in nodes
+                                     if node['id'] in graph.node_index))
+
+        # Existing nodes whose attributes change: retract their old contributions first
+        incident = np.unique(np.concatenate((self.out_index.of_nodes(touched), self.in_index.of_nodes(touched))))
+        incident = incident[self._creative_mask(incident)]
+        for i in touched:
+            self._count('node_type_counts', _node_type(graph, i), -1)
+        for e in incident:
+            self._tally(e, -1)
+
+        append_to_graph(graph, nodes, links)
+        new_n, new_e = graph.num_nodes, graph.num_edges
+        grow = new_n - old_n
+        self.node_alive = np.concatenate((self.node_alive, np.ones(grow, dtype=bool)))
+        self.in_degree = np.concatenate((self.in_degree, np.zeros(grow, dtype=self.in_degree.dtype)))
+        self.out_degree = np.concatenate((self.out_degree, np.zeros(grow, dtype=self.out_degree.dtype)))
+        self.row_node = np.concatenate((self.row_node, np.zeros(grow, dtype=bool)))
+        self.row_work = np.concatenate((self.row_work, np.zeros(grow, dtype=bool)))
+        self.row_components = np.concatenate((self.row_components, np.full((grow, 4), -1, dtype=np.int64)))
+        self.wcc.extend(grow)
+        self.scc.extend(grow)
+        self.counters['node_count'] += grow
+        self.counters['edge_count'] += new_e - old_e
+
+        for i in touched:
+            self._count('node_type_counts', _node_type(graph, i), +1)
+        for i in range(old_n, new_n):
+            self._count('node_type_counts', _node_type(graph, i), +1)
+        for e in incident:
+            self._tally(e, +1)
+        self.changed.update(touched)
+        self.changed.update(range(old_n, new_n))
+        if new_e == old_e:
+            return
+
+        new_edges = np.arange(old_e, new_e)
+        src, dst = graph.edge_src[new_edges], graph.edge_dst[new_edges]
+        # A new edge joins the adjacency entry of a live parallel edge, else opens one
+        keys = _pack(src, dst)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        lo = np.searchsorted(self.out_index.keys, keys[first])
+        found = np.searchsorted(self.out_index.keys, keys[first], side='right') > lo
+        anchor = new_edges[first]
+        anchor[found] = self.edge_anchor[self.out_index.edges[lo[found]]]
+        self.edge_alive = np.concatenate((self.edge_alive, np.ones(len(new_edges), dtype=bool)))
+        self.edge_anchor = np.concatenate((self.edge_anchor, anchor[inverse]))
+        self.out_index.insert(src, dst, new_edges)
+        self.in_index.insert(dst, src, new_edges)
+
+        np.add.at(self.out_degree, src, 1)
+        np.add.at(self.in_degree, dst, 1)
+        names = graph.edge_types + ['Unknown']
+        for e in new_edges:
+            self._count('edge_type_counts', names[graph.edge_type[e]], +1)
+        creative = new_edges[self._creative_mask(new_edges)]
+        for e in creative:
+            self._tally(e, +1)
+        self.influenced.update(graph.edge_dst[creative].tolist())
+
+        # Weak components: join the labels each new edge connects, relabelling all but the largest
+        parent = {}
+
+        def find(x):
+            while parent.setdefault(x, x) != x:
+                x = parent[x]
+            return x
+
+        for a, b in zip(self.wcc.label[src].tolist(), self.wcc.label[dst].tolist()):
+            parent[find(a)] = find(b)
+        groups = {}
+        for label in parent:
+            groups.setdefault(find(label), []).append(label)
+        for labels in groups.values():
+            keep = max(labels, key=lambda label: self.wcc.size[label])
+            for label in labels:
+                if label != keep:
+                    members = self._reach([self.wcc.first[label]], self._neighbors,
+                                          lambda nodes, label=label: self.wcc.label[nodes] == label)
+                    self.wcc.merge(keep, label, members)
+
+        # New cycles can only run through nodes reachable from a new target that reach a new source
+        cross = self.scc.label[src] != self.scc.label[dst]
+        if cross.any():
+            forward = self._reach(dst[cross], self._successors)
+            backward = self._reach(src[cross], self._predecessors)
+            self._relabel_scc(np.intersect1d(forward, backward, assume_unique=True))
+
+    def _remove_links(self, links):
+        graph = self.graph
+        removed = []
+        for link in links:
+            u, v = graph.node_index.get(link['source']), graph.node_index.get(link['target'])
+            if u is None or v is None:
+                continue
+            matches = self.out_index.of_pair(u, v)
+            if EDGE_TYPE in link:
+                # An explicit null matches the links that have no Edge Type
+                if link[EDGE_TYPE] is None:
+                    code = MISSING
+                elif link[EDGE_TYPE] in graph.edge_types:
+                    code = graph.edge_types.index(link[EDGE_TYPE])
+                else:
+                    continue
+                matches = matches[graph.edge_type[matches] == code]
+            # Like MultiDiGraph.remove_edge: drop the most recently added match
+            matches = matches[~np.isin(matches, removed)]
+            if len(matches):
+                removed.append(int(matches[-1]))
+        self._drop_edges(np.array(removed, dtype=np.int64))
+
+    def _remove_nodes(self, node_ids):
+        graph = self.graph
+        nodes = [graph.node_index[n] for n in dict.fromkeys(node_ids) if n in graph.node_index]
+        if not nodes:
+            return
+        nodes = np.array(nodes, dtype=np.int64)
+        self._drop_edges(np.unique(np.concatenate((self.out_index.of_nodes(nodes), self.in_index.of_nodes(nodes)))))
+
+        # Each removed node is now an isolated singleton: drop it from its components
+        for i in nodes:
+            self._count('node_type_counts', _node_type(graph, int(i)), -1)
+        self.node_alive[nodes] = False
+        self.wcc.retire(nodes)
+        self.scc.retire(nodes)
+        self.counters['node_count'] -= len(nodes)
+        # Re-adding a removed id later creates a fresh node at the end, as in NetworkX
+        for i in nodes:
+            del graph.node_index[graph.node_ids[i]]
+        self.changed.update(nodes.tolist())
+
+    def _drop_edges(self, edge_ids):
+        if len(edge_ids) == 0:
+            return
+        graph = self.graph
+        creative = edge_ids[self._creative_mask(edge_ids)]
+        for e in creative:
+            self._tally(e, -1)
+        self.influenced.update(graph.edge_dst[creative].tolist())
+        names = graph.edge_types + ['Unknown']
+        for e in edge_ids:
+            self._count('edge_type_counts', names[graph.edge_type[e]], -1)
+        src, dst = graph.edge_src[edge_ids], graph.edge_dst[edge_ids]
+        np.subtract.at(self.out_degree, src, 1)
+        np.subtract.at(self.in_degree, dst, 1)
+
+        # An SCC can only split if a removed edge ran inside it; collect its members while the edge is indexed
+        inner = (self.scc.label[src] == self.scc.label[dst]) & (src != dst)
+        members = np.zeros(0, dtype=np.int64)
+        if inner.any():
+            labels = np.unique(self.scc.label[src[inner]])
+            members = self._reach(src[inner], self._successors, lambda nodes: np.isin(self.scc.label[nodes], labels))
+
+        self.edge_alive[edge_ids] = False
+        self.counters['edge_count'] -= len(edge_ids)
+        self.out_index.delete(src, dst, edge_ids)
+        self.in_index.delete(dst, src, edge_ids)
+
+        seeds = np.unique(np.concatenate((src, dst)))
+        seed_labels = self.wcc.label[seeds]
+        for label in np.unique(seed_labels):
+            self._split_wcc(label, seeds[seed_labels == label])
+        self._relabel_scc(members)
+
+    # ------------------------------------------------------------------
+    # Artifacts
+    # ------------------------------------------------------------------
+    def network_metrics(self):
+        n = self.counters['node_count']
+        m = self.counters['edge_count']
+        return {
+            'node_count': n,
+            'edge_count': m,
+            'density': m / (n * (n - 1)) if m and n > 1 else 0,
+            'weakly_connected_components': self.wcc.count,
+            'strongly_connected_components': self.scc.count,
+            'largest_wcc_size': self.wcc.largest,
+            'largest_scc_size': self.scc.largest,
+        }
+
+    def edge_type_counts(self):
+        """Live edge type counts, keyed in first-seen order of NetworkX edge iteration.
+
+        NetworkX visits edges by source node, then by the order each (u, v)
+        adjacency entry was opened, then by key; only the leading nodes are
+        scanned, until every live type has been seen.
+        """
+        counts = self.counters['edge_type_counts']
+        names = self.graph.edge_types + ['Unknown']
+        ordered = {}
+        start, block = 0, 1024
+        while len(ordered) < len(counts) and start < self.graph.num_nodes:
+            edges = self.out_index.of_nodes(np.arange(start, min(start + block, self.graph.num_nodes)))
+            edges = edges[np.lexsort((edges, self.edge_anchor[edges], self.graph.edge_src[edges]))]
+            types = self.graph.edge_type[edges]
+            _, first = np.unique(types, return_index=True)
+            for code in types[np.sort(first)].tolist():
+                ordered.setdefault(names[code], counts[names[code]])
+            start, block = start + block, block * 2
+        return ordered
+
+    def edge_analysis(self):
+        return {
+            'edge_type_counts': self.edge_type_counts(),
+            'creative_influences': EDGE_CATEGORIES['creative_influences'],
+            'professional_roles': EDGE_CATEGORIES['professional_roles'],
+            'business_relationships': EDGE_CATEGORIES['business_relationships'],
+            'total_creative_influences': self.counters['total_creative_influences'],
+        }
+
+    def _live_creative(self):
+        """Collapsed creative subgraph of the whole live graph."""
+        alive = np.flatnonzero(self.edge_alive)
+        csr = CSRGraph(self.graph.num_nodes, self.graph.edge_src[alive], self.graph.edge_dst[alive])
+        return csr.edge_subgraph(self._creative_mask(alive))
+
+    def _cascade_rows(self, rows):
+        """cascade_frame of the works ``rows``, computed over their creative ancestors only."""
+        codes = self._creative_codes()
+        ancestors = self._reach(rows, lambda nodes: self._predecessors(nodes, codes))
+        edges = self.in_index.of_nodes(ancestors)
+        edges = edges[np.isin(self.graph.edge_type[edges], codes)]
+        csr = CSRGraph(len(ancestors), np.searchsorted(ancestors, self.graph.edge_src[edges]),
+                       np.searchsorted(ancestors, self.graph.edge_dst[edges]))
+        creative = csr.edge_subgraph(np.ones(len(edges), dtype=bool))
+        return cascade_frame(self.graph, creative, np.searchsorted(ancestors, rows), nodes=ancestors)
+
+    def write_artifacts(self, out_dir, full=False):
+        """Write the artifacts; unless ``full``, only rows of changed nodes are formatted."""
+        os.makedirs(out_dir, exist_ok=True)
+        graph = self.graph
+        changed = np.array(sorted(self.changed), dtype=np.int64)
+        works = self.row_work.copy()
+        if full:
+            works = self.node_alive & self._is_work(np.arange(graph.num_nodes))
+        else:
+            works[changed] = self.node_alive[changed] & self._is_work(changed)
+
+        _write_table(os.path.join(out_dir, SONGS_ALBUMS_FILE), full, self.row_work, works, changed,
+                     lambda rows: songs_albums(node_frame(graph, rows)),
+                     lambda: songs_albums(node_frame(graph, np.flatnonzero(self.node_alive))))
+
+        # A work's cascade depends only on its ancestors: redo the works downstream of a changed creative edge
+        codes = self._creative_codes()
+        influenced = [i for i in self.influenced if self.node_alive[i]]
+        downstream = self._reach(influenced, lambda nodes: self._successors(nodes, codes))
+        _write_table(os.path.join(out_dir, CASCADE_FILE), full, self.row_work, works,
+                     np.union1d(changed, downstream), self._cascade_rows,
+                     lambda: cascade_frame(graph, self._live_creative(), np.flatnonzero(works)))
+        self.row_work = works
+
+        with open(os.path.join(out_dir, 'network_metrics.json'), 'w') as f:
+            json.dump(self.network_metrics(), f, indent=2)
+
+        # Dense labels shift when a component appears or vanishes before others: compare every live row
+        live = np.flatnonzero(self.node_alive)
+        components = np.full((graph.num_nodes, 4), -1, dtype=np.int64)
+        components[live] = np.column_stack(self.wcc.dense(live) + self.scc.dense(live))
+        redo = np.flatnonzero((components != self.row_components).any(axis=1))
+
+        def frame(rows):
+            values = components[rows]
+            return component_frame([graph.node_ids[i] for i in rows], wcc_labels=values[:, 0], scc_labels=values[:, 2],
+                                   wcc_sizes=values[:, 1], scc_sizes=values[:, 3])
+
+        _write_table(os.path.join(out_dir, COMPONENTS_FILE), full, self.row_node, self.node_alive, redo,
+                     frame, lambda: frame(live))
+        self.row_node = self.node_alive.copy()
+        self.row_components = components
+
+        with open(os.path.join(out_dir, 'edge_analysis.json'), 'w') as f:
+            json.dump(self.edge_analysis(), f, indent=2)
+        self.changed.clear()
+        self.influenced.clear()
+
+
+_TALLIES = ('notable_influences_received', 'notable_influences_given',
+            'non_notable_influences_received', 'non_notable_influences_given')
+
+
+def _node_type(graph, i):
+    code = graph.columns['Node Type'][i]
+    return graph.categories['Node Type'][code] if code != MISSING else 'Unknown'
+
+
+def _pack(nodes, neighbors):
+    """Sortable int64 key of each (node, neighbor) pair."""
+    return (np.asarray(nodes, dtype=np.int64) << 32) | np.asarray(neighbors, dtype=np.int64)
+
+
+def _spans(lo, hi):
+    """Concatenated index ranges ``lo[i]:hi[i]``."""
+    lengths = hi - lo
+    starts = np.repeat(lo - np.cumsum(lengths) + lengths, lengths)
+    return starts + np.arange(lengths.sum())
+
+
+def _first_member(labels, label, start):
+    """Smallest node at or after ``start`` with ``label``, scanning in growing blocks."""
+    block = 1024
+    while start < len(labels):
+        hits = np.flatnonzero(labels[start:start + block] == label)
+        if len(hits):
+            return start + int(hits[0])
+        start, block = start + block, block * 2
+    return -1
+
+
+def _write_table(path, full, had_row, has_row, redo, frame_rows, frame_all):
+    """Write one per-node table, patching the saved file unless ``full`` or it cannot be patched."""
+    if full or not _patch_csv(path, had_row, has_row, redo, frame_rows):
+        frame_all().to_csv(path, index=False)
+
+
+def _patch_csv(path, had_row, has_row, redo, frame_rows):
+    """Rewrite the table at ``path`` to one row per node of ``has_row``, in node order.
+
+    The file holds one line per node of ``had_row``.  Nodes new to the table
+    or listed in ``redo`` get their row from ``frame_rows(nodes)``; every other
+    line is copied unchanged.  Returns False, writing nothing, when the file
+    is missing or does not line up with ``had_row``.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            header, _, body = f.read().partition(os.linesep)
+    except FileNotFoundError:
+        return False
+    lines = body.split(os.linesep)
+    old_rows = np.flatnonzero(had_row)
+    if lines.pop() != '' or len(lines) != len(old_rows):
+        return False
+    new_rows = np.flatnonzero(has_row)
+    fresh = ~had_row
+    fresh[redo] = True
+    fresh = fresh[new_rows]
+    rows = new_rows[fresh]
+    formatted = frame_rows(rows).to_csv(index=False, header=False).split(os.linesep)[:-1] if len(rows) else []
+    if len(formatted) != len(rows):
+        return False
+    out = np.empty(len(new_rows), dtype=object)
+    out[~fresh] = np.array(lines, dtype=object)[np.searchsorted(old_rows, new_rows[~fresh])]
+    out[fresh] = formatted
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(header + os.linesep + ''.join(line + os.linesep for line in out))
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incrementally update the EDA artifacts from graph deltas.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    init = sub.add_parser('init', help="full computation; writes artifacts and the incremental state")
+    init.add_argument('--graph', default='MC1_graph.json')
+    apply = sub.add_parser('apply', help="apply one or more delta files")
+    apply.add_argument('deltas', nargs='+')
+    for p in (init, apply):
+        p.add_argument('--state-dir', default=DEFAULT_STATE_DIR)
+        p.add_argument('--out-dir', default='.')
+    args = parser.parse_args(argv)
+
+    if args.command == 'init':
+        from graph_cache import load_graph_cached
+
+        state = IncrementalState.from_graph(load_graph_cached(args.graph))
+        state.write_artifacts(args.out_dir, full=True)
+    else:
+        state = IncrementalState.load(args.state_dir)
+        for path in args.deltas:
+            with open(path, 'r', encoding='utf-8') as f:
+                state.apply(json.load(f))
+        state.write_artifacts(args.out_dir)
+    state.save(args.state_dir)
+    metrics = state.network_metrics()
+    print(f"{metrics['node_count']:,} nodes, {metrics['edge_count']:,} edges, "
+          f"{metrics['weakly_connected_components']} weak / {metrics['strongly_connected_components']} strong components")
+
+
+if __name__ == '__main__':
+    main()
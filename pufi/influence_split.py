@@ -0,0 +1,60 @@
+"""Influence tallies for any split of the nodes into groups.
+
+Section 5 of ``eda.py`` compares notable with non-notable works, but the same
+counts are useful for any node attribute (genre, node type, release decade,
+an ego network...).  A split is an integer code per node: ``0..k-1`` for the
+group the node belongs to and ``-1`` for nodes outside every group (e.g. the
+people and labels when comparing works).
+
+:func:`split_tallies` counts, for every (group, edge type), the edges whose
+target (``received``) or source (``given``) lies in the group with one
+``np.bincount`` per direction over ``group * num_types + type``; tallies of
+edge chunks can simply be added up.  :func:`split_values` groups a per-node
+array (degrees, scores) the same way.
+
+    groups = split_codes(notable_mask, non_notable_mask)      # 0 notable, 1 non-notable
+    tallies = split_tallies(groups, 2, src, dst, edge_type, len(type_names))
+    tallies['received'].sum(axis=1)                           # influences received per group
+
+    groups = graph.columns['genre']                           # any code column (-1 = missing)
+"""
+
+import numpy as np
+
+
+def split_codes(*masks):
+    """Group code per node from boolean masks: the first mask holding the node, ``-1`` for none."""
+    codes = np.full(len(masks[0]), -1, dtype=np.int64)
+    for group in reversed(range(len(masks))):
+        codes[np.asarray(masks[group], dtype=bool)] = group
+    return codes
+
+
+def split_tallies(groups, num_groups, src, dst, edge_type, num_types):
+    """``{'received': ..., 'given': ...}``: ``(num_groups, num_types)`` edge counts.
+
+    ``received[g, t]`` counts edges of type ``t`` whose target is in group
+    ``g`` and ``given[g, t]`` those whose source is.  ``edge_type`` holds
+    codes in ``0..num_types-1``.
+    """
+    groups = np.asarray(groups)
+    edge_type = np.asarray(edge_type, dtype=np.int64)
+    size = num_groups * num_types
+
+    def tally(endpoints):
+        group = groups[endpoints]
+        inside = group >= 0
+        slots = group[inside].astype(np.int64) * num_types + edge_type[inside]
+        return np.bincount(slots, minlength=size).reshape(num_groups, num_types)
+
+    return {'received': tally(dst), 'given': tally(src)}
+
+
+def split_values(values, groups, num_groups, mask=None):
+    """``values`` of the nodes in each group (optionally only where ``mask``), in node order."""
+    groups = np.asarray(groups)
+    if mask is not None:
+        groups = np.where(mask, groups, -1)
+    order = np.argsort(groups, kind='stable')
+    bounds = np.searchsorted(groups[order], np.arange(num_groups + 1))
+    return [np.asarray(values)[order[bounds[g]:bounds[g + 1]]] for g in range(num_groups)]
@@ -0,0 +1,82 @@
+"""Typed node table built straight from the loader's columns.
+
+``node_frame(graph)`` wraps the :class:`graph_loader.GraphArrays` codes
+without walking nodes one by one:
+
+- ``type``, ``genre`` and the three raw date columns are ``Categorical``
+  over the loader's code arrays (missing values → NaN);
+- ``notable`` / ``single`` are nullable ``boolean`` from the int8 flags;
+- ``release_year``, ``notoriety_year`` and ``written_year`` are nullable
+  ``Int16``, parsed once per distinct date string.
+
+Rows are dense node indices, so any boolean mask over nodes (degrees,
+component labels, ...) selects rows directly.  :func:`songs_albums` derives
+the songs_albums_analysis.csv table from it.
+"""
+
+import numpy as np
+import pandas as pd
+
+WORK_TYPES = ('Song', 'Album')
+
+_CATEGORICAL = {'type': 'Node Type', 'genre': 'genre', 'release_date': 'release_date',
+                'notoriety_date': 'notoriety_date', 'written_date': 'written_date'}
+_FLAGS = ('notable', 'single')
+_YEARS = {'release_year': 'release_date', 'notoriety_year': 'notoriety_date',
+          'written_year': 'written_date'}
+
+SONGS_ALBUMS_COLUMNS = ['id', 'type', 'genre', 'notable', 'release_date', 'notoriety_date',
+                        'written_date', 'single', 'release_year', 'notoriety_year']
+
+
+def year_column(values):
+    """Nullable ``Int16`` years from date strings (non-numeric → NA)."""
+    years = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+    valid = np.isfinite(years) & (years == np.round(years)) & (np.abs(years) <= np.iinfo(np.int16).max)
+    return pd.arrays.IntegerArray(np.where(valid, years, 0).astype(np.int16), ~valid)
+
+
+def _codes(graph, column, rows):
+    codes = np.asarray(graph.columns[column])
+    return codes if rows is None else codes[rows]
+
+
+def node_years(graph, column, rows=None):
+    """Nullable ``Int16`` year of every node (or of ``rows``) from a raw date column."""
+    # One parse per distinct date string, then a gather by code (-1 → trailing NA slot)
+    years = year_column(list(graph.categories[column]) + [None])
+    return years[_codes(graph, column, rows).astype(np.intp)]
+
+
+def node_frame(graph, rows=None):
+    """Typed attribute table for all nodes, or the dense indices ``rows``."""
+    ids = graph.node_ids if rows is None else [graph.node_ids[i] for i in rows]
+    names = graph.text['name'] if rows is None else [graph.text['name'][i] for i in rows]
+    data = {'id': ids, 'name': names}
+    for name, column in _CATEGORICAL.items():
+        data[name] = pd.Categorical.from_codes(_codes(graph, column, rows).astype(np.int32),
+                                               categories=graph.categories[column])
+    for name in _FLAGS:
+        flags = _codes(graph, name, rows)
+        data[name] = pd.arrays.BooleanArray(flags == 1, flags < 0)
+    for name, column in _YEARS.items():
+        data[name] = node_years(graph, column, rows)
+    frame = pd.DataFrame(data)
+    frame.index = pd.RangeIndex(graph.num_nodes) if rows is None else pd.Index(np.asarray(rows), name=None)
+    return frame
+
+
+def type_mask(nodes, types):
+    """Boolean row mask of nodes whose type is one of ``types``."""
+    return nodes['type'].isin(types).to_numpy()
+
+
+def songs_albums(nodes):
+    """The songs_albums_analysis.csv table (songs and albums, in node order)."""
+    df = nodes.loc[type_mask(nodes, WORK_TYPES), SONGS_ALBUMS_COLUMNS].reset_index(drop=True)
+    for column in ('type', 'genre'):
+        df[column] = df[column].cat.remove_unused_categories()
+    # A work without the flag counts as not notable; 'single' only applies to songs
+    df['notable'] = df['notable'].fillna(False).astype(bool)
+    df['single'] = df['single'].where(df['type'] == 'Song')
+    return df
@@ -0,0 +1,190 @@
+"""Run the eda.py stages concurrently in worker processes.
+
+Once the graph is loaded the sections only read it, so they can run side by
+side.  The parent evaluates ``load`` once and copies every numeric array it
+produced (node code columns, edge arrays, the CSR/CSC index and the weak
+component labels) into ``multiprocessing.shared_memory`` blocks.  Each worker
+maps those blocks as read-only numpy views and rebuilds the ``load`` result
+around them; the node ids, names and category tables are handed over once
+per worker by the pool initializer.  No NetworkX graph and no copy of the
+edge arrays is ever pickled.
+
+Stages are then scheduled over the dependency DAG: a stage is submitted as
+soon as its dependencies have finished, with their results passed along, so
+independent sections (node, edge, structure, genre matrix, payloads, ...)
+overlap.  Each stage's printed output is captured in the worker and replayed
+in report order, and figure stages run in the parent when their turn comes,
+so the report reads the same as a serial run.  Files are written by the
+stage that owns them, into the shared ``out_dir``.
+
+    python eda.py --no-figures --parallel 8
+"""
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from graph_loader import GraphArrays
+
+_EDGE_ARRAYS = ('edge_src', 'edge_dst', 'edge_type')
+
+
+# ---------------------------------------------------------------------------
+# Shared arrays
+# ---------------------------------------------------------------------------
+
+class SharedArrays:
+    """Named numpy arrays copied into shared-memory blocks (parent side)."""
+
+    def __init__(self, arrays):
+        self.blocks = []
+        self.specs = {}
+        for name, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(values.shape, values.dtype, buffer=block.buf)[...] = values
+            self.blocks.append(block)
+            self.specs[name] = (block.name, values.shape, values.dtype.str)
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+
+def attach(specs):
+    """Read-only views of the blocks in ``specs``; returns ``(arrays, blocks)``."""
+    arrays, blocks = {}, []
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        view = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+        view.flags.writeable = False
+        arrays[name] = view
+        blocks.append(block)
+    return arrays, blocks
+
+
+def _share_load(loaded):
+    """Split the ``load`` result into shared numeric arrays and small picklable tables."""
+    graph, csr = loaded['graph'], loaded['csr']
+    arrays = {f"column:{c}": values for c, values in graph.columns.items()}
+    arrays.update({name: getattr(graph, name) for name in _EDGE_ARRAYS})
+    arrays.update({f"csr:{name}": values for name, values in csr.index_arrays().items()})
+    arrays['wcc_labels'] = loaded['wcc_labels']
+    tables = {
+        'node_ids': graph.node_ids,
+        'categories': graph.categories,
+        'text': graph.text,
+        'edge_types': graph.edge_types,
+        'node_extra': graph.node_extra,
+        'edge_extra': graph.edge_extra,
+        'graph_attrs': graph.graph_attrs,
+        'wcc_count': loaded['wcc_count'],
+    }
+    return SharedArrays(arrays), tables
+
+
+def _rebuild_load(arrays, tables):
+    node_ids = tables['node_ids']
+    graph = GraphArrays(
+        node_ids=node_ids,
+        node_index={node_id: i for i, node_id in enumerate(node_ids)},
+        columns={name.split(':', 1)[1]: values for name, values in arrays.items() if name.startswith('column:')},
+        categories=tables['categories'],
+        text=tables['text'],
+        edge_types=tables['edge_types'],
+        node_extra=tables['node_extra'],
+        edge_extra=tables['edge_extra'],
+        graph_attrs=tables['graph_attrs'],
+        **{name: arrays[name] for name in _EDGE_ARRAYS},
+    )
+    csr = CSRGraph.from_index_arrays(graph.num_nodes, {
+        name.split(':', 1)[1]: values for name, values in arrays.items() if name.startswith('csr:')})
+    return {'graph': graph, 'csr': csr, 'wcc_labels': arrays['wcc_labels'], 'wcc_count': tables['wcc_count']}
+
+
+# ---------------------------------------------------------------------------
+# Workers
+# ---------------------------------------------------------------------------
+
+_worker = {}
+
+
+def _init_worker(specs, tables, params):
+    arrays, blocks = attach(specs)
+    _worker.update(blocks=blocks, load=_rebuild_load(arrays, tables), params=params)
+
+
+def _run_stage(name, dep_results):
+    """Evaluate one stage in a worker; returns its captured output, result and wall time."""
+    from eda import pipeline
+    from pipeline import Run
+
+    run = Run(pipeline, _worker['params'])
+    run.results['load'] = _worker['load']
+    run.results.update(dep_results)
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        result = run[name]
+    return out.getvalue(), result, time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+def run(pipeline, targets, workers=None, **params):
+    """Evaluate ``targets`` like ``pipeline.run``, fanning stages out over ``workers`` processes.
+
+    Returns the parent :class:`pipeline.Run` holding every stage result; its
+    ``timings`` attribute maps stage name to the worker's wall time.
+    """
+    from pipeline import Run
+
+    workers = workers or os.cpu_count() or 1
+    order = pipeline.resolve(targets)
+    parent = Run(pipeline, params)
+    parent.timings = {}
+    parent['load']
+    shared, tables = _share_load(parent.results['load'])
+    logs = {}
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(shared.specs, tables, params)) as pool:
+            running = {}
+            flushed = 0
+            while flushed < len(order):
+                # Submit every worker stage whose dependencies are done
+                for name in order:
+                    stage = pipeline.stages[name]
+                    if (name in parent or name in running.values() or stage.figure
+                            or not all(dep in parent for dep in stage.deps)):
+                        continue
+                    deps = {dep: parent.results[dep] for dep in stage.deps if dep != 'load'}
+                    running[pool.submit(_run_stage, name, deps)] = name
+                # Replay finished stages in report order; figures run here, in order
+                while flushed < len(order):
+                    name = order[flushed]
+                    if pipeline.stages[name].figure and all(dep in parent for dep in pipeline.stages[name].deps):
+                        parent[name]
+                    elif name in logs:
+                        print(logs.pop(name), end='')
+                    elif name not in parent or name in running.values():
+                        break
+                    flushed += 1
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        logs[name], parent.results[name], parent.timings[name] = future.result()
+    finally:
+        shared.close()
+    return parent
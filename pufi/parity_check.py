@@ -0,0 +1,121 @@
+"""Parity checks: array-backed metrics vs the NetworkX reference numbers.
+
+Every check builds the value the original eda.py computed with NetworkX and
+the value the array code computes, and fails loudly on any difference.
+``tests/test_parity.py`` runs them on small fixture graphs; this script runs
+them on the real data:
+
+    python parity_check.py [MC1_graph.json]
+"""
+
+import json
+import sys
+from collections import Counter
+
+import networkx as nx
+import numpy as np
+
+from csr_graph import CSRGraph
+from edge_table import EDGE_CATEGORIES, EdgeTable
+from graph_loader import load_graph
+
+CREATIVE_INFLUENCES = EDGE_CATEGORIES['creative_influences']
+
+
+def reference_graph(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        graph_data = json.load(f)
+    try:
+        return nx.node_link_graph(graph_data, edges='links')
+    except TypeError:  # networkx < 3.4
+        return nx.node_link_graph(graph_data)
+
+
+def _check(name, expected, actual):
+    if expected != actual:
+        raise AssertionError(f"{name}: expected {expected!r}, got {actual!r}")
+    print(f"  ok  {name}")
+
+
+def check_csr(G, graph):
+    csr = CSRGraph.from_arrays(graph)
+    ids = graph.node_ids
+
+    _check('node order', list(G.nodes()), ids)
+    _check('number_of_nodes', G.number_of_nodes(), csr.num_nodes)
+    _check('number_of_edges', G.number_of_edges(), csr.num_edges)
+    _check('density', nx.density(G), csr.density())
+
+    _check('in_degree', dict(G.in_degree()), dict(zip(ids, csr.in_degree().tolist())))
+    _check('out_degree', dict(G.out_degree()), dict(zip(ids, csr.out_degree().tolist())))
+    _check('degree', dict(G.degree()), dict(zip(ids, csr.degree().tolist())))
+
+    top_in = sorted(dict(G.in_degree()).items(), key=lambda x: x[1], reverse=True)[:10]
+    in_deg = csr.in_degree()
+    order = np.argsort(-in_deg, kind='stable')[:10]
+    _check('top-10 in-degree', top_in, [(ids[i], int(in_deg[i])) for i in order])
+
+    for kind, reference, labels in (
+        ('weakly', nx.weakly_connected_components(G), csr.weakly_connected_components()),
+        ('strongly', nx.strongly_connected_components(G), csr.strongly_connected_components()),
+    ):
+        components = sorted(sorted(graph.node_index[n] for n in c) for c in reference)
+        label, count = labels
+        _check(f'{kind} component count', len(components), count)
+        order = np.argsort(label, kind='stable')
+        groups = sorted(g.tolist() for g in np.split(order, np.cumsum(np.bincount(label))[:-1]))
+        _check(f'{kind} component membership', components, groups)
+
+    creative_codes = [graph.edge_types.index(t) for t in CREATIVE_INFLUENCES if t in graph.edge_types]
+    creative_subgraph = nx.DiGraph()
+    for u, v, d in G.edges(data=True):
+        if d.get('Edge Type') in CREATIVE_INFLUENCES:
+            creative_subgraph.add_edge(u, v, EdgeType=d.get('Edge Type'))
+    sub = csr.edge_subgraph(np.isin(graph.edge_type, creative_codes))
+    present = sub.has_edges()
+    _check('creative subgraph nodes', creative_subgraph.number_of_nodes(), int(present.sum()))
+    _check('creative subgraph edges', creative_subgraph.number_of_edges(), sub.num_edges)
+    _check('creative in_degree',
+           {n: creative_subgraph.in_degree(n) for n in creative_subgraph},
+           {ids[i]: int(d) for i, d in enumerate(sub.in_degree()) if present[i]})
+    _check('creative out_degree',
+           {n: creative_subgraph.out_degree(n) for n in creative_subgraph},
+           {ids[i]: int(d) for i, d in enumerate(sub.out_degree()) if present[i]})
+    _check('creative predecessors',
+           {n: sorted(creative_subgraph.predecessors(n)) for n in creative_subgraph},
+           {ids[i]: sorted(ids[p] for p in sub.predecessors(i)) for i in np.flatnonzero(present)})
+
+
+def check_edge_table(G, graph):
+    edges = EdgeTable.from_arrays(graph)
+    ids = graph.node_ids
+
+    _check('edge iteration order',
+           [(u, v) for u, v in G.edges()],
+           [(ids[edges.src[e]], ids[edges.dst[e]]) for e in edges.networkx_order()])
+
+    reference = Counter(d.get('Edge Type', 'Unknown') for _, _, d in G.edges(data=True))
+    counts = Counter(edges.type_counts())
+    _check('edge type counts', list(reference.items()), list(counts.items()))
+    _check('edge type most_common', reference.most_common(), counts.most_common())
+
+    category_counts = edges.category_counts()
+    for category, types in EDGE_CATEGORIES.items():
+        _check(f'{category} count', sum(reference[t] for t in types), category_counts[category])
+        mask = edges.category_mask(category)
+        _check(f'{category} mask',
+               sorted((u, v) for u, v, d in G.edges(data=True) if d.get('Edge Type') in types),
+               sorted(zip([ids[i] for i in edges.src[mask]], [ids[i] for i in edges.dst[mask]])))
+
+
+def main(path='MC1_graph.json'):
+    print(f"Parity checks on {path}")
+    G = reference_graph(path)
+    graph = load_graph(path)
+    check_csr(G, graph)
+    check_edge_table(G, graph)
+    print("All parity checks passed.")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
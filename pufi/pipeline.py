@@ -0,0 +1,101 @@
+"""Minimal lazily evaluated stage graph.
+
+A :class:`Pipeline` is a registry of named stages, each a function taking a
+:class:`Run` and returning its result.  Stages declare the stages they depend
+on; asking a run for a stage evaluates (once) exactly that stage and its
+transitive dependencies, nothing else::
+
+    pipeline = Pipeline()
+
+    @pipeline.stage('load')
+    def load(run):
+        return load_graph(run.params['graph_path'])
+
+    @pipeline.stage('structure', deps=('load',))
+    def structure(run):
+        graph = run['load']
+        ...
+
+    pipeline.run(['structure'], graph_path='MC1_graph.json')
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    func: object
+    deps: tuple = ()
+    figure: bool = False
+    doc: str = ''
+
+
+class Pipeline:
+    """Registry of named stages forming a dependency DAG."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def stage(self, name, deps=(), figure=False):
+        """Decorator registering ``func`` as stage ``name``."""
+        def register(func):
+            if name in self.stages:
+                raise ValueError(f"Stage {name!r} is already registered")
+            doc = (func.__doc__ or '').strip().splitlines()
+            self.stages[name] = Stage(name, func, tuple(deps), figure, doc[0] if doc else '')
+            return func
+        return register
+
+    def resolve(self, targets):
+        """Targets plus their transitive dependencies, in evaluation order."""
+        order, done, active = [], set(), []
+
+        def visit(name):
+            if name in done:
+                return
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage {name!r}; known stages: {', '.join(self.stages)}")
+            if name in active:
+                cycle = ' -> '.join(active[active.index(name):] + [name])
+                raise ValueError(f"Stage dependency cycle: {cycle}")
+            active.append(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            active.pop()
+            done.add(name)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def run(self, targets, **params):
+        """Evaluate ``targets`` (and only what they need); returns the :class:`Run`."""
+        run = Run(self, params)
+        for name in self.resolve(targets):
+            run[name]
+        return run
+
+
+class Run:
+    """One evaluation of a pipeline: parameters plus memoized stage results."""
+
+    def __init__(self, pipeline, params=None):
+        self.pipeline = pipeline
+        self.params = dict(params or {})
+        self.results = {}
+
+    def __getitem__(self, name):
+        if name not in self.results:
+            stage = self.pipeline.stages[name]
+            for dep in stage.deps:
+                self[dep]
+            self.results[name] = self._call(stage)
+        return self.results[name]
+
+    def _call(self, stage):
+        return stage.func(self)
+
+    def __contains__(self, name):
+        return name in self.results
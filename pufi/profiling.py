@@ -0,0 +1,147 @@
+"""Per-stage timing and memory instrumentation for the eda.py pipeline.
+
+:class:`ProfiledRun` wraps every stage call (``Run._call``) and records:
+
+- ``wall_s`` / ``cpu_s``: ``time.perf_counter`` and ``time.process_time``;
+- ``rss_peak_delta_mb``: growth of the process's peak resident set
+  (``getrusage`` high-water mark; ``None`` where :mod:`resource` is missing);
+- ``heap_peak_mb`` / ``heap_delta_mb``: tracemalloc peak above the stage's
+  starting heap, and the heap left behind when it returns;
+- ``alloc_blocks``: net number of memory blocks still allocated afterwards.
+
+Stages are timed exclusive of their declared dependencies, which are
+evaluated before the stage is called.  tracemalloc slows Python-heavy code
+down, so wall times are inflated compared with a plain run; compare them
+with each other, not with an unprofiled run.
+
+``write_trace`` stores the records as JSON; ``write_chrome_trace`` writes a
+trace-event file that chrome://tracing or Perfetto can open.  With
+``cprofile_dir`` each stage also gets a ``<stage>.prof`` cProfile dump for
+``pstats`` or snakeviz.
+
+    python eda.py --no-figures --profile --trace-events trace.json --cprofile prof
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+
+from pipeline import Run
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+TRACE_FILE = 'stage_profile.json'
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class ProfiledRun(Run):
+    """A :class:`pipeline.Run` that records one entry in ``records`` per stage call."""
+
+    def __init__(self, pipeline, params=None, cprofile_dir=None, memory=True):
+        super().__init__(pipeline, params)
+        self.records = []
+        self.cprofile_dir = cprofile_dir
+        self.memory = memory
+        self._origin = time.perf_counter()
+
+    def _call(self, stage):
+        if self.memory:
+            heap_before = tracemalloc.get_traced_memory()[0]
+            blocks_before = len(tracemalloc.take_snapshot().traces)
+            tracemalloc.reset_peak()
+        rss_before = _peak_rss_mb()
+        profiler = cProfile.Profile() if self.cprofile_dir else None
+
+        start, cpu_start = time.perf_counter(), time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            return super()._call(stage)
+        finally:
+            if profiler:
+                profiler.disable()
+            wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+            rss_after = _peak_rss_mb()
+            record = {
+                'stage': stage.name,
+                'start_s': start - self._origin,
+                'wall_s': wall,
+                'cpu_s': cpu,
+                'rss_peak_delta_mb': None if rss_before is None else rss_after - rss_before,
+                'heap_peak_mb': None,
+                'heap_delta_mb': None,
+                'alloc_blocks': None,
+            }
+            if self.memory:
+                heap_after, heap_peak = tracemalloc.get_traced_memory()
+                record.update(heap_peak_mb=(heap_peak - heap_before) / 2**20,
+                              heap_delta_mb=(heap_after - heap_before) / 2**20,
+                              alloc_blocks=len(tracemalloc.take_snapshot().traces) - blocks_before)
+            self.records.append(record)
+            if profiler:
+                os.makedirs(self.cprofile_dir, exist_ok=True)
+                profiler.dump_stats(os.path.join(self.cprofile_dir, f"{stage.name}.prof"))
+
+
+def run(pipeline, targets, cprofile_dir=None, memory=True, **params):
+    """Evaluate ``targets`` like ``pipeline.run`` under a :class:`ProfiledRun`.
+
+    ``memory=False`` skips tracemalloc (the heap fields are ``None``) for
+    undisturbed timings.
+    """
+    started = not memory or tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+    try:
+        profiled = ProfiledRun(pipeline, params, cprofile_dir, memory)
+        for name in pipeline.resolve(targets):
+            profiled[name]
+    finally:
+        if not started:
+            tracemalloc.stop()
+    return profiled
+
+
+def write_trace(records, path, **meta):
+    """Stage records (plus ``meta`` such as the graph path) as indented JSON."""
+    with open(path, 'w') as f:
+        json.dump({**meta, 'stages': records}, f, indent=2)
+
+
+def write_chrome_trace(records, path):
+    """Chrome trace-event file: one complete ("X") event per stage, in microseconds."""
+    pid = os.getpid()
+    events = [{
+        'name': r['stage'],
+        'cat': 'stage',
+        'ph': 'X',
+        'ts': round(r['start_s'] * 1e6),
+        'dur': round(r['wall_s'] * 1e6),
+        'pid': pid,
+        'tid': 0,
+        'args': {key: value for key, value in r.items() if key not in ('stage', 'start_s', 'wall_s')},
+    } for r in records]
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def print_records(records):
+    print(f"\n{'stage':>18} {'wall (s)':>9} {'cpu (s)':>8} {'rss +MB':>8} {'heap pk MB':>11} {'blocks':>9}")
+    print("-" * 68)
+    for r in records:
+        rss = '-' if r['rss_peak_delta_mb'] is None else f"{r['rss_peak_delta_mb']:.1f}"
+        heap = '-' if r['heap_peak_mb'] is None else f"{r['heap_peak_mb']:.1f}"
+        blocks = '-' if r['alloc_blocks'] is None else f"{r['alloc_blocks']:,}"
+        print(f"{r['stage']:>18} {r['wall_s']:>9.3f} {r['cpu_s']:>8.3f} {rss:>8} {heap:>11} {blocks:>9}")
+    print(f"{'total':>18} {sum(r['wall_s'] for r in records):>9.3f} {sum(r['cpu_s'] for r in records):>8.3f}")
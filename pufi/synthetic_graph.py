@@ -0,0 +1,283 @@
+"""Synthetic MC1-shaped graphs, from 10k to 10M nodes.
+
+The generator reproduces the schema of ``MC1_graph.json`` (node-link JSON,
+integer ids, the node attributes :mod:`graph_loader` reads) and the shape of
+its distributions, scaled linearly with the node count:
+
+- node type shares and edge type counts per node, from ``data.md`` /
+  ``edge_analysis.json`` (17,412 nodes, 37,857 edges);
+- genre skew, notable and single ratios, release years (5-year bins,
+  1975-2040), and the presence of notoriety and written dates, from
+  ``songs_albums_analysis.csv``;
+- endpoints by edge type: people and groups perform, people compose,
+  produce and write lyrics, works are recorded and distributed by labels,
+  people are members of groups, and creative influences point from a work
+  to an older work, so the graph is acyclic (MC1's largest strong
+  component has 2 nodes);
+- heavy-tailed degrees: endpoints are drawn with Zipf-like popularity, and
+  every node gets at least one edge, so almost everything falls into one
+  weak component.
+
+Attribute correlations beyond these (e.g. genre by era) and influences
+that name an artist rather than a work are not modelled.
+Output is deterministic for a given ``--nodes`` and ``--seed`` and is
+written in chunks, so 10M nodes need only the numpy arrays in memory.
+
+    python synthetic_graph.py --nodes 1M --out synthetic_1M.json
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+# MC1 node type counts (data.md)
+NODE_TYPE_COUNTS = {'Person': 11361, 'Song': 3615, 'RecordLabel': 1217, 'Album': 996, 'MusicalGroup': 223}
+
+# MC1 edge type counts (edge_analysis.json)
+EDGE_TYPE_COUNTS = {
+    'InterpolatesFrom': 1574, 'RecordedBy': 3798, 'PerformerOf': 13587, 'ComposerOf': 3290,
+    'ProducerOf': 3209, 'InStyleOf': 2289, 'LyricalReferenceTo': 1496, 'CoverOf': 1429,
+    'DistributedBy': 3013, 'MemberOf': 568, 'LyricistOf': 2985, 'DirectlySamples': 619,
+}
+MC1_NODES = sum(NODE_TYPE_COUNTS.values())
+
+# Songs and albums per genre (songs_albums_analysis.csv)
+GENRE_COUNTS = {
+    'Dream Pop': 742, 'Indie Folk': 450, 'Synthwave': 382, 'Doom Metal': 348, 'Oceanus Folk': 305,
+    'Alternative Rock': 258, 'Southern Gothic Rock': 242, 'Indie Rock': 208, 'Americana': 184,
+    'Psychedelic Rock': 172, 'Lo-Fi Electronica': 136, 'Indie Pop': 134, 'Jazz Surf Rock': 127,
+    'Desert Rock': 125, 'Space Rock': 121, 'Blues Rock': 109, 'Darkwave': 104, 'Speed Metal': 84,
+    'Emo/Pop Punk': 77, 'Post-Apocalyptic Folk': 72, 'Avant-Garde Folk': 70, 'Symphonic Metal': 64,
+    'Synthpop': 46, 'Sea Shanties': 21, 'Acoustic Folk': 18, 'Celtic Folk': 12,
+}
+
+# Release years in 5-year bins starting 1975; the last bin is 2040 alone
+YEAR_BIN_START, YEAR_BIN_WIDTH, LAST_YEAR = 1975, 5, 2040
+YEAR_BIN_COUNTS = (17, 47, 70, 133, 159, 272, 269, 628, 575, 1083, 1086, 192, 77, 3)
+
+NOTABLE_SHARE = 4297 / 4611         # of songs and albums
+SINGLE_SHARE = 2838 / 3615          # of songs; albums have no 'single'
+NOTORIETY_SHARE = 0.151             # of notable works; years after release are mostly 0
+WRITTEN_SHARE = {'Song': 0.294, 'Album': 0.395}  # written up to a few years before release
+STAGE_NAME_SHARE = 0.05             # of people (not in the saved tables; an assumption)
+
+PERFORMERS = ('Person', 'MusicalGroup')
+WORKS = ('Song', 'Album')
+# Source and target node types of every edge type
+ENDPOINTS = {
+    'PerformerOf': (PERFORMERS, WORKS),
+    'ComposerOf': (('Person',), WORKS),
+    'ProducerOf': (('Person',), WORKS),
+    'LyricistOf': (('Person',), WORKS),
+    'RecordedBy': (WORKS, ('RecordLabel',)),
+    'DistributedBy': (WORKS, ('RecordLabel',)),
+    'MemberOf': (('Person',), ('MusicalGroup',)),
+    'InStyleOf': (WORKS, WORKS),
+    'InterpolatesFrom': (WORKS, WORKS),
+    'CoverOf': (WORKS, WORKS),
+    'LyricalReferenceTo': (WORKS, WORKS),
+    'DirectlySamples': (WORKS, WORKS),
+}
+CREATIVE = ('InStyleOf', 'InterpolatesFrom', 'CoverOf', 'LyricalReferenceTo', 'DirectlySamples')
+
+ZIPF_EXPONENT = 0.8
+
+
+def parse_count(text):
+    """``'10k'`` / ``'2.5M'`` / ``'17412'`` -> int."""
+    text = str(text).strip()
+    scale = {'k': 10**3, 'm': 10**6}.get(text[-1:].lower())
+    return int(float(text[:-1]) * scale) if scale else int(text)
+
+
+def _shares(counts):
+    values = np.array(list(counts.values()), dtype=np.float64)
+    return values / values.sum()
+
+
+def _scaled(counts, total):
+    """Integer split of ``total`` proportional to ``counts`` (largest remainders)."""
+    exact = _shares(counts) * total
+    sizes = np.floor(exact).astype(np.int64)
+    sizes[np.argsort(sizes - exact)[:total - sizes.sum()]] += 1
+    return dict(zip(counts, sizes.tolist()))
+
+
+class _Pool:
+    """Node indices of some types with Zipf-like popularity weights."""
+
+    def __init__(self, nodes, rng):
+        self.nodes = rng.permutation(nodes)
+        weights = (np.arange(len(nodes)) + 1.0) ** -ZIPF_EXPONENT
+        self.cdf = np.cumsum(weights / weights.sum())
+
+    def sample(self, rng, size, cover=None):
+        """``size`` draws; ``cover='head'`` / ``'tail'`` makes the first / last draws visit every node once."""
+        picks = self.nodes[np.minimum(np.searchsorted(self.cdf, rng.random(size)), len(self.nodes) - 1)]
+        if cover:
+            span = min(size, len(self.nodes))
+            slots = slice(0, span) if cover == 'head' else slice(size - span, size)
+            picks[slots] = rng.permutation(self.nodes)[:span]
+        return picks
+
+
+def generate(num_nodes, seed=0):
+    """Node and edge arrays of a synthetic graph with ``num_nodes`` nodes.
+
+    Returns a dict of numpy arrays: ``node_type`` (index into
+    ``type_names``), ``genre`` (index into ``genres``, -1 for non-works),
+    ``release_year`` / ``notoriety_year`` / ``written_year`` (0 = absent),
+    ``notable`` / ``single`` (int8, -1 = absent), ``stage_name`` (bool),
+    ``edge_src`` / ``edge_dst`` / ``edge_type`` (index into ``edge_types``).
+    """
+    rng = np.random.default_rng(seed)
+    type_names = list(NODE_TYPE_COUNTS)
+    node_type = np.repeat(np.arange(len(type_names), dtype=np.int8),
+                          list(_scaled(NODE_TYPE_COUNTS, num_nodes).values()))
+    rng.shuffle(node_type)
+    by_type = {name: np.flatnonzero(node_type == k) for k, name in enumerate(type_names)}
+
+    works = np.sort(np.concatenate([by_type['Song'], by_type['Album']]))
+    is_song = node_type[works] == type_names.index('Song')
+    genres = list(GENRE_COUNTS)
+    genre = np.full(num_nodes, -1, dtype=np.int16)
+    genre[works] = rng.choice(len(genres), size=len(works), p=_shares(GENRE_COUNTS))
+
+    release = np.zeros(num_nodes, dtype=np.int16)
+    bins = rng.choice(len(YEAR_BIN_COUNTS), size=len(works), p=_shares(dict(enumerate(YEAR_BIN_COUNTS))))
+    years = YEAR_BIN_START + YEAR_BIN_WIDTH * bins + rng.integers(0, YEAR_BIN_WIDTH, len(works))
+    release[works] = np.minimum(years, LAST_YEAR)
+
+    notable = np.full(num_nodes, -1, dtype=np.int8)
+    notable[works] = rng.random(len(works)) < NOTABLE_SHARE
+    single = np.full(num_nodes, -1, dtype=np.int8)
+    single[works[is_song]] = rng.random(int(is_song.sum())) < SINGLE_SHARE
+
+    notoriety = np.zeros(num_nodes, dtype=np.int16)
+    noted = works[(notable[works] == 1) & (rng.random(len(works)) < NOTORIETY_SHARE)]
+    lag = np.where(rng.random(len(noted)) < 0.1, rng.geometric(0.25, len(noted)), 0)
+    notoriety[noted] = release[noted] + lag
+    written = np.zeros(num_nodes, dtype=np.int16)
+    written_share = np.where(is_song, WRITTEN_SHARE['Song'], WRITTEN_SHARE['Album'])
+    penned = works[rng.random(len(works)) < written_share]
+    lead = np.where(rng.random(len(penned)) < 0.25, rng.geometric(0.36, len(penned)), 0)
+    written[penned] = release[penned] - lead
+
+    stage_name = np.zeros(num_nodes, dtype=bool)
+    stage_name[by_type['Person']] = rng.random(len(by_type['Person'])) < STAGE_NAME_SHARE
+
+    # Edges, type by type; every node is covered by the first draws of its busiest edge type
+    edge_types = list(EDGE_TYPE_COUNTS)
+    num_edges = round(num_nodes * sum(EDGE_TYPE_COUNTS.values()) / MC1_NODES)
+    pools = {}
+
+    def pool(types):
+        if types not in pools:
+            pools[types] = _Pool(np.sort(np.concatenate([by_type[t] for t in types])), rng)
+        return pools[types]
+
+    # Covering draws of the two ends use opposite slots, so rare nodes attach to popular ones
+    covering = {'PerformerOf': ('head', 'tail'), 'ComposerOf': ('head', None), 'RecordedBy': (None, 'tail'),
+                'MemberOf': (None, 'tail')}
+    src, dst, etype = [], [], []
+    for code, (name, size) in enumerate(_scaled(EDGE_TYPE_COUNTS, num_edges).items()):
+        sources, targets = ENDPOINTS[name]
+        cover_src, cover_dst = covering.get(name, (None, None))
+        s = pool(sources).sample(rng, size, cover_src)
+        t = pool(targets).sample(rng, size, cover_dst)
+        if name in CREATIVE:
+            # The influenced work is the newer one (ties by id), so influences form a DAG
+            swap = (release[s] < release[t]) | ((release[s] == release[t]) & (s < t))
+            s, t = np.where(swap, t, s), np.where(swap, s, t)
+        src.append(s)
+        dst.append(t)
+        etype.append(np.full(size, code, dtype=np.int8))
+    order = rng.permutation(num_edges)
+    return {
+        'type_names': type_names, 'genres': genres, 'edge_types': edge_types,
+        'node_type': node_type, 'genre': genre, 'release_year': release, 'notoriety_year': notoriety,
+        'written_year': written, 'notable': notable, 'single': single, 'stage_name': stage_name,
+        'edge_src': np.concatenate(src)[order].astype(np.int64),
+        'edge_dst': np.concatenate(dst)[order].astype(np.int64),
+        'edge_type': np.concatenate(etype)[order],
+    }
+
+
+def _edge_keys(src, dst):
+    """Per-edge multigraph key: the rank of the edge among earlier (src, dst) duplicates."""
+    order = np.lexsort((np.arange(len(src)), dst, src))
+    s, d = src[order], dst[order]
+    starts = np.flatnonzero(np.r_[True, (s[1:] != s[:-1]) | (d[1:] != d[:-1])])
+    keys = np.empty(len(src), dtype=np.int64)
+    keys[order] = np.arange(len(src)) - np.repeat(starts, np.diff(np.r_[starts, len(src)]))
+    return keys
+
+
+def _node_records(g, lo, hi):
+    type_names, genres = g['type_names'], [json.dumps(x) for x in g['genres']]
+    flags = {0: 'false', 1: 'true'}
+    columns = [g[c][lo:hi].tolist() for c in ('node_type', 'genre', 'release_year', 'notable', 'single',
+                                              'written_year', 'notoriety_year', 'stage_name')]
+    for i, (t, genre, year, notable, single, written, noted, stage) in enumerate(zip(*columns), lo):
+        kind = type_names[t]
+        fields = [f'"Node Type": "{kind}"']
+        if genre >= 0:
+            fields.append(f'"genre": {genres[genre]}')
+        fields.append(f'"name": "{kind} {i}"')
+        if year:
+            fields.append(f'"release_date": "{year}"')
+        if notable >= 0:
+            fields.append(f'"notable": {flags[notable]}')
+        if single >= 0:
+            fields.append(f'"single": {flags[single]}')
+        if written:
+            fields.append(f'"written_date": "{written}"')
+        if noted:
+            fields.append(f'"notoriety_date": "{noted}"')
+        if stage:
+            fields.append(f'"stage_name": "Stage {i}"')
+        fields.append(f'"id": {i}')
+        yield '{' + ', '.join(fields) + '}'
+
+
+def write_node_link(g, path, chunk_size=100_000):
+    """Write ``g`` (see :func:`generate`) as node-link JSON, ``chunk_size`` records at a time."""
+    num_nodes, num_edges = len(g['node_type']), len(g['edge_src'])
+    keys = _edge_keys(g['edge_src'], g['edge_dst'])
+    edge_types = [json.dumps(t) for t in g['edge_types']]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"directed": true, "multigraph": true, "graph": {}, "nodes": [')
+        for lo in range(0, num_nodes, chunk_size):
+            f.write((', ' if lo else '') + ', '.join(_node_records(g, lo, min(lo + chunk_size, num_nodes))))
+        f.write('], "links": [')
+        for lo in range(0, num_edges, chunk_size):
+            hi = min(lo + chunk_size, num_edges)
+            rows = zip(g['edge_type'][lo:hi].tolist(), g['edge_src'][lo:hi].tolist(),
+                       g['edge_dst'][lo:hi].tolist(), keys[lo:hi].tolist())
+            f.write((', ' if lo else '') + ', '.join(
+                f'{{"Edge Type": {edge_types[t]}, "source": {s}, "target": {d}, "key": {k}}}'
+                for t, s, d, k in rows))
+        f.write(']}')
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic MC1-shaped graph.")
+    parser.add_argument('--nodes', default='17412', help="node count, e.g. 10k, 1M (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="output path (default: synthetic_<nodes>.json)")
+    args = parser.parse_args(argv)
+
+    num_nodes = parse_count(args.nodes)
+    path = args.out or f"synthetic_{args.nodes}.json"
+    g = generate(num_nodes, args.seed)
+    write_node_link(g, path)
+    print(f"Wrote {path}: {num_nodes:,} nodes, {len(g['edge_src']):,} edges "
+          f"({os.path.getsize(path) / 2**20:.1f} MB)")
+    return path
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Sorted-by-year index over the works and edges for range counts and snapshots.
+
+Built once from the loader's columns:
+
+- ``order``: songs and albums with a release year, sorted by year (node
+  order within a year), and ``offsets`` into it for each distinct year in
+  ``years`` -- the works released in a year range are one slice;
+- ``genre_prefix``, ``notable_genre_prefix`` and ``notable_prefix``:
+  running counts per genre (last column = no genre), of notable works per
+  genre and of notable works over those years, so any ``[first, last]``
+  count is a difference of two rows;
+- ``edge_order`` / ``edge_years``: edges sorted by the year they appear, the
+  latest release year of their work endpoints.  People, groups and labels
+  carry no date and never hold an edge back; an edge touching a work without
+  a release year is undated and sorts last.  "The graph as of year Y" is the
+  prefix ``edge_order[:k]``.
+
+Every range lookup is a ``np.searchsorted`` on ``years`` or ``edge_years``,
+so counts cost O(log n) and snapshots O(slice) instead of a scan over the
+node table.
+"""
+
+import numpy as np
+
+from node_frame import WORK_TYPES, node_years
+
+_TIMELESS = np.iinfo(np.int64).min
+_UNDATED = np.iinfo(np.int64).max
+
+
+class TemporalIndex:
+    """Works and edges of a :class:`graph_loader.GraphArrays` ordered by release year."""
+
+    def __init__(self, graph):
+        self.genres = list(graph.categories['genre'])
+        type_codes = [graph.categories['Node Type'].index(t) for t in WORK_TYPES
+                      if t in graph.categories['Node Type']]
+        is_work = np.isin(np.asarray(graph.columns['Node Type']), type_codes)
+        release = node_years(graph, 'release_date')
+        dated = ~np.asarray(release.isna())
+        year = release.to_numpy(dtype=np.int64, na_value=0)
+
+        # Works by release year
+        works = np.flatnonzero(is_work & dated)
+        self.order = works[np.argsort(year[works], kind='stable')]
+        self.years, counts = np.unique(year[self.order], return_counts=True)
+        self.offsets = np.zeros(len(self.years) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+
+        self.work_genre = np.asarray(graph.columns['genre'], dtype=np.int64)[self.order]
+        self.work_genre[self.work_genre < 0] = len(self.genres)
+        self.work_notable = np.asarray(graph.columns['notable'])[self.order] == 1
+        self.genre_prefix = self._prefix(counts, self.work_genre)
+        self.notable_genre_prefix = self._prefix(counts, self.work_genre, self.work_notable)
+        self.notable_prefix = np.r_[0, np.cumsum(self.work_notable)]
+
+        # Edges by the year both endpoints exist
+        node_time = np.where(is_work, np.where(dated, year, _UNDATED), _TIMELESS)
+        edge_time = np.maximum(node_time[np.asarray(graph.edge_src)], node_time[np.asarray(graph.edge_dst)])
+        self.edge_order = np.argsort(edge_time, kind='stable')
+        self.edge_years = edge_time[self.edge_order]
+
+    def _prefix(self, counts, genre, weights=None):
+        """Running per-genre totals over the years: row k sums the first k years."""
+        width = len(self.genres) + 1
+        year_slot = np.repeat(np.arange(len(self.years)), counts)
+        per_year = np.bincount(year_slot * width + genre, weights=weights,
+                               minlength=len(self.years) * width).astype(np.int64)
+        prefix = np.zeros((len(self.years) + 1, width), dtype=np.int64)
+        np.cumsum(per_year.reshape(len(self.years), width), axis=0, out=prefix[1:])
+        return prefix
+
+    # ------------------------------------------------------------------
+    # Works
+    # ------------------------------------------------------------------
+    def _bounds(self, first, last):
+        lo = 0 if first is None else np.searchsorted(self.years, first, side='left')
+        hi = len(self.years) if last is None else np.searchsorted(self.years, last, side='right')
+        return lo, max(lo, hi)
+
+    def works(self, first=None, last=None):
+        """Node indices of works released in ``[first, last]`` (a view, sorted by year)."""
+        lo, hi = self._bounds(first, last)
+        return self.order[self.offsets[lo]:self.offsets[hi]]
+
+    def count(self, first=None, last=None, genre=None, notable=None):
+        """Works released in ``[first, last]``, optionally of one genre and/or notability."""
+        lo, hi = self._bounds(first, last)
+        if genre is not None:
+            column = self.genres.index(genre)
+            total = int(self.genre_prefix[hi, column] - self.genre_prefix[lo, column])
+            notable_count = int(self.notable_genre_prefix[hi, column] - self.notable_genre_prefix[lo, column])
+        else:
+            start, end = self.offsets[lo], self.offsets[hi]
+            total = int(end - start)
+            notable_count = int(self.notable_prefix[end] - self.notable_prefix[start])
+        if notable is None:
+            return total
+        return notable_count if notable else total - notable_count
+
+    def counts_by_year(self, genre=None, notable=None):
+        """``(years, counts)`` of works per release year, from the prefix arrays."""
+        if genre is not None:
+            column = self.genres.index(genre)
+            totals = np.diff(self.genre_prefix[:, column])
+            notable_counts = np.diff(self.notable_genre_prefix[:, column])
+        else:
+            totals = np.diff(self.offsets)
+            notable_counts = np.diff(self.notable_prefix[self.offsets])
+        if notable is None:
+            return self.years, totals
+        return self.years, notable_counts if notable else totals - notable_counts
+
+    # ------------------------------------------------------------------
+    # Edges
+    # ------------------------------------------------------------------
+    def snapshot_edges(self, year):
+        """Edge ids present by the end of ``year`` (a view of ``edge_order``)."""
+        return self.edge_order[:np.searchsorted(self.edge_years, year, side='right')]
+
+    def edges_between(self, first, last):
+        """Edge ids that appear during ``[first, last]``."""
+        lo = np.searchsorted(self.edge_years, first, side='left')
+        hi = np.searchsorted(self.edge_years, last, side='right')
+        return self.edge_order[lo:max(lo, hi)]
@@ -0,0 +1,73 @@
+"""Fixture graphs shared by the tests.
+
+The modules live flat in ``pufi/``, so that directory goes on ``sys.path``.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic_graph import generate, write_node_link  # noqa: E402
+
+# Small, but with everything the loader and the CSR code must get right:
+# creative and membership cycles, a self-loop, parallel edges, a link without
+# an Edge Type, nodes without a Node Type, links to ids missing from "nodes"
+# and an isolated node.
+HAND_BUILT = {
+    'directed': True,
+    'multigraph': True,
+    'graph': {},
+    'nodes': [
+        {'id': 'song_a', 'Node Type': 'Song', 'name': 'A', 'genre': 'Oceanus Folk', 'notable': True,
+         'release_date': '2031', 'notoriety_date': '2032', 'single': True},
+        {'id': 'album_b', 'Node Type': 'Album', 'name': 'B', 'genre': 'Dream Pop', 'notable': False,
+         'release_date': '2029'},
+        {'id': 'song_d', 'Node Type': 'Song', 'name': 'D', 'genre': 'Oceanus Folk', 'notable': False,
+         'release_date': '2035', 'written_date': '2033', 'single': False},
+        {'id': 'person_c', 'Node Type': 'Person', 'name': 'C', 'stage_name': 'Cee'},
+        {'id': 'group_e', 'Node Type': 'MusicalGroup', 'name': 'E'},
+        {'id': 'label_f', 'Node Type': 'RecordLabel', 'name': 'F'},
+        {'id': 'untyped_g', 'name': 'G', 'mood': 'unknown'},
+        {'id': 'person_h', 'Node Type': 'Person', 'name': 'H'},
+    ],
+    'links': [
+        {'source': 'song_a', 'target': 'album_b', 'Edge Type': 'InStyleOf'},
+        {'source': 'album_b', 'target': 'song_d', 'Edge Type': 'CoverOf'},
+        {'source': 'song_d', 'target': 'song_a', 'Edge Type': 'InterpolatesFrom'},
+        {'source': 'song_a', 'target': 'song_a', 'Edge Type': 'LyricalReferenceTo'},
+        {'source': 'person_c', 'target': 'song_a', 'Edge Type': 'PerformerOf'},
+        {'source': 'person_c', 'target': 'song_a', 'Edge Type': 'PerformerOf'},
+        {'source': 'person_c', 'target': 'song_a', 'Edge Type': 'ComposerOf'},
+        {'source': 'person_c', 'target': 'group_e', 'Edge Type': 'MemberOf'},
+        {'source': 'group_e', 'target': 'person_c', 'Edge Type': 'PerformerOf'},
+        {'source': 'song_d', 'target': 'label_f', 'Edge Type': 'RecordedBy'},
+        {'source': 'person_c', 'target': 'ghost_1', 'Edge Type': 'PerformerOf'},
+        {'source': 'ghost_2', 'target': 'song_d', 'Edge Type': 'DirectlySamples'},
+        {'source': 'album_b', 'target': 'person_c'},
+        {'source': 'untyped_g', 'target': 'song_d', 'Edge Type': 'InStyleOf'},
+        {'source': 'song_a', 'target': 'album_b', 'Edge Type': 'CoverOf'},
+    ],
+}
+
+
+@pytest.fixture(scope='session')
+def synthetic_graph_path(tmp_path_factory):
+    """A 2,000-node MC1-shaped graph from :mod:`synthetic_graph`."""
+    return write_node_link(generate(2000, seed=7), str(tmp_path_factory.mktemp('graphs') / 'synthetic.json'))
+
+
+@pytest.fixture(scope='session')
+def hand_built_graph_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp('graphs') / 'hand_built.json'
+    path.write_text(json.dumps(HAND_BUILT), encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(params=['synthetic', 'hand_built'])
+def graph_path(request):
+    """Each fixture graph in turn."""
+    return request.getfixturevalue(f'{request.param}_graph_path')
@@ -0,0 +1,125 @@
+"""incremental.py against a full ``eda.py --only export`` after init and after every delta.
+
+Each delta is replayed on a NetworkX graph, which is written out and run
+through the export stage; all five artifacts must match byte for byte.
+"""
+
+import json
+import random
+
+import networkx as nx
+import pytest
+
+import eda
+import incremental
+from edge_table import EDGE_CATEGORIES
+from parity_check import reference_graph
+
+ARTIFACTS = ('songs_albums_analysis.csv', 'network_metrics.json', 'edge_analysis.json',
+             'node_components.csv', 'cascade_metrics.csv')
+CREATIVE = EDGE_CATEGORIES['creative_influences']
+OTHER = ['PerformerOf', 'ComposerOf', 'MemberOf', 'RecordedBy']
+GENRES = ['Oceanus Folk', 'Dream Pop', 'Brand New Genre']
+# Which halves of a delta each step uses
+STEPS = ('both', 'add', 'remove', 'both', 'both')
+
+
+def _assert_same_artifacts(expected_dir, actual_dir):
+    for name in ARTIFACTS:
+        expected = (expected_dir / name).read_bytes()
+        actual = (actual_dir / name).read_bytes()
+        assert actual == expected, f"{name} differs from eda.py --only export"
+
+
+def _random_delta(G, rng, new_id, removed, kind):
+    ids = list(G.nodes)
+    works = [n for n in ids if G.nodes[n].get('Node Type') in ('Song', 'Album')]
+    # eda.py prints the share of singles, so songs with a 'single' flag stay songs
+    singles = {n for n in works if 'single' in G.nodes[n]}
+    add_nodes, add_links, remove_nodes, remove_links = [], [], [], []
+    if kind != 'remove':
+        for _ in range(3):
+            node_type = rng.choice(['Song', 'Album', 'Person'])
+            node = {'id': new_id(), 'Node Type': node_type, 'name': f'new {node_type}'}
+            if node_type != 'Person':
+                node.update(genre=rng.choice(GENRES), notable=rng.random() < 0.5,
+                            release_date=str(rng.randint(2000, 2040)))
+            add_nodes.append(node)
+        if removed:
+            add_nodes.append({'id': removed.pop(), 'Node Type': 'Song', 'genre': 'Dream Pop', 'notable': True})
+        for work in rng.sample(works, min(2, len(works))):
+            update = {'id': work, 'notable': rng.random() < 0.5, 'genre': rng.choice(GENRES)}
+            if rng.random() < 0.3 and work not in singles:
+                update['Node Type'] = rng.choice(['Song', 'Album', 'Person'])
+            add_nodes.append(update)
+        pool = ids + [node['id'] for node in add_nodes]
+        for _ in range(6):
+            add_links.append({'source': rng.choice(pool), 'target': rng.choice(pool),
+                              'Edge Type': rng.choice(CREATIVE + OTHER)})
+        if len(works) >= 2:
+            a, b = rng.sample(works, 2)
+            add_links += [{'source': a, 'target': b, 'Edge Type': 'CoverOf'},
+                          {'source': b, 'target': a, 'Edge Type': 'InStyleOf'}]
+        add_links.append({'source': new_id(), 'target': rng.choice(ids), 'Edge Type': 'CoverOf'})
+    if kind != 'add':
+        edges = list(G.edges(data=True))
+        for u, v, data in rng.sample(edges, min(4, len(edges))):
+            remove_links.append({'source': u, 'target': v, 'Edge Type': data.get('Edge Type')})
+        if remove_links:
+            remove_links.append(dict(remove_links[0]))
+        remove_links.append({'source': ids[0], 'target': ids[-1], 'Edge Type': 'NoSuchType'})
+        for node in rng.sample([n for n in ids if n not in singles], 1):
+            remove_nodes.append(node)
+            removed.append(node)
+    return {'add': {'nodes': add_nodes, 'links': add_links},
+            'remove': {'nodes': remove_nodes, 'links': remove_links}}
+
+
+def _replay(G, delta):
+    """Apply ``delta`` the way incremental.py documents it, on a NetworkX MultiDiGraph."""
+    for link in delta['remove']['links']:
+        u, v = link['source'], link['target']
+        if G.has_edge(u, v):
+            keys = [k for k, d in G[u][v].items() if 'Edge Type' not in link or d.get('Edge Type') == link['Edge Type']]
+            if keys:
+                G.remove_edge(u, v, keys[-1])
+    for node in delta['remove']['nodes']:
+        if node in G:
+            G.remove_node(node)
+    for node in delta['add']['nodes']:
+        node = dict(node)
+        G.add_node(node.pop('id'), **node)
+    for link in delta['add']['links']:
+        link = dict(link)
+        G.add_edge(link.pop('source'), link.pop('target'), **link)
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_apply_matches_full_export(graph_path, tmp_path, seed):
+    state_dir, out_dir = str(tmp_path / 'state'), tmp_path / 'incremental'
+    incremental.main(['init', '--graph', graph_path, '--state-dir', state_dir, '--out-dir', str(out_dir)])
+    eda.main(['--graph', graph_path, '--out-dir', str(tmp_path / 'full_init'), '--only', 'export'])
+    _assert_same_artifacts(tmp_path / 'full_init', out_dir)
+
+    G = reference_graph(graph_path)
+    rng = random.Random(seed)
+    ints = all(isinstance(n, int) for n in G.nodes)
+    counter = iter(range(max(G.nodes) + 1 if ints else 0, 1 << 30))
+
+    def new_id():
+        return next(counter) if ints else f'new_{next(counter)}'
+
+    removed = []
+    for step, kind in enumerate(STEPS):
+        delta = _random_delta(G, rng, new_id, removed, kind)
+        delta_path = tmp_path / f'delta_{step}.json'
+        delta_path.write_text(json.dumps(delta), encoding='utf-8')
+        incremental.main(['apply', str(delta_path), '--state-dir', state_dir, '--out-dir', str(out_dir)])
+
+        _replay(G, delta)
+        # A new file per step: eda.py caches parsed graphs by path
+        graph_file = tmp_path / f'graph_{step}.json'
+        graph_file.write_text(json.dumps(nx.node_link_data(G, edges='links')), encoding='utf-8')
+        expected_dir = tmp_path / f'full_{step}'
+        eda.main(['--graph', str(graph_file), '--out-dir', str(expected_dir), '--only', 'export'])
+        _assert_same_artifacts(expected_dir, out_dir)
@@ -0,0 +1,18 @@
+"""Array-backed metrics against NetworkX on the fixture graphs (see parity_check.py)."""
+
+from graph_loader import load_graph
+from parity_check import check_csr, check_edge_table, reference_graph
+
+
+def test_csr_matches_networkx(graph_path):
+    check_csr(reference_graph(graph_path), load_graph(graph_path))
+
+
+def test_edge_table_matches_networkx(graph_path):
+    check_edge_table(reference_graph(graph_path), load_graph(graph_path))
+
+
+def test_links_to_missing_nodes_add_them_in_link_order(hand_built_graph_path):
+    graph = load_graph(hand_built_graph_path)
+    assert graph.node_ids[-2:] == ['ghost_1', 'ghost_2']
+    assert list(reference_graph(hand_built_graph_path).nodes()) == graph.node_ids
@@ -1,14 +1,14 @@
-Promise.all([
-    d3.json('MC1_graph.json'),
-    d3.csv('songs_albums_analysis.csv')
-]).then(([graphData, songsData]) => {
+// Scores, trajectories and metrics are precomputed by the Python pipeline
+// (pufi/dashboard_payloads.py, `python eda.py --only dashboard_payloads`).
+d3.json('payloads/rising_stars.json').then(risingStarsData => {
     console.log('Data loaded successfully');
-    console.log('Graph nodes:', graphData.nodes.length);
-    console.log('Songs data:', songsData.length);
-    
-    // Process rising stars data
-    const risingStarsData = processRisingStarsData(graphData, songsData);
-    
+    console.log('Rising stars:', risingStarsData.predictions.length);
+
+    // Release dates arrive as strings
+    risingStarsData.trajectories.forEach(trajectory => {
+        trajectory.timeline.forEach(work => { work.date = new Date(work.date); });
+    });
+
     // Initialize visualizations
     initializeTrajectoryChart(risingStarsData.trajectories);
     initializeMetricsPanel(risingStarsData.metrics);
@@ -22,280 +22,6 @@ Promise.all([
     `;
 });
 
-function processRisingStarsData(graphData, songsData) {
-    // Create lookup for songs data
-    const songsLookup = new Map(songsData.map(d => [d.id, d]));
-
-    // Precompute workCollaboratorsMap
-    const workCollaboratorsMap = new Map();
-    graphData.links.forEach(link => {
-        if (["PerformerOf", "ComposerOf"].includes(link["Edge Type"])) {
-            const sourceNode = graphData.nodes.find(n => n.id === link.source);
-            const targetNode = graphData.nodes.find(n => n.id === link.target);
-            if (!sourceNode || !targetNode) return;
-            let workId, personId;
-            if (sourceNode["Node Type"] === "Person") {
-                personId = sourceNode.id;
-                workId = targetNode.id;
-            } else if (targetNode["Node Type"] === "Person") {
-                personId = targetNode.id;
-                workId = sourceNode.id;
-            } else {
-                return;
-            }
-            if (!workCollaboratorsMap.has(workId)) workCollaboratorsMap.set(workId, new Set());
-            workCollaboratorsMap.get(workId).add(personId);
-        }
-    });
-    // Precompute nodeById
-    const nodeById = new Map(graphData.nodes.map(n => [n.id, n]));
-
-    // Find potential rising stars
-    const risingStars = findRisingStars(graphData, songsData, songsLookup, workCollaboratorsMap, nodeById);
-
-    // Use the top 3 emerging artists by score for trajectories and metrics
-    const topArtists = risingStars.slice(0, 3).map(star => star.name);
-    const artistMetrics = new Map();
-    topArtists.forEach(artist => {
-        const metrics = processArtistMetrics(artist, graphData, songsData, songsLookup);
-        if (metrics) {
-            artistMetrics.set(artist, metrics);
-        }
-    });
-
-    return {
-        trajectories: Array.from(artistMetrics.entries())
-            .filter(([_, metrics]) => metrics !== null)
-            .map(([artist, metrics]) => ({
-                artist,
-                ...metrics
-            })),
-        metrics: {
-            averageTimeToSuccess: calculateAverageTimeToSuccess(artistMetrics),
-            keyCollaborations: findKeyCollaborations(artistMetrics, graphData),
-            genreVersatility: calculateGenreVersatility(artistMetrics)
-        },
-        predictions: risingStars
-    };
-}
-
-function processArtistMetrics(artistName, graphData, songsData, songsLookup) {
-    const artistNode = graphData.nodes.find(n => n.name === artistName);
-    if (!artistNode) return null;
-
-    const works = new Set();
-    const collaborators = new Set();
-    const genres = new Set();
-    const timeline = [];
-
-    // Process works and collaborations
-    graphData.links.forEach(link => {
-        if (link.source === artistNode.id || link.target === artistNode.id) {
-            const otherNodeId = link.source === artistNode.id ? link.target : link.source;
-            const otherNode = graphData.nodes.find(n => n.id === otherNodeId);
-            
-            if (!otherNode) return;
-
-            if (otherNode['Node Type'] === 'Song' || otherNode['Node Type'] === 'Album') {
-                works.add(otherNode.id);
-                const songData = songsLookup.get(otherNode.id) || {};
-                const genre = otherNode.genre || songData.genre;
-                if (genre) genres.add(genre);
-                
-                const releaseDate = otherNode.release_date || songData.release_date;
-                if (releaseDate) {
-                    timeline.push({
-                        date: new Date(releaseDate),
-                        type: otherNode['Node Type'],
-                        name: otherNode.name || `${otherNode['Node Type']} ${otherNode.id}`,
-                        genre: genre || 'Unknown',
-                        notable: otherNode.notable || false
-                    });
-                }
-            } else if (otherNode['Node Type'] === 'Person') {
-                collaborators.add(otherNode.id);
-            }
-        }
-    });
-
-    // Calculate success metrics
-    const notableWorks = timeline.filter(work => work.notable).length;
-    const timeToSuccess = calculateTimeToSuccess(timeline);
-    const genreSpread = genres.size;
-    const collaborationScore = calculateCollaborationScore(collaborators, graphData);
-
-    return {
-        timeline: timeline.sort((a, b) => a.date - b.date),
-        notableWorks,
-        timeToSuccess,
-        genreSpread,
-        collaborationScore,
-        totalWorks: works.size,
-        genres: Array.from(genres)
-    };
-}
-
-function calculateTimeToSuccess(timeline) {
-    if (timeline.length === 0) return null;
-    
-    const firstWork = timeline[0];
-    const firstNotable = timeline.find(work => work.notable);
-    
-    if (!firstNotable) return null;
-    
-    return (firstNotable.date - firstWork.date) / (1000 * 60 * 60 * 24 * 365); // Years
-}
-
-function calculateCollaborationScore(collaborators, graphData) {
-    let score = 0;
-    collaborators.forEach(id => {
-        const collaborator = graphData.nodes.find(n => n.id === id);
-        if (collaborator && collaborator.notable) {
-            score += 1;
-        }
-    });
-    return score;
-}
-
-function findRisingStars(graphData, songsData, songsLookup, workCollaboratorsMap, nodeById) {
-    const oceanusArtists = new Set();
-    const risingStars = [];
-
-    // Find Oceanus Folk artists
-    graphData.nodes.forEach(node => {
-        if (node['Node Type'] === 'Person') {
-            const works = graphData.links.filter(link => 
-                (link.source === node.id || link.target === node.id) &&
-                ['PerformerOf', 'ComposerOf'].includes(link['Edge Type'])
-            );
-
-            const oceanusWorks = works.filter(link => {
-                const workNode = graphData.nodes.find(n => 
-                    n.id === (link.source === node.id ? link.target : link.source)
-                );
-                return workNode && (workNode.genre === 'Oceanus Folk' || 
-                       (songsLookup.get(workNode.id) || {}).genre === 'Oceanus Folk');
-            });
-
-            if (oceanusWorks.length > 0) {
-                oceanusArtists.add(node.id);
-            }
-        }
-    });
-
-    // Analyze each Oceanus artist
-    // Use 2025 as the current year for synthetic data
-    // Use 2039 as the current year for this filter
-    const now = new Date(2039, 0, 1); // January 1, 2039
-    const fiveYearsAgo = new Date(2034, 0, 1); // January 1, 2034
-    oceanusArtists.forEach(artistId => {
-        const artist = graphData.nodes.find(n => n.id === artistId);
-        if (!artist) return;
-
-        const metrics = processArtistMetrics(artist.name, graphData, songsData, songsLookup);
-        if (metrics && metrics.notableWorks > 0 && metrics.timeline.length >= 3) {
-            // Only consider if at least one work in the last 5 years (2034-2039)
-            const hasRecentWork5y = metrics.timeline.some(work => work.date >= fiveYearsAgo && work.date < now);
-            if (hasRecentWork5y) {
-                // Filter timeline to last 5 years
-                const timeline5y = metrics.timeline.filter(work => work.date >= fiveYearsAgo);
-                // Calculate metrics for last 5 years
-                const notableWorks5y = timeline5y.filter(work => work.notable).length;
-                const genreSet5y = new Set(timeline5y.map(work => work.genre));
-                const genreSpread5y = genreSet5y.size;
-                // Calculate collaboration score for last 5 years
-                // Find all collaborators from works in the last 5 years
-                const collaboratorIds5y = new Set();
-                timeline5y.forEach(work => {
-                    const collaborators = workCollaboratorsMap.get(work.id) || new Set();
-                    collaborators.forEach(pid => {
-                        if (pid !== artist.id) {
-                            const person = nodeById.get(pid);
-                            if (person && person.notable) {
-                                collaboratorIds5y.add(pid);
-                            }
-                        }
-                    });
-                });
-                const collaborationScore5y = collaboratorIds5y.size;
-                // Potential score for last 5 years
-                const metrics5y = {
-                    notableWorks: notableWorks5y,
-                    genreSpread: genreSpread5y,
-                    collaborationScore: collaborationScore5y,
-                    timeToSuccess: metrics.timeToSuccess // keep as is, or recalc if needed
-                };
-                const score5y = calculatePotentialScore(metrics5y);
-                // Log artist info in the requested format (last 5 years)
-                console.log(`\n${artist.name}\nNotable Works\n${notableWorks5y}\nGenre Spread\n${genreSpread5y}\nCollaboration Score\n${collaborationScore5y}\nPotential Score ${score5y.toFixed(1)} (last 5 years)`);
-                risingStars.push({
-                    name: artist.name,
-                    metrics,
-                    score: score5y
-                });
-            }
-        }
-    });
-
-    return risingStars.sort((a, b) => b.score - a.score).slice(0, 5);
-}
-
-function calculatePotentialScore(metrics) {
-    const timeToSuccessScore = metrics.timeToSuccess ? Math.max(0, 5 - metrics.timeToSuccess) : 0;
-    const notableWorksScore = metrics.notableWorks * 2;
-    const genreSpreadScore = metrics.genreSpread;
-    const collaborationScore = metrics.collaborationScore * 1.5;
-    
-    return timeToSuccessScore + notableWorksScore + genreSpreadScore + collaborationScore;
-}
-
-function calculateAverageTimeToSuccess(artistMetrics) {
-    const times = Array.from(artistMetrics.values())
-        .filter(metrics => metrics && metrics.timeToSuccess)
-        .map(metrics => metrics.timeToSuccess);
-    
-    return times.length > 0 ? d3.mean(times) : null;
-}
-
-function findKeyCollaborations(artistMetrics, graphData) {
-    const collaborations = new Map();
-    
-    artistMetrics.forEach((metrics, artist) => {
-        const artistNode = graphData.nodes.find(n => n.name === artist);
-        if (!artistNode) return;
-
-        graphData.links.forEach(link => {
-            if (link.source === artistNode.id || link.target === artistNode.id) {
-                const otherNodeId = link.source === artistNode.id ? link.target : link.source;
-                const otherNode = graphData.nodes.find(n => n.id === otherNodeId);
-                
-                if (otherNode && otherNode.type === 'Person' && otherNode.notable) {
-                    const key = `${artist}-${otherNode.name}`;
-                    collaborations.set(key, (collaborations.get(key) || 0) + 1);
-                }
-            }
-        });
-    });
-
-    return Array.from(collaborations.entries())
-        .sort((a, b) => b[1] - a[1])
-        .slice(0, 10)
-        .map(([key, count]) => ({
-            artists: key.split('-'),
-            count
-        }));
-}
-
-function calculateGenreVersatility(artistMetrics) {
-    return Array.from(artistMetrics.entries())
-        .filter(([_, metrics]) => metrics && metrics.genres) // Add null check
-        .map(([artist, metrics]) => ({
-            artist,
-            genres: metrics.genres || [],
-            versatility: metrics.genreSpread || 0
-        }));
-}
-
 function initializeTrajectoryChart(trajectoryData) {
     try {
         // Setup artist filter buttons
@@ -24,13 +24,11 @@ let currentView = 'collaboration';
 let currentDepth = 1;
 let centerNode = null;
 
-// Load and process data
-Promise.all([
-    d3.json('MC1_graph.json')
-]).then(([graphData]) => {
-    // Process data for network visualization
-    networkData = processNetworkData(graphData);
-    
+// Load the precomputed depth-2 ego network (pufi/dashboard_payloads.py)
+d3.json('payloads/sailor_ego.json').then(egoData => {
+    networkData = egoData;
+    centerNode = networkData ? networkData.nodes.find(n => n.center) : null;
+
     // Initialize visualization
     initializeVisualization();
     createNetwork();
@@ -40,107 +38,6 @@ Promise.all([
     console.error('Error loading data:', error);
 });
 
-function processNetworkData(graphData) {
-    // Find Sailor Shift's node
-    const sailorNode = graphData.nodes.find(n => n.name === "Sailor Shift");
-    if (!sailorNode) return null;
-
-    centerNode = sailorNode;
-
-    const nodes = new Map();
-    const links = new Map();
-
-    // Add center node
-    nodes.set(sailorNode.id, {
-        id: sailorNode.id,
-        name: sailorNode.name,
-        type: sailorNode['Node Type'],
-        notable: sailorNode.notable || false,
-        depth: 0,
-        center: true
-    });
-
-    // Process direct connections (depth 1)
-    graphData.links.forEach(link => {
-        if (link.source === sailorNode.id || link.target === sailorNode.id) {
-            const isSource = link.source === sailorNode.id;
-            const otherId = isSource ? link.target : link.source;
-            const otherNode = graphData.nodes.find(n => n.id === otherId);
-            
-            if (!otherNode) return;
-
-            // Add node if not exists
-            if (!nodes.has(otherId)) {
-                nodes.set(otherId, {
-                    id: otherId,
-                    name: otherNode.name,
-                    type: otherNode['Node Type'],
-                    notable: otherNode.notable || false,
-                    depth: 1
-                });
-            } else {
-                // If node already exists, set depth to 1 if it's less than current
-                if (nodes.get(otherId).depth > 1) {
-                    nodes.get(otherId).depth = 1;
-                }
-            }
-
-            // Add link
-            const linkId = `${link.source}-${link.target}`;
-            if (!links.has(linkId)) {
-                links.set(linkId, {
-                    source: link.source,
-                    target: link.target,
-                    type: link['Edge Type'],
-                    isInfluence: ['InStyleOf', 'CoverOf', 'DirectlySamples', 'InterpolatesFrom', 'LyricalReferenceTo'].includes(link['Edge Type'])
-                });
-            }
-        }
-    });
-
-    // Process indirect connections (depth 2)
-    nodes.forEach(node => {
-        if (node.depth === 1) {
-            graphData.links.forEach(link => {
-                if (link.source === node.id || link.target === node.id) {
-                    const isSource = link.source === node.id;
-                    const otherId = isSource ? link.target : link.source;
-                    // Do not add Sailor Shift again
-                    if (otherId === sailorNode.id) return;
-                    const otherNode = graphData.nodes.find(n => n.id === otherId);
-                    if (!otherNode) return;
-
-                    // Only add as depth 2 if not already present
-                    if (!nodes.has(otherId)) {
-                        nodes.set(otherId, {
-                            id: otherId,
-                            name: otherNode.name,
-                            type: otherNode['Node Type'],
-                            notable: otherNode.notable || false,
-                            depth: 2
-                        });
-                    }
-
-                    const linkId = `${link.source}-${link.target}`;
-                    if (!links.has(linkId)) {
-                        links.set(linkId, {
-                            source: link.source,
-                            target: link.target,
-                            type: link['Edge Type'],
-                            isInfluence: ['InStyleOf', 'CoverOf', 'DirectlySamples', 'InterpolatesFrom', 'LyricalReferenceTo'].includes(link['Edge Type'])
-                        });
-                    }
-                }
-            });
-        }
-    });
-
-    return {
-        nodes: Array.from(nodes.values()),
-        links: Array.from(links.values())
-    };
-}
-
 function initializeVisualization() {
     // Set dimensions
     const container = document.getElementById('network-view');
@@ -18,19 +18,16 @@ let activeFilters = {
 };
 // Add Sailor Shift era filter logic
 let currentEra = 'all';
-let originalGraphData = null;
-let originalSongsData = null;
+let sankeyFlows = null;
 
 async function init() {
     try {
         const container = document.getElementById('visualization');
         config.width = container.clientWidth - config.margin.left - config.margin.right;
         config.height = container.clientHeight - config.margin.top - config.margin.bottom;
-        const graphData = await d3.json('MC1_graph.json');
-        const songsData = await d3.csv('songs_albums_analysis.csv');
-        originalGraphData = graphData;
-        originalSongsData = songsData;
-        await processInfluenceSpreadData(graphData, songsData);
+        // Flow tables per era are precomputed (heaviest first) by pufi/dashboard_payloads.py
+        sankeyFlows = await d3.json('payloads/sankey_flows.json');
+        processInfluenceSpreadData(sankeyFlows);
         setupSVG();
         createSankeyDiagram();
         setupControls();
@@ -41,163 +38,88 @@ async function init() {
     }
 }
 
-function getEraFilter(year) {
-    if (!year) return false;
-    if (currentEra === 'pre') return year <= 2023;
-    if (currentEra === 'mid') return year > 2022 && year <= 2030;
-    if (currentEra === 'peak') return year > 2030 && year <= 2039;
-    return true; // 'all'
-}
-
-async function processInfluenceSpreadData(graphData, songsData) {
-    console.log('[Sankey] processInfluenceSpreadData called. Era:', currentEra, 'Links:', graphData.links.length);
-    // Build robust genre lookup from CSV (string match, trim whitespace)
-    const genreLookup = {};
-    songsData.forEach(d => {
-        if (d.id && d.genre) genreLookup[String(d.id).trim()] = d.genre;
-    });
-    graphData.nodes.forEach(n => {
-        if (n.id && n.genre) genreLookup[String(n.id).trim()] = n.genre;
-    });
-
-    // Helper: get genre for a node
-    function getGenre(node) {
-        // For Song/Album, always use CSV genre if available
-        if (node['Node Type'] === 'Song' || node['Node Type'] === 'Album') {
-            const genre = genreLookup[String(node.id).trim()];
-            if (genre && genre !== 'Unknown') return genre;
-        }
-        // Otherwise, use node genre if available
-        if (node.genre && node.genre !== 'Unknown') return node.genre;
-        if (genreLookup[String(node.id).trim()] && genreLookup[String(node.id).trim()] !== 'Unknown') return genreLookup[String(node.id).trim()];
-        return 'Unknown';
+// Tables in the payload are sorted heaviest first, so the rows at or above a
+// flow strength are a prefix: binary search for its end
+function aboveThreshold(rows, minWeight) {
+    let lo = 0, hi = rows.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (rows[mid][rows[mid].length - 1] >= minWeight) lo = mid + 1;
+        else hi = mid;
     }
+    return rows.slice(0, lo);
+}
+// Diagram data per (era, flow strength), built once and reused when switching back
+const sankeyCache = new Map();
+const MAX_ARTISTS = 12;
 
-    // Helper: get release year
-    function getYear(node) {
-        let y = node.release_date || node.release_year;
-        if (!y && node.id && songsData) {
-            const d = songsData.find(row => String(row.id).trim() === String(node.id).trim());
-            if (d && d.release_date) y = d.release_date;
-        }
-        if (y) return parseInt(y);
-        return null;
+function processInfluenceSpreadData(flows) {
+    console.log('[Sankey] processInfluenceSpreadData called. Era:', currentEra);
+    const key = `${currentEra}|${activeFilters.minFlowStrength}`;
+    if (!sankeyCache.has(key)) {
+        sankeyCache.set(key, buildSankeyData(flows.flows[currentEra], activeFilters.minFlowStrength));
     }
+    originalData = sankeyCache.get(key);
+    updateProcessedData();
+}
 
-    // DEBUG: Track unknown genres (for Song/Album only)
-    let unknownCount = 0;
-    let totalNodes = graphData.nodes.filter(n => n['Node Type'] === 'Song' || n['Node Type'] === 'Album').length;
-    graphData.nodes.forEach(n => {
-        if (n['Node Type'] !== 'Song' && n['Node Type'] !== 'Album') return;
-        const genre = getGenre(n);
-        if (genre === 'Unknown') {
-            unknownCount++;
-            console.log('[DEBUG] Unknown genre:', {
-                id: n.id,
-                name: n.name,
-                type: n['Node Type'],
-                nodeGenre: n.genre,
-                csvGenre: genreLookup[String(n.id).trim()]
-            });
-        }
-    });
-    console.log(`[DEBUG] Total Song/Album nodes: ${totalNodes}, Unknown genre count: ${unknownCount}, Percent unknown: ${(unknownCount/totalNodes*100).toFixed(2)}%`);
-
-    // Identify Oceanus Folk nodes (Song/Album only)
-    const isOceanusFolk = n => (n['Node Type'] === 'Song' || n['Node Type'] === 'Album') && getGenre(n) === 'Oceanus Folk';
-    const nodes = new Map();
-    graphData.nodes.forEach(n => {
-        if (n['Node Type'] === 'Song' || n['Node Type'] === 'Album') {
-            nodes.set(n.id, { ...n, genre: getGenre(n) });
-        }
-    });
-
-    // Collect all links where Oceanus Folk Song/Album is source or target, and both source/target are Song/Album
-    const inward = []; // Other genre -> Oceanus Folk
-    const outward = []; // Oceanus Folk -> Other genre
-    graphData.links.forEach(link => {
-        const source = nodes.get(link.source);
-        const target = nodes.get(link.target);
-        if (!source || !target) return;
-        // Apply era filter: for inward, use target year; for outward, use source year
-        if (isOceanusFolk(target) && !isOceanusFolk(source)) {
-            const year = getYear(target);
-            if (getEraFilter(year)) {
-                inward.push({
-                    from: source,
-                    to: target,
-                    type: link['Edge Type']
-                });
-            }
-        } else if (isOceanusFolk(source) && !isOceanusFolk(target)) {
-            const year = getYear(source);
-            if (getEraFilter(year)) {
-                outward.push({
-                    from: source,
-                    to: target,
-                    type: link['Edge Type']
-                });
-            }
-        }
-    });
-
-    // Aggregate inward by source genre
-    const inwardAgg = {};
-    inward.forEach(l => {
-        const genre = l.from.genre || 'Unknown';
-        inwardAgg[genre] = (inwardAgg[genre] || 0) + 1;
-    });
-    // Aggregate outward by target genre
-    const outwardGenreAgg = {};
-    outward.forEach(l => {
-        const genre = l.to.genre || 'Unknown';
-        outwardGenreAgg[genre] = (outwardGenreAgg[genre] || 0) + 1;
-    });
+function buildSankeyData(eraFlows, minFlowStrength) {
+    // [genre, count] pairs, heaviest first (ties in first-seen link order, as before)
+    const inwardAgg = Object.fromEntries(eraFlows.inward);
+    const outwardGenreAgg = Object.fromEntries(eraFlows.outward);
 
     // Build Sankey nodes
     const sankeyNodes = [];
     const nodeIndex = new Map();
+    const addNode = (id, name, category, color) => {
+        sankeyNodes.push({ id, name, category, color });
+        nodeIndex.set(id, sankeyNodes.length - 1);
+    };
     // Left: Inward genres
-    Object.keys(inwardAgg).forEach(genre => {
-        sankeyNodes.push({ id: `inward_${genre}`, name: genre, category: 'genre', color: config.colors.genre });
-        nodeIndex.set(`inward_${genre}`, sankeyNodes.length - 1);
-    });
+    eraFlows.inward.forEach(([genre]) => addNode(`inward_${genre}`, genre, 'genre', config.colors.genre));
     // Middle: Oceanus Folk
-    sankeyNodes.push({ id: 'oceanusfolk', name: 'Oceanus Folk', category: 'oceanus', color: config.colors.oceanus });
-    nodeIndex.set('oceanusfolk', sankeyNodes.length - 1);
+    addNode('oceanusfolk', 'Oceanus Folk', 'oceanus', config.colors.oceanus);
     // Right: Outward genres (top 8)
-    const topGenres = Object.entries(outwardGenreAgg).sort((a,b) => b[1]-a[1]).slice(0,8);
-    topGenres.forEach(([genre]) => {
-        sankeyNodes.push({ id: `outward_${genre}`, name: genre, category: 'genre', color: config.colors.genre });
-        nodeIndex.set(`outward_${genre}`, sankeyNodes.length - 1);
-    });
+    const topGenres = eraFlows.outward.slice(0, 8);
+    topGenres.forEach(([genre]) => addNode(`outward_${genre}`, genre, 'genre', config.colors.genre));
 
     // Build Sankey links
     const sankeyLinks = [];
     // Inward: genre -> Oceanus Folk
-    Object.entries(inwardAgg).forEach(([genre, count]) => {
-        if (count >= activeFilters.minFlowStrength) {
-            sankeyLinks.push({
-                source: nodeIndex.get(`inward_${genre}`),
-                target: nodeIndex.get('oceanusfolk'),
-                value: count,
-                color: config.colors.genre
-            });
-        }
+    aboveThreshold(eraFlows.inward, minFlowStrength).forEach(([genre, count]) => {
+        sankeyLinks.push({
+            source: nodeIndex.get(`inward_${genre}`),
+            target: nodeIndex.get('oceanusfolk'),
+            value: count,
+            color: config.colors.genre
+        });
     });
     // Outward: Oceanus Folk -> genre
-    topGenres.forEach(([genre, count]) => {
-        if (count >= activeFilters.minFlowStrength) {
-            sankeyLinks.push({
-                source: nodeIndex.get('oceanusfolk'),
-                target: nodeIndex.get(`outward_${genre}`),
-                value: count,
-                color: config.colors.oceanus
-            });
+    aboveThreshold(topGenres, minFlowStrength).forEach(([genre, count]) => {
+        sankeyLinks.push({
+            source: nodeIndex.get('oceanusfolk'),
+            target: nodeIndex.get(`outward_${genre}`),
+            value: count,
+            color: config.colors.oceanus
+        });
+    });
+    // Outward genre -> credited artists, strongest first
+    let artists = 0;
+    aboveThreshold(eraFlows.artists, minFlowStrength).forEach(([genre, artist, count]) => {
+        if (!nodeIndex.has(`outward_${genre}`)) return;
+        if (!nodeIndex.has(`artist_${artist}`)) {
+            if (artists === MAX_ARTISTS) return;
+            addNode(`artist_${artist}`, artist, 'artist', config.colors.artist);
+            artists += 1;
         }
+        sankeyLinks.push({
+            source: nodeIndex.get(`outward_${genre}`),
+            target: nodeIndex.get(`artist_${artist}`),
+            value: count,
+            color: config.colors.artist
+        });
     });
-    originalData = { sankeyNodes, sankeyLinks, inward, outward, inwardAgg, outwardGenreAgg };
-    updateProcessedData();
+    return { sankeyNodes, sankeyLinks, inwardAgg, outwardGenreAgg };
 }
 function updateProcessedData() {
     processedData = {
@@ -333,7 +255,8 @@ function updateStats() {
     const totalInward = Object.values(originalData.inwardAgg).reduce((a,b) => a+b, 0);
     const totalOutward = Object.values(originalData.outwardGenreAgg).reduce((a,b) => a+b, 0);
     // b. Top genres/artists influenced
-    const topGenre = Object.entries(originalData.outwardGenreAgg).sort((a,b) => b[1]-a[1])[0]?.[0] || 'None';
+    const topGenre = Object.keys(originalData.outwardGenreAgg)[0] || 'None';
+    const topInwardGenre = Object.keys(originalData.inwardAgg)[0] || 'None';
     const sr = document.getElementById('successRate');
     if (sr) sr.textContent = `Inward: ${totalInward}, Outward: ${totalOutward}`;
     const at = document.getElementById('avgTimeToSuccess');
@@ -384,8 +307,8 @@ if (typeof window !== 'undefined') {
             filter.addEventListener('change', async function() {
                 currentEra = this.value;
                 console.log('[Sankey Filter] Era changed to:', currentEra);
-                if (originalGraphData && originalSongsData) {
-                    await processInfluenceSpreadData(originalGraphData, originalSongsData);
+                if (sankeyFlows) {
+                    processInfluenceSpreadData(sankeyFlows);
                     createSankeyDiagram();
                 }
             });